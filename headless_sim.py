@@ -0,0 +1,462 @@
+#!/usr/bin/env python3
+"""
+Kingdom - Headless simulation runner
+Drives the gameplay systems (enemies, bullets, collisions, missiles, cores)
+without a window or rendering, as fast as possible, for benchmarks, CI
+performance gates and long soak runs across many seeds.
+
+Examples:
+    python headless_sim.py --seconds 60 --seed 1
+    python headless_sim.py --seconds 300 --input random --json
+    python headless_sim.py --seconds 120 --seeds 1,2,3,4 --jobs 4 --quiet
+    python headless_sim.py --seconds 60 --input random --record recordings/run.krec
+    python headless_sim.py --replay recordings/run.krec
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import math
+import os
+import random
+import struct
+import sys
+import time
+
+# No window or audio device - must be set before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame as pg
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.entities.player import Player
+from src.entities.bullet import BulletManager
+from src.entities.enemy import EnemyManager
+from src.systems.collision import CollisionManager
+from src.effects.missile_system import MissileManager, MissileState
+from src.world.world_manager import WorldManager
+from src.utils import log
+from src.utils.input_recording import InputRecorder, InputPlayback
+
+# Simulation defaults
+DEFAULT_TICK_RATE = 120  # Matches SIMULATION_HZ in main.py
+DEFAULT_SECONDS = 60.0
+DEFAULT_MISSILE_INTERVAL = 3.0  # Seconds between scripted missile launches
+MISSILE_EXPLOSION_RADIUS = 150  # Matches Game.check_missile_enemy_collisions
+
+# Systems timed per tick, in update order
+SYSTEMS = ("input", "cores", "player", "bullets", "missiles", "enemies", "collisions")
+
+
+class ScriptedInput:
+    """Deterministic input: circle-strafe around the spawn point while firing at the nearest enemy."""
+
+    def __init__(self, radius: float = 300.0, period: float = 12.0):
+        """Initialize the strafe pattern."""
+        self.radius = radius
+        self.period = period
+
+    def apply(self, player, game_time: float, enemies) -> bool:
+        """Set movement keys and aim on the player. Returns True to fire this tick."""
+        # Chase a point that travels around the strafe circle
+        phase = (game_time / self.period) * 2 * math.pi
+        target_x = math.cos(phase) * self.radius
+        target_y = math.sin(phase) * self.radius
+        _set_move_keys(player, target_x - player.pos.x, target_y - player.pos.y)
+        return _aim_at_nearest(player, enemies)
+
+
+class RandomInput:
+    """Seeded random input: wander in random directions while firing at the nearest enemy."""
+
+    def __init__(self, seed: int = None):
+        """Initialize the input generator with its own random stream."""
+        self.rng = random.Random(seed)
+        self.next_change_time = 0.0
+        self.direction = (0.0, 0.0)
+
+    def apply(self, player, game_time: float, enemies) -> bool:
+        """Set movement keys and aim on the player. Returns True to fire this tick."""
+        if game_time >= self.next_change_time:
+            angle = self.rng.uniform(0, 2 * math.pi)
+            moving = self.rng.random() > 0.15  # Occasionally stand still
+            self.direction = (math.cos(angle), math.sin(angle)) if moving else (0.0, 0.0)
+            self.next_change_time = game_time + self.rng.uniform(0.5, 2.0)
+        _set_move_keys(player, self.direction[0], self.direction[1])
+        return _aim_at_nearest(player, enemies)
+
+
+def _set_move_keys(player, dx: float, dy: float, dead_zone: float = 0.2):
+    """Translate a desired movement direction into the player's WASD key state."""
+    length = math.hypot(dx, dy)
+    if length > 0:
+        dx /= length
+        dy /= length
+    player.move_keys['up'] = dy < -dead_zone
+    player.move_keys['down'] = dy > dead_zone
+    player.move_keys['left'] = dx < -dead_zone
+    player.move_keys['right'] = dx > dead_zone
+
+
+def _aim_at_nearest(player, enemies, max_range: float = 900.0) -> bool:
+    """Aim the player at the nearest enemy in range. Returns True if there is one."""
+    nearest = None
+    nearest_distance_sq = max_range * max_range
+    px, py = player.pos.x, player.pos.y
+    for enemy in enemies:
+        dx = enemy.pos.x - px
+        dy = enemy.pos.y - py
+        distance_sq = dx * dx + dy * dy
+        if distance_sq < nearest_distance_sq:
+            nearest = enemy
+            nearest_distance_sq = distance_sq
+    if nearest is None:
+        return False
+    player.angle = math.degrees(math.atan2(nearest.pos.y - py, nearest.pos.x - px))
+    return True
+
+
+class HeadlessSimulation:
+    """The gameplay systems from Game.update, without a screen, camera, effects or networking."""
+
+    def __init__(self, seed: int = 1, tick_rate: int = DEFAULT_TICK_RATE, input_mode: str = "scripted",
+                 invincible: bool = True, missile_interval: float = DEFAULT_MISSILE_INTERVAL,
+                 enemy_pool: bool = False, numpy_separation: bool = False, replay_path: str = None,
+                 record: bool = False):
+        """Create the world and managers for one seeded run (replaying a recording if given)."""
+        self.seed = seed
+        self.dt = 1.0 / tick_rate
+        self.invincible = invincible
+        self.missile_interval = missile_interval
+
+        random.seed(seed)
+        try:
+            import numpy as np
+            np.random.seed(seed)
+        except ImportError:
+            pass
+
+        # Same construction order as Game.__init__
+        self.world_manager = WorldManager(seed=seed)
+        self.core_manager = self.world_manager.core_manager
+        self.player = Player(0, 0)
+        self.bullet_manager = BulletManager()
+        self.enemy_manager = EnemyManager(self.world_manager, spawn_point=(0, 0))
+        self.enemy_manager.populate_enemies_on_start(player_pos=pg.Vector2(0, 0))
+        self.collision_manager = CollisionManager()
+        self.missile_manager = MissileManager()
+
+        if enemy_pool:
+            self.enemy_manager.enable_enemy_pool(True, seed=seed)
+        self.enemy_manager.use_numpy_separation = numpy_separation
+
+        if replay_path:
+            self.input = InputPlayback(replay_path)
+            if (self.input.seed, self.input.tick_rate) != (seed, tick_rate):
+                raise ValueError(f"{replay_path} was recorded with seed {self.input.seed} at "
+                                 f"{self.input.tick_rate} Hz, not seed {seed} at {tick_rate} Hz")
+        elif input_mode == "random":
+            self.input = RandomInput(seed)
+        else:
+            self.input = ScriptedInput()
+        self.recorder = InputRecorder(seed, tick_rate, options={
+            "invincible": invincible,
+            "missile_interval": missile_interval,
+            "enemy_pool": enemy_pool,
+            "numpy_separation": numpy_separation,
+        }) if record else None
+        self.game_time = 0.0
+        self.next_missile_time = missile_interval
+        self.ticks = 0
+        self.kills = 0
+
+        # Profiling
+        self.system_time = {name: 0.0 for name in SYSTEMS}
+        self.peak_counts = {"enemies": 0, "bullets": 0, "missiles": 0, "cores": 0}
+
+    def step(self):
+        """Advance the simulation by one fixed tick, timing each system."""
+        dt = self.dt
+        player = self.player
+        enemies = self.enemy_manager.enemies
+        timings = self.system_time
+        clock = time.perf_counter
+
+        start = clock()
+        fire = self.input.apply(player, self.game_time, enemies)
+        if self.recorder:
+            self.recorder.record(player, fire)
+        if fire:
+            self._fire(player)
+        now = clock()
+        timings["input"] += now - start
+
+        start = now
+        self.core_manager.update(dt, player.pos)
+        now = clock()
+        timings["cores"] += now - start
+
+        start = now
+        player.update(dt, self.bullet_manager, self.world_manager)
+        now = clock()
+        timings["player"] += now - start
+
+        start = now
+        self.bullet_manager.update(dt, self.game_time, self.world_manager)
+        now = clock()
+        timings["bullets"] += now - start
+
+        start = now
+        self.missile_manager.update(dt, enemies)
+        now = clock()
+        timings["missiles"] += now - start
+
+        start = now
+        self.enemy_manager.update(dt, player.pos, self.game_time, self.bullet_manager)
+        now = clock()
+        timings["enemies"] += now - start
+
+        self.game_time += dt
+
+        start = now
+        self._check_collisions()
+        timings["collisions"] += clock() - start
+
+        if self.invincible:
+            player.health = player.max_health
+
+        self.ticks += 1
+        self._track_peaks()
+
+    def _fire(self, player):
+        """Fire the player's weapon and launch a missile on the scripted interval."""
+        bullet_manager = self.bullet_manager
+        if bullet_manager.can_shoot(self.game_time):
+            tip = player.get_gun_tip_position()
+            bullet_manager.add_bullet(
+                bullet_manager.create_bullet(tip.x, tip.y, player.angle, weapon_type=player.weapon_type))
+            bullet_manager.last_shot_time = self.game_time
+
+        if self.missile_interval > 0 and self.game_time >= self.next_missile_time:
+            angle = math.radians(player.angle)
+            self.missile_manager.fire_missile(player.pos.x, player.pos.y,
+                                              player.pos.x + math.cos(angle) * 500,
+                                              player.pos.y + math.sin(angle) * 500)
+            self.next_missile_time = self.game_time + self.missile_interval
+
+    def _check_collisions(self):
+        """Run the host collision passes from Game.update."""
+        collision_manager = self.collision_manager
+        self.kills += collision_manager.check_bullet_enemy_collisions(
+            self.bullet_manager, self.enemy_manager, self.player, None, self.world_manager)
+
+        # Missile explosions damage everything in range
+        for missile in self.missile_manager.missiles:
+            if missile.state == MissileState.EXPLODING:
+                for enemy in self.enemy_manager.get_enemies():
+                    if (missile.pos - enemy.pos).length() <= MISSILE_EXPLOSION_RADIUS:
+                        was_alive = enemy.is_alive()
+                        enemy.take_damage(missile.damage)
+                        if was_alive and not enemy.is_alive():
+                            self.kills += 1
+
+        collision_manager.rebuild_bullet_grid(self.bullet_manager)
+        collision_manager.check_bullet_chest_collisions(self.bullet_manager, self.core_manager)
+        collision_manager.check_player_enemy_collisions(self.player, self.enemy_manager)
+        collision_manager.check_enemy_bullet_player_collisions(self.bullet_manager, self.player)
+
+    def _track_peaks(self):
+        """Record the highest entity counts seen."""
+        peaks = self.peak_counts
+        for name, count in self.get_entity_counts().items():
+            if count > peaks[name]:
+                peaks[name] = count
+
+    def get_entity_counts(self) -> dict:
+        """Get the current number of live entities per system."""
+        return {
+            "enemies": len(self.enemy_manager.enemies),
+            "bullets": len(self.bullet_manager.bullets),
+            "missiles": len(self.missile_manager.missiles),
+            "cores": len(self.core_manager.cores),
+        }
+
+    def get_state_hash(self) -> str:
+        """Fingerprint of the simulation state; equal hashes mean two runs ended bit-for-bit the same."""
+        digest = hashlib.sha1()
+        player = self.player
+        digest.update(struct.pack("<dddd", player.pos.x, player.pos.y, player.angle, player.health))
+        for enemy in self.enemy_manager.enemies:
+            digest.update(struct.pack("<ddd", enemy.pos.x, enemy.pos.y, enemy.health))
+        for bullet in self.bullet_manager.bullets:
+            digest.update(struct.pack("<dd", bullet.pos.x, bullet.pos.y))
+        for missile in self.missile_manager.missiles:
+            digest.update(struct.pack("<dd", missile.pos.x, missile.pos.y))
+        for core in self.core_manager.cores:
+            digest.update(struct.pack("<dd", core.pos.x, core.pos.y))
+        digest.update(struct.pack("<qq", self.kills, self.ticks))
+        return digest.hexdigest()[:16]
+
+    def run(self, seconds: float) -> dict:
+        """Simulate the given number of game seconds as fast as possible and return a report."""
+        total_ticks = int(round(seconds / self.dt))
+        start = time.perf_counter()
+        for _ in range(total_ticks):
+            if getattr(self.input, "finished", False):
+                break
+            self.step()
+            if not self.player.is_alive():
+                break
+        wall_time = time.perf_counter() - start
+        return self.get_report(wall_time)
+
+    def get_report(self, wall_time: float) -> dict:
+        """Build the run report: throughput, entity counts and per-system timings."""
+        ticks = max(1, self.ticks)
+        return {
+            "seed": self.seed,
+            "ticks": self.ticks,
+            "sim_seconds": round(self.game_time, 3),
+            "wall_seconds": round(wall_time, 3),
+            "ticks_per_second": round(self.ticks / wall_time, 1) if wall_time > 0 else None,
+            "realtime_factor": round(self.game_time / wall_time, 2) if wall_time > 0 else None,
+            "player_alive": self.player.is_alive(),
+            "kills": self.kills,
+            "wave": self.enemy_manager.get_wave(),
+            "entities": self.get_entity_counts(),
+            "peak_entities": dict(self.peak_counts),
+            "state_hash": self.get_state_hash(),
+            "systems_ms_per_tick": {name: round(total * 1000.0 / ticks, 4)
+                                    for name, total in self.system_time.items()},
+        }
+
+
+def run_simulation(options: dict) -> dict:
+    """Run one seeded simulation from a dict of options (picklable for worker processes)."""
+    pg.init()
+    pg.display.set_mode((1, 1))  # Sprite loading needs a display surface for convert_alpha
+
+    try:
+        seconds = options.pop("seconds")
+        quiet = options.pop("quiet")
+        record_path = options.pop("record_path", None)
+        options["record"] = record_path is not None
+        if quiet:
+            # Game systems log freely; keep report output clean
+            log.set_level("", "WARNING")
+            with contextlib.redirect_stdout(io.StringIO()):
+                simulation = HeadlessSimulation(**options)
+                report = simulation.run(seconds)
+        else:
+            simulation = HeadlessSimulation(**options)
+            report = simulation.run(seconds)
+        if record_path:
+            simulation.recorder.save(record_path)
+            report["recording"] = record_path
+    finally:
+        # Shut SDL down so its signal handlers are gone before the process exits
+        pg.quit()
+    return report
+
+
+def format_report(report: dict) -> str:
+    """Format a run report as human-readable text."""
+    lines = [
+        f"Seed {report['seed']}: {report['sim_seconds']}s simulated in {report['wall_seconds']}s "
+        f"({report['ticks']} ticks, {report['ticks_per_second']} ticks/s, {report['realtime_factor']}x realtime)",
+        f"  Wave {report['wave']}, kills {report['kills']}, player {'alive' if report['player_alive'] else 'dead'}, "
+        f"state {report['state_hash']}",
+        "  Entities (final/peak): " + ", ".join(
+            f"{name} {count}/{report['peak_entities'][name]}" for name, count in report['entities'].items()),
+        "  Per-system ms/tick:",
+    ]
+    for name, ms in report["systems_ms_per_tick"].items():
+        lines.append(f"    {name:<11} {ms:8.4f}")
+    if "recording" in report:
+        lines.append(f"  Input recorded to {report['recording']}")
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the game simulation headless for benchmarks and soak tests.")
+    parser.add_argument("--seconds", type=float, default=None,
+                        help=f"game seconds to simulate per seed (default {DEFAULT_SECONDS:g}, or the whole recording)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for a single run")
+    parser.add_argument("--seeds", type=str, default=None, help="comma-separated seeds to run (overrides --seed)")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes when running several seeds")
+    parser.add_argument("--tick-rate", type=int, default=DEFAULT_TICK_RATE, help="simulation ticks per second")
+    parser.add_argument("--input", choices=("scripted", "random"), default="scripted", help="player input driver")
+    parser.add_argument("--mortal", action="store_true", help="let the player die (stops that run)")
+    parser.add_argument("--missile-interval", type=float, default=DEFAULT_MISSILE_INTERVAL,
+                        help="seconds between missile launches (0 disables)")
+    parser.add_argument("--enemy-pool", action="store_true", help="use the NumPy structure-of-arrays enemy update")
+    parser.add_argument("--numpy-separation", action="store_true", help="use the batched NumPy separation solver")
+    parser.add_argument("--json", action="store_true", help="print reports as JSON")
+    parser.add_argument("--quiet", action="store_true", help="suppress game log output during runs")
+    parser.add_argument("--record", type=str, default=None, metavar="FILE",
+                        help="write the per-tick player input to FILE (single seed only)")
+    parser.add_argument("--replay", type=str, default=None, metavar="FILE",
+                        help="replay a recording with its seed, tick rate and settings (overrides them)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Entry point of the headless runner."""
+    args = parse_args(argv)
+    seeds = [int(seed) for seed in args.seeds.split(",")] if args.seeds else [args.seed]
+    if args.record and len(seeds) > 1:
+        sys.exit("--record needs a single seed")
+
+    jobs = [{
+        "seed": seed,
+        "seconds": args.seconds if args.seconds is not None else DEFAULT_SECONDS,
+        "tick_rate": args.tick_rate,
+        "input_mode": args.input,
+        "invincible": not args.mortal,
+        "missile_interval": args.missile_interval,
+        "enemy_pool": args.enemy_pool,
+        "numpy_separation": args.numpy_separation,
+        "quiet": args.quiet,
+        "record_path": args.record,
+    } for seed in seeds]
+
+    if args.replay:
+        # The recording decides everything that changes the outcome
+        try:
+            playback = InputPlayback(args.replay)
+        except (OSError, ValueError) as e:
+            sys.exit(f"Cannot replay {args.replay}: {e}")
+        jobs = [dict(jobs[0], seed=playback.seed, tick_rate=playback.tick_rate, input_mode="replay",
+                     replay_path=args.replay, **playback.options)]
+        if args.seconds is None:
+            jobs[0]["seconds"] = playback.duration
+
+    if args.jobs > 1 and len(jobs) > 1:
+        import multiprocessing
+        # Fresh interpreters per worker - SDL state does not survive fork
+        # close()/join() rather than the context manager: its terminate() sends
+        # SIGTERM, which SDL-initialised workers ignore, hanging the join
+        pool = multiprocessing.get_context("spawn").Pool(min(args.jobs, len(jobs)))
+        try:
+            reports = pool.map(run_simulation, jobs)
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        reports = [run_simulation(job) for job in jobs]
+
+    if args.json:
+        print(json.dumps(reports if len(reports) > 1 else reports[0], indent=2))
+    else:
+        for report in reports:
+            print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
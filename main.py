@@ -7,6 +7,7 @@ Main game with character selection and sprite animation support
 import pygame as pg
 import sys
 import os
+import time
 
 # Add src directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
@@ -30,12 +31,18 @@ from src.effects.slash_effect import SlashEffectManager
 from src.world.world_manager import WorldManager
 from src.world.minimap import MiniMap
 from src.utils.score_manager import ScoreManager
+from src.systems.render_interpolation import RenderInterpolator, interpolate
+from src.utils.profiler import profiler
+from src.utils.rng import rng
+from src.ui.profiler_overlay import ProfilerOverlay
 
 # Multiplayer imports
 from src.networking.network_manager import NetworkManager
 from src.networking.game_synchronizer import GameStateSynchronizer
 from src.networking.modern_multiplayer_lobby import ModernMultiplayerLobby
 from src.networking.multiplayer_renderer import MultiplayerRenderer
+from src.networking.net_stats import StatsLogger
+from src.ui.net_stats_overlay import NetStatsOverlay
 
 # Game constants
 DEFAULT_SCREEN_WIDTH = 1920
@@ -43,6 +50,12 @@ DEFAULT_SCREEN_HEIGHT = 1080
 BACKGROUND_COLOR = (20, 20, 40)
 FPS = 60
 
+# Fixed-timestep simulation
+SIMULATION_HZ = 120  # Simulation ticks per second, independent of the render rate
+FIXED_DT = 1.0 / SIMULATION_HZ
+MAX_FRAME_TIME = 0.25  # Longer frames (window drags, loading hitches) are clamped to this
+MAX_TICKS_PER_FRAME = 8  # Catch-up cap - excess simulation time is dropped instead of spiralling
+
 class Game:
     """Main game class with character selection and sprite support."""
     
@@ -64,6 +77,7 @@ class Game:
         self.fps_timer = 0.0
         self.current_fps = 60
         self.show_debug_info = False  # Toggle with F3
+        self.profiler_overlay = ProfilerOverlay(profiler, pg.font.Font(None, 22))  # Toggle with F6, F7 records a trace
         
         # Initialize cursor variables
         self.crosshair_cursor = None
@@ -147,6 +161,12 @@ class Game:
         self.running = True
         self.dt = 0.0
         self.game_time = 0.0
+        
+        # Fixed-timestep loop state (see run)
+        self.sim_accumulator = 0.0
+        self.render_alpha = 1.0  # Fraction of a tick the render clock is ahead of the simulation
+        self.render_interpolator = RenderInterpolator()
+        self.prev_camera_pos = (0.0, 0.0)
         # Remove old score tracking - now handled by score_manager
         
         # Input handling
@@ -164,6 +184,9 @@ class Game:
         self.multiplayer_renderer = MultiplayerRenderer(self.character_manager)
         self.is_multiplayer = False
         self.multiplayer_players = {}  # Network player states
+        self.net_stats_overlay = NetStatsOverlay(pg.font.Font(None, 22))  # Toggle with F4
+        self.net_stats_logger = None  # Toggle with F5, writes net_stats/*.jsonl
+        self.net_stats_log_timer = 0.0
     
     def _start_multiplayer_game(self):
         """Start a multiplayer game from the lobby."""
@@ -249,23 +272,6 @@ class Game:
         if self.is_multiplayer and self.game_synchronizer:
             self.game_synchronizer.on_bullet_hit(x, y)
 
-    def _send_enemy_updates(self):
-        """Send enemy position updates to clients (host only)."""
-        if not hasattr(self, '_last_enemy_sync_time'):
-            self._last_enemy_sync_time = 0.0
-        
-        current_time = self.game_time
-        # Send enemy updates every 0.1 seconds (10 times per second)
-        if current_time - self._last_enemy_sync_time < 0.1:
-            return
-        
-        self._last_enemy_sync_time = current_time
-        
-        # Send updates for all living enemies
-        for enemy in self.enemy_manager.get_enemies():
-            if enemy.is_alive():
-                self.game_synchronizer.send_enemy_update(enemy)
-
     # Camera system compatibility properties
     @property
     def camera_x(self):
@@ -491,10 +497,10 @@ class Game:
             self.camera_shake_duration -= dt
             
             # Calculate shake offset
-            import random
+            shake_random = rng.stream("camera")
             shake_amount = self.camera_shake_intensity * (self.camera_shake_duration / 0.5)
-            self.camera_offset.x = random.uniform(-shake_amount, shake_amount)
-            self.camera_offset.y = random.uniform(-shake_amount, shake_amount)
+            self.camera_offset.x = shake_random.uniform(-shake_amount, shake_amount)
+            self.camera_offset.y = shake_random.uniform(-shake_amount, shake_amount)
             
             if self.camera_shake_duration <= 0:
                 self.camera_offset = pg.Vector2(0, 0)
@@ -651,6 +657,22 @@ class Game:
                         self.show_debug_info = not self.show_debug_info
                         if event.key in self.keys_just_pressed:
                             self.keys_just_pressed.remove(event.key)
+                    elif event.key == pg.K_F4:  # 'F4' key to toggle network stats
+                        self.net_stats_overlay.toggle()
+                        if event.key in self.keys_just_pressed:
+                            self.keys_just_pressed.remove(event.key)
+                    elif event.key == pg.K_F5:  # 'F5' key to toggle the network stats dump
+                        self.toggle_net_stats_logging()
+                        if event.key in self.keys_just_pressed:
+                            self.keys_just_pressed.remove(event.key)
+                    elif event.key == pg.K_F6:  # 'F6' key to toggle the frame profiler
+                        self.profiler_overlay.toggle()
+                        if event.key in self.keys_just_pressed:
+                            self.keys_just_pressed.remove(event.key)
+                    elif event.key == pg.K_F7:  # 'F7' key to start/stop a Chrome trace capture
+                        self.toggle_profiler_trace()
+                        if event.key in self.keys_just_pressed:
+                            self.keys_just_pressed.remove(event.key)
                 
                 # Handle character selection
                 if self.state_manager.is_character_select():
@@ -1209,7 +1231,7 @@ class Game:
                                         if is_special_attack and self.player.weapon_type == "Shotgun":
                                             pellet_color = (255, 0, 0)  # Bright intense red for special attack
                                         
-                                        self.bullet_manager.bullets.append(
+                                        self.bullet_manager.add_bullet(
                                             self.bullet_manager.create_bullet(
                                                 gun_tip.x, gun_tip.y, pellet_angle,
                                                 damage=weapon_damage,
@@ -1337,7 +1359,7 @@ class Game:
                                             enemy_targeting=enemy_targeting
                                         )
                                         if bullet2:
-                                            self.bullet_manager.bullets.append(bullet2)
+                                            self.bullet_manager.add_bullet(bullet2)
                                             bullet_fired_2 = True
                                     
                                     # Both streams fired successfully
@@ -1819,15 +1841,7 @@ class Game:
         return kills
     
     def update(self):
-        """Update game logic."""
-        # Performance monitoring
-        self.fps_counter += 1
-        self.fps_timer += self.dt
-        if self.fps_timer >= 1.0:  # Update FPS every second
-            self.current_fps = int(self.fps_counter / self.fps_timer)
-            self.fps_counter = 0
-            self.fps_timer = 0.0
-        
+        """Update game logic by one simulation tick of self.dt seconds."""
         # Always update state manager for menu animations
         self.state_manager.update(self.dt)
         
@@ -1852,7 +1866,15 @@ class Game:
         
         # Update multiplayer synchronization during gameplay
         if self.is_multiplayer and self.game_synchronizer and self.state_manager.is_playing():
-            self.game_synchronizer.update(self.dt)
+            with profiler.section("network"):
+                self.game_synchronizer.update(self.dt)
+            
+            # Dump network stats once per second while logging is on
+            if self.net_stats_logger:
+                self.net_stats_log_timer += self.dt
+                if self.net_stats_log_timer >= 1.0:
+                    self.net_stats_log_timer = 0.0
+                    self.net_stats_logger.write(self.network_manager.get_network_stats())
             # Get network players for rendering
             self.multiplayer_players = self.game_synchronizer.get_network_players()
             
@@ -1861,29 +1883,31 @@ class Game:
                 print(f"[MULTIPLAYER] is_multiplayer={self.is_multiplayer}, network_players={len(self.multiplayer_players)}, is_host={getattr(self.multiplayer_lobby, 'is_host', 'N/A')}")
                 # Removed per-player position logging to reduce spam
             
-            # Sync enemies if host (host authoritative)
-            if self.multiplayer_lobby and self.multiplayer_lobby.is_host:
-                self.enemy_manager.sync_enemies_to_network(self.game_time)
+            # Host enemy state is sent by the synchronizer's world snapshots
         
         if self.state_manager.is_playing() and self.player:
-            # Update camera shake
-            self.update_camera_shake(self.dt)
+            with profiler.section("camera"):
+                # Update camera shake
+                self.update_camera_shake(self.dt)
             
-            # Update camera position to follow player
-            self.update_camera()
+                # Update camera position to follow player
+                self.update_camera()
             
             # Update world manager (NPCs, objectives, etc.)
-            keys_pressed = pg.key.get_pressed()
-            self.world_manager.update(self.dt, self.player.pos, keys_pressed)
+            with profiler.section("world"):
+                keys_pressed = pg.key.get_pressed()
+                self.world_manager.update(self.dt, self.player.pos, keys_pressed)
             
             # Only end match when player dies - no objective completion
             # (Removed objective completion check for pure survival mode)
             
             # Update core system (replaces resource system) - pass player position and score manager for auto pickup
-            self.world_manager.core_manager.update(self.dt, self.player.pos, self.score_manager)
+            with profiler.section("cores"):
+                self.world_manager.core_manager.update(self.dt, self.player.pos, self.score_manager)
             
             # Update player
-            self.player.update(self.dt, self.bullet_manager, self.world_manager)
+            with profiler.section("player"):
+                self.player.update(self.dt, self.bullet_manager, self.world_manager)
             
             # Add footprints for snow atmosphere with proper timing
             if hasattr(self.player, 'velocity') and self.player.velocity.length() > 30:  # Lower threshold for walking
@@ -1894,139 +1918,142 @@ class Game:
                 # Footprints have been removed from new atmospheric effects system
             
             # Update managers
-            self.bullet_manager.update(self.dt, self.game_time, self.world_manager)
+            with profiler.section("bullets"):
+                self.bullet_manager.update(self.dt, self.game_time, self.world_manager)
             
             # Missiles handle their own explosions automatically
-            self.missile_manager.update(self.dt, self.enemy_manager.get_enemies())
+            with profiler.section("missiles"):
+                self.missile_manager.update(self.dt, self.enemy_manager.get_enemies())
             
             # Enemy management: Only host manages enemies in multiplayer, clients receive updates
-            if not self.is_multiplayer or (self.multiplayer_lobby and self.multiplayer_lobby.is_host):
-                # Single player or multiplayer host: Update enemy AI, spawning, etc.
-                self.enemy_manager.update(self.dt, self.player.pos, self.game_time, self.bullet_manager,
-                                         self.base_zoom, self.screen_width, self.screen_height)
-                if self.is_multiplayer and self.game_time % 15.0 < self.dt:  # Log every 15 seconds (reduced)
-                    print(f"[ENEMY_SYNC] Host managing {len(self.enemy_manager.get_enemies())} enemies")
-                
-                # Send enemy position updates to clients (host only)
-                if self.is_multiplayer and self.game_synchronizer:
-                    self._send_enemy_updates()
-            else:
-                # Multiplayer client: Only update enemy rendering/animation, not AI or spawning
-                # The actual enemy positions come from host via GameStateSynchronizer
-                self.enemy_manager.update_render_only(self.dt)
-                if self.game_time % 15.0 < self.dt:  # Log every 15 seconds (reduced)
-                    enemy_count = len(self.enemy_manager.get_enemies()) if hasattr(self.enemy_manager, 'get_enemies') else 0
-                    print(f"[ENEMY_SYNC] Client has {enemy_count} enemies from network")
+            with profiler.section("enemies"):
+                if not self.is_multiplayer or (self.multiplayer_lobby and self.multiplayer_lobby.is_host):
+                    # Single player or multiplayer host: Update enemy AI, spawning, etc.
+                    self.enemy_manager.update(self.dt, self.player.pos, self.game_time, self.bullet_manager,
+                                             self.base_zoom, self.screen_width, self.screen_height)
+                    if self.is_multiplayer and self.game_time % 15.0 < self.dt:  # Log every 15 seconds (reduced)
+                        print(f"[ENEMY_SYNC] Host managing {len(self.enemy_manager.get_enemies())} enemies")
+                else:
+                    # Multiplayer client: Only update enemy rendering/animation, not AI or spawning
+                    # The actual enemy positions come from host via GameStateSynchronizer
+                    self.enemy_manager.update_render_only(self.dt)
+                    if self.game_time % 15.0 < self.dt:  # Log every 15 seconds (reduced)
+                        enemy_count = len(self.enemy_manager.get_enemies()) if hasattr(self.enemy_manager, 'get_enemies') else 0
+                        print(f"[ENEMY_SYNC] Client has {enemy_count} enemies from network")
             
             # Sync game state in multiplayer
-            if self.is_multiplayer and self.game_synchronizer:
-                # Sync wave updates (host only)
-                if self.multiplayer_lobby and self.multiplayer_lobby.is_host:
-                    self.game_synchronizer.on_wave_update(
-                        self.enemy_manager.wave, 
-                        self.enemy_manager.enemies_killed,
-                        self.enemy_manager.wave_timer
-                    )
+            with profiler.section("network"):
+                if self.is_multiplayer and self.game_synchronizer:
+                    # Sync wave updates (host only)
+                    if self.multiplayer_lobby and self.multiplayer_lobby.is_host:
+                        self.game_synchronizer.on_wave_update(
+                            self.enemy_manager.wave, 
+                            self.enemy_manager.enemies_killed,
+                            self.enemy_manager.wave_timer
+                        )
                 
-                # Sync score updates (all players)
-                local_player_id = self.multiplayer_lobby.get_local_player_id()
-                if local_player_id and hasattr(self.score_manager, 'get_current_score'):
-                    current_score = self.score_manager.get_current_score()
-                    self.game_synchronizer.on_score_update(
-                        local_player_id,
-                        current_score,
-                        self.score_manager.player_rapture_cores,
-                        self.enemy_manager.enemies_killed
-                    )
-            
-            self.effects_manager.update(self.dt, self.player.pos)
-            self.slash_effect_manager.update(self.dt)
+                    # Sync score updates (all players)
+                    local_player_id = self.multiplayer_lobby.get_local_player_id()
+                    if local_player_id and hasattr(self.score_manager, 'get_current_score'):
+                        current_score = self.score_manager.get_current_score()
+                        self.game_synchronizer.on_score_update(
+                            local_player_id,
+                            current_score,
+                            self.score_manager.player_rapture_cores,
+                            self.enemy_manager.enemies_killed
+                        )
+            
+            with profiler.section("effects"):
+                self.effects_manager.update(self.dt, self.player.pos)
+                self.slash_effect_manager.update(self.dt)
             
             # Update atmospheric effects with player position for proper particle respawning
             # Both player and atmospheric systems use same coordinate system centered at (0,0)
-            player_pos = (self.player.pos.x, self.player.pos.y) if self.player else None
-            self.atmospheric_effects.update(self.dt, player_pos)
+            with profiler.section("atmosphere"):
+                player_pos = (self.player.pos.x, self.player.pos.y) if self.player else None
+                self.atmospheric_effects.update(self.dt, player_pos)
             
             # Update minigun effects if player is using minigun
-            if self.player.weapon_type == "Minigun":
-                gun_tip = self.player.get_gun_tip_position()
-                is_firing = self.bullet_manager.is_firing_continuously
-                self.minigun_effects_manager.update(
-                    self.dt, is_firing, self.bullet_manager.current_fire_rate, 
-                    (gun_tip.x, gun_tip.y), self.player.angle
-                )
+            with profiler.section("weapon_effects"):
+                if self.player.weapon_type == "Minigun":
+                    gun_tip = self.player.get_gun_tip_position()
+                    is_firing = self.bullet_manager.is_firing_continuously
+                    self.minigun_effects_manager.update(
+                        self.dt, is_firing, self.bullet_manager.current_fire_rate, 
+                        (gun_tip.x, gun_tip.y), self.player.angle
+                    )
                 
-                # Update whip trail damage segments with current bullets for collision detection
-                minigun_bullets = [bullet for bullet in self.bullet_manager.bullets 
-                                 if hasattr(bullet, 'weapon_type') and bullet.weapon_type == 'Minigun']
-                self.minigun_effects_manager.update_whip_trail_with_bullets(minigun_bullets)
+                    # Update whip trail damage segments with current bullets for collision detection
+                    minigun_bullets = [bullet for bullet in self.bullet_manager.bullets 
+                                     if hasattr(bullet, 'weapon_type') and bullet.weapon_type == 'Minigun']
+                    self.minigun_effects_manager.update_whip_trail_with_bullets(minigun_bullets)
             
-            # Update shotgun fire trail effects if player is using shotgun
-            if self.player.weapon_type == "Shotgun":
-                self.shotgun_effects_manager.update(self.dt)
+                # Update shotgun fire trail effects if player is using shotgun
+                if self.player.weapon_type == "Shotgun":
+                    self.shotgun_effects_manager.update(self.dt)
             
-            # Check for continuous sword damage from active slash effects
-            self.check_slash_damage()
+            with profiler.section("area_damage"):
+                # Check for continuous sword damage from active slash effects
+                self.check_slash_damage()
             
-            # Check for continuous beam damage from active mystical beam effects
-            self.check_beam_damage()
+                # Check for continuous beam damage from active mystical beam effects
+                self.check_beam_damage()
             
-            # Check for continuous missile damage from visual effects (body hits and explosions)
-            self.check_missile_visual_damage()
+                # Check for continuous missile damage from visual effects (body hits and explosions)
+                self.check_missile_visual_damage()
             
-            # Check for ground fire damage from special missile explosions
-            self.check_ground_fire_damage()
+                # Check for ground fire damage from special missile explosions
+                self.check_ground_fire_damage()
             
-            # Check for burning trail damage from special sniper attacks
-            self.check_burning_trail_damage()
+                # Check for burning trail damage from special sniper attacks
+                self.check_burning_trail_damage()
             
             # Update game timer
             self.game_time += self.dt
             
             # Handle collisions
-            if not self.is_multiplayer or (self.multiplayer_lobby and self.multiplayer_lobby.is_host):
-                # Single player or multiplayer host: Full collision processing with enemy death authority
-                kills = self.collision_manager.check_bullet_enemy_collisions(
-                    self.bullet_manager, self.enemy_manager, self.player, self.effects_manager, self.world_manager, self._on_bullet_hit)
+            with profiler.section("collisions"):
+                if not self.is_multiplayer or (self.multiplayer_lobby and self.multiplayer_lobby.is_host):
+                    # Single player or multiplayer host: Full collision processing with enemy death authority
+                    kills = self.collision_manager.check_bullet_enemy_collisions(
+                        self.bullet_manager, self.enemy_manager, self.player, self.effects_manager, self.world_manager, self._on_bullet_hit)
                 
-                # Handle missile collisions with enemies
-                missile_kills = self.check_missile_enemy_collisions()
-                kills += missile_kills
+                    # Handle missile collisions with enemies
+                    missile_kills = self.check_missile_enemy_collisions()
+                    kills += missile_kills
                 
-                # Handle minigun whip damage when at full speed
-                if self.player.weapon_type == "Minigun" and self.minigun_effects_manager.whip_trail_active:
-                    whip_kills = self.check_whip_damage()
-                    kills += whip_kills
+                    # Handle minigun whip damage when at full speed
+                    if self.player.weapon_type == "Minigun" and self.minigun_effects_manager.whip_trail_active:
+                        whip_kills = self.check_whip_damage()
+                        kills += whip_kills
                 
-                # Add score for kills (10 points per enemy)
-                if kills > 0:
-                    # Add kills to score manager instead of direct score tracking
-                    for _ in range(kills):
-                        self.score_manager.add_kill_score(10)
-            else:
-                # Multiplayer client: Detect collisions but send damage to host instead of applying locally
-                kills = self.collision_manager.check_bullet_enemy_collisions_network_client(
-                    self.bullet_manager, self.enemy_manager, self.player, self.effects_manager, 
-                    self.world_manager, self.game_synchronizer, self._on_bullet_hit)
+                    # Add score for kills (10 points per enemy)
+                    if kills > 0:
+                        # Add kills to score manager instead of direct score tracking
+                        for _ in range(kills):
+                            self.score_manager.add_kill_score(10)
+                else:
+                    # Multiplayer client: Detect collisions but send damage to host instead of applying locally
+                    kills = self.collision_manager.check_bullet_enemy_collisions_network_client(
+                        self.bullet_manager, self.enemy_manager, self.player, self.effects_manager, 
+                        self.world_manager, self.game_synchronizer, self._on_bullet_hit)
 
-            # Check bullet-chest collisions (all players can damage chests)
-            bullets_to_remove = []
-            for bullet in self.bullet_manager.bullets[:]:  # Copy to allow modification
-                if bullet.type.value == "player":  # Only player bullets can damage chests
-                    if self.world_manager.core_manager.check_bullet_chest_collision(bullet.get_rect(), bullet.damage):
-                        bullets_to_remove.append(bullet)
+                # Index surviving bullets once for the chest and enemy-bullet passes below
+                self.collision_manager.rebuild_bullet_grid(self.bullet_manager)
 
-            # Remove bullets that hit chests
-            for bullet in bullets_to_remove:
-                self.bullet_manager.remove_bullet(bullet)
-            
-            # Check player-enemy collisions
-            player_hit = self.collision_manager.check_player_enemy_collisions(
-                self.player, self.enemy_manager)
-            
-            # Check enemy bullet-player collisions
-            bullet_hit = self.collision_manager.check_enemy_bullet_player_collisions(
-                self.bullet_manager, self.player)
+            # Check bullet-chest collisions (all players can damage chests)
+            with profiler.section("chests"):
+                self.collision_manager.check_bullet_chest_collisions(
+                    self.bullet_manager, self.world_manager.core_manager)
+            
+            with profiler.section("collisions"):
+                # Check player-enemy collisions
+                player_hit = self.collision_manager.check_player_enemy_collisions(
+                    self.player, self.enemy_manager)
+                
+                # Check enemy bullet-player collisions
+                bullet_hit = self.collision_manager.check_enemy_bullet_player_collisions(
+                    self.bullet_manager, self.player)
             
             if player_hit or bullet_hit:
                 # Add camera shake and red flash for player hit
@@ -2118,46 +2145,54 @@ class Game:
                 virtual_offset = self.get_world_camera_offset()
             
             # Render level-based world background
-            if self.player:
-                self.world_manager.render_world_background(
-                    virtual_surface, self.camera_x, self.camera_y, 
-                    virtual_surface.get_width(), virtual_surface.get_height()
-                )
+            with profiler.section("render.world"):
+                if self.player:
+                    self.world_manager.render_world_background(
+                        virtual_surface, self.camera_x, self.camera_y, 
+                        virtual_surface.get_width(), virtual_surface.get_height()
+                    )
             
-            # Render map tiles (above background, below everything else)
-            self.world_manager.render_map(virtual_surface, virtual_offset)
+                # Render map tiles (above background, below everything else)
+                self.world_manager.render_map(virtual_surface, virtual_offset)
             
             # Render cores and chests (above terrain, below player) - replaces resource nodes
-            self.world_manager.core_manager.render(virtual_surface, virtual_offset)
+            with profiler.section("render.cores"):
+                self.world_manager.core_manager.render(virtual_surface, virtual_offset)
             
             # Render NPCs (above terrain, below player)
-            self.world_manager.render_npcs(virtual_surface, virtual_offset)
+            with profiler.section("render.npcs"):
+                self.world_manager.render_npcs(virtual_surface, virtual_offset)
             
             # Render game objects with world offset
-            if self.player:
-                if hasattr(self.player, 'render') and len(self.player.render.__code__.co_varnames) > 3:
-                    # AnimatedPlayer with offset support
-                    self.player.render(virtual_surface, self.game_time, virtual_offset)
-                else:
-                    # Regular player
-                    self.player.render(virtual_surface, self.game_time)
+            with profiler.section("render.player"):
+                if self.player:
+                    if hasattr(self.player, 'render') and len(self.player.render.__code__.co_varnames) > 3:
+                        # AnimatedPlayer with offset support
+                        self.player.render(virtual_surface, self.game_time, virtual_offset)
+                    else:
+                        # Regular player
+                        self.player.render(virtual_surface, self.game_time)
             
             # Render enemies (bottom layer)
-            self.enemy_manager.render(virtual_surface, virtual_offset)
+            with profiler.section("render.enemies"):
+                self.enemy_manager.render(virtual_surface, virtual_offset)
             
             # Render multiplayer players (above enemies, same layer as local player)
-            if self.is_multiplayer and self.multiplayer_players:
-                self.multiplayer_renderer.render_network_players(
-                    virtual_surface, self.multiplayer_players, virtual_offset
-                )
+            with profiler.section("render.network_players"):
+                if self.is_multiplayer and self.multiplayer_players:
+                    self.multiplayer_renderer.render_network_players(
+                        virtual_surface, self.multiplayer_players, virtual_offset
+                    )
             
             # Render effects on top
-            self.effects_manager.render(virtual_surface, virtual_offset)
-            self.slash_effect_manager.render(virtual_surface, virtual_offset)
+            with profiler.section("render.effects"):
+                self.effects_manager.render(virtual_surface, virtual_offset)
+                self.slash_effect_manager.render(virtual_surface, virtual_offset)
             
             # Render bullets and missiles LAST to make sure they're visible (temporary debug)
-            self.bullet_manager.render(virtual_surface, virtual_offset)
-            self.missile_manager.render(virtual_surface, virtual_offset)
+            with profiler.section("render.bullets"):
+                self.bullet_manager.render(virtual_surface, virtual_offset)
+                self.missile_manager.render(virtual_surface, virtual_offset)
             
             # Render network bullets for multiplayer
             if self.is_multiplayer and self.game_synchronizer:
@@ -2169,46 +2204,51 @@ class Game:
                 #     )
             
             # Render minigun muzzle flames if active
-            if self.player.weapon_type == "Minigun":
-                # Get minigun bullets for whip trail rendering
-                minigun_bullets = [bullet for bullet in self.bullet_manager.bullets 
-                                 if hasattr(bullet, 'weapon_type') and bullet.weapon_type == 'Minigun']
+            with profiler.section("render.weapon_effects"):
+                if self.player.weapon_type == "Minigun":
+                    # Get minigun bullets for whip trail rendering
+                    minigun_bullets = [bullet for bullet in self.bullet_manager.bullets 
+                                     if hasattr(bullet, 'weapon_type') and bullet.weapon_type == 'Minigun']
                 
-                # Render whip trail lines between bullets
-                self.minigun_effects_manager.render_whip_trail_lines(virtual_surface, minigun_bullets, virtual_offset)
+                    # Render whip trail lines between bullets
+                    self.minigun_effects_manager.render_whip_trail_lines(virtual_surface, minigun_bullets, virtual_offset)
                 
-                # Render trail sparks
-                self.minigun_effects_manager.render_muzzle_flames(virtual_surface, virtual_offset)
-            
-            # Render shotgun fire trails if active
-            if self.player.weapon_type == "Shotgun":
-                # Get shotgun pellets for fire trail rendering
-                shotgun_bullets = [bullet for bullet in self.bullet_manager.bullets 
-                                 if hasattr(bullet, 'weapon_type') and bullet.weapon_type == 'Shotgun']
+                    # Render trail sparks
+                    self.minigun_effects_manager.render_muzzle_flames(virtual_surface, virtual_offset)
+            
+                # Render shotgun fire trails if active
+                if self.player.weapon_type == "Shotgun":
+                    # Get shotgun pellets for fire trail rendering
+                    shotgun_bullets = [bullet for bullet in self.bullet_manager.bullets 
+                                     if hasattr(bullet, 'weapon_type') and bullet.weapon_type == 'Shotgun']
                 
-                # Render fire trail lines between pellets
-                self.shotgun_effects_manager.render_fire_trail_lines(virtual_surface, shotgun_bullets, virtual_offset)
+                    # Render fire trail lines between pellets
+                    self.shotgun_effects_manager.render_fire_trail_lines(virtual_surface, shotgun_bullets, virtual_offset)
                 
-            # Shell casings disabled
-            self.minigun_effects_manager.render_shell_casings(virtual_surface, virtual_offset)
+                # Shell casings disabled
+                self.minigun_effects_manager.render_shell_casings(virtual_surface, virtual_offset)
             
             # Render atmospheric effects particles in world space (they need to be on the virtual surface)
-            self.atmospheric_effects.render(virtual_surface, virtual_offset)
+            with profiler.section("render.atmosphere"):
+                self.atmospheric_effects.render(virtual_surface, virtual_offset)
             
             # If we used a virtual surface, scale it to the screen
-            if self.base_zoom != 1.0:
-                scaled_surface = pg.transform.scale(virtual_surface, (self.screen_width, self.screen_height))
-                self.screen.blit(scaled_surface, (0, 0))
-            else:
-                # No scaling needed, just blit the virtual surface
-                self.screen.blit(virtual_surface, (0, 0))
+            with profiler.section("render.zoom"):
+                if self.base_zoom != 1.0:
+                    scaled_surface = pg.transform.scale(virtual_surface, (self.screen_width, self.screen_height))
+                    self.screen.blit(scaled_surface, (0, 0))
+                else:
+                    # No scaling needed, just blit the virtual surface
+                    self.screen.blit(virtual_surface, (0, 0))
             
             # Render atmospheric screen overlays (storm tint, lightning) on top of everything
-            self.atmospheric_effects.render_screen_effects(self.screen)            # Render map debug overlay (after scaling)
-            self.world_manager.render_map_debug(self.screen, self.calculate_offset())
+            with profiler.section("render.overlays"):
+                self.atmospheric_effects.render_screen_effects(self.screen)            # Render map debug overlay (after scaling)
+                self.world_manager.render_map_debug(self.screen, self.calculate_offset())
             
             # Render game UI
-            self.render_game_ui_clean()
+            with profiler.section("render.ui"):
+                self.render_game_ui_clean()
             
         elif self.state_manager.is_paused():
             # Render game objects (frozen) with camera shake offset
@@ -2258,7 +2298,8 @@ class Game:
             # Then render the quit confirmation overlay on top
             self.state_manager.render_quit_confirmation()
         
-        pg.display.flip()
+        with profiler.section("present"):
+            pg.display.flip()
     
     def draw_clean_ui_panel(self, rect: pg.Rect, alpha: int = 200):
         """Draw a clean UI panel with main menu styling."""
@@ -2436,6 +2477,36 @@ class Game:
             # Instructions
             debug_info_text = self.small_font.render("F3 to toggle debug", True, (150, 150, 150))
             self.screen.blit(debug_info_text, (self.screen_width - 200, debug_y + 100))
+        
+        # === NETWORK STATS (F4, multiplayer only) ===
+        if self.is_multiplayer and self.network_manager:
+            self.net_stats_overlay.render(self.screen, self.network_manager, (20, 150))
+        
+        # === FRAME PROFILER (F6) ===
+        self.profiler_overlay.render(self.screen, (20, self.screen_height - 420))
+    
+    def toggle_profiler_trace(self):
+        """Start recording a Chrome trace, or stop and write it to profiles/trace_<time>.json."""
+        if profiler.tracing:
+            path = profiler.stop_trace()
+            profiler.set_enabled(self.profiler_overlay.visible)
+            if path:
+                print(f"[PROFILER] Open {path} in chrome://tracing or ui.perfetto.dev")
+        else:
+            profiler.start_trace()
+            print("[PROFILER] Recording trace (F7 to stop)")
+    
+    def toggle_net_stats_logging(self):
+        """Start or stop dumping network stats snapshots to net_stats/net_stats_<time>.jsonl."""
+        if self.net_stats_logger:
+            print(f"[NET_STATS] Wrote {self.net_stats_logger.rows_written} snapshots to {self.net_stats_logger.path}")
+            self.net_stats_logger.close()
+            self.net_stats_logger = None
+        elif self.is_multiplayer and self.network_manager and hasattr(self.network_manager, 'get_network_stats'):
+            path = os.path.join("net_stats", time.strftime("net_stats_%Y%m%d_%H%M%S.jsonl"))
+            self.net_stats_logger = StatsLogger(path)
+            self.net_stats_log_timer = 0.0
+            print(f"[NET_STATS] Logging network stats to {path}")
     
     def _render_local_multiplayer(self):
         """Render the local multiplayer screen with basic UI."""
@@ -2481,14 +2552,79 @@ class Game:
         # print(f"Found characters: {self.character_manager.get_character_display_names()}")
         
         while self.running:
-            self.dt = self.clock.tick(FPS) / 1000.0
-            
-            self.handle_events()
-            self.update()
-            self.render()
+            frame_time = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            profiler.begin_frame()
+            
+            # Performance monitoring (rendered frames per second)
+            self.fps_counter += 1
+            self.fps_timer += frame_time
+            if self.fps_timer >= 1.0:  # Update FPS every second
+                self.current_fps = int(self.fps_counter / self.fps_timer)
+                self.fps_counter = 0
+                self.fps_timer = 0.0
+            
+            # Input is read once per rendered frame
+            self.dt = frame_time
+            with profiler.section("events"):
+                self.handle_events()
+            
+            # Advance the simulation in fixed ticks so results don't depend on the frame rate
+            self.sim_accumulator += frame_time
+            ticks = 0
+            while self.sim_accumulator >= FIXED_DT and ticks < MAX_TICKS_PER_FRAME:
+                self._capture_interpolation_state()
+                self.dt = FIXED_DT
+                self.update()
+                self.sim_accumulator -= FIXED_DT
+                ticks += 1
+            if ticks == MAX_TICKS_PER_FRAME:
+                # Too far behind - drop the backlog rather than spiral further behind
+                self.sim_accumulator = min(self.sim_accumulator, FIXED_DT)
+            
+            # Rendering (and menu animation driven from render) runs on the frame clock
+            self.dt = frame_time
+            self.render_alpha = self.sim_accumulator / FIXED_DT
+            self._render_interpolated()
+            profiler.end_frame()
         
         pg.quit()
         sys.exit()
+    
+    def _get_interpolated_object_lists(self):
+        """Get the lists of moving objects drawn at interpolated positions."""
+        object_lists = [self.enemy_manager.enemies, self.bullet_manager.bullets, self.missile_manager.missiles]
+        if self.player:
+            object_lists.append((self.player,))
+        return object_lists
+    
+    def _capture_interpolation_state(self):
+        """Remember positions before a simulation tick for render interpolation."""
+        if not (self.state_manager.is_playing() and self.player):
+            return
+        for objects in self._get_interpolated_object_lists():
+            self.render_interpolator.capture(objects)
+        self.prev_camera_pos = (self.camera_x, self.camera_y)
+    
+    def _render_interpolated(self):
+        """Render with moving objects and the camera blended between the last two ticks."""
+        if not (self.state_manager.is_playing() and self.player):
+            self.render()
+            return
+        
+        alpha = self.render_alpha
+        camera_x, camera_y = self.camera_x, self.camera_y
+        prev_x, prev_y = self.prev_camera_pos
+        if (camera_x - prev_x) ** 2 + (camera_y - prev_y) ** 2 <= self.render_interpolator.snap_distance_sq:
+            self.camera_x = interpolate(prev_x, camera_x, alpha)
+            self.camera_y = interpolate(prev_y, camera_y, alpha)
+        for objects in self._get_interpolated_object_lists():
+            self.render_interpolator.begin(objects, alpha)
+        try:
+            self.render()
+        finally:
+            # Restore simulation state so the next tick continues from exact positions
+            self.render_interpolator.end()
+            self.camera_x, self.camera_y = camera_x, camera_y
 
 def main():
     """Entry point of the game."""
@@ -0,0 +1,631 @@
+"""
+Benchmark suite for Kingdom-Pygame.
+Runs fixed-seed scenarios for the systems that have caused frame spikes and
+times every frame: a 500-enemy crowd with separation, shotgun special V-blasts
+into a crowd, the minigun whip trail at full spin, sniper burning trails,
+missile ground fire, map rendering at each zoom level and a 4-client network
+fan-out over loopback. Every scenario reseeds the random streams
+(src/utils/rng.py) and drives its systems with scripted input, so two runs
+do the same work. Headless input recordings can be added as scenarios too.
+
+Each scenario reports mean, p50, p99 and max milliseconds per frame. Results
+are compared with a JSON baseline, and the run fails (exit code 1) when a mean
+or p99 time got slower than the allowed percentage. Thresholds come from the
+command line and can be overridden per scenario in the baseline file.
+
+Usage:
+    python scripts/benchmark_suite.py --save-baseline          # record benchmarks/baseline.json
+    python scripts/benchmark_suite.py                          # compare with it
+    python scripts/benchmark_suite.py --only enemy_crowd,map_zoom_1.0 --frames 600
+    python scripts/benchmark_suite.py --mean-threshold 10 --p99-threshold 25
+    python scripts/benchmark_suite.py --recording recordings/wave1.krec
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import os
+import platform
+import socket
+import sys
+import time
+
+# No window or audio device - must be set before pygame initializes
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame as pg
+
+from src.entities.player import Player
+from src.entities.bullet import BulletManager
+from src.entities.enemy import Enemy, EnemyManager, EnemyType
+from src.systems.collision import CollisionManager
+from src.effects.visual_effects import EffectsManager
+from src.effects.minigun_effects import MinigunEffectsManager
+from src.effects.missile_system import MissileManager
+from src.world.world_manager import WorldManager
+from src.weapons.weapon_manager import weapon_manager
+from src.networking.network_manager import NetworkManager, MessageType
+from src.networking.udp_channel import HOST_PEER_ID
+from src.networking.wire_codec import CODEC_JSON
+from src.utils import log
+from src.utils.rng import rng
+
+SEED = 1
+FRAME_DT = 1.0 / 60          # Scenarios advance one 60 FPS frame per measured frame
+SCREEN_SIZE = (1920, 1080)
+DEFAULT_FRAMES = 300
+DEFAULT_WARMUP = 30
+DEFAULT_BASELINE = os.path.join("benchmarks", "baseline.json")
+DEFAULT_MEAN_THRESHOLD = 10.0  # Percent slower than the baseline mean that fails the run
+DEFAULT_P99_THRESHOLD = 25.0   # Percent slower than the baseline p99 that fails the run
+ZOOM_LEVELS = (0.8, 1.0, 1.5, 2.0)  # Game.min_zoom, default, in between, Game.max_zoom
+
+
+def _spawn_crowd(enemy_manager: EnemyManager, count: int, center, radius: float, arc=None):
+    """Place enemies at seeded random spots in a disc (or a sector of it) around center."""
+    placement = rng.stream("spawns")
+    for _ in range(count):
+        if arc is None:
+            angle = placement.uniform(0, 2 * math.pi)
+        else:
+            angle = math.radians(placement.uniform(arc[0], arc[1]))
+        distance = radius * math.sqrt(placement.uniform(0.05, 1.0))
+        enemy_manager.enemies.append(Enemy(center[0] + math.cos(angle) * distance,
+                                           center[1] + math.sin(angle) * distance,
+                                           EnemyType.BASIC, enemy_manager.cached_sprite_path,
+                                           enemy_id=enemy_manager.generate_enemy_id()))
+
+
+def _fire(bullet_manager: BulletManager, weapon_type: str, x: float, y: float, angle: float,
+          special: bool = False, **extra):
+    """Fire one bullet the way Game.handle_events builds it from the weapon config."""
+    props = weapon_manager.get_bullet_properties(weapon_type)
+    bullet_manager.add_bullet(bullet_manager.create_bullet(
+        x, y, angle,
+        damage=weapon_manager.get_damage(weapon_type),
+        speed=props["speed"],
+        size_multiplier=props["size_multiplier"],
+        color=(255, 0, 0) if special else tuple(props["color"]),
+        penetration=props.get("penetration", 1),
+        shape=props.get("shape", "standard"),
+        range_limit=props.get("range", 800),
+        weapon_type=weapon_type,
+        special_attack=special,
+        **extra))
+
+
+class Scenario:
+    """One benchmark: build the systems in setup(), then advance and draw one frame per frame() call."""
+
+    name = ""
+    description = ""
+    mean_threshold = None  # Per-scenario defaults written into new baselines (None = command line)
+    p99_threshold = None
+
+    def setup(self):
+        """Create the systems under test."""
+
+    def frame(self, index: int):
+        """Run one frame."""
+        raise NotImplementedError
+
+    def teardown(self):
+        """Release sockets, threads and other resources."""
+
+    def get_extra(self) -> dict:
+        """Scenario-specific counters added to the result."""
+        return {}
+
+
+class CombatScenario(Scenario):
+    """Shared setup: a world, a player at the origin, a crowd, bullets, collisions, effects and a screen."""
+
+    crowd = 0
+    crowd_radius = 600.0
+    crowd_arc = None
+    crowd_center = (0.0, 0.0)
+
+    def setup(self):
+        self.world_manager = WorldManager(seed=SEED)
+        self.player = Player(0, 0)
+        self.bullet_manager = BulletManager()
+        self.enemy_manager = EnemyManager(self.world_manager, spawn_point=(0, 0))
+        self.collision_manager = CollisionManager()
+        self.effects_manager = EffectsManager()
+        self.screen = pg.Surface(SCREEN_SIZE)
+        self.offset = (SCREEN_SIZE[0] / 2, SCREEN_SIZE[1] / 2)  # Camera centered on the player
+        self.kills = 0
+        self.refill()
+
+    def refill(self):
+        """Top the crowd back up so every frame has the same load."""
+        missing = self.crowd - len(self.enemy_manager.enemies)
+        if missing > 0:
+            _spawn_crowd(self.enemy_manager, missing, self.crowd_center, self.crowd_radius, self.crowd_arc)
+
+    def collide(self):
+        """Bullet-enemy collisions as the host runs them."""
+        self.kills += self.collision_manager.check_bullet_enemy_collisions(
+            self.bullet_manager, self.enemy_manager, self.player, self.effects_manager, self.world_manager)
+
+    def get_extra(self) -> dict:
+        return {"kills": self.kills, "enemies": len(self.enemy_manager.enemies),
+                "bullets": len(self.bullet_manager.bullets)}
+
+
+class EnemyCrowdScenario(CombatScenario):
+    name = "enemy_crowd"
+    description = "500 enemies converging on the player with bubble separation"
+    crowd = 500
+
+    def frame(self, index: int):
+        game_time = index * FRAME_DT
+        self.enemy_manager.update(FRAME_DT, self.player.pos, game_time, self.bullet_manager)
+        self.player.health = self.player.max_health
+
+
+class ShotgunVBlastScenario(CombatScenario):
+    name = "shotgun_v_blast"
+    description = "Shotgun special volleys into a 300-enemy crowd, V-blasts and their effects drawn"
+    crowd = 300
+    crowd_radius = 900.0
+    crowd_arc = (-30, 30)
+    volley_interval = 10  # Frames between volleys
+
+    def frame(self, index: int):
+        game_time = index * FRAME_DT
+        if index % self.volley_interval == 0:
+            pellets = weapon_manager.get_pellet_count("Shotgun")
+            spread = weapon_manager.get_spread_angle("Shotgun")
+            for i in range(pellets):
+                offset = (i - (pellets - 1) / 2) * (2 * spread / (pellets - 1)) if pellets > 1 else 0
+                _fire(self.bullet_manager, "Shotgun", 30, 0, offset, special=True)
+        self.bullet_manager.update(FRAME_DT, game_time, self.world_manager)
+        self.collide()
+        self.effects_manager.update(FRAME_DT, self.player.pos)
+        self.screen.fill((0, 0, 0))
+        self.effects_manager.render(self.screen, self.offset)
+        self.bullet_manager.render(self.screen, self.offset)
+        self.refill()
+
+
+class MinigunWhipScenario(CombatScenario):
+    name = "minigun_whip"
+    description = "Minigun at full spin sweeping a 200-enemy crowd, whip segments hit-tested and drawn"
+    crowd = 200
+    full_spin_rate = 0.03  # MinigunEffectsManager treats this fire rate as full speed
+
+    def setup(self):
+        super().setup()
+        self.minigun_effects = MinigunEffectsManager(lighting_system=None)
+
+    def frame(self, index: int):
+        game_time = index * FRAME_DT
+        angle = math.degrees(math.sin(game_time * 1.5) * 1.2)  # Sweep back and forth
+        self.player.angle = angle
+        tip = self.player.get_gun_tip_position()
+        if index % 2 == 0:  # About one bullet per full-spin interval
+            _fire(self.bullet_manager, "Minigun", tip.x, tip.y, angle)
+        self.bullet_manager.update(FRAME_DT, game_time, self.world_manager)
+        self.minigun_effects.update(FRAME_DT, True, self.full_spin_rate, (tip.x, tip.y), angle)
+        minigun_bullets = [bullet for bullet in self.bullet_manager.bullets if bullet.weapon_type == "Minigun"]
+        self.minigun_effects.update_whip_trail_with_bullets(minigun_bullets)
+        for enemy in list(self.enemy_manager.enemies):
+            hit, damage, hit_x, hit_y = self.minigun_effects.check_whip_collision(enemy.pos.x, enemy.pos.y, enemy.size)
+            if hit:
+                enemy.take_damage(damage)
+                self.minigun_effects.create_impact_spark(hit_x, hit_y)
+                if not enemy.is_alive():
+                    self.enemy_manager.remove_enemy(enemy)
+                    self.kills += 1
+        self.collide()
+        self.screen.fill((0, 0, 0))
+        self.bullet_manager.render(self.screen, self.offset)
+        self.minigun_effects.render_whip_trail_lines(self.screen, minigun_bullets, self.offset)
+        self.minigun_effects.render_muzzle_flames(self.screen, self.offset)
+        self.refill()
+
+
+class SniperTrailsScenario(CombatScenario):
+    name = "sniper_burning_trails"
+    description = "Sniper special shots leaving burning trails through a 200-enemy crowd"
+    crowd = 200
+    shot_interval = 30  # Frames between shots
+
+    def frame(self, index: int):
+        game_time = index * FRAME_DT
+        if index % self.shot_interval == 0:
+            angle = (index // self.shot_interval) * 37.0 % 360.0  # Fan out around the player
+            _fire(self.bullet_manager, "Sniper", 0, 0, angle, special=True, trail_enabled=True, trail_duration=3.0)
+        self.bullet_manager.update(FRAME_DT, game_time, self.world_manager)
+        for enemy, damage in self.bullet_manager.check_burning_trail_damage(self.enemy_manager.enemies, game_time):
+            enemy.take_damage(damage)
+        self.collide()
+        self.screen.fill((0, 0, 0))
+        self.bullet_manager.render(self.screen, self.offset)
+        self.refill()
+
+    def get_extra(self) -> dict:
+        return dict(super().get_extra(), trails=len(self.bullet_manager.burning_trails))
+
+
+class MissileGroundFireScenario(CombatScenario):
+    name = "missile_ground_fire"
+    description = "Special missiles leaving ground fire around a 150-enemy crowd"
+    crowd = 150
+    launch_interval = 45  # Frames between launches
+
+    def setup(self):
+        super().setup()
+        self.missile_manager = MissileManager()
+
+    def frame(self, index: int):
+        game_time = index * FRAME_DT
+        if index % self.launch_interval == 0:
+            angle = math.radians((index // self.launch_interval) * 53.0)
+            self.missile_manager.fire_missile(0, 0, math.cos(angle) * 350, math.sin(angle) * 350,
+                                              special_attack=True)
+        enemies = self.enemy_manager.enemies
+        self.missile_manager.update(FRAME_DT, enemies)
+        for event in self.missile_manager.check_ground_fire_damage(enemies, game_time):
+            event["enemy"].take_damage(event["damage"])
+        self.screen.fill((0, 0, 0))
+        self.missile_manager.render(self.screen, self.offset)
+
+    def get_extra(self) -> dict:
+        return dict(super().get_extra(), ground_fires=len(self.missile_manager.ground_fires))
+
+
+class MapZoomScenario(Scenario):
+    """World background and map tiles drawn the way Game.render does at one zoom level."""
+
+    def __init__(self, zoom: float):
+        self.zoom = zoom
+        self.name = f"map_zoom_{zoom:.1f}"
+        self.description = f"World background and map tiles at {zoom:.1f}x zoom, camera panning"
+
+    def setup(self):
+        self.world_manager = WorldManager(seed=SEED)
+        self.screen = pg.Surface(SCREEN_SIZE)
+
+    def frame(self, index: int):
+        # Pan in a slow loop so different tiles come into view
+        game_time = index * FRAME_DT
+        camera_x = math.cos(game_time * 0.5) * 1200
+        camera_y = math.sin(game_time * 0.7) * 700
+        if self.zoom != 1.0:
+            surface = pg.Surface((int(SCREEN_SIZE[0] / self.zoom), int(SCREEN_SIZE[1] / self.zoom)))
+        else:
+            surface = self.screen
+        width, height = surface.get_size()
+        self.world_manager.render_world_background(surface, camera_x, camera_y, width, height)
+        self.world_manager.render_map(surface, (width // 2 - camera_x, height // 2 - camera_y))
+        if self.zoom != 1.0:
+            self.screen.blit(pg.transform.scale(surface, SCREEN_SIZE), (0, 0))
+
+
+class NetworkFanoutScenario(Scenario):
+    name = "network_fanout"
+    description = "Host broadcasting 30 enemy updates per frame to 4 clients over loopback"
+    p99_threshold = 50.0  # Thread scheduling makes the tail noisy
+    clients = 4
+    updates_per_frame = 30
+    receive_timeout = 1.0
+
+    def setup(self):
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as probe:
+            probe.bind(("127.0.0.1", 0))
+            port = probe.getsockname()[1]
+        self.host = NetworkManager(is_server=True)
+        if not self.host.start_server("127.0.0.1", port):
+            raise RuntimeError("could not start the benchmark host")
+        self.peers = []
+        self.received = [0] * self.clients
+        for number in range(self.clients):
+            peer = NetworkManager(is_server=False)
+            if not peer.connect_to_server("127.0.0.1", port, f"bench{number}"):
+                raise RuntimeError("could not connect a benchmark client")
+            peer.register_message_handler(MessageType.ENEMY_UPDATE, self._counter(number))
+            self.peers.append(peer)
+
+        # Wait for the codec and the UDP handshake so frames measure steady-state traffic
+        deadline = time.perf_counter() + 5.0
+        while time.perf_counter() < deadline:
+            for peer in self.peers:
+                peer.process_messages()
+            if len(self.host.connected_clients) == self.clients and all(self._ready(peer) for peer in self.peers):
+                break
+            time.sleep(0.01)
+        self.expected = 0
+        self.lost = 0
+        self.enemy_positions = [(rng.stream("spawns").uniform(-1500, 1500), rng.stream("spawns").uniform(-900, 900))
+                                for _ in range(self.updates_per_frame)]
+
+    def _counter(self, number: int):
+        """Handler counting the enemy updates one client received."""
+        def handler(message):
+            self.received[number] += 1
+        return handler
+
+    @staticmethod
+    def _ready(peer: NetworkManager) -> bool:
+        """True once the peer has its codec and, if it has one, a ready UDP channel."""
+        if peer.codec == CODEC_JSON:
+            return False
+        return peer.udp_channel is None or peer.udp_channel.is_ready(HOST_PEER_ID)
+
+    def frame(self, index: int):
+        for number, (x, y) in enumerate(self.enemy_positions):
+            self.host.send_message(MessageType.ENEMY_UPDATE, {
+                "enemy_id": f"enemy_{number}",
+                "position": (x + math.sin(index * 0.1 + number) * 40, y),
+                "velocity": (40.0, 0.0),
+                "health": 60,
+                "max_health": 60,
+                "timestamp": time.time(),
+            })
+        self.expected += self.updates_per_frame
+
+        # The frame ends when every client has processed every update (or the timeout hits)
+        deadline = time.perf_counter() + self.receive_timeout
+        while True:
+            for peer in self.peers:
+                peer.process_messages()
+            if min(self.received) >= self.expected:
+                return
+            if time.perf_counter() > deadline:
+                self.lost += sum(self.expected - count for count in self.received)
+                self.received = [self.expected] * self.clients
+                return
+            time.sleep(0)
+
+    def teardown(self):
+        for peer in self.peers:
+            peer.disconnect()
+        self.host.disconnect()
+
+    def get_extra(self) -> dict:
+        return {"clients": len(self.host.connected_clients), "lost_updates": self.lost}
+
+
+class ReplayScenario(Scenario):
+    """A headless input recording replayed tick by tick (frames are simulation ticks)."""
+
+    def __init__(self, path: str):
+        from src.utils.input_recording import InputPlayback
+        self.path = path
+        self.playback = InputPlayback(path)
+        stem = os.path.splitext(os.path.basename(path))[0]
+        self.name = f"replay_{stem}"
+        self.description = f"Headless replay of {path} ({self.playback.tick_count} ticks)"
+
+    def setup(self):
+        from headless_sim import HeadlessSimulation
+        self.simulation = HeadlessSimulation(seed=self.playback.seed, tick_rate=self.playback.tick_rate,
+                                             replay_path=self.path, **self.playback.options)
+
+    def frame(self, index: int):
+        self.simulation.step()
+
+    def get_extra(self) -> dict:
+        return {"state_hash": self.simulation.get_state_hash()}
+
+
+def build_scenarios(recordings=()) -> list:
+    """All scenarios in run order."""
+    scenarios = [
+        EnemyCrowdScenario(),
+        ShotgunVBlastScenario(),
+        MinigunWhipScenario(),
+        SniperTrailsScenario(),
+        MissileGroundFireScenario(),
+    ]
+    scenarios.extend(MapZoomScenario(zoom) for zoom in ZOOM_LEVELS)
+    scenarios.append(NetworkFanoutScenario())
+    scenarios.extend(ReplayScenario(path) for path in recordings)
+    return scenarios
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def run_scenario(scenario: Scenario, frames: int, warmup: int) -> dict:
+    """Set up a scenario from the fixed seed, warm it up and time each frame."""
+    rng.reseed(SEED)
+    scenario.setup()
+    try:
+        if isinstance(scenario, ReplayScenario):
+            # The whole recording, warm-up included
+            frames = max(1, scenario.playback.tick_count - warmup)
+        for index in range(warmup):
+            scenario.frame(index)
+        gc.collect()
+
+        clock = time.perf_counter
+        times = []
+        for index in range(warmup, warmup + frames):
+            start = clock()
+            scenario.frame(index)
+            times.append(clock() - start)
+        extra = scenario.get_extra()
+    finally:
+        scenario.teardown()
+
+    ordered = sorted(times)
+    return {
+        "description": scenario.description,
+        "frames": frames,
+        "mean_ms": round(sum(times) / len(times) * 1000.0, 4),
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000.0, 4),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000.0, 4),
+        "max_ms": round(ordered[-1] * 1000.0, 4),
+        "extra": extra,
+    }
+
+
+def compare(results: dict, baseline: dict, mean_threshold: float, p99_threshold: float) -> dict:
+    """
+    Compare results with a baseline. Returns {scenario: {"mean_change", "p99_change",
+    "mean_limit", "p99_limit", "regressed"}} for the scenarios the baseline has
+    (or {"skipped": reason} when the runs are not comparable).
+    """
+    comparison = {}
+    for name, result in results.items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        if base["frames"] != result["frames"]:
+            # Effects and trails pile up over a run, so longer runs are slower per frame
+            comparison[name] = {"skipped": f"baseline has {base['frames']} frames", "regressed": False}
+            continue
+        thresholds = base.get("thresholds", {})
+        mean_limit = thresholds.get("mean_pct", mean_threshold)
+        p99_limit = thresholds.get("p99_pct", p99_threshold)
+        mean_change = (result["mean_ms"] / base["mean_ms"] - 1.0) * 100.0 if base["mean_ms"] > 0 else 0.0
+        p99_change = (result["p99_ms"] / base["p99_ms"] - 1.0) * 100.0 if base["p99_ms"] > 0 else 0.0
+        comparison[name] = {
+            "mean_change": round(mean_change, 1),
+            "p99_change": round(p99_change, 1),
+            "mean_limit": mean_limit,
+            "p99_limit": p99_limit,
+            "regressed": mean_change > mean_limit or p99_change > p99_limit,
+        }
+    return comparison
+
+
+def save_baseline(path: str, results: dict, scenarios: list, previous: dict):
+    """Write results as the new baseline, keeping per-scenario thresholds already in it."""
+    defaults = {scenario.name: scenario for scenario in scenarios}
+    entries = {}
+    for name, result in results.items():
+        entry = {key: result[key] for key in ("description", "frames", "mean_ms", "p50_ms", "p99_ms", "max_ms")}
+        thresholds = previous.get("scenarios", {}).get(name, {}).get("thresholds")
+        if thresholds is None:
+            scenario = defaults[name]
+            thresholds = {key: value for key, value in (("mean_pct", scenario.mean_threshold),
+                                                        ("p99_pct", scenario.p99_threshold)) if value is not None}
+        if thresholds:
+            entry["thresholds"] = thresholds
+        entries[name] = entry
+    baseline = {
+        "version": 1,
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "pygame": pg.version.ver,
+        "scenarios": dict(previous.get("scenarios", {}), **entries),
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=2)
+        f.write("\n")
+
+
+def format_results(results: dict, comparison: dict) -> str:
+    """Results table with the change against the baseline."""
+    header = f"{'scenario':<24}{'frames':>7}{'mean ms':>10}{'p50 ms':>9}{'p99 ms':>9}{'max ms':>9}{'mean':>9}{'p99':>9}"
+    lines = [header, "-" * len(header)]
+    for name, result in results.items():
+        line = (f"{name:<24}{result['frames']:>7}{result['mean_ms']:>10.3f}{result['p50_ms']:>9.3f}"
+                f"{result['p99_ms']:>9.3f}{result['max_ms']:>9.3f}")
+        change = comparison.get(name)
+        if change and "skipped" in change:
+            line += f"  not compared: {change['skipped']}"
+        elif change:
+            line += f"{change['mean_change']:>+8.1f}%{change['p99_change']:>+8.1f}%"
+            if change["regressed"]:
+                line += f"  REGRESSION (limits {change['mean_limit']:g}% / {change['p99_limit']:g}%)"
+        else:
+            line += f"{'-':>9}{'-':>9}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the fixed-seed benchmark scenarios and check for regressions.")
+    parser.add_argument("--only", type=str, default=None, help="comma-separated scenario names to run")
+    parser.add_argument("--list", action="store_true", help="list the scenarios and exit")
+    parser.add_argument("--frames", type=int, default=DEFAULT_FRAMES, help="measured frames per scenario")
+    parser.add_argument("--warmup", type=int, default=DEFAULT_WARMUP, help="unmeasured frames before timing")
+    parser.add_argument("--recording", action="append", default=[], metavar="FILE",
+                        help="add a headless input recording as a scenario (repeatable)")
+    parser.add_argument("--baseline", type=str, default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument("--save-baseline", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--mean-threshold", type=float, default=DEFAULT_MEAN_THRESHOLD,
+                        help="allowed mean slowdown in percent")
+    parser.add_argument("--p99-threshold", type=float, default=DEFAULT_P99_THRESHOLD,
+                        help="allowed p99 slowdown in percent")
+    parser.add_argument("--output", type=str, default=None, help="also write the results and comparison as JSON")
+    parser.add_argument("--verbose", action="store_true", help="show game log output")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Entry point of the benchmark suite."""
+    args = parse_args(argv)
+    scenarios = build_scenarios(args.recording)
+    if args.list:
+        for scenario in scenarios:
+            print(f"{scenario.name:<24}{scenario.description}")
+        return 0
+    if args.only:
+        wanted = set(args.only.split(","))
+        unknown = wanted - {scenario.name for scenario in scenarios}
+        if unknown:
+            sys.exit(f"Unknown scenarios: {', '.join(sorted(unknown))} (see --list)")
+        scenarios = [scenario for scenario in scenarios if scenario.name in wanted]
+
+    pg.init()
+    pg.display.set_mode((1, 1))  # Sprite loading needs a display surface for convert_alpha
+    if not args.verbose:
+        log.set_level("", "WARNING")
+
+    results = {}
+    for scenario in scenarios:
+        print(f"Running {scenario.name}...", flush=True)
+        if args.verbose:
+            results[scenario.name] = run_scenario(scenario, args.frames, args.warmup)
+        else:
+            with contextlib.redirect_stdout(io.StringIO()):  # Game systems print freely
+                results[scenario.name] = run_scenario(scenario, args.frames, args.warmup)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    comparison = {} if args.save_baseline else compare(results, baseline, args.mean_threshold, args.p99_threshold)
+
+    print(format_results(results, comparison))
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"results": results, "comparison": comparison}, f, indent=2)
+
+    pg.quit()
+    if args.save_baseline:
+        save_baseline(args.baseline, results, scenarios, baseline)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not baseline:
+        print(f"No baseline at {args.baseline} - run with --save-baseline to create one")
+        return 0
+    regressed = [name for name, change in comparison.items() if change["regressed"]]
+    if regressed:
+        print(f"Regressions: {', '.join(regressed)}")
+        return 1
+    print("No regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Wire codec benchmark for Kingdom-Pygame.
+Compares the JSON and binary codecs on representative game messages:
+bytes on the wire per message and encode/decode time in microseconds.
+
+Usage:
+    python scripts/codec_benchmark.py [--iterations N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.networking.network_manager import MessageType, NetworkMessage
+from src.networking.wire_codec import CODEC_JSON, CODEC_BINARY
+
+
+def build_sample_messages():
+    """Build messages shaped like the ones the game synchronizer sends."""
+    now = time.time()
+    return [
+        NetworkMessage(MessageType.PLAYER_UPDATE, {
+            "player_id": "A1B2C3D4",
+            "position": (1834.625, 972.25),
+            "angle": -37.5,
+            "velocity": (141.42, -141.42),
+            "health": 87,
+            "max_health": 100,
+            "character_id": "Cecil",
+            "weapon_type": "Assault Rifle",
+            "is_dashing": False,
+            "is_alive": True,
+            "player_name": "Player",
+            "animation_state": "idle",
+            "ammo": 24,
+            "burst_gauge": 0.35
+        }, now, "A1B2C3D4"),
+        NetworkMessage(MessageType.ENEMY_UPDATE, {
+            "enemy_id": "enemy_1042",
+            "position": (2210.8, 640.1),
+            "velocity": (-56.2, 80.9),
+            "health": 45,
+            "max_health": 60,
+            "type": "fast",
+            "target_player_id": "A1B2C3D4",
+            "is_alive": True,
+            "wave": 3
+        }, now, "HOST"),
+        NetworkMessage(MessageType.ENEMY_UPDATE, {
+            "enemy_id": "enemy_1042",
+            "position": (2210.8, 640.1),
+            "velocity": (-56.2, 80.9),
+            "health": 45,
+            "max_health": 60,
+            "timestamp": now
+        }, now, "HOST"),
+        NetworkMessage(MessageType.BULLET_HIT, {
+            "position": (2205.0, 644.5),
+            "timestamp": now
+        }, now, "A1B2C3D4"),
+        NetworkMessage(MessageType.WAVE_UPDATE, {
+            "wave_number": 3,
+            "enemies_remaining": 17,
+            "wave_timer": 42.5
+        }, now, "HOST"),
+    ]
+
+
+def measure(message: NetworkMessage, codec: str, iterations: int) -> dict:
+    """Measure frame size and per-message encode/decode time for one codec."""
+    frame = message.to_bytes(codec)
+    payload = frame[4:]  # from_bytes takes the payload without the length prefix
+    encode_seconds = timeit.timeit(lambda: message.to_bytes(codec), number=iterations)
+    decode_seconds = timeit.timeit(lambda: NetworkMessage.from_bytes(payload), number=iterations)
+    return {
+        "bytes": len(frame),
+        "encode_us": encode_seconds / iterations * 1e6,
+        "decode_us": decode_seconds / iterations * 1e6
+    }
+
+
+def main():
+    """Run the benchmark and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark the network wire codecs.")
+    parser.add_argument("--iterations", type=int, default=20000,
+                        help="encode/decode repetitions per message (default: 20000)")
+    args = parser.parse_args()
+
+    header = f"{'message':<16}{'codec':<11}{'bytes':>7}{'encode us':>11}{'decode us':>11}"
+    print(header)
+    print("-" * len(header))
+
+    totals = {CODEC_JSON: 0, CODEC_BINARY: 0}
+    for message in build_sample_messages():
+        label = message.message_type.value
+        for codec in (CODEC_JSON, CODEC_BINARY):
+            result = measure(message, codec, args.iterations)
+            totals[codec] += result["bytes"]
+            print(f"{label:<16}{codec:<11}{result['bytes']:>7}"
+                  f"{result['encode_us']:>11.2f}{result['decode_us']:>11.2f}")
+            label = ""
+
+    saved = 1.0 - totals[CODEC_BINARY] / totals[CODEC_JSON]
+    print("-" * len(header))
+    print(f"Total bytes: json={totals[CODEC_JSON]} binary={totals[CODEC_BINARY]} ({saved:.0%} smaller)")
+
+
+if __name__ == "__main__":
+    main()
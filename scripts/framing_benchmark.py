@@ -0,0 +1,148 @@
+"""
+Framing microbenchmark for Kingdom-Pygame networking.
+Feeds bursts of small length-prefixed frames (binary player updates) to three
+readers and reports the time to drain one burst:
+  - exact:     the old NetworkManager approach (recv exactly 4 bytes, then
+               exactly N bytes, growing a bytes object with data += chunk)
+  - slicing:   the old SecureNetworkManager approach (recv 4096 bytes, append
+               to a bytes buffer and re-slice it after every frame)
+  - reader:    FrameReader (recv_into a preallocated buffer, memoryview frames)
+
+The socket is simulated with its whole burst already buffered, as after a
+network stall, so only the framing work is measured.
+
+Usage:
+    python scripts/framing_benchmark.py [--frames 1000] [--bursts 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.networking.framing import FrameReader
+from src.networking.network_manager import MessageType, NetworkMessage
+from src.networking.wire_codec import CODEC_BINARY
+
+
+class BurstSocket:
+    """Stands in for a socket whose receive buffer already holds a whole burst."""
+
+    def __init__(self, data: bytes):
+        self.data = memoryview(data)
+        self.offset = 0
+
+    def recv(self, size: int) -> bytes:
+        chunk = bytes(self.data[self.offset:self.offset + size])
+        self.offset += len(chunk)
+        return chunk
+
+    def recv_into(self, buffer) -> int:
+        size = min(len(buffer), len(self.data) - self.offset)
+        buffer[:size] = self.data[self.offset:self.offset + size]
+        self.offset += size
+        return size
+
+
+def build_burst(frame_count: int) -> bytes:
+    """Encode frame_count player updates back to back."""
+    frames = []
+    for number in range(frame_count):
+        message = NetworkMessage(MessageType.PLAYER_UPDATE, {
+            "player_id": "A1B2C3D4", "position": (100.0 + number, 200.0), "angle": 45.0,
+            "velocity": (120.0, 0.0), "health": 100, "is_alive": True, "ammo": number % 30
+        }, 1000.0, "A1B2C3D4")
+        frames.append(message.to_bytes(CODEC_BINARY))
+    return b''.join(frames)
+
+
+def drain_exact(sock: BurstSocket, frame_count: int) -> int:
+    """Old NetworkManager._receive_message/_receive_exact."""
+    def receive_exact(num_bytes):
+        data = b''
+        while len(data) < num_bytes:
+            chunk = sock.recv(num_bytes - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    total = 0
+    for _ in range(frame_count):
+        length = int.from_bytes(receive_exact(4), byteorder='big')
+        total += len(receive_exact(length))
+    return total
+
+
+def drain_slicing(sock: BurstSocket, frame_count: int) -> int:
+    """Old SecureNetworkManager._receive_framed_messages."""
+    buffer = b''
+    total = 0
+    count = 0
+    while count < frame_count:
+        data = sock.recv(4096)
+        if not data:
+            break
+        buffer += data
+        while len(buffer) >= 4:
+            length = int.from_bytes(buffer[:4], 'big')
+            if len(buffer) < 4 + length:
+                break
+            total += len(buffer[4:4 + length])
+            buffer = buffer[4 + length:]
+            count += 1
+    return total
+
+
+def drain_reader(sock: BurstSocket, frame_count: int, reader: FrameReader) -> int:
+    """FrameReader: recv_into plus memoryview frames."""
+    total = 0
+    count = 0
+    while count < frame_count:
+        if not reader.recv_from(sock):
+            break
+        for payload in reader.frames():
+            total += len(payload)
+            count += 1
+    return total
+
+
+def main():
+    """Run the benchmark and print per-burst timings."""
+    parser = argparse.ArgumentParser(description="Benchmark length-prefixed frame readers.")
+    parser.add_argument("--frames", type=int, default=1000, help="frames per burst (default: 1000)")
+    parser.add_argument("--bursts", type=int, default=200, help="bursts per reader (default: 200)")
+    args = parser.parse_args()
+
+    burst = build_burst(args.frames)
+    expected = len(burst) - 4 * args.frames
+    reader = FrameReader()
+    readers = [
+        ("exact", lambda sock: drain_exact(sock, args.frames)),
+        ("slicing", lambda sock: drain_slicing(sock, args.frames)),
+        ("reader", lambda sock: drain_reader(sock, args.frames, reader)),
+    ]
+
+    print(f"Burst: {args.frames} frames, {len(burst)} bytes ({len(burst) // args.frames} bytes/frame), "
+          f"{args.bursts} bursts per reader")
+    header = f"{'reader':<10}{'us/burst':>12}{'ns/frame':>12}{'MB/s':>10}"
+    print(header)
+    print("-" * len(header))
+
+    baseline = None
+    for name, drain in readers:
+        if drain(BurstSocket(burst)) != expected:
+            raise RuntimeError(f"{name} reader lost payload bytes")
+        start = time.perf_counter()
+        for _ in range(args.bursts):
+            drain(BurstSocket(burst))
+        elapsed = (time.perf_counter() - start) / args.bursts
+        baseline = baseline or elapsed
+        print(f"{name:<10}{elapsed * 1e6:>12.1f}{elapsed / args.frames * 1e9:>12.0f}"
+              f"{len(burst) / elapsed / 1e6:>10.1f}   ({baseline / elapsed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
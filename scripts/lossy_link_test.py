@@ -0,0 +1,138 @@
+"""
+Lossy link test for the UDP state channel.
+Runs a host and a client channel on localhost, pushes player updates from the
+client through a simulated bad network (loss, latency, jitter, duplication)
+and reports how many updates arrived, how many were recovered from redundant
+copies, and how stale the host's view of the player got, with redundancy off
+and on.
+
+Usage:
+    python scripts/lossy_link_test.py [--loss 0.1] [--latency 60] [--jitter 20]
+                                      [--duplicate 0.02] [--redundancy 2]
+                                      [--rate 60] [--seconds 5]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.networking.lossy_link import LossyLink
+from src.networking.network_manager import MessageType, NetworkMessage
+from src.networking.udp_channel import UdpChannel, HOST_PEER_ID
+from src.networking.wire_codec import CODEC_BINARY
+
+
+def run_trial(args, redundancy: int) -> dict:
+    """Send updates for args.seconds through a lossy link and measure what the host sees."""
+    link = LossyLink(args.loss, args.latency / 1000.0, args.jitter / 1000.0, args.duplicate, seed=args.seed)
+    host = UdpChannel("127.0.0.1", 0, redundancy)
+    client = UdpChannel("127.0.0.1", 0, redundancy, link)
+    try:
+        # Handshake (the token normally comes from the TCP welcome)
+        token = host.add_peer("client")
+        client.connect(HOST_PEER_ID, token, ("127.0.0.1", host.port))
+        deadline = time.perf_counter() + 5.0
+        while not client.is_ready(HOST_PEER_ID) and time.perf_counter() < deadline:
+            client.receive(0.01)
+            host.receive(0.01)
+        if not client.is_ready(HOST_PEER_ID):
+            raise RuntimeError("UDP handshake did not complete (loss too high?)")
+
+        interval = 1.0 / args.rate
+        total = int(args.seconds * args.rate)
+        sent_at = {}
+        applied = []    # (update number, latency)
+        staleness = []  # Age of the newest applied update, sampled every send
+        newest_sent_time = None
+
+        def drain(timeout):
+            nonlocal newest_sent_time
+            for peer_id, sequence, payload in host.receive(timeout):
+                message = NetworkMessage.from_bytes(payload)
+                if not host.accept_message(peer_id, sequence, message.message_type.value,
+                                           message.sender_id, message.data):
+                    continue
+                number = message.data["ammo"]
+                applied.append((number, time.perf_counter() - sent_at[number]))
+                newest_sent_time = sent_at[number]
+
+        start = time.perf_counter()
+        for number in range(total):
+            now = time.perf_counter()
+            sent_at[number] = now
+            message = NetworkMessage(MessageType.PLAYER_UPDATE, {
+                "player_id": "P1", "position": (number * 2.0, 100.0), "angle": 90.0,
+                "velocity": (120.0, 0.0), "health": 100, "ammo": number
+            }, now, "P1")
+            client.send(HOST_PEER_ID, message.to_bytes(CODEC_BINARY)[4:])
+            if newest_sent_time is not None:
+                staleness.append(now - newest_sent_time)
+
+            # Receive until the next send is due
+            next_send = start + (number + 1) * interval
+            while True:
+                client.receive(0.0)  # Flushes the link's delayed datagrams
+                remaining = next_send - time.perf_counter()
+                if remaining <= 0:
+                    break
+                drain(min(remaining, 0.002))
+
+        # Let the last delayed datagrams land
+        settle = time.perf_counter() + (args.latency + args.jitter) / 1000.0 + 0.1
+        while time.perf_counter() < settle:
+            client.receive(0.0)
+            drain(0.002)
+
+        latencies = sorted(latency for _, latency in applied)
+        staleness.sort()
+        return {
+            "sent": total,
+            "applied": len(applied),
+            "recovered": host.recovered,
+            "duplicates": host.duplicates_dropped,
+            "stale": host.stale_dropped,
+            "link_dropped": link.dropped,
+            "bytes": client.bytes_sent,
+            "latency_ms": latencies[len(latencies) // 2] * 1000 if latencies else 0.0,
+            "staleness_p95_ms": staleness[int(len(staleness) * 0.95)] * 1000 if staleness else 0.0,
+            "staleness_max_ms": staleness[-1] * 1000 if staleness else 0.0,
+        }
+    finally:
+        client.close()
+        host.close()
+
+
+def main():
+    """Run the trials and print a comparison."""
+    parser = argparse.ArgumentParser(description="Test the UDP state channel over a simulated lossy link.")
+    parser.add_argument("--loss", type=float, default=0.1, help="datagram loss probability (default: 0.1)")
+    parser.add_argument("--latency", type=float, default=60.0, help="one-way latency in ms (default: 60)")
+    parser.add_argument("--jitter", type=float, default=20.0, help="latency jitter in +- ms (default: 20)")
+    parser.add_argument("--duplicate", type=float, default=0.02, help="duplication probability (default: 0.02)")
+    parser.add_argument("--redundancy", type=int, default=2,
+                        help="earlier updates repeated per datagram in the second trial (default: 2)")
+    parser.add_argument("--rate", type=float, default=60.0, help="updates per second (default: 60)")
+    parser.add_argument("--seconds", type=float, default=5.0, help="length of each trial (default: 5)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the link (default: 1)")
+    args = parser.parse_args()
+
+    print(f"Link: loss={args.loss:.0%} latency={args.latency:.0f}ms jitter=+-{args.jitter:.0f}ms "
+          f"duplicate={args.duplicate:.0%}, {args.rate:.0f} updates/s for {args.seconds:.0f}s")
+    header = (f"{'redundancy':<12}{'applied':>10}{'recovered':>11}{'dups':>7}{'stale':>7}"
+              f"{'bytes':>9}{'latency ms':>12}{'stale p95':>11}{'stale max':>11}")
+    print(header)
+    print("-" * len(header))
+    for redundancy in (0, args.redundancy):
+        result = run_trial(args, redundancy)
+        applied = f"{result['applied']}/{result['sent']}"
+        print(f"{redundancy:<12}{applied:>10}{result['recovered']:>11}{result['duplicates']:>7}"
+              f"{result['stale']:>7}{result['bytes']:>9}{result['latency_ms']:>12.1f}"
+              f"{result['staleness_p95_ms']:>11.1f}{result['staleness_max_ms']:>11.1f}")
+    print("(stale = reordered updates dropped because a newer one was already applied)")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,11 +5,40 @@ Handles Rapture Cores (single currency), collection, drops, and chests.
 
 import pygame as pg
 import math
-import random
 from enum import Enum
 from typing import List, Dict, Tuple, Optional
 from dataclasses import dataclass
 
+# Handle logging import
+try:
+    from src.utils.log import get_logger
+except ImportError:
+    from utils.log import get_logger
+
+logger = get_logger(__name__)
+
+# Handle render queue import for batched core rendering
+try:
+    from src.utils.render_queue import RenderQueue, get_circle_sprite
+except ImportError:
+    from utils.render_queue import RenderQueue, get_circle_sprite
+
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("cores")  # Drops, chest placement and animation phases
+_render_random = rng.stream("render")  # Draw-time sparkle and jitter
+
+# Render queue layers for cores (bodies drawn normally, glows added on top)
+CORE_BODY_LAYER = "core_bodies"
+CORE_GLOW_LAYER = "core_glows"
+
+# Cached additive glow surfaces, keyed by (glow size, alpha)
+_core_glow_surfaces: Dict[Tuple[int, int], pg.Surface] = {}
+
 class CoreType(Enum):
     """Single core type - Rapture Core"""
     RAPTURE_CORE = "rapture_core"
@@ -46,8 +75,8 @@ class RaptureCore:
         self.being_collected = False  # Animation state for collection
         self.collection_timer = 0.0   # Timer for collection animation
         self.collection_duration = 0.3  # How long the collection animation takes
-        self.glow_phase = random.uniform(0, math.pi * 2)  # For pulsing glow effect
-        self.float_phase = random.uniform(0, math.pi * 2)  # For floating animation
+        self.glow_phase = _random.uniform(0, math.pi * 2)  # For pulsing glow effect
+        self.float_phase = _random.uniform(0, math.pi * 2)  # For floating animation
         self.being_attracted = False  # Whether core is being magnetically pulled
         
     def update(self, dt: float, player_pos: pg.Vector2 = None):
@@ -108,6 +137,14 @@ class RaptureCore:
         
     def render(self, screen: pg.Surface, offset: Tuple[int, int]):
         """Render the Rapture Core as a simple red eye with inner glow."""
+        render_queue = RenderQueue()
+        render_queue.begin(screen)
+        self.submit_render(render_queue, offset)
+        render_queue.flush(screen, CORE_BODY_LAYER)
+        render_queue.flush(screen, CORE_GLOW_LAYER, pg.BLEND_ADD)
+    
+    def submit_render(self, render_queue: RenderQueue, offset: Tuple[int, int]):
+        """Queue the core's eye sprites and additive glow for batched rendering."""
         if self.collected and not self.being_collected:
             return
             
@@ -121,47 +158,57 @@ class RaptureCore:
         render_x = int(self.pos.x + offset[0])
         render_y = int(self.pos.y + offset[1] + float_offset)
         
-        # Only render if on screen
-        if -100 <= render_x <= screen.get_width() + 100 and -100 <= render_y <= screen.get_height() + 100:
-            # Scale down the core during collection
-            size_multiplier = 1.0 - (collection_progress * 0.8)  # Shrink to 20% of original size
-            outer_size = int(CORE_INFO.size * 1.5 * size_multiplier)  # Outer red circle
-            inner_size = int(CORE_INFO.size * 0.6 * size_multiplier)  # Inner glow
-            
-            # Don't render if too small
-            if outer_size < 1:
-                return
-            
-            # Pulsing intensity for the inner glow
-            pulse_intensity = 0.6 + 0.4 * math.sin(self.glow_phase)
-            attraction_boost = 1.5 if self.being_attracted else 1.0
-            glow_intensity = pulse_intensity * attraction_boost
-            
-            # Collection animation effects
-            if self.being_collected:
-                glow_intensity *= (1.0 + collection_progress * 2.0)  # Bright flash during collection
-                # Add screen shake effect
-                shake_amount = collection_progress * 2
-                render_x += int(math.sin(self.collection_timer * 30) * shake_amount)
-                render_y += int(math.cos(self.collection_timer * 30) * shake_amount)
-            
-            # Draw outer red circle (eye outline)
-            pg.draw.circle(screen, (150, 20, 20), (render_x, render_y), outer_size)
-            
-            # Draw inner glowing center (pupil/iris)
-            if inner_size > 0:
-                inner_alpha = int(180 * glow_intensity)
-                inner_color = (255, min(255, 40 + int(inner_alpha * 0.3)), 40)
-                pg.draw.circle(screen, inner_color, (render_x, render_y), inner_size)
-                
-            # Add a subtle outer glow for the eye effect
-            if outer_size > 2:
-                glow_size = outer_size + 2
-                glow_surf = pg.Surface((glow_size * 2, glow_size * 2), pg.SRCALPHA)
-                glow_alpha = int(40 * glow_intensity * (1.0 - collection_progress * 0.5))
-                glow_color = (200, 50, 50, max(1, glow_alpha))
-                pg.draw.circle(glow_surf, glow_color, (glow_size, glow_size), glow_size)
-                screen.blit(glow_surf, (render_x - glow_size, render_y - glow_size), special_flags=pg.BLEND_ADD)
+        # Scale down the core during collection
+        size_multiplier = 1.0 - (collection_progress * 0.8)  # Shrink to 20% of original size
+        outer_size = int(CORE_INFO.size * 1.5 * size_multiplier)  # Outer red circle
+        inner_size = int(CORE_INFO.size * 0.6 * size_multiplier)  # Inner glow
+        
+        # Don't render if too small
+        if outer_size < 1:
+            return
+        
+        # Pulsing intensity for the inner glow
+        pulse_intensity = 0.6 + 0.4 * math.sin(self.glow_phase)
+        attraction_boost = 1.5 if self.being_attracted else 1.0
+        glow_intensity = pulse_intensity * attraction_boost
+        
+        # Collection animation effects
+        if self.being_collected:
+            glow_intensity *= (1.0 + collection_progress * 2.0)  # Bright flash during collection
+            # Add screen shake effect
+            shake_amount = collection_progress * 2
+            render_x += int(math.sin(self.collection_timer * 30) * shake_amount)
+            render_y += int(math.cos(self.collection_timer * 30) * shake_amount)
+        
+        # Outer red circle (eye outline)
+        render_queue.submit(CORE_BODY_LAYER, get_circle_sprite((150, 20, 20), outer_size),
+                            (render_x - outer_size, render_y - outer_size))
+        
+        # Inner glowing center (pupil/iris)
+        if inner_size > 0:
+            inner_alpha = int(180 * glow_intensity)
+            inner_color = (255, min(255, 40 + int(inner_alpha * 0.3)), 40)
+            render_queue.submit(CORE_BODY_LAYER, get_circle_sprite(inner_color, inner_size),
+                                (render_x - inner_size, render_y - inner_size))
+            
+        # Add a subtle outer glow for the eye effect
+        if outer_size > 2:
+            glow_size = outer_size + 2
+            glow_alpha = int(40 * glow_intensity * (1.0 - collection_progress * 0.5))
+            render_queue.submit(CORE_GLOW_LAYER, self._get_glow_surface(glow_size, max(1, glow_alpha)),
+                                (render_x - glow_size, render_y - glow_size))
+    
+    @staticmethod
+    def _get_glow_surface(glow_size: int, glow_alpha: int) -> pg.Surface:
+        """Get a cached glow circle surface for additive blending."""
+        key = (glow_size, glow_alpha)
+        glow_surf = _core_glow_surfaces.get(key)
+        if glow_surf is None:
+            glow_surf = pg.Surface((glow_size * 2, glow_size * 2), pg.SRCALPHA)
+            pg.draw.circle(glow_surf, (200, 50, 50, glow_alpha), (glow_size, glow_size), glow_size)
+            _core_glow_surfaces[key] = glow_surf
+        return glow_surf
+
 class CoreChest:
     """A rare chest containing Rapture Cores."""
     
@@ -172,7 +219,7 @@ class CoreChest:
         self.collection_radius = 100  # Reasonable chest opening range
         self.opened = False
         self.size = 60  # Much larger chest size
-        self.glow_phase = random.uniform(0, math.pi * 2)  # Glowing animation
+        self.glow_phase = _random.uniform(0, math.pi * 2)  # Glowing animation
         self.health = 50  # Chest health - must be shot to open
         self.max_health = 50
         self.exploding = False
@@ -203,7 +250,7 @@ class CoreChest:
                 # Create cores that will explode outward
                 for i in range(self.core_amount):
                     angle = (i / self.core_amount) * math.pi * 2  # Distribute evenly around circle
-                    distance = random.uniform(50, 120)  # Random distance from chest
+                    distance = _random.uniform(50, 120)  # Random distance from chest
                     
                     core_x = self.pos.x + math.cos(angle) * distance
                     core_y = self.pos.y + math.sin(angle) * distance
@@ -315,15 +362,15 @@ class CoreChest:
             pg.draw.circle(screen, (0, 0, 0), (render_x, render_y), 6)
             
             # Add sparkle effects around the chest
-            if random.random() < 0.4:  # 40% chance for sparkles
-                sparkle_count = random.randint(3, 8)
+            if _render_random.random() < 0.4:  # 40% chance for sparkles
+                sparkle_count = _render_random.randint(3, 8)
                 for _ in range(sparkle_count):
-                    sparkle_angle = random.uniform(0, math.pi * 2)
-                    sparkle_distance = random.uniform(self.size * 0.8, self.size * 1.5)
+                    sparkle_angle = _render_random.uniform(0, math.pi * 2)
+                    sparkle_distance = _render_random.uniform(self.size * 0.8, self.size * 1.5)
                     sparkle_x = render_x + math.cos(sparkle_angle) * sparkle_distance
                     sparkle_y = render_y + math.sin(sparkle_angle) * sparkle_distance
-                    sparkle_color = (255, 255, random.randint(100, 255))  # Golden sparkles
-                    sparkle_size = random.randint(2, 4)
+                    sparkle_color = (255, 255, _render_random.randint(100, 255))  # Golden sparkles
+                    sparkle_size = _render_random.randint(2, 4)
                     pg.draw.circle(screen, sparkle_color, (int(sparkle_x), int(sparkle_y)), sparkle_size)
 
 class CoreManager:
@@ -335,6 +382,7 @@ class CoreManager:
         self.chests: List[CoreChest] = []
         self.player_cores = 0  # Total cores collected
         self.cores_per_chunk = 1  # Very rare - only 1 chest per chunk sometimes
+        self.render_queue = RenderQueue(cull_margin=100)  # Batched core rendering
         
     def clear_all_cores(self):
         """Clear all cores and chests (used when starting a new level)."""
@@ -355,11 +403,11 @@ class CoreManager:
         
         for _ in range(num_chests):
             # Random position within region
-            chest_x = random.uniform(min_x + 200, max_x - 200)  # Stay away from edges
-            chest_y = random.uniform(min_y + 200, max_y - 200)
+            chest_x = _random.uniform(min_x + 200, max_x - 200)  # Stay away from edges
+            chest_y = _random.uniform(min_y + 200, max_y - 200)
             
             # More cores per chest since there are fewer chests
-            core_amount = random.randint(8, 15)  # More cores per chest in level system
+            core_amount = _random.randint(8, 15)  # More cores per chest in level system
             
             chest = CoreChest(chest_x, chest_y, core_amount)
             self.chests.append(chest)
@@ -370,13 +418,13 @@ class CoreManager:
         # Much rarer chest generation - only in high danger areas
         chest_chance = 0.02 + (danger_level * 0.01)  # 2-7% chance per chunk (much rarer)
         
-        if random.random() < chest_chance:
+        if _random.random() < chest_chance:
             # Place one chest in this chunk, more spread out
-            chest_x = chunk_x + random.randint(400, chunk_size - 400)  # More spread out
-            chest_y = chunk_y + random.randint(400, chunk_size - 400)
+            chest_x = chunk_x + _random.randint(400, chunk_size - 400)  # More spread out
+            chest_y = chunk_y + _random.randint(400, chunk_size - 400)
             
             # More cores in dangerous biomes and rarer chests
-            core_amount = random.randint(3, 5 + danger_level * 2)  # 3-15 cores per chest
+            core_amount = _random.randint(3, 5 + danger_level * 2)  # 3-15 cores per chest
             
             chest = CoreChest(chest_x, chest_y, core_amount)
             self.chests.append(chest)
@@ -387,17 +435,15 @@ class CoreManager:
         # Higher drop chance based on enemy difficulty
         drop_chance = 0.4 + (enemy_danger_level * 0.15) + (enemy_type_multiplier * 0.1)  # Much higher chance
         
-        print(f"DEBUG: Enemy died at {enemy_pos}, drop chance: {drop_chance:.2f}")  # Debug print
-        
-        if random.random() < drop_chance:
+        if _random.random() < drop_chance:
             # Number of cores based on enemy strength
-            core_count = random.randint(1, max(1, enemy_danger_level))
-            print(f"DEBUG: Dropping {core_count} cores!")  # Debug print
+            core_count = _random.randint(1, max(1, enemy_danger_level))
+            logger.debug("Enemy died at %s (drop chance %.2f): dropping %d cores", enemy_pos, drop_chance, core_count)
             
             # Drop cores near enemy position with some spread
             for _ in range(core_count):
-                drop_x = enemy_pos.x + random.randint(-30, 30)
-                drop_y = enemy_pos.y + random.randint(-30, 30)
+                drop_x = enemy_pos.x + _random.randint(-30, 30)
+                drop_y = enemy_pos.y + _random.randint(-30, 30)
                 core = RaptureCore(drop_x, drop_y, 1)
                 self.cores.append(core)
                 
@@ -409,7 +455,7 @@ class CoreManager:
                         "core_id": f"core_{drop_x}_{drop_y}_{core_count}"
                     })
         else:
-            print("DEBUG: No core dropped")  # Debug print
+            logger.debug("Enemy died at %s (drop chance %.2f): no core dropped", enemy_pos, drop_chance)
     
     def add_network_core(self, position: tuple, value: int):
         """Add a core from network synchronization."""
@@ -486,9 +532,13 @@ class CoreManager:
         for chest in self.chests:
             chest.render(screen, world_offset)
             
-        # Render cores
+        # Render cores in two batched passes: eye sprites, then additive glows
+        render_queue = self.render_queue
+        render_queue.begin(screen)
         for core in self.cores:
-            core.render(screen, world_offset)
+            core.submit_render(render_queue, world_offset)
+        render_queue.flush(screen, CORE_BODY_LAYER)
+        render_queue.flush(screen, CORE_GLOW_LAYER, pg.BLEND_ADD)
             
     def get_player_cores(self) -> int:
         """Get total cores collected by player."""
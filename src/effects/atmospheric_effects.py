@@ -5,10 +5,17 @@ similar to how enemies work in the game.
 """
 
 import pygame as pg
-import random
 import math
 from typing import List, Tuple, Dict, Any, Optional
 
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("atmosphere")  # Weather particles and lightning
+
 class Particle:
     """A single atmospheric particle with fixed world coordinates."""
     
@@ -19,39 +26,39 @@ class Particle:
         self.created_time = pg.time.get_ticks() / 1000.0
         
         if particle_type == "rain":
-            self.speed_y = random.uniform(400, 800)  # Pixels per second downward
-            self.speed_x = random.uniform(-50, 50)   # Slight horizontal drift
-            self.width = random.randint(2, 4)
-            self.height = random.randint(15, 25)
-            self.color = random.choice([
+            self.speed_y = _random.uniform(400, 800)  # Pixels per second downward
+            self.speed_x = _random.uniform(-50, 50)   # Slight horizontal drift
+            self.width = _random.randint(2, 4)
+            self.height = _random.randint(15, 25)
+            self.color = _random.choice([
                 (180, 200, 255),
                 (160, 180, 255),
                 (200, 220, 255)
             ])
             
         elif particle_type == "snow":
-            self.speed_y = random.uniform(60, 120)   # Slower falling
-            self.speed_x = random.uniform(-80, 80)   # More horizontal drift
-            self.size = random.randint(3, 8)
-            self.color = random.choice([
+            self.speed_y = _random.uniform(60, 120)   # Slower falling
+            self.speed_x = _random.uniform(-80, 80)   # More horizontal drift
+            self.size = _random.randint(3, 8)
+            self.color = _random.choice([
                 (255, 255, 255),
                 (240, 240, 255),
                 (220, 220, 240)
             ])
             
         elif particle_type == "cherry_blossom":
-            self.speed_y = random.uniform(40, 100)   # Slow falling
-            self.speed_x = random.uniform(-120, 120) # Wide drift
-            self.size = random.randint(5, 11)  # Increased by 25% (was 4-9, now 5-11)
-            self.color = random.choice([
+            self.speed_y = _random.uniform(40, 100)   # Slow falling
+            self.speed_x = _random.uniform(-120, 120) # Wide drift
+            self.size = _random.randint(5, 11)  # Increased by 25% (was 4-9, now 5-11)
+            self.color = _random.choice([
                 (255, 182, 193),  # Light pink
                 (255, 192, 203),  # Pink
                 (255, 174, 185),  # Rose pink
                 (255, 160, 180),  # Deeper pink
                 (240, 170, 190)   # Soft pink
             ])
-            self.rotation = random.uniform(0, 2 * math.pi)
-            self.rotation_speed = random.uniform(-2, 2)  # Radians per second
+            self.rotation = _random.uniform(0, 2 * math.pi)
+            self.rotation_speed = _random.uniform(-2, 2)  # Radians per second
     
     def update(self, dt: float, world_bounds: Tuple[int, int], player_pos=None):
         """Update particle position in world space - they should fall naturally."""
@@ -71,11 +78,11 @@ class Particle:
         # If particle falls below world, reset to top with random X position across entire world
         if self.world_y > max_y + 100:
             # Respawn at top of world with random X position across entire world width
-            self.world_x = random.uniform(min_x, max_x)
-            self.world_y = random.uniform(min_y - 200, min_y - 100)  # Spawn above world with variation
+            self.world_x = _random.uniform(min_x, max_x)
+            self.world_y = _random.uniform(min_y - 200, min_y - 100)  # Spawn above world with variation
             
             # Debug: Print respawn info occasionally (reduced frequency for performance)
-            if random.random() < 0.002:  # 0.2% chance (reduced from 0.5%)
+            if _random.random() < 0.002:  # 0.2% chance (reduced from 0.5%)
                 print(f"Particle respawned: ({self.world_x:.0f}, {self.world_y:.0f}), type: {self.type}")
             
         # Keep particles within world bounds - don't wrap, just constrain
@@ -242,7 +249,7 @@ class AtmosphericEffects:
     def _play_thunder_sound(self):
         """Play a random thunder sound effect."""
         if self.audio_manager:
-            thunder_sound = random.choice(self.thunder_sounds)
+            thunder_sound = _random.choice(self.thunder_sounds)
             self.audio_manager.play_sound(thunder_sound)
             print(f"Playing thunder: {thunder_sound}")
 
@@ -255,8 +262,8 @@ class AtmosphericEffects:
         
         for _ in range(count):
             # Distribute particles randomly across the entire world
-            world_x = random.uniform(min_x, max_x)
-            world_y = random.uniform(min_y, max_y)
+            world_x = _random.uniform(min_x, max_x)
+            world_y = _random.uniform(min_y, max_y)
             
             particle = Particle(world_x, world_y, particle_type)
             self.particles.append(particle)
@@ -289,8 +296,8 @@ class AtmosphericEffects:
         # Start lightning flash
         if self.lightning_timer >= self.next_lightning_time and not self.lightning_active:
             self.lightning_active = True
-            self.lightning_duration = random.uniform(0.1, 0.2)  # Flash duration
-            self.next_lightning_time = self.lightning_timer + random.uniform(5.0, 12.0)
+            self.lightning_duration = _random.uniform(0.1, 0.2)  # Flash duration
+            self.next_lightning_time = self.lightning_timer + _random.uniform(5.0, 12.0)
             print("Lightning flash!")
             
             # Play thunder sound with the lightning flash
@@ -374,5 +381,5 @@ class AtmosphericEffects:
     def set_random_atmosphere(self, player_pos=None):
         """Set a random atmospheric effect."""
         atmosphere_types = ["none", "rain", "snow", "cherry_blossom"]
-        selected = random.choice(atmosphere_types)
+        selected = _random.choice(atmosphere_types)
         self.set_atmosphere(selected, player_pos)
\ No newline at end of file
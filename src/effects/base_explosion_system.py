@@ -5,11 +5,20 @@ Handles simple particle explosions, complex multi-phase explosions, and weapon-s
 
 import pygame as pg
 import math
-import random
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Dict, Any, Optional
 from enum import Enum
 
+# Handle seeded random stream and object pool imports
+try:
+    from src.utils.rng import rng
+    from src.utils.object_pool import ObjectPool, swap_remove
+except ImportError:
+    from utils.rng import rng
+    from utils.object_pool import ObjectPool, swap_remove
+
+_random = rng.stream("effects")  # Explosion particles
+
 
 class ExplosionPhase(Enum):
     """Phases of a complex explosion."""
@@ -21,15 +30,24 @@ class ExplosionPhase(Enum):
 
 
 class BaseExplosion(ABC):
-    """Abstract base class for all explosion effects."""
+    """
+    Abstract base class for all explosion effects.
+    Explosions are pooled by ExplosionManager: a subclass's reset() takes its
+    constructor arguments, sets its own fields and ends with _start().
+    """
     
     def __init__(self, x: float, y: float, explosion_type: str):
+        self.particles = []
+        self._start(x, y, explosion_type)
+    
+    def _start(self, x: float, y: float, explosion_type: str):
+        """(Re)start the explosion at a position with fresh particles."""
         self.x = x
         self.y = y
         self.explosion_type = explosion_type
         self.age = 0.0
         self.max_lifetime = self._get_lifetime()
-        self.particles = []
+        self.particles.clear()
         self.is_alive = True
         
         # Generate initial particles
@@ -62,10 +80,17 @@ class SimpleExplosion(BaseExplosion):
     def __init__(self, x: float, y: float, explosion_type: str = "basic",
                  color: Tuple[int, int, int] = (255, 200, 100),
                  particle_count: int = 15, speed: float = 200):
+        self.particles = []
+        self.reset(x, y, explosion_type, color, particle_count, speed)
+    
+    def reset(self, x: float, y: float, explosion_type: str = "basic",
+              color: Tuple[int, int, int] = (255, 200, 100),
+              particle_count: int = 15, speed: float = 200):
+        """Restart a recycled explosion."""
         self.color = color
         self.particle_count = particle_count
         self.speed = speed
-        super().__init__(x, y, explosion_type)
+        self._start(x, y, explosion_type)
     
     def _get_lifetime(self) -> float:
         type_lifetimes = {
@@ -80,8 +105,8 @@ class SimpleExplosion(BaseExplosion):
     def _generate_particles(self):
         """Generate simple explosion particles."""
         for _ in range(self.particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed_variation = random.uniform(0.5, 1.5)
+            angle = _random.uniform(0, 2 * math.pi)
+            speed_variation = _random.uniform(0.5, 1.5)
             velocity = pg.Vector2(
                 math.cos(angle) * self.speed * speed_variation,
                 math.sin(angle) * self.speed * speed_variation
@@ -90,10 +115,10 @@ class SimpleExplosion(BaseExplosion):
             particle = {
                 'pos': pg.Vector2(self.x, self.y),
                 'velocity': velocity,
-                'size': random.uniform(2, 6),
-                'initial_size': random.uniform(2, 6),
-                'life': random.uniform(0.3, 0.8),
-                'initial_life': random.uniform(0.3, 0.8),
+                'size': _random.uniform(2, 6),
+                'initial_size': _random.uniform(2, 6),
+                'life': _random.uniform(0.3, 0.8),
+                'initial_life': _random.uniform(0.3, 0.8),
                 'color': self.color
             }
             self.particles.append(particle)
@@ -102,17 +127,15 @@ class SimpleExplosion(BaseExplosion):
         """Update simple explosion particles."""
         self.age += dt
         
-        particles_to_remove = []
-        for particle in self.particles:
+        particles = self.particles
+        for i in range(len(particles) - 1, -1, -1):
+            particle = particles[i]
             particle['pos'] += particle['velocity'] * dt
             particle['life'] -= dt
             particle['velocity'] *= 0.95  # Friction
             
             if particle['life'] <= 0:
-                particles_to_remove.append(particle)
-        
-        for particle in particles_to_remove:
-            self.particles.remove(particle)
+                swap_remove(particles, i)
         
         # Remove explosion when all particles are gone or max lifetime reached
         self.is_alive = len(self.particles) > 0 and self.age < self.max_lifetime
@@ -149,11 +172,6 @@ class ComplexExplosion(BaseExplosion):
     
     def __init__(self, x: float, y: float, explosion_type: str = "normal",
                  radius: float = 100, damage: int = 50):
-        self.radius = radius
-        self.damage = damage
-        self.current_phase = ExplosionPhase.FLASH
-        self.phase_progress = 0.0
-        
         # Phase timings (as ratios of total lifetime)
         self.phase_timings = {
             ExplosionPhase.FLASH: 0.1,      # 10% of lifetime
@@ -161,8 +179,17 @@ class ComplexExplosion(BaseExplosion):
             ExplosionPhase.PEAK: 0.3,        # 30% of lifetime
             ExplosionPhase.FADE: 0.3         # 30% of lifetime
         }
-        
-        super().__init__(x, y, explosion_type)
+        self.particles = []
+        self.reset(x, y, explosion_type, radius, damage)
+    
+    def reset(self, x: float, y: float, explosion_type: str = "normal",
+              radius: float = 100, damage: int = 50):
+        """Restart a recycled explosion from its flash phase."""
+        self.radius = radius
+        self.damage = damage
+        self.current_phase = ExplosionPhase.FLASH
+        self.phase_progress = 0.0
+        self._start(x, y, explosion_type)
     
     def _get_lifetime(self) -> float:
         type_lifetimes = {
@@ -179,9 +206,9 @@ class ComplexExplosion(BaseExplosion):
         particle_count = int(self.radius / 3)  # Scale with explosion size
         
         for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.radius * 1.5)
-            speed = random.uniform(50, 200)
+            angle = _random.uniform(0, 2 * math.pi)
+            distance = _random.uniform(0, self.radius * 1.5)
+            speed = _random.uniform(50, 200)
             
             particle = {
                 'pos': pg.Vector2(self.x, self.y),
@@ -189,10 +216,10 @@ class ComplexExplosion(BaseExplosion):
                     math.cos(angle) * speed,
                     math.sin(angle) * speed
                 ),
-                'size': random.uniform(1, 4),
-                'life': random.uniform(0.5, 1.0),
-                'initial_life': random.uniform(0.5, 1.0),
-                'color': random.choice([
+                'size': _random.uniform(1, 4),
+                'life': _random.uniform(0.5, 1.0),
+                'initial_life': _random.uniform(0.5, 1.0),
+                'color': _random.choice([
                     (255, 255, 150), (255, 200, 100), (255, 150, 50), (255, 100, 0)
                 ])
             }
@@ -227,18 +254,16 @@ class ComplexExplosion(BaseExplosion):
         else:
             self.current_phase = ExplosionPhase.COMPLETE
         
-        # Update particles
-        particles_to_remove = []
-        for particle in self.particles:
+        # Update particles (backwards, so swap-remove only pulls in updated ones)
+        particles = self.particles
+        for i in range(len(particles) - 1, -1, -1):
+            particle = particles[i]
             particle['pos'] += particle['velocity'] * dt
             particle['life'] -= dt
             particle['velocity'] *= 0.98  # Light friction
             
             if particle['life'] <= 0:
-                particles_to_remove.append(particle)
-        
-        for particle in particles_to_remove:
-            self.particles.remove(particle)
+                swap_remove(particles, i)
         
         self.is_alive = self.current_phase != ExplosionPhase.COMPLETE
         return not self.is_alive
@@ -354,15 +379,20 @@ class WeaponSpecificExplosion(SimpleExplosion):
     """Explosion effects tailored for specific weapon types."""
     
     def __init__(self, x: float, y: float, weapon_type: str):
+        self.particles = []
+        self.reset(x, y, weapon_type)
+    
+    def reset(self, x: float, y: float, weapon_type: str):
+        """Restart a recycled explosion for a (possibly different) weapon."""
         self.weapon_type = weapon_type
         
         # Get weapon-specific properties
         props = self._get_weapon_explosion_properties()
         
-        super().__init__(x, y, weapon_type, 
-                        color=props['color'],
-                        particle_count=props['particle_count'],
-                        speed=props['speed'])
+        super().reset(x, y, weapon_type, 
+                      color=props['color'],
+                      particle_count=props['particle_count'],
+                      speed=props['speed'])
     
     def _get_weapon_explosion_properties(self) -> Dict[str, Any]:
         """Get explosion properties based on weapon type."""
@@ -411,32 +441,41 @@ class ExplosionManager:
     
     def __init__(self):
         self.explosions = []
+        # One free list per explosion class; all live explosions share self.explosions
+        self.pools = {
+            explosion_class: ObjectPool(explosion_class, max_free=64)
+            for explosion_class in (SimpleExplosion, ComplexExplosion, WeaponSpecificExplosion)
+        }
     
     def create_simple_explosion(self, x: float, y: float, explosion_type: str = "basic",
                                color: Tuple[int, int, int] = (255, 200, 100),
                                particle_count: int = 15, speed: float = 200):
         """Create a simple particle explosion."""
-        explosion = SimpleExplosion(x, y, explosion_type, color, particle_count, speed)
+        explosion = self.pools[SimpleExplosion].obtain(x, y, explosion_type, color, particle_count, speed)
         self.explosions.append(explosion)
         return explosion
     
     def create_complex_explosion(self, x: float, y: float, explosion_type: str = "normal",
                                 radius: float = 100, damage: int = 50):
         """Create a complex multi-phase explosion."""
-        explosion = ComplexExplosion(x, y, explosion_type, radius, damage)
+        explosion = self.pools[ComplexExplosion].obtain(x, y, explosion_type, radius, damage)
         self.explosions.append(explosion)
         return explosion
     
     def create_weapon_explosion(self, x: float, y: float, weapon_type: str):
         """Create a weapon-specific explosion effect."""
-        explosion = WeaponSpecificExplosion(x, y, weapon_type)
+        explosion = self.pools[WeaponSpecificExplosion].obtain(x, y, weapon_type)
         self.explosions.append(explosion)
         return explosion
     
     def update(self, dt: float):
-        """Update all explosions."""
-        self.explosions = [explosion for explosion in self.explosions 
-                          if not explosion.update(dt)]
+        """Update all explosions and recycle finished ones."""
+        explosions = self.explosions
+        for i in range(len(explosions) - 1, -1, -1):
+            explosion = explosions[i]
+            if explosion.update(dt):
+                swap_remove(explosions, i)
+                self.pools[type(explosion)].recycle(explosion)
     
     def render(self, screen: pg.Surface, offset: Tuple[float, float] = (0, 0)):
         """Render all explosions."""
@@ -445,6 +484,8 @@ class ExplosionManager:
     
     def clear_explosions(self):
         """Clear all active explosions."""
+        for explosion in self.explosions:
+            self.pools[type(explosion)].recycle(explosion)
         self.explosions.clear()
     
     def get_explosion_count(self) -> int:
@@ -5,10 +5,15 @@ Provides a unified interface for different types of particles (sparks, debris, e
 
 import pygame as pg
 import math
-import random
 from abc import ABC, abstractmethod
 from typing import List, Tuple, Dict, Any
 
+from ..utils.object_pool import ObjectPool
+from ..utils.render_queue import get_circle_sprite, get_faded_circle_sprite
+from ..utils.rng import rng
+
+_random = rng.stream("effects")  # Particle spread, speed and lifetime
+
 
 class Particle:
     """Individual particle with physics and rendering."""
@@ -17,10 +22,19 @@ class Particle:
                  color: Tuple[int, int, int] = (255, 255, 255), size: float = 3.0, 
                  lifetime: float = 1.0, particle_type: str = "spark"):
         """Initialize a particle."""
-        self.pos = pg.Vector2(x, y)
-        self.velocity = pg.Vector2(velocity_x, velocity_y)
+        self.pos = pg.Vector2()
+        self.velocity = pg.Vector2()
+        self.reset(x, y, velocity_x, velocity_y, color, size, lifetime, particle_type)
+    
+    def reset(self, x: float, y: float, velocity_x: float = 0, velocity_y: float = 0, 
+              color: Tuple[int, int, int] = (255, 255, 255), size: float = 3.0, 
+              lifetime: float = 1.0, particle_type: str = "spark"):
+        """Re-emit a recycled particle with fresh properties."""
+        self.pos.update(x, y)
+        self.velocity.update(velocity_x, velocity_y)
         self.color = color
-        self.initial_color = color
+        self.initial_color = tuple(color)  # Hashable sprite cache key
+        self.fade = 1.0
         self.size = size
         self.initial_size = size
         self.age = 0.0
@@ -60,6 +74,7 @@ class Particle:
             
         # Update visual properties
         fade_factor = 1.0 - progress
+        self.fade = fade_factor
         self.alpha = int(255 * fade_factor)
         self.size = max(0.5, self.initial_size * fade_factor)
         
@@ -100,6 +115,26 @@ class Particle:
                 # Default circular particle
                 pg.draw.circle(screen, self.color, (render_x, render_y), particle_size)
     
+    def add_circle_blits(self, blits: list, x: int, y: int, size: int):
+        """
+        Append the cached circle sprites that draw a spark, impact or default particle.
+        Matches render() on an opaque target, where circle alpha has no effect,
+        up to the fade rounding of get_faded_circle_sprite.
+        """
+        color, fade = self.initial_color, self.fade
+        if self.particle_type == "impact":
+            # Outer glow
+            if self.alpha > 50:
+                blits.append((get_faded_circle_sprite(color, size + 1, fade), (x - size - 1, y - size - 1)))
+            # Bright center
+            blits.append((get_faded_circle_sprite(color, size, fade), (x - size, y - size)))
+            # Bright white center point
+            if size > 1:
+                center_size = max(1, size // 2)
+                blits.append((get_circle_sprite((255, 255, 255), center_size), (x - center_size, y - center_size)))
+        else:
+            blits.append((get_faded_circle_sprite(color, size, fade), (x - size, y - size)))
+    
     def _draw_fire_particle(self, screen: pg.Surface, x: int, y: int, size: int):
         """Draw a fire-themed particle with glow."""
         if size <= 0:
@@ -146,31 +181,30 @@ class BaseParticleSystem:
     
     def __init__(self, lighting_system=None):
         """Initialize particle system."""
-        self.particles: List[Particle] = []
+        self.particle_pool = ObjectPool(Particle)
+        self.particles: List[Particle] = self.particle_pool.active
         self.lighting_system = lighting_system
     
     def add_particles(self, x: float, y: float, particle_type: str = "spark", 
                      count: int = 5, **kwargs):
         """Add particles at the specified location."""
         for _ in range(count):
-            particle = self._create_particle(x, y, particle_type, **kwargs)
-            if particle:
-                self.particles.append(particle)
+            self._create_particle(x, y, particle_type, **kwargs)
     
     def _create_particle(self, x: float, y: float, particle_type: str, **kwargs) -> Particle:
-        """Create a single particle. Override in subclasses for custom behavior."""
+        """Emit a single live particle from the pool. Override in subclasses for custom behavior."""
         # Default particle properties
-        velocity_x = kwargs.get('velocity_x', random.uniform(-100, 100))
-        velocity_y = kwargs.get('velocity_y', random.uniform(-100, 100))
+        velocity_x = kwargs.get('velocity_x', _random.uniform(-100, 100))
+        velocity_y = kwargs.get('velocity_y', _random.uniform(-100, 100))
         color = kwargs.get('color', (255, 255, 255))
-        size = kwargs.get('size', random.uniform(2, 4))
-        lifetime = kwargs.get('lifetime', random.uniform(0.3, 0.8))
+        size = kwargs.get('size', _random.uniform(2, 4))
+        lifetime = kwargs.get('lifetime', _random.uniform(0.3, 0.8))
         
         # Add position variation
-        pos_x = x + random.uniform(-2, 2)
-        pos_y = y + random.uniform(-2, 2)
+        pos_x = x + _random.uniform(-2, 2)
+        pos_y = y + _random.uniform(-2, 2)
         
-        particle = Particle(pos_x, pos_y, velocity_x, velocity_y, color, size, lifetime, particle_type)
+        particle = self.particle_pool.acquire(pos_x, pos_y, velocity_x, velocity_y, color, size, lifetime, particle_type)
         
         # Set physics properties based on type
         if particle_type == "spark":
@@ -186,25 +220,42 @@ class BaseParticleSystem:
         return particle
     
     def update(self, dt: float):
-        """Update all particles and remove expired ones."""
-        # Update particles and collect expired ones
-        particles_to_remove = []
-        for particle in self.particles:
+        """Update all particles and recycle expired ones."""
+        particles = self.particles
+        # Backwards, so each swap-remove pulls in a particle that was already updated
+        for i in range(len(particles) - 1, -1, -1):
+            particle = particles[i]
             if particle.update(dt):
-                particles_to_remove.append(particle)
-        
-        # Remove expired particles
-        for particle in particles_to_remove:
-            self.particles.remove(particle)
+                self.particle_pool.release(particle)
     
     def render(self, screen: pg.Surface, offset: Tuple[float, float] = (0, 0)):
-        """Render all particles."""
+        """Render all particles, batching circle-based particles into one blit."""
+        screen_width, screen_height = screen.get_size()
+        blits = []
         for particle in self.particles:
-            particle.render(screen, offset)
+            if particle.particle_type == "fire":
+                # Fire particles blend their own glow - flush pending circles first to keep draw order
+                if blits:
+                    screen.fblits(blits)
+                    blits = []
+                particle.render(screen, offset)
+                continue
+            if particle.expired or particle.alpha <= 0:
+                continue
+            
+            render_x = int(particle.pos.x + offset[0])
+            render_y = int(particle.pos.y + offset[1])
+            
+            # Only render if on screen (with small buffer)
+            if (-20 <= render_x <= screen_width + 20 and 
+                -20 <= render_y <= screen_height + 20):
+                particle.add_circle_blits(blits, render_x, render_y, max(1, int(particle.size)))
+        if blits:
+            screen.fblits(blits)
     
     def clear(self):
         """Clear all particles."""
-        self.particles.clear()
+        self.particle_pool.release_all()
     
     def get_particle_count(self) -> int:
         """Get current particle count."""
@@ -228,34 +279,31 @@ class ImpactSparksSystem(BaseParticleSystem):
             colors = [(255, 255, 255), (255, 255, 200), (255, 200, 100)]
         
         # Create 3-5 sparks per impact
-        count = random.randint(3, 5)
+        count = _random.randint(3, 5)
         
         for _ in range(count):
             # Calculate direction based on impact angle
             if impact_angle is not None:
                 base_angle = impact_angle + math.pi  # Opposite to impact direction
-                angle_variation = random.uniform(-math.pi/3, math.pi/3)
+                angle_variation = _random.uniform(-math.pi/3, math.pi/3)
                 spark_angle = base_angle + angle_variation
             else:
-                spark_angle = random.uniform(0, 2 * math.pi)
+                spark_angle = _random.uniform(0, 2 * math.pi)
             
             # Convert to velocity
-            speed = random.uniform(50, 150)
+            speed = _random.uniform(50, 150)
             velocity_x = math.cos(spark_angle) * speed
             velocity_y = math.sin(spark_angle) * speed
             
             # Create particle
-            particle = self._create_particle(
+            self._create_particle(
                 x, y, "impact",
                 velocity_x=velocity_x,
                 velocity_y=velocity_y,
-                color=random.choice(colors),
-                size=random.uniform(2, 4),
-                lifetime=random.uniform(0.2, 0.5)
+                color=_random.choice(colors),
+                size=_random.uniform(2, 4),
+                lifetime=_random.uniform(0.2, 0.5)
             )
-            
-            if particle:
-                self.particles.append(particle)
 
 
 class TrailSparksSystem(BaseParticleSystem):
@@ -269,12 +317,12 @@ class TrailSparksSystem(BaseParticleSystem):
             
         # Add sparks between bullets occasionally
         for i in range(len(bullets) - 1):
-            if random.random() < 0.3:  # 30% chance per frame
+            if _random.random() < 0.3:  # 30% chance per frame
                 bullet1 = bullets[i]
                 bullet2 = bullets[i + 1]
                 
                 # Position spark between bullets
-                t = random.uniform(0.2, 0.8)
+                t = _random.uniform(0.2, 0.8)
                 spark_x = bullet1.pos.x + t * (bullet2.pos.x - bullet1.pos.x) + offset[0]
                 spark_y = bullet1.pos.y + t * (bullet2.pos.y - bullet1.pos.y) + offset[1]
                 
@@ -286,14 +334,11 @@ class TrailSparksSystem(BaseParticleSystem):
                 else:
                     colors = [(255, 255, 255), (255, 255, 200), (255, 200, 100)]
                 
-                particle = self._create_particle(
+                self._create_particle(
                     spark_x, spark_y, spark_type,
-                    velocity_x=random.uniform(-30, 30),
-                    velocity_y=random.uniform(-30, 30),
-                    color=random.choice(colors),
-                    size=random.uniform(2, 5),
-                    lifetime=random.uniform(0.5, 1.2)
-                )
-                
-                if particle:
-                    self.particles.append(particle)
\ No newline at end of file
+                    velocity_x=_random.uniform(-30, 30),
+                    velocity_y=_random.uniform(-30, 30),
+                    color=_random.choice(colors),
+                    size=_random.uniform(2, 5),
+                    lifetime=_random.uniform(0.5, 1.2)
+                )
\ No newline at end of file
@@ -5,10 +5,17 @@ Handles muzzle flashes, shell casings, and impact effects for all weapon types.
 
 import pygame as pg
 import math
-import random
 from abc import ABC, abstractmethod
 from typing import Tuple, Dict, Any, Optional
 
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("effects")  # Muzzle flash and impact particles
+
 
 class BaseMuzzleFlash(ABC):
     """Abstract base class for muzzle flash effects."""
@@ -39,11 +46,11 @@ class BaseMuzzleFlash(ABC):
         
         for _ in range(props['count']):
             # Calculate particle angle with spread
-            spread_angle = random.uniform(-props['spread']/2, props['spread']/2)
+            spread_angle = _random.uniform(-props['spread']/2, props['spread']/2)
             particle_angle = math.radians(self.angle + spread_angle)
             
             # Calculate velocity
-            speed = random.uniform(props['min_speed'], props['max_speed'])
+            speed = _random.uniform(props['min_speed'], props['max_speed'])
             velocity = pg.Vector2(
                 math.cos(particle_angle) * speed,
                 math.sin(particle_angle) * speed
@@ -53,9 +60,9 @@ class BaseMuzzleFlash(ABC):
                 'pos': pg.Vector2(self.x, self.y),
                 'velocity': velocity,
                 'color': props['color'],
-                'size': random.uniform(props['min_size'], props['max_size']),
-                'life': random.uniform(props['min_life'], props['max_life']),
-                'initial_life': random.uniform(props['min_life'], props['max_life']),
+                'size': _random.uniform(props['min_size'], props['max_size']),
+                'life': _random.uniform(props['min_life'], props['max_life']),
+                'initial_life': _random.uniform(props['min_life'], props['max_life']),
                 'fade_speed': props.get('fade_speed', 0.95)
             }
             self.particles.append(particle)
@@ -194,16 +201,16 @@ class BaseShellCasing:
         self.max_lifetime = 3.0
         
         # Calculate ejection properties
-        eject_angle = math.radians(angle + random.uniform(70, 110))  # Perpendicular to barrel
-        eject_speed = random.uniform(80, 150)
+        eject_angle = math.radians(angle + _random.uniform(70, 110))  # Perpendicular to barrel
+        eject_speed = _random.uniform(80, 150)
         
         self.velocity = pg.Vector2(
             math.cos(eject_angle) * eject_speed,
             math.sin(eject_angle) * eject_speed
         )
         
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-720, 720)  # degrees per second
+        self.rotation = _random.uniform(0, 360)
+        self.rotation_speed = _random.uniform(-720, 720)  # degrees per second
         
         # Visual properties based on weapon type
         self.size, self.color = self._get_visual_properties()
@@ -415,8 +422,8 @@ class BaseImpactEffect:
     def _generate_impact_particles(self, props: Dict[str, Any]):
         """Generate impact particles."""
         for _ in range(props['particle_count']):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(props['speed'] * 0.5, props['speed'] * 1.5)
+            angle = _random.uniform(0, 2 * math.pi)
+            speed = _random.uniform(props['speed'] * 0.5, props['speed'] * 1.5)
             
             particle = {
                 'pos': pg.Vector2(self.x, self.y),
@@ -424,9 +431,9 @@ class BaseImpactEffect:
                     math.cos(angle) * speed,
                     math.sin(angle) * speed
                 ),
-                'size': random.uniform(*props['size_range']),
-                'life': random.uniform(0.2, 0.6),
-                'initial_life': random.uniform(0.2, 0.6)
+                'size': _random.uniform(*props['size_range']),
+                'life': _random.uniform(0.2, 0.6),
+                'initial_life': _random.uniform(0.2, 0.6)
             }
             self.particles.append(particle)
     
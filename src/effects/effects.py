@@ -5,9 +5,23 @@ These classes are instantiated and managed by the EffectsManager.
 
 import pygame as pg
 import math
-import random
 from typing import List, Tuple
 
+from ..utils.object_pool import swap_remove
+from ..utils.render_queue import get_faded_circle_sprite
+from ..utils.rng import rng
+
+_random = rng.stream("effects")  # Particle spread, speed and lifetime
+_render_random = rng.stream("render")  # Draw-time sparkle and jitter
+
+
+def _spare_particle(spent: list) -> dict:
+    """A dead particle dict to refill (its 'pos' and 'velocity' are updated in place), or a new one."""
+    if spent:
+        return spent.pop()
+    return {'pos': pg.Vector2(), 'velocity': pg.Vector2()}
+
+
 class ComicDashLine:
     """Comic book/anime style dash line effect that follows the player with tapered styling."""
     
@@ -90,31 +104,38 @@ class ParticleEffect:
                  particle_count: int = 8, speed: float = 100):
         """Initialize a particle effect."""
         self.particles = []
+        self.spent_particles = []  # Dead particle dicts, refilled by reset()
+        self.reset(x, y, color, particle_count, speed)
+    
+    def reset(self, x: float, y: float, color: Tuple[int, int, int], 
+              particle_count: int = 8, speed: float = 100):
+        """Start a new burst, reusing the particles of a finished one (see EffectsManager.effect_pools)."""
+        self.spent_particles.extend(self.particles)
+        self.particles.clear()
         self.lifetime = 1.0
         self.age = 0.0
         
         for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed_variation = random.uniform(0.5, 1.5)
-            particle = {
-                'pos': pg.Vector2(x, y),
-                'velocity': pg.Vector2(
-                    math.cos(angle) * speed * speed_variation,
-                    math.sin(angle) * speed * speed_variation
-                ),
-                'color': color,
-                'size': random.randint(2, 4),
-                'life': random.uniform(0.5, 1.0)
-            }
+            angle = _random.uniform(0, 2 * math.pi)
+            speed_variation = _random.uniform(0.5, 1.5)
+            particle = _spare_particle(self.spent_particles)
+            particle['pos'].update(x, y)
+            particle['velocity'].update(
+                math.cos(angle) * speed * speed_variation,
+                math.sin(angle) * speed * speed_variation
+            )
+            particle['color'] = tuple(color)  # Hashable sprite cache key
+            particle['size'] = _random.randint(2, 4)
+            particle['life'] = _random.uniform(0.5, 1.0)
             self.particles.append(particle)
     
     def update(self, dt: float) -> bool:
         """Update particles. Returns True if effect should be removed."""
         self.age += dt
         
-        particles_to_remove = []
-        
-        for particle in self.particles:
+        particles = self.particles
+        for i in range(len(particles) - 1, -1, -1):
+            particle = particles[i]
             particle['pos'] += particle['velocity'] * dt
             particle['life'] -= dt
             
@@ -122,21 +143,22 @@ class ParticleEffect:
             particle['velocity'] *= 0.98
             
             if particle['life'] <= 0:
-                particles_to_remove.append(particle)
-        
-        for particle in particles_to_remove:
-            self.particles.remove(particle)
+                swap_remove(particles, i)
+                self.spent_particles.append(particle)
         
         return len(self.particles) == 0
     
     def render(self, screen: pg.Surface, offset=(0, 0)):
-        """Render all particles."""
+        """Render all particles in one batched blit."""
+        blits = []
         for particle in self.particles:
-            alpha = max(0, particle['life'])
-            color = tuple(int(c * alpha) for c in particle['color'])
             render_x = int(particle['pos'].x + offset[0])
             render_y = int(particle['pos'].y + offset[1])
-            pg.draw.circle(screen, color, (render_x, render_y), particle['size'])
+            size = particle['size']
+            blits.append((get_faded_circle_sprite(particle['color'], size, max(0, particle['life'])),
+                          (render_x - size, render_y - size)))
+        if blits:
+            screen.fblits(blits)
 
 class EnhancedExplosionEffect:
     """Enhanced fiery explosion effect with multiple particle types."""
@@ -147,6 +169,16 @@ class EnhancedExplosionEffect:
                  direction_angle: float = None, spread_angle: float = 360):
         """Initialize enhanced explosion effect."""
         self.particles = []
+        self.spent_particles = []  # Dead particle dicts, refilled by reset()
+        self.reset(x, y, color, particle_count, speed, size_range, explosion_type, direction_angle, spread_angle)
+    
+    def reset(self, x: float, y: float, color: Tuple[int, int, int], 
+              particle_count: int = 20, speed: float = 150, 
+              size_range: Tuple[int, int] = (3, 6), explosion_type: str = "normal",
+              direction_angle: float = None, spread_angle: float = 360):
+        """Set off a recycled explosion layer, refilling its old particle dicts."""
+        self.spent_particles.extend(self.particles)
+        self.particles.clear()
         self.explosion_type = explosion_type
         self.age = 0.0
         
@@ -218,46 +250,44 @@ class EnhancedExplosionEffect:
         for _ in range(particle_count):
             if direction_angle is not None:
                 spread_rad = math.radians(spread_angle)
-                angle = math.radians(direction_angle) + random.uniform(-spread_rad/2, spread_rad/2)
+                angle = math.radians(direction_angle) + _random.uniform(-spread_rad/2, spread_rad/2)
             else:
-                angle = random.uniform(0, 2 * math.pi)
+                angle = _random.uniform(0, 2 * math.pi)
                 
-            speed_variation = random.uniform(0.3, 1.8)
+            speed_variation = _random.uniform(0.3, 1.8)
             
             if explosion_type == "sparks":
                 velocity_magnitude = speed * speed_variation
-                size = random.randint(size_range[0], size_range[1])
-                life_duration = random.uniform(0.2, 0.8)
+                size = _random.randint(size_range[0], size_range[1])
+                life_duration = _random.uniform(0.2, 0.8)
             elif explosion_type == "smoke":
                 velocity_magnitude = speed * speed_variation * 0.6
-                size = random.randint(size_range[0], size_range[1])
-                life_duration = random.uniform(0.8, 1.4)
+                size = _random.randint(size_range[0], size_range[1])
+                life_duration = _random.uniform(0.8, 1.4)
             else:
                 velocity_magnitude = speed * speed_variation
-                size = random.randint(size_range[0], size_range[1])
-                life_duration = random.uniform(0.5, 1.5)
+                size = _random.randint(size_range[0], size_range[1])
+                life_duration = _random.uniform(0.5, 1.5)
             
-            particle = {
-                'pos': pg.Vector2(x, y),
-                'velocity': pg.Vector2(
-                    math.cos(angle) * velocity_magnitude,
-                    math.sin(angle) * velocity_magnitude
-                ),
-                'base_color': color,
-                'size': size,
-                'initial_size': size,
-                'life': life_duration,
-                'initial_life': life_duration,
-                'gravity_factor': gravity_factor
-            }
+            particle = _spare_particle(self.spent_particles)
+            particle['pos'].update(x, y)
+            particle['velocity'].update(
+                math.cos(angle) * velocity_magnitude,
+                math.sin(angle) * velocity_magnitude
+            )
+            particle['base_color'] = tuple(color)  # Hashable sprite cache key
+            particle['size'] = particle['initial_size'] = size
+            particle['life'] = particle['initial_life'] = life_duration
+            particle['gravity_factor'] = gravity_factor
             self.particles.append(particle)
     
     def update(self, dt: float) -> bool:
         """Update particles with enhanced effects."""
         self.age += dt
-        particles_to_remove = []
         
-        for particle in self.particles:
+        particles = self.particles
+        for i in range(len(particles) - 1, -1, -1):
+            particle = particles[i]
             particle['pos'] += particle['velocity'] * dt
             particle['life'] -= dt
             
@@ -267,21 +297,20 @@ class EnhancedExplosionEffect:
                                      particle['initial_size'] + (self.age * 8))
             elif self.explosion_type == "sparks":
                 particle['velocity'] *= 0.99
-                particle['velocity'].x += random.uniform(-10, 10)
-                particle['velocity'].y += random.uniform(-10, 10)
+                particle['velocity'].x += _random.uniform(-10, 10)
+                particle['velocity'].y += _random.uniform(-10, 10)
             else:
                 particle['velocity'] *= particle['gravity_factor']
             
             if particle['life'] <= 0:
-                particles_to_remove.append(particle)
-        
-        for particle in particles_to_remove:
-            self.particles.remove(particle)
+                swap_remove(particles, i)
+                self.spent_particles.append(particle)
         
         return len(self.particles) == 0
     
     def render(self, screen: pg.Surface, offset=(0, 0)):
-        """Render enhanced explosion particles."""
+        """Render enhanced explosion particles in one batched blit."""
+        blits = []
         for particle in self.particles:
             life_ratio = particle['life'] / particle['initial_life']
             render_x = int(particle['pos'].x + offset[0])
@@ -298,34 +327,37 @@ class EnhancedExplosionEffect:
                 elif life_ratio > 0.3: color = (255, 100, 0)
                 else: color = (150, 50, 0)
             elif self.explosion_type == "smoke":
+                # Gray that darkens with life, expressed as a fixed base so the
+                # fade below covers both the darkening and the alpha falloff
                 if life_ratio > 0.3:
-                    gray_value = int(120 * life_ratio)
-                    color = (gray_value, gray_value//2, gray_value//3)
+                    color = (120, 60, 40)
                 else:
-                    fade_factor = life_ratio / 0.3
-                    gray_value = int(60 * fade_factor)
-                    color = (gray_value, gray_value//2, gray_value//4)
+                    color = (60, 30, 15)
             elif self.explosion_type == "sparks":
-                if random.random() > 0.3: color = (255, 255, 200)
+                if _render_random.random() > 0.3: color = (255, 255, 200)
                 else: color = (255, 255, 255)
             else:
                 color = particle['base_color']
             
-            if self.explosion_type == "smoke" and life_ratio < 0.3:
-                alpha_factor = life_ratio / 0.3
+            if self.explosion_type == "smoke":
+                fade = life_ratio if life_ratio > 0.3 else life_ratio / 0.3
+                alpha_factor = fade * fade
             else:
                 alpha_factor = max(0.05, life_ratio)
             
-            final_color = tuple(int(c * alpha_factor) for c in color)
-            
             if self.explosion_type in ["core", "fire", "sparks"]:
-                glow_size = particle['size'] + 2
-                glow_color = tuple(int(c * 0.3) for c in final_color)
+                glow_size = int(particle['size'] + 2)
                 if glow_size > 0:
-                    pg.draw.circle(screen, glow_color, (render_x, render_y), glow_size)
+                    blits.append((get_faded_circle_sprite(color, glow_size, alpha_factor * 0.3),
+                                  (render_x - glow_size, render_y - glow_size)))
             
-            if particle['size'] > 0:
-                pg.draw.circle(screen, final_color, (render_x, render_y), int(particle['size']))
+            size = int(particle['size'])
+            if size > 0:
+                blits.append((get_faded_circle_sprite(color, size, alpha_factor),
+                              (render_x - size, render_y - size)))
+        
+        if blits:
+            screen.fblits(blits)
 
 class MysticalBeamEffect:
     """A mystical beam effect for sword thrust attacks that follows the player."""
@@ -386,15 +418,15 @@ class MysticalBeamEffect:
             num_particles = int(beam_length / 15)
             for i in range(num_particles):
                 t = i / max(1, num_particles - 1)
-                particle_x = start_x + t * beam_dx + random.uniform(-self.width/4, self.width/4)
-                particle_y = start_y + t * beam_dy + random.uniform(-self.width/4, self.width/4)
+                particle_x = start_x + t * beam_dx + _random.uniform(-self.width/4, self.width/4)
+                particle_y = start_y + t * beam_dy + _random.uniform(-self.width/4, self.width/4)
                 
                 self.particles.append({
                     'x': particle_x,
                     'y': particle_y,
-                    'size': random.uniform(2, 5),
-                    'alpha': random.uniform(0.7, 1.0),
-                    'pulse_speed': random.uniform(2, 4)
+                    'size': _random.uniform(2, 5),
+                    'alpha': _random.uniform(0.7, 1.0),
+                    'pulse_speed': _random.uniform(2, 4)
                 })
     
     def update(self, dt: float):
@@ -5,25 +5,40 @@ Creates small particle effects when bullets hit walls or obstacles.
 
 import pygame as pg
 import math
-import random
 from typing import List, Tuple
 
+# Handle seeded random stream and object pool imports
+try:
+    from src.utils.rng import rng
+    from src.utils.object_pool import ObjectPool
+except ImportError:
+    from utils.rng import rng
+    from utils.object_pool import ObjectPool
+
+_random = rng.stream("effects")  # Spark directions and lifetimes
+
 
 class ImpactSpark:
     """Individual spark particle."""
     
     def __init__(self, x: float, y: float, angle: float, speed: float, color: Tuple[int, int, int]):
         """Initialize a spark particle."""
-        self.pos = pg.Vector2(x, y)
-        self.velocity = pg.Vector2(
+        self.pos = pg.Vector2()
+        self.velocity = pg.Vector2()
+        self.reset(x, y, angle, speed, color)
+    
+    def reset(self, x: float, y: float, angle: float, speed: float, color: Tuple[int, int, int]):
+        """Re-launch a recycled spark."""
+        self.pos.update(x, y)
+        self.velocity.update(
             math.cos(angle) * speed,
             math.sin(angle) * speed
         )
         self.color = color
         self.initial_color = color
         self.age = 0.0
-        self.lifetime = random.uniform(0.2, 0.5)  # 0.2-0.5 seconds
-        self.size = random.randint(2, 4)
+        self.lifetime = _random.uniform(0.2, 0.5)  # 0.2-0.5 seconds
+        self.size = _random.randint(2, 4)
         self.initial_size = self.size
         
     def update(self, dt: float) -> bool:
@@ -72,7 +87,8 @@ class ImpactSparksManager:
     
     def __init__(self):
         """Initialize the impact sparks manager."""
-        self.sparks: List[ImpactSpark] = []
+        self.spark_pool = ObjectPool(ImpactSpark, max_free=256)
+        self.sparks: List[ImpactSpark] = self.spark_pool.active
     
     def add_impact_sparks(self, x: float, y: float, impact_angle: float = None, surface_type: str = "wall"):
         """Create impact sparks at the specified position."""
@@ -87,42 +103,39 @@ class ImpactSparksManager:
             colors = [(255, 255, 255), (255, 255, 200), (255, 200, 100)]  # Default white/yellow
         
         # Create 3-5 sparks per impact
-        num_sparks = random.randint(3, 5)
+        num_sparks = _random.randint(3, 5)
         
         for i in range(num_sparks):
             # Calculate spark direction
             if impact_angle is not None:
                 # Reflect sparks based on impact angle
                 base_angle = impact_angle + math.pi  # Opposite direction of impact
-                angle_variation = random.uniform(-math.pi/3, math.pi/3)  # ±60 degrees spread
+                angle_variation = _random.uniform(-math.pi/3, math.pi/3)  # ±60 degrees spread
                 spark_angle = base_angle + angle_variation
             else:
                 # Random direction if no impact angle provided
-                spark_angle = random.uniform(0, 2 * math.pi)
+                spark_angle = _random.uniform(0, 2 * math.pi)
             
             # Random speed and color
-            speed = random.uniform(50, 150)
-            color = random.choice(colors)
+            speed = _random.uniform(50, 150)
+            color = _random.choice(colors)
             
             # Add slight position variation
-            spark_x = x + random.uniform(-2, 2)
-            spark_y = y + random.uniform(-2, 2)
+            spark_x = x + _random.uniform(-2, 2)
+            spark_y = y + _random.uniform(-2, 2)
             
             # Create spark
-            spark = ImpactSpark(spark_x, spark_y, spark_angle, speed, color)
-            self.sparks.append(spark)
+            self.spark_pool.acquire(spark_x, spark_y, spark_angle, speed, color)
     
     def update(self, dt: float):
         """Update all sparks and remove expired ones."""
-        sparks_to_remove = []
+        sparks = self.sparks
         
-        for spark in self.sparks:
+        # Walk backwards so the spark swapped into a freed slot was already updated
+        for i in range(len(sparks) - 1, -1, -1):
+            spark = sparks[i]
             if spark.update(dt):
-                sparks_to_remove.append(spark)
-        
-        # Remove expired sparks
-        for spark in sparks_to_remove:
-            self.sparks.remove(spark)
+                self.spark_pool.release(spark)
     
     def render(self, screen: pg.Surface, offset: Tuple[int, int] = (0, 0)):
         """Render all sparks."""
@@ -131,7 +144,7 @@ class ImpactSparksManager:
     
     def clear(self):
         """Clear all sparks."""
-        self.sparks.clear()
+        self.spark_pool.release_all()
     
     def get_spark_count(self) -> int:
         """Get the number of active sparks."""
@@ -5,11 +5,13 @@ Handles muzzle flames, barrel spin effects, and enhanced bullet rendering for mi
 
 import pygame as pg
 import math
-import random
 from typing import Tuple
 from .base_trail_renderer import MinigunTrailRenderer
 from .base_particle_system import BaseParticleSystem
 from .base_weapon_effects import BaseWeaponEffectsManager
+from ..utils.rng import rng
+
+_random = rng.stream("effects")  # Impact sparks
 
 class MinigunEffectsManager(BaseWeaponEffectsManager):
     """Manages visual effects for the minigun weapon."""
@@ -120,16 +122,16 @@ class MinigunEffectsManager(BaseWeaponEffectsManager):
             x, y, 
             particle_type="impact",
             count=1,
-            velocity_x=random.uniform(-50, 50),
-            velocity_y=random.uniform(-50, 50),
-            color=random.choice([
+            velocity_x=_random.uniform(-50, 50),
+            velocity_y=_random.uniform(-50, 50),
+            color=_random.choice([
                 (100, 220, 255),  # Bright cyan to match bullet inner core
                 (150, 240, 255),  # Electric cyan
                 (200, 250, 255),  # Bright white-cyan
                 (255, 255, 255)   # Pure white for brightness
             ]),
-            size=random.uniform(2, 4),
-            lifetime=random.uniform(0.15, 0.25)
+            size=_random.uniform(2, 4),
+            lifetime=_random.uniform(0.15, 0.25)
         )
         
     def get_whip_damage_segments(self):
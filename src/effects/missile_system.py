@@ -8,6 +8,15 @@ import math
 from typing import Tuple, Optional, List
 from enum import Enum
 
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("missiles")  # Ground fire particles
+_render_random = rng.stream("render")  # Draw-time sparkle and jitter
+
 class MissileState(Enum):
     """States for missile lifecycle."""
     FLYING = "flying"
@@ -42,7 +51,6 @@ class GroundFire:
     
     def _initialize_fire_particles(self):
         """Initialize fire particle positions for visual effects."""
-        import random
         base_particle_count = int(self.radius / 4)  # More particles for visibility
         
         # Create multiple layers of fire particles for depth
@@ -55,66 +63,66 @@ class GroundFire:
         
         # Base flame layer - large stationary flames
         for _ in range(base_particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.radius * 0.9)
+            angle = _random.uniform(0, 2 * math.pi)
+            distance = _random.uniform(0, self.radius * 0.9)
             x = self.pos.x + math.cos(angle) * distance
             y = self.pos.y + math.sin(angle) * distance
             self.fire_layers['base_flames'].append({
                 'x': x, 'y': y,
                 'base_x': x, 'base_y': y,
-                'size': random.uniform(8, 16),
-                'intensity': random.uniform(0.8, 1.2),
-                'flicker_speed': random.uniform(6, 10),
-                'color_variant': random.uniform(0.8, 1.2)
+                'size': _random.uniform(8, 16),
+                'intensity': _random.uniform(0.8, 1.2),
+                'flicker_speed': _random.uniform(6, 10),
+                'color_variant': _random.uniform(0.8, 1.2)
             })
         
         # Dancing flame layer - moving flames
         for _ in range(base_particle_count // 2):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.radius * 0.7)
+            angle = _random.uniform(0, 2 * math.pi)
+            distance = _random.uniform(0, self.radius * 0.7)
             x = self.pos.x + math.cos(angle) * distance
             y = self.pos.y + math.sin(angle) * distance
             self.fire_layers['dancing_flames'].append({
                 'x': x, 'y': y,
                 'base_x': x, 'base_y': y,
-                'size': random.uniform(6, 12),
-                'intensity': random.uniform(0.9, 1.4),
-                'flicker_speed': random.uniform(12, 18),
-                'dance_radius': random.uniform(8, 15),
-                'dance_speed': random.uniform(2, 4),
-                'color_variant': random.uniform(0.9, 1.1)
+                'size': _random.uniform(6, 12),
+                'intensity': _random.uniform(0.9, 1.4),
+                'flicker_speed': _random.uniform(12, 18),
+                'dance_radius': _random.uniform(8, 15),
+                'dance_speed': _random.uniform(2, 4),
+                'color_variant': _random.uniform(0.9, 1.1)
             })
         
         # Spark layer - small bright particles
         for _ in range(base_particle_count * 2):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.radius * 0.8)
+            angle = _random.uniform(0, 2 * math.pi)
+            distance = _random.uniform(0, self.radius * 0.8)
             x = self.pos.x + math.cos(angle) * distance
             y = self.pos.y + math.sin(angle) * distance
             self.fire_layers['sparks'].append({
                 'x': x, 'y': y,
                 'base_x': x, 'base_y': y,
-                'size': random.uniform(2, 5),
-                'intensity': random.uniform(1.0, 1.5),
-                'flicker_speed': random.uniform(15, 25),
-                'pop_interval': random.uniform(0.5, 2.0),
+                'size': _random.uniform(2, 5),
+                'intensity': _random.uniform(1.0, 1.5),
+                'flicker_speed': _random.uniform(15, 25),
+                'pop_interval': _random.uniform(0.5, 2.0),
                 'last_pop': 0,
-                'color_variant': random.uniform(1.0, 1.3)
+                'color_variant': _random.uniform(1.0, 1.3)
             })
         
         # Smoke layer - darker particles for realism
         for _ in range(base_particle_count // 3):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(self.radius * 0.3, self.radius * 1.1)
+            angle = _random.uniform(0, 2 * math.pi)
+            distance = _random.uniform(self.radius * 0.3, self.radius * 1.1)
             x = self.pos.x + math.cos(angle) * distance
             y = self.pos.y + math.sin(angle) * distance
             self.fire_layers['smoke'].append({
                 'x': x, 'y': y,
                 'base_x': x, 'base_y': y,
-                'size': random.uniform(10, 20),
-                'intensity': random.uniform(0.3, 0.7),
-                'drift_speed': random.uniform(1, 3),
-                'drift_direction': random.uniform(0, 2 * math.pi)
+                'size': _random.uniform(10, 20),
+                'intensity': _random.uniform(0.3, 0.7),
+                'drift_speed': _random.uniform(1, 3),
+                'drift_direction': _random.uniform(0, 2 * math.pi)
             })
     
     def update(self, dt: float) -> bool:
@@ -123,13 +131,12 @@ class GroundFire:
         self.flame_flicker_time += dt
         
         # Update multi-layer fire particle animations
-        import random
         
         # Update base flames - gentle flickering
         for particle in self.fire_layers['base_flames']:
             flicker = math.sin(self.flame_flicker_time * particle['flicker_speed']) * 2
-            particle['x'] = particle['base_x'] + random.uniform(-1, 1) + flicker
-            particle['y'] = particle['base_y'] + random.uniform(-1, 1) + flicker * 0.5
+            particle['x'] = particle['base_x'] + _random.uniform(-1, 1) + flicker
+            particle['y'] = particle['base_y'] + _random.uniform(-1, 1) + flicker * 0.5
         
         # Update dancing flames - more movement
         for particle in self.fire_layers['dancing_flames']:
@@ -138,22 +145,22 @@ class GroundFire:
             dance_y = math.sin(dance_angle) * particle['dance_radius'] * 0.5
             flicker = math.sin(self.flame_flicker_time * particle['flicker_speed']) * 3
             
-            particle['x'] = particle['base_x'] + dance_x + random.uniform(-2, 2) + flicker
-            particle['y'] = particle['base_y'] + dance_y + random.uniform(-1, 1) + flicker * 0.3
+            particle['x'] = particle['base_x'] + dance_x + _random.uniform(-2, 2) + flicker
+            particle['y'] = particle['base_y'] + dance_y + _random.uniform(-1, 1) + flicker * 0.3
         
         # Update sparks - rapid flickering with occasional pops
         for particle in self.fire_layers['sparks']:
             # Check for spark pop (bright flash)
             if self.flame_flicker_time - particle['last_pop'] > particle['pop_interval']:
                 particle['last_pop'] = self.flame_flicker_time
-                particle['pop_interval'] = random.uniform(0.5, 2.0)
-                particle['intensity'] = random.uniform(1.5, 2.0)
+                particle['pop_interval'] = _random.uniform(0.5, 2.0)
+                particle['intensity'] = _random.uniform(1.5, 2.0)
             else:
                 particle['intensity'] = max(0.8, particle['intensity'] - dt * 2)
             
             flicker = math.sin(self.flame_flicker_time * particle['flicker_speed']) * 4
-            particle['x'] = particle['base_x'] + random.uniform(-3, 3) + flicker
-            particle['y'] = particle['base_y'] + random.uniform(-2, 2) + flicker * 0.4
+            particle['x'] = particle['base_x'] + _random.uniform(-3, 3) + flicker
+            particle['y'] = particle['base_y'] + _random.uniform(-2, 2) + flicker * 0.4
         
         # Update smoke - slow upward drift
         for particle in self.fire_layers['smoke']:
@@ -1002,7 +1009,6 @@ class Missile:
     def _render_soft_flame_layer(self, screen: pg.Surface, base_x: float, base_y: float,
                                 cos_angle: float, sin_angle: float, perpendicular_x: float, perpendicular_y: float, layer: dict):
         """Render a soft flame layer with particles and proper shape."""
-        import random
         
         flame_length = layer['length']
         max_width = layer['width'] * (self.width / 4)  # Further reduced max width
@@ -1095,14 +1101,13 @@ class Missile:
     def _add_flame_particles(self, screen: pg.Surface, base_x: float, base_y: float, 
                            cos_angle: float, sin_angle: float, flame_length: float, flame_color: tuple):
         """Add particle effects to the flame."""
-        import random
         
         # Particle count based on flame intensity (reduced for performance)
-        particle_count = random.randint(2, 5)  # Reduced from 3-8
+        particle_count = _render_random.randint(2, 5)  # Reduced from 3-8
         
         for _ in range(particle_count):
             # Random position along flame length
-            particle_progress = random.uniform(0.1, 0.9)
+            particle_progress = _render_random.uniform(0.1, 0.9)
             particle_distance = flame_length * particle_progress
             
             # Base position along flame
@@ -1110,19 +1115,19 @@ class Missile:
             particle_y = base_y - sin_angle * particle_distance
             
             # Add random spread perpendicular to flame
-            spread = random.uniform(-15, 15)
+            spread = _render_random.uniform(-15, 15)
             particle_x += -sin_angle * spread * cos_angle
             particle_y += cos_angle * spread * sin_angle
             
             # Particle size varies with position (smaller towards tip)
-            particle_size = int(random.uniform(1, 4) * (1.0 - particle_progress * 0.5))
+            particle_size = int(_render_random.uniform(1, 4) * (1.0 - particle_progress * 0.5))
             
             # Particle color - brighter variants of flame color
             base_r, base_g, base_b = flame_color[:3]
-            particle_r = min(255, base_r + random.randint(-30, 50))
-            particle_g = min(255, base_g + random.randint(-20, 30))  
-            particle_b = max(0, base_b + random.randint(-10, 20))
-            particle_alpha = random.randint(120, 200)
+            particle_r = min(255, base_r + _render_random.randint(-30, 50))
+            particle_g = min(255, base_g + _render_random.randint(-20, 30))  
+            particle_b = max(0, base_b + _render_random.randint(-10, 20))
+            particle_alpha = _render_random.randint(120, 200)
             
             # Draw particle with slight transparency
             particle_surface = pg.Surface((particle_size * 2, particle_size * 2), pg.SRCALPHA)
@@ -1222,15 +1227,14 @@ class Missile:
                 pg.draw.circle(explosion_surface, layer_color, (int(center_x), int(center_y)), layer_radius)
         
         # Add particle effects around the explosion
-        import random
         particle_count = int(20 * expansion_progress)
         for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(explosion_radius * 0.8, explosion_radius * 1.3)
+            angle = _render_random.uniform(0, 2 * math.pi)
+            distance = _render_random.uniform(explosion_radius * 0.8, explosion_radius * 1.3)
             particle_x = center_x + math.cos(angle) * distance
             particle_y = center_y + math.sin(angle) * distance
-            particle_size = random.randint(2, 6)
-            particle_color = (*[255, random.randint(150, 255), random.randint(0, 100)], random.randint(120, 200))
+            particle_size = _render_random.randint(2, 6)
+            particle_color = (*[255, _render_random.randint(150, 255), _render_random.randint(0, 100)], _render_random.randint(120, 200))
             pg.draw.circle(explosion_surface, particle_color, (int(particle_x), int(particle_y)), particle_size)
         
         # Shockwave ring with transparency
@@ -1277,7 +1281,6 @@ class Missile:
                 pg.draw.circle(screen, color, (int(x), int(y)), layer_radius)
         
         # Add debris particles flying outward
-        import random
         debris_count = 12
         for i in range(debris_count):
             angle = (i / debris_count) * 2 * math.pi
@@ -1285,8 +1288,8 @@ class Missile:
             debris_x = x + math.cos(angle) * debris_distance
             debris_y = y + math.sin(angle) * debris_distance
             
-            debris_size = random.randint(2, 6)
-            debris_color = (255, random.randint(100, 200), 0)
+            debris_size = _render_random.randint(2, 6)
+            debris_color = (255, _render_random.randint(100, 200), 0)
             pg.draw.circle(screen, debris_color, (int(debris_x), int(debris_y)), debris_size)
     
     def _render_explosion_fade(self, screen: pg.Surface, x: float, y: float, progress: float):
@@ -1313,16 +1316,15 @@ class Missile:
         
         # Remaining embers
         if fade_progress < 0.7:
-            import random
             ember_count = 8
             for i in range(ember_count):
-                angle = random.random() * 2 * math.pi
-                ember_distance = smoke_radius * random.uniform(0.3, 0.8)
+                angle = _render_random.random() * 2 * math.pi
+                ember_distance = smoke_radius * _render_random.uniform(0.3, 0.8)
                 ember_x = x + math.cos(angle) * ember_distance
                 ember_y = y + math.sin(angle) * ember_distance
                 
-                ember_size = random.randint(1, 3)
-                ember_color = (255, random.randint(150, 255), random.randint(0, 100))
+                ember_size = _render_random.randint(1, 3)
+                ember_color = (255, _render_random.randint(150, 255), _render_random.randint(0, 100))
                 pg.draw.circle(screen, ember_color, (int(ember_x), int(ember_y)), ember_size)
     
     def get_explosion_damage_area(self) -> Tuple[pg.Vector2, float]:
@@ -7,6 +7,14 @@ import pygame as pg
 import math
 from typing import List, Tuple
 
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_render_random = rng.stream("render")  # Draw-time sparkle and jitter
+
 class SlashEffect:
     """Individual slash effect for sword attacks that follows the player."""
     
@@ -214,23 +222,22 @@ class SlashEffect:
     def _draw_simple_sparkles(self, screen: pg.Surface, render_pos: Tuple[float, float], 
                             current_range: float, alpha: float, current_angle: float):
         """Draw enhanced magical sparkles around the slash with purple theme."""
-        import random
         
         # Number of sparkles based on range and alpha
         sparkle_count = max(0, int(10 * alpha * (current_range / 300)))
         
         for _ in range(sparkle_count):
             # Random position around the slash arc using current angle
-            angle_offset = random.uniform(-self.arc_angle // 2, self.arc_angle // 2)
+            angle_offset = _render_random.uniform(-self.arc_angle // 2, self.arc_angle // 2)
             sparkle_angle = math.radians(current_angle + angle_offset)
-            sparkle_distance = random.uniform(current_range * 0.2, current_range * 1.1)
+            sparkle_distance = _render_random.uniform(current_range * 0.2, current_range * 1.1)
             
             sparkle_x = int(render_pos[0] + math.cos(sparkle_angle) * sparkle_distance)
             sparkle_y = int(render_pos[1] + math.sin(sparkle_angle) * sparkle_distance)
             
             # Enhanced sparkles with size variation and purple theme
-            sparkle_size = random.randint(2, 5)
-            sparkle_intensity = random.uniform(0.4, 0.8)
+            sparkle_size = _render_random.randint(2, 5)
+            sparkle_intensity = _render_random.uniform(0.4, 0.8)
             sparkle_color = (
                 max(0, min(255, int(180 * alpha * sparkle_intensity))),
                 max(0, min(255, int(120 * alpha * sparkle_intensity))),
@@ -260,7 +267,6 @@ class SlashEffect:
     def _draw_magical_slash_crescent(self, screen: pg.Surface, render_pos: Tuple[float, float], 
                                    current_range: float, alpha: float, wipe_progress: float):
         """Draw the main magical crescent slash effect."""
-        import random
         
         # Calculate bounding box for efficient rendering
         bbox_size = int(current_range * 3.0)  # Larger for magical effects
@@ -344,23 +350,22 @@ class SlashEffect:
     def _draw_magical_sparkles(self, screen: pg.Surface, render_pos: Tuple[float, float], 
                              current_range: float, alpha: float, wipe_progress: float):
         """Draw magical sparkle effects around the slash."""
-        import random
         
         # Number of sparkles based on slash progress
         sparkle_count = int(12 * wipe_progress * alpha)
         
         for _ in range(sparkle_count):
             # Random position around the slash arc
-            angle_offset = random.uniform(-self.arc_angle // 2, self.arc_angle // 2)
+            angle_offset = _render_random.uniform(-self.arc_angle // 2, self.arc_angle // 2)
             sparkle_angle = math.radians(self.angle + angle_offset)
-            sparkle_distance = random.uniform(current_range * 0.4, current_range * 1.2)
+            sparkle_distance = _render_random.uniform(current_range * 0.4, current_range * 1.2)
             
             sparkle_x = render_pos[0] + math.cos(sparkle_angle) * sparkle_distance
             sparkle_y = render_pos[1] + math.sin(sparkle_angle) * sparkle_distance
             
             # Sparkle properties
-            sparkle_size = random.randint(2, 5)
-            sparkle_alpha = int(alpha * random.uniform(120, 255))
+            sparkle_size = _render_random.randint(2, 5)
+            sparkle_alpha = int(alpha * _render_random.uniform(120, 255))
             sparkle_color = (255, 255, 255, sparkle_alpha)
             
             # Draw star-shaped sparkle
@@ -10,6 +10,7 @@ from .effects import (ComicDashLine, ParticleEffect,
                       EnhancedExplosionEffect, MysticalBeamEffect)
 from .base_weapon_effects import BaseWeaponEffectsManager, WeaponImpactEffectsManager
 from .base_explosion_system import ExplosionManager
+from ..utils.object_pool import ObjectPool, swap_remove
 
 
 class VisualEffectsSystem:
@@ -233,6 +234,11 @@ class EffectsManager:
     def __init__(self):
         """Initialize the effects manager."""
         self.effects = []
+        # Bursts and explosion layers are recycled when they finish (a V-blast alone spawns ~250 layers)
+        self.effect_pools = {
+            ParticleEffect: ObjectPool(ParticleEffect, max_free=256),
+            EnhancedExplosionEffect: ObjectPool(EnhancedExplosionEffect, max_free=2048),
+        }
         
         # Initialize consolidated weapon effects systems
         self.weapon_effects = BaseWeaponEffectsManager()
@@ -245,10 +251,21 @@ class EffectsManager:
         """Add a new effect to the manager."""
         self.effects.append(effect)
     
+    def _obtain(self, effect_class, *args, **kwargs):
+        """Get a recycled (or new) particle burst or explosion layer."""
+        return self.effect_pools[effect_class].obtain(*args, **kwargs)
+    
     def update(self, dt: float, player_pos: pg.Vector2 = None):
         """Update all active effects."""
-        # Use a list comprehension for efficient removal of dead effects
-        self.effects = [effect for effect in self.effects if not self._update_effect(effect, dt, player_pos)]
+        # Walk backwards and swap-remove dead effects, handing poolable ones back
+        effects = self.effects
+        for i in range(len(effects) - 1, -1, -1):
+            effect = effects[i]
+            if self._update_effect(effect, dt, player_pos):
+                swap_remove(effects, i)
+                pool = self.effect_pools.get(type(effect))
+                if pool is not None:
+                    pool.recycle(effect)
         
         # Update consolidated weapon effects
         self.weapon_effects.update(dt)
@@ -283,6 +300,10 @@ class EffectsManager:
     
     def clear_effects(self):
         """Remove all active effects."""
+        for effect in self.effects:
+            pool = self.effect_pools.get(type(effect))
+            if pool is not None:
+                pool.recycle(effect)
         self.effects.clear()
 
     # --- Effect Creation Methods ---
@@ -311,7 +332,7 @@ class EffectsManager:
     def add_particle_effect(self, x: float, y: float, color: Tuple[int, int, int], 
                             particle_count: int = 10, speed: float = 120):
         """Create a simple particle burst."""
-        self.add_effect(ParticleEffect(x, y, color, particle_count, speed))
+        self.add_effect(self._obtain(ParticleEffect, x, y, color, particle_count, speed))
 
     def add_enhanced_explosion(self, x: float, y: float, explosion_type: str, 
                                color: Tuple[int, int, int] = (255, 100, 0),
@@ -319,56 +340,56 @@ class EffectsManager:
         """Create a more complex, multi-layered explosion."""
         # Core flash
         if explosion_type == "normal":
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 255, 200), 15, 250, (4, 8), "core", direction_angle, spread_angle))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 255, 200), 15, 250, (4, 8), "core", direction_angle, spread_angle))
             # Fiery parts
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 150, 0), 25, 180, (3, 7), "fire", direction_angle, spread_angle))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 150, 0), 25, 180, (3, 7), "fire", direction_angle, spread_angle))
             # Smoke
-            self.add_effect(EnhancedExplosionEffect(x, y, (80, 80, 80), 20, 80, (5, 10), "smoke", direction_angle, spread_angle))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (80, 80, 80), 20, 80, (5, 10), "smoke", direction_angle, spread_angle))
             # Sparks
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 255, 255), 15, 350, (1, 3), "sparks", direction_angle, spread_angle))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 255, 255), 15, 350, (1, 3), "sparks", direction_angle, spread_angle))
         elif explosion_type == "muzzle_flash":
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 220, 180), 8, 400, (2, 5), "muzzle_flash", direction_angle, 45))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 220, 180), 8, 400, (2, 5), "muzzle_flash", direction_angle, 45))
         elif explosion_type == "shotgun_blast":
             # Core flash
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 255, 220), 10, 500, (3, 6), "pellet_core", direction_angle, 30))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 255, 220), 10, 500, (3, 6), "pellet_core", direction_angle, 30))
             # Sparks
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 200, 100), 15, 600, (1, 3), "pellet_sparks", direction_angle, 35))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 200, 100), 15, 600, (1, 3), "pellet_sparks", direction_angle, 35))
         elif explosion_type == "energy_weapon":
             # Energy wisps
-            self.add_effect(EnhancedExplosionEffect(x, y, (150, 200, 255), 12, 300, (2, 4), "energy_wisps", direction_angle, 60))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (150, 200, 255), 12, 300, (2, 4), "energy_wisps", direction_angle, 60))
             # Energy residue
-            self.add_effect(EnhancedExplosionEffect(x, y, (100, 150, 200), 8, 100, (3, 5), "energy_residue", direction_angle, 90))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (100, 150, 200), 8, 100, (3, 5), "energy_residue", direction_angle, 90))
         elif explosion_type == "tactical_grenade":
             # Bright flash
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 255, 255), 5, 600, (10, 15), "tactical_flash", direction_angle, 360))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 255, 255), 5, 600, (10, 15), "tactical_flash", direction_angle, 360))
             # Anime-style sharp flash
-            self.add_effect(EnhancedExplosionEffect(x, y, (200, 220, 255), 8, 800, (2, 4), "anime_flash", direction_angle, 360))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (200, 220, 255), 8, 800, (2, 4), "anime_flash", direction_angle, 360))
             # Dense smoke
-            self.add_effect(EnhancedExplosionEffect(x, y, (150, 150, 150), 25, 120, (8, 15), "tactical_smoke", direction_angle, 360))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (150, 150, 150), 25, 120, (8, 15), "tactical_smoke", direction_angle, 360))
             # High-velocity sparks
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 230, 200), 20, 450, (1, 3), "tactical_sparks", direction_angle, 360))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 230, 200), 20, 450, (1, 3), "tactical_sparks", direction_angle, 360))
             # Debris
-            self.add_effect(EnhancedExplosionEffect(x, y, (100, 80, 60), 15, 200, (2, 5), "tactical_debris", direction_angle, 360))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (100, 80, 60), 15, 200, (2, 5), "tactical_debris", direction_angle, 360))
         elif explosion_type == "bullet_impact":
             # Small, sharp flash
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 255, 220), 5, 250, (2, 4), "impact_flash", direction_angle, 90))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 255, 220), 5, 250, (2, 4), "impact_flash", direction_angle, 90))
             # Tiny sparks
-            self.add_effect(EnhancedExplosionEffect(x, y, (200, 200, 200), 8, 350, (1, 2), "sparks", direction_angle, 90))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (200, 200, 200), 8, 350, (1, 2), "sparks", direction_angle, 90))
         elif explosion_type == "cyber_sword_clash":
             # Neon burst
-            self.add_effect(EnhancedExplosionEffect(x, y, (0, 255, 255), 10, 900, (2, 4), "neon_burst", direction_angle, 45))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (0, 255, 255), 10, 900, (2, 4), "neon_burst", direction_angle, 45))
             # Digital fragments
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 0, 255), 15, 700, (1, 3), "digital_fragments", direction_angle, 60))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 0, 255), 15, 700, (1, 3), "digital_fragments", direction_angle, 60))
             # Holographic glow
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 255, 255), 5, 200, (5, 8), "holographic_glow", direction_angle, 90))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 255, 255), 5, 200, (5, 8), "holographic_glow", direction_angle, 90))
         elif explosion_type == "anime_dash":
             # Energy burst
-            self.add_effect(EnhancedExplosionEffect(x, y, (200, 200, 255), 12, 400, (3, 5), "anime_energy_burst", direction_angle, 120))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (200, 200, 255), 12, 400, (3, 5), "anime_energy_burst", direction_angle, 120))
             # Skid marks
-            self.add_effect(EnhancedExplosionEffect(x, y, (100, 100, 100), 8, 80, (4, 6), "skid_mark", direction_angle, 60))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (100, 100, 100), 8, 80, (4, 6), "skid_mark", direction_angle, 60))
         elif explosion_type == "v_shaped_blast":
             # CLEAN bright red V-shaped blast - single layer for clarity
-            self.add_effect(EnhancedExplosionEffect(x, y, (255, 0, 0), 80, 400, (8, 15), "v_blast_clean", direction_angle, spread_angle))
+            self.add_effect(self._obtain(EnhancedExplosionEffect, x, y, (255, 0, 0), 80, 400, (8, 15), "v_blast_clean", direction_angle, spread_angle))
 
     def add_mystical_beam_effect(self, player_ref, relative_angle: float, beam_range: float, 
                                  width: float, duration: float, color: list, damage: float):
@@ -514,8 +535,8 @@ class EffectsManager:
             left_y = y + distance * math.sin(math.radians(left_arm_angle))
             
             # Bright red fire core (not explosive particles)
-            left_fire = EnhancedExplosionEffect(
-                left_x, left_y,
+            left_fire = self._obtain(
+                EnhancedExplosionEffect, left_x, left_y,
                 color=(255, 40, 0),  # Bright red-orange fire
                 particle_count=6,   # Fewer particles for straight line effect
                 speed=15,           # Very slow for fire beam
@@ -531,8 +552,8 @@ class EffectsManager:
             right_y = y + distance * math.sin(math.radians(right_arm_angle))
             
             # Bright red fire core (not explosive particles)
-            right_fire = EnhancedExplosionEffect(
-                right_x, right_y,
+            right_fire = self._obtain(
+                EnhancedExplosionEffect, right_x, right_y,
                 color=(255, 40, 0),  # Bright red-orange fire
                 particle_count=6,   # Fewer particles for straight line effect
                 speed=15,           # Very slow for fire beam
@@ -555,8 +576,8 @@ class EffectsManager:
                 fill_y = y + distance * math.sin(math.radians(fill_angle))
                 
                 # Red fire fill effect (smaller than main beams)
-                fill_fire = EnhancedExplosionEffect(
-                    fill_x, fill_y,
+                fill_fire = self._obtain(
+                    EnhancedExplosionEffect, fill_x, fill_y,
                     color=(200, 60, 0),  # Slightly darker red fire for fill
                     particle_count=4,    # Fewer particles for fill
                     speed=12,            # Very slow
@@ -568,8 +589,8 @@ class EffectsManager:
                 self.add_effect(fill_fire)
         
         # Add MASSIVE bright central flash at blast origin (where beams meet)
-        origin_flash = EnhancedExplosionEffect(
-            x, y,
+        origin_flash = self._obtain(
+            EnhancedExplosionEffect, x, y,
             color=(255, 255, 0),  # Bright yellow for maximum visibility
             particle_count=40,  # Many particles
             speed=80,
@@ -579,8 +600,8 @@ class EffectsManager:
         self.add_effect(origin_flash)
         
         # Add secondary white flash for even more visibility
-        white_flash = EnhancedExplosionEffect(
-            x, y,
+        white_flash = self._obtain(
+            EnhancedExplosionEffect, x, y,
             color=(255, 255, 255),  # Pure white
             particle_count=30,
             speed=60,
@@ -8,6 +8,22 @@ import math
 from typing import List, Tuple
 from enum import Enum
 
+# Handle seeded random stream and object pool imports
+try:
+    from src.utils.rng import rng
+    from src.utils.object_pool import ObjectPool
+except ImportError:
+    from utils.rng import rng
+    from utils.object_pool import ObjectPool
+
+_random = rng.stream("bullets")  # Bounce sparks and trail particles
+_render_random = rng.stream("render")  # Draw-time sparkle and jitter
+
+# Per-bullet extras (bounce sparks, grenade and network flags, laser size, the
+# RenderInterpolator's pre-tick position) a recycled bullet must not inherit
+_TRANSIENT_ATTRS = ("bounce_effects", "create_explosion", "explosion_pos", "is_network_bullet", "owner_id", "length", "width",
+                    "_prev_render_pos")
+
 class BulletType(Enum):
     """Types of bullets."""
     PLAYER = "player"
@@ -18,8 +34,22 @@ class Bullet:
     
     def __init__(self, x: float, y: float, angle: float, bullet_type: BulletType = BulletType.PLAYER, speed: float = 800, damage: int = None, size_multiplier: float = 1.0, color: tuple = None, penetration: int = 1, shape: str = "standard", range_limit: float = None, weapon_type: str = None, special_attack: bool = False, bounce_enabled: bool = False, max_bounces: int = 0, bounce_range: float = None, enemy_targeting: bool = False, trail_enabled: bool = False, trail_duration: float = 0.0, target_pos: tuple = None):
         """Initialize a bullet."""
-        self.pos = pg.Vector2(x, y)
-        self.start_pos = pg.Vector2(x, y)  # Store starting position for range calculation
+        self.pos = pg.Vector2()
+        self.start_pos = pg.Vector2()
+        self.last_trail_pos = pg.Vector2()
+        self.velocity = pg.Vector2()
+        self.trail_points = []
+        self.trail_positions = []
+        self.reset(x, y, angle, bullet_type, speed, damage, size_multiplier, color, penetration, shape, range_limit, weapon_type, special_attack, bounce_enabled, max_bounces, bounce_range, enemy_targeting, trail_enabled, trail_duration, target_pos)
+    
+    def reset(self, x: float, y: float, angle: float, bullet_type: BulletType = BulletType.PLAYER, speed: float = 800, damage: int = None, size_multiplier: float = 1.0, color: tuple = None, penetration: int = 1, shape: str = "standard", range_limit: float = None, weapon_type: str = None, special_attack: bool = False, bounce_enabled: bool = False, max_bounces: int = 0, bounce_range: float = None, enemy_targeting: bool = False, trail_enabled: bool = False, trail_duration: float = 0.0, target_pos: tuple = None):
+        """Set up the bullet for a new shot, reusing its vectors and lists (see BulletManager.bullet_pool)."""
+        # Drop state that update(), collisions and the managers attach on the fly
+        for name in _TRANSIENT_ATTRS:
+            self.__dict__.pop(name, None)
+        
+        self.pos.update(x, y)
+        self.start_pos.update(x, y)  # Store starting position for range calculation
         self.angle = angle  # Direction in degrees
         self.type = bullet_type
         self.speed = speed  # pixels per second
@@ -41,9 +71,9 @@ class Bullet:
         # Trail properties for special sniper bullets
         self.trail_enabled = trail_enabled  # Can this bullet leave a burning trail?
         self.trail_duration = trail_duration  # How long the trail lasts
-        self.trail_points = []  # List of positions where the bullet has been
+        self.trail_points.clear()  # List of positions where the bullet has been
         self.trail_segment_interval = 10  # Distance between trail segments (pixels)
-        self.last_trail_pos = pg.Vector2(x, y)  # Last position where we added a trail point
+        self.last_trail_pos.update(x, y)  # Last position where we added a trail point
         
         # Grenade targeting properties
         self.target_pos = target_pos  # Target position for grenade launcher
@@ -62,7 +92,7 @@ class Bullet:
         
         # Calculate velocity from angle
         angle_rad = math.radians(angle)
-        self.velocity = pg.Vector2(
+        self.velocity.update(
             math.cos(angle_rad) * speed,
             math.sin(angle_rad) * speed
         )
@@ -97,7 +127,7 @@ class Bullet:
         self.age = 0.0
         
         # Trail effect
-        self.trail_positions = []
+        self.trail_positions.clear()
     
     def _init_stats_by_type(self):
         """Initialize bullet stats based on type."""
@@ -121,8 +151,12 @@ class Bullet:
             self.length = 25  # Length of the laser beam
             self.width = 3   # Width of the laser beam
     
-    def update(self, dt: float, current_game_time: float = None, world_manager=None) -> bool:
-        """Update bullet position and state. Returns True if bullet should be removed."""
+    def update(self, dt: float, current_game_time: float = None, world_manager=None, map_blocked: bool = None) -> bool:
+        """
+        Update bullet position and state. Returns True if bullet should be removed.
+        map_blocked is the precomputed map collision flag for the moved position
+        (see BulletManager.update); when None the map is queried directly.
+        """
         # Check if visual effect bullet should expire first
         if self.lifespan is not None and self.creation_time is not None and current_game_time is not None:
             if current_game_time - self.creation_time > self.lifespan:
@@ -141,7 +175,9 @@ class Bullet:
         
         # Check map collision (blocks bullets or causes bounces)
         if world_manager is not None and hasattr(world_manager, 'is_position_blocked_by_map'):
-            if world_manager.is_position_blocked_by_map(self.pos.x, self.pos.y):
+            if map_blocked is None:
+                map_blocked = world_manager.is_position_blocked_by_map(self.pos.x, self.pos.y)
+            if map_blocked:
                 # Check if bullet can bounce
                 if self.bounce_enabled and self.bounces_remaining > 0:
                     # Attempt to bounce
@@ -190,7 +226,7 @@ class Bullet:
                     'pos': self.pos.copy(),
                     'timestamp': current_game_time
                 })
-                self.last_trail_pos = self.pos.copy()
+                self.last_trail_pos.update(self.pos)
         
         # Update bounce effects if any exist
         if hasattr(self, 'bounce_effects'):
@@ -281,14 +317,13 @@ class Bullet:
         }
         
         # Create spark particles in all directions
-        import random
         for i in range(8):
             angle = (i / 8.0) * 2 * math.pi
-            speed = random.uniform(50, 150)
+            speed = _random.uniform(50, 150)
             bounce_effect['particles'].append({
                 'pos': bounce_pos.copy(),
                 'velocity': pg.Vector2(math.cos(angle) * speed, math.sin(angle) * speed),
-                'size': random.uniform(2, 4),
+                'size': _random.uniform(2, 4),
                 'color': (255, 255, 100),  # Yellow sparks
                 'life': 1.0
             })
@@ -532,10 +567,9 @@ class Bullet:
                     
                     # Add occasional digital glitch pixels
                     if i % 2 == 0:  # Every other trail position
-                        import random
-                        glitch_x = trail_render_x + random.uniform(-trail_size * 2, trail_size * 2)
-                        glitch_y = trail_render_y + random.uniform(-trail_size * 2, trail_size * 2)
-                        glitch_size = random.randint(1, 2)
+                        glitch_x = trail_render_x + _render_random.uniform(-trail_size * 2, trail_size * 2)
+                        glitch_y = trail_render_y + _render_random.uniform(-trail_size * 2, trail_size * 2)
+                        glitch_size = _render_random.randint(1, 2)
                         glitch_alpha = int(alpha * 100)
                         if glitch_alpha > 0:
                             self._draw_pixel_artifact(screen, glitch_x, glitch_y, glitch_size, (0, 255, 255, glitch_alpha))
@@ -568,10 +602,9 @@ class Bullet:
                     
                     # Add magical sparkle particles
                     if i % 3 == 0:  # Every third trail position
-                        import random
-                        sparkle_x = trail_render_x + random.uniform(-trail_size * 3, trail_size * 3)
-                        sparkle_y = trail_render_y + random.uniform(-trail_size * 3, trail_size * 3)
-                        sparkle_size = random.randint(2, 4)
+                        sparkle_x = trail_render_x + _render_random.uniform(-trail_size * 3, trail_size * 3)
+                        sparkle_y = trail_render_y + _render_random.uniform(-trail_size * 3, trail_size * 3)
+                        sparkle_size = _render_random.randint(2, 4)
                         sparkle_alpha = int(alpha * 150)
                         if sparkle_alpha > 0:
                             self._draw_magical_sparkle(screen, sparkle_x, sparkle_y, sparkle_size, (255, 255, 255, sparkle_alpha))
@@ -671,7 +704,6 @@ class Bullet:
     def render_sniper_bullet(self, screen: pg.Surface, x: float, y: float):
         """Render a sci-fi laser beam with particle effects."""
         import math
-        import random
         
         angle_rad = math.radians(self.angle)
         cos_angle = math.cos(angle_rad)
@@ -914,7 +946,6 @@ class Bullet:
     def _draw_flame_layer(self, screen: pg.Surface, x: float, y: float, size: int, color: tuple, time_offset: float):
         """Draw a flickering flame layer with animated distortion."""
         import math
-        import random
         
         # Create flame-like distorted circle
         points = []
@@ -1020,7 +1051,6 @@ class Bullet:
     def render_neon_bullet(self, screen: pg.Surface, x: float, y: float):
         """Render a cyberpunk neon bullet with holographic effects."""
         import math
-        import random
         
         # Cyberpunk neon bullet - holographic projectile with digital effects
         angle_rad = math.radians(self.angle)
@@ -1069,13 +1099,13 @@ class Bullet:
         
         # Digital artifacts - glitchy pixel effects around the bullet
         for _ in range(3):
-            artifact_x = x + random.uniform(-bullet_length * 0.8, bullet_length * 0.8)
-            artifact_y = y + random.uniform(-bullet_width * 2, bullet_width * 2)
-            artifact_size = random.randint(1, 3)
-            artifact_alpha = random.randint(80, 150)
+            artifact_x = x + _render_random.uniform(-bullet_length * 0.8, bullet_length * 0.8)
+            artifact_y = y + _render_random.uniform(-bullet_width * 2, bullet_width * 2)
+            artifact_size = _render_random.randint(1, 3)
+            artifact_alpha = _render_random.randint(80, 150)
             
             # Small glitch pixels
-            if random.random() > 0.3:  # 70% chance
+            if _render_random.random() > 0.3:  # 70% chance
                 self._draw_pixel_artifact(screen, artifact_x, artifact_y, artifact_size, (*neon_cyan, artifact_alpha))
         
         # Holographic tip effect - bright leading edge
@@ -1129,7 +1159,6 @@ class Bullet:
     def render_sword_slash(self, screen: pg.Surface, x: float, y: float):
         """Render a magical fantasy sword slash with energy crescents and sparkle effects."""
         import math
-        import random
         
         # Magical sword slash - crescent-shaped energy wave
         angle_rad = math.radians(self.angle)
@@ -1182,16 +1211,16 @@ class Bullet:
         self._draw_magical_crescent(screen, x, y, slash_length * 0.9, core_width, blade_core)
         
         # Add magical sparkle particles around the slash
-        sparkle_count = random.randint(8, 15)
+        sparkle_count = _render_random.randint(8, 15)
         for _ in range(sparkle_count):
-            sparkle_distance = random.uniform(slash_length * 0.3, slash_length * 0.7)
-            sparkle_angle = self.angle + random.uniform(-30, 30)
+            sparkle_distance = _render_random.uniform(slash_length * 0.3, slash_length * 0.7)
+            sparkle_angle = self.angle + _render_random.uniform(-30, 30)
             sparkle_angle_rad = math.radians(sparkle_angle)
             
             sparkle_x = x + math.cos(sparkle_angle_rad) * sparkle_distance
             sparkle_y = y + math.sin(sparkle_angle_rad) * sparkle_distance
-            sparkle_size = random.randint(2, 5)
-            sparkle_alpha = random.randint(120, 200)
+            sparkle_size = _render_random.randint(2, 5)
+            sparkle_alpha = _render_random.randint(120, 200)
             
             self._draw_magical_sparkle(screen, sparkle_x, sparkle_y, sparkle_size, (*blade_bright, sparkle_alpha))
         
@@ -1346,7 +1375,6 @@ class Bullet:
     def _draw_laser_particles(self, screen: pg.Surface, tip_x: float, tip_y: float, angle_rad: float):
         """Draw optimized particle effects at the laser tip."""
         import math
-        import random
         
         cos_angle = math.cos(angle_rad)
         sin_angle = math.sin(angle_rad)
@@ -1358,8 +1386,8 @@ class Bullet:
             trail_y = tip_y - sin_angle * trail_dist
             
             # Smaller random offset for better performance
-            offset_x = random.uniform(-2, 2)  # Reduced spread
-            offset_y = random.uniform(-2, 2)
+            offset_x = _render_random.uniform(-2, 2)  # Reduced spread
+            offset_y = _render_random.uniform(-2, 2)
             
             particle_size = max(1, 4 - i // 2)  # Smaller particles
             color = (255, min(255, 180 + i * 8), min(255, 120 + i * 12))
@@ -1373,8 +1401,8 @@ class Bullet:
             
             for i in range(particles):
                 # Random particle position around the tip
-                particle_angle = (i / particles) * 2 * math.pi + random.uniform(-0.3, 0.3)
-                particle_dist = ring_radius + random.uniform(-3, 3)  # Reduced spread
+                particle_angle = (i / particles) * 2 * math.pi + _render_random.uniform(-0.3, 0.3)
+                particle_dist = ring_radius + _render_random.uniform(-3, 3)  # Reduced spread
                 
                 particle_x = tip_x + math.cos(particle_angle) * particle_dist
                 particle_y = tip_y + math.sin(particle_angle) * particle_dist
@@ -1391,18 +1419,17 @@ class Bullet:
                     size = 1
                 
                 # Reduced particle visibility check - 70% chance (was 80%)
-                if random.random() > 0.3:
+                if _render_random.random() > 0.3:
                     pg.draw.circle(screen, color, (int(particle_x), int(particle_y)), size)
         
         # Smaller center flash with less variation
-        flash_size = 6 + int(random.uniform(-1, 1))  # Smaller flash
+        flash_size = 6 + int(_render_random.uniform(-1, 1))  # Smaller flash
         pg.draw.circle(screen, (255, 255, 255), (int(tip_x), int(tip_y)), flash_size)
         pg.draw.circle(screen, (200, 240, 255), (int(tip_x), int(tip_y)), flash_size + 2, 1)  # Thinner ring
     
     def _draw_energy_crackling(self, screen: pg.Surface, back_x: float, back_y: float, front_x: float, front_y: float, beam_width: float):
         """Draw optimized energy crackling effects along the beam."""
         import math
-        import random
         
         beam_length = math.sqrt((front_x - back_x)**2 + (front_y - back_y)**2)
         
@@ -1416,14 +1443,14 @@ class Bullet:
             base_y = back_y + (front_y - back_y) * t
             
             # Smaller crackling offset for performance
-            offset_dist = random.uniform(beam_width * 0.5, beam_width * 1.5)  # Reduced range
-            offset_angle = random.uniform(0, 2 * math.pi)
+            offset_dist = _render_random.uniform(beam_width * 0.5, beam_width * 1.5)  # Reduced range
+            offset_angle = _render_random.uniform(0, 2 * math.pi)
             
             crack_x = base_x + math.cos(offset_angle) * offset_dist
             crack_y = base_y + math.sin(offset_angle) * offset_dist
             
             # Draw crackling line - simpler color logic
-            color = (200, 230, 255) if random.random() > 0.5 else (255, 255, 255)
+            color = (200, 230, 255) if _render_random.random() > 0.5 else (255, 255, 255)
             pg.draw.line(screen, color, (int(base_x), int(base_y)), (int(crack_x), int(crack_y)), 1)
     
     def get_rect(self) -> pg.Rect:
@@ -1449,14 +1476,22 @@ class BurningTrail:
             duration: How long the trail segment burns (seconds)
             damage: Damage per second to enemies touching this segment
         """
-        self.pos = pg.Vector2(x, y)
+        self.pos = pg.Vector2()
+        self.damaged_enemies = set()  # Track recently damaged enemies
+        self.last_damage_times = {}  # Track last damage time per enemy
+        self.fire_particles = []
+        self.reset(x, y, duration, damage)
+    
+    def reset(self, x: float, y: float, duration: float = 2.5, damage: float = 12):
+        """Relight a recycled segment at a new position (see BulletManager.trail_pool)."""
+        self.pos.update(x, y)
         self.radius = 40  # Larger radius for better visibility
         self.damage_per_second = damage
         self.duration = duration
         self.age = 0.0
-        self.damaged_enemies = set()  # Track recently damaged enemies
+        self.damaged_enemies.clear()
         self.damage_cooldown = 0.3  # Seconds between damage ticks per enemy
-        self.last_damage_times = {}  # Track last damage time per enemy
+        self.last_damage_times.clear()
         
         # Visual properties for trail fire animation
         self.flame_flicker_time = 0.0
@@ -1464,28 +1499,31 @@ class BurningTrail:
     
     def _initialize_trail_particles(self):
         """Initialize trail fire particles for visual effects."""
-        import random
         import math
         
-        # Create fire particles for the trail segment
-        self.fire_particles = []
+        # Fire particles for the trail segment (a recycled segment refills its old dicts)
+        particles = self.fire_particles
         
         # Create more fire particles in a line-like pattern for better visibility
         particle_count = 20  # Increased count for trail segments
-        for _ in range(particle_count):
+        del particles[particle_count:]
+        for i in range(particle_count):
             # Position particles in a small area around the trail point
-            angle = random.uniform(0, 2 * math.pi)
-            distance = random.uniform(0, self.radius * 0.9)
+            angle = _random.uniform(0, 2 * math.pi)
+            distance = _random.uniform(0, self.radius * 0.9)
             x = self.pos.x + math.cos(angle) * distance
             y = self.pos.y + math.sin(angle) * distance
-            self.fire_particles.append({
-                'x': x, 'y': y,
-                'base_x': x, 'base_y': y,
-                'size': random.uniform(6, 14),  # Larger particles
-                'intensity': random.uniform(0.9, 1.4),
-                'flicker_speed': random.uniform(8, 15),
-                'color_variant': random.uniform(0.9, 1.1)
-            })
+            if i < len(particles):
+                particle = particles[i]
+            else:
+                particle = {}
+                particles.append(particle)
+            particle['x'] = particle['base_x'] = x
+            particle['y'] = particle['base_y'] = y
+            particle['size'] = _random.uniform(6, 14)  # Larger particles
+            particle['intensity'] = _random.uniform(0.9, 1.4)
+            particle['flicker_speed'] = _random.uniform(8, 15)
+            particle['color_variant'] = _random.uniform(0.9, 1.1)
     
     def update(self, dt: float) -> bool:
         """Update the burning trail. Returns True if it should be removed."""
@@ -1514,7 +1552,6 @@ class BurningTrail:
             alpha = max(0.0, 1.0 - fade_progress)
         
         # Render fire particles
-        import random
         for particle in self.fire_particles:
             # Calculate screen position (add offset like ground fire does)
             screen_x = particle['x'] + offset.x
@@ -1569,7 +1606,9 @@ class BulletManager:
     
     def __init__(self):
         """Initialize the bullet manager."""
-        self.bullets: List[Bullet] = []
+        # Bullets and trail segments are recycled; the live lists are the pools' active lists
+        self.bullet_pool = ObjectPool(Bullet, max_free=512)
+        self.bullets: List[Bullet] = self.bullet_pool.active
         
         # Shooting mechanics
         self.last_shot_time = 0.0
@@ -1583,7 +1622,8 @@ class BulletManager:
         self.minigun_reload_reset = False  # Flag to prevent spin-up restart until fire button released
         
         # Burning trail system for special sniper bullets
-        self.burning_trails = []  # List of active burning trail segments
+        self.trail_pool = ObjectPool(BurningTrail, max_free=256)
+        self.burning_trails = self.trail_pool.active  # List of active burning trail segments
     
     def set_fire_rate(self, fire_rate: float):
         """Set the fire rate for bullets."""
@@ -1662,21 +1702,21 @@ class BulletManager:
         return current_time - self.last_shot_time >= self.current_fire_rate
     
     def create_bullet(self, x: float, y: float, angle: float, bullet_type: BulletType = BulletType.PLAYER, damage: int = None, speed: float = 800, size_multiplier: float = 1.0, color: tuple = None, penetration: int = 1, shape: str = None, range_limit: float = None, weapon_type: str = None, lighting_system=None, special_attack: bool = False, bounce_enabled: bool = False, max_bounces: int = 0, bounce_range: float = None, enemy_targeting: bool = False, trail_enabled: bool = False, trail_duration: float = 0.0, target_pos: tuple = None):
-        """Create a bullet without fire rate checking (used for multi-pellet weapons)."""
-        from src.entities.bullet import Bullet
-        
+        """
+        Create a bullet without fire rate checking (used for multi-pellet weapons).
+        The bullet comes from the pool but is not live until it is passed to add_bullet().
+        """
         # Add muzzle flash lighting effect for shotgun pellets (reduced intensity per pellet)
         if lighting_system and bullet_type == BulletType.PLAYER:
             print(f"Shotgun pellet - adding muzzle flash for weapon: {weapon_type}")
             lighting_system.add_muzzle_flash(x, y, intensity=0.5, weapon_type=weapon_type or "default")
         
-        return Bullet(x, y, angle, bullet_type, speed=speed, damage=damage, size_multiplier=size_multiplier, color=color, penetration=penetration, shape=shape, range_limit=range_limit, weapon_type=weapon_type, special_attack=special_attack, bounce_enabled=bounce_enabled, max_bounces=max_bounces, bounce_range=bounce_range, enemy_targeting=enemy_targeting, trail_enabled=trail_enabled, trail_duration=trail_duration, target_pos=target_pos)
+        return self.bullet_pool.obtain(x, y, angle, bullet_type, speed=speed, damage=damage, size_multiplier=size_multiplier, color=color, penetration=penetration, shape=shape, range_limit=range_limit, weapon_type=weapon_type, special_attack=special_attack, bounce_enabled=bounce_enabled, max_bounces=max_bounces, bounce_range=bounce_range, enemy_targeting=enemy_targeting, trail_enabled=trail_enabled, trail_duration=trail_duration, target_pos=target_pos)
     
     def shoot(self, x: float, y: float, angle: float, current_time: float, bullet_type: BulletType = BulletType.PLAYER, damage: int = None, speed: float = 800, size_multiplier: float = 1.0, color: tuple = None, penetration: int = 1, shape: str = None, range_limit: float = None, weapon_type: str = None, lighting_system=None, special_attack: bool = False, bounce_enabled: bool = False, max_bounces: int = 0, bounce_range: float = None, enemy_targeting: bool = False, trail_enabled: bool = False, trail_duration: float = 0.0) -> bool:
         """Create a new bullet if fire rate allows. Returns True if bullet was fired."""
         if self.can_shoot(current_time):
-            bullet = Bullet(x, y, angle, bullet_type, speed=speed, damage=damage, size_multiplier=size_multiplier, color=color, penetration=penetration, shape=shape, range_limit=range_limit, weapon_type=weapon_type, special_attack=special_attack, bounce_enabled=bounce_enabled, max_bounces=max_bounces, bounce_range=bounce_range, enemy_targeting=enemy_targeting, trail_enabled=trail_enabled, trail_duration=trail_duration)
-            self.bullets.append(bullet)
+            self.bullet_pool.acquire(x, y, angle, bullet_type, speed=speed, damage=damage, size_multiplier=size_multiplier, color=color, penetration=penetration, shape=shape, range_limit=range_limit, weapon_type=weapon_type, special_attack=special_attack, bounce_enabled=bounce_enabled, max_bounces=max_bounces, bounce_range=bounce_range, enemy_targeting=enemy_targeting, trail_enabled=trail_enabled, trail_duration=trail_duration)
             self.last_shot_time = current_time
             
             # Add muzzle flash lighting effect
@@ -1691,20 +1731,28 @@ class BulletManager:
     
     def shoot_enemy_laser(self, x: float, y: float, angle: float, current_time: float):
         """Create an enemy laser bullet (no fire rate limit for enemies)."""
-        bullet = Bullet(x, y, angle, BulletType.ENEMY_LASER, speed=300)  # Reduced speed for visibility
-        self.bullets.append(bullet)
+        self.bullet_pool.acquire(x, y, angle, BulletType.ENEMY_LASER, speed=300)  # Reduced speed for visibility
     
     def update(self, dt: float, current_game_time: float = None, world_manager=None, impact_sparks_manager=None):
         """Update all bullets and remove expired ones."""
         # Update bullets and mark for removal
         bullets_to_remove = []
         
-        for bullet in self.bullets:
+        # Query map collision for every bullet's next position in one batch
+        blocked_flags = None
+        if (self.bullets and world_manager is not None and
+                hasattr(world_manager, 'are_positions_blocked_by_map')):
+            blocked_flags = world_manager.are_positions_blocked_by_map(
+                [bullet.pos.x + bullet.velocity.x * dt for bullet in self.bullets],
+                [bullet.pos.y + bullet.velocity.y * dt for bullet in self.bullets])
+        
+        for i, bullet in enumerate(self.bullets):
             # Store previous position for impact angle calculation
             old_pos = bullet.pos.copy()
             
             # Check if bullet should be removed due to wall collision or other reasons
-            should_remove = bullet.update(dt, current_game_time, world_manager)
+            map_blocked = bool(blocked_flags[i]) if blocked_flags is not None else None
+            should_remove = bullet.update(dt, current_game_time, world_manager, map_blocked)
             
             # If bullet was removed due to wall collision, create impact sparks
             if should_remove and world_manager and impact_sparks_manager:
@@ -1724,12 +1772,11 @@ class BulletManager:
                     
                     for trail_data in points_to_process:
                         # Create a burning trail segment at this position
-                        trail_segment = BurningTrail(
+                        self.trail_pool.acquire(
                             trail_data['pos'].x, trail_data['pos'].y,
                             duration=bullet.trail_duration,
                             damage=12
                         )
-                        self.burning_trails.append(trail_segment)
                     
                     # Remove processed points to avoid duplicates
                     bullet.trail_points = bullet.trail_points[-(min(3, len(bullet.trail_points))):]
@@ -1737,12 +1784,11 @@ class BulletManager:
             # When bullet is removed, create final trail segments for any remaining trail points
             if should_remove and bullet.trail_enabled:
                 for trail_data in bullet.trail_points:
-                    trail_segment = BurningTrail(
+                    self.trail_pool.acquire(
                         trail_data['pos'].x, trail_data['pos'].y,
                         duration=bullet.trail_duration,
                         damage=12
                     )
-                    self.burning_trails.append(trail_segment)
             
             if should_remove:
                 bullets_to_remove.append(bullet)
@@ -1758,7 +1804,7 @@ class BulletManager:
             # If this is a grenade that should explode, don't remove it yet - let main game handle it
             if hasattr(bullet, 'create_explosion') and bullet.create_explosion:
                 continue  # Skip removal, let main game handle explosion and removal
-            self.bullets.remove(bullet)
+            self.bullet_pool.release(bullet)
         
         # Update burning trails
         trails_to_remove = []
@@ -1768,7 +1814,7 @@ class BulletManager:
         
         # Remove expired trails
         for trail in trails_to_remove:
-            self.burning_trails.remove(trail)
+            self.trail_pool.release(trail)
     
     def render(self, screen: pg.Surface, offset=(0, 0)):
         """Render all bullets and burning trails."""
@@ -1822,7 +1868,7 @@ class BulletManager:
                     bullet_color = (255, 255, 255)  # Fall back to default bullet color
         
         # Create bullet with all transmitted network properties - preserve full appearance
-        bullet = Bullet(
+        bullet = self.bullet_pool.acquire(
             x, y, angle, 
             BulletType.PLAYER,  # Use player type to get proper appearance
             speed=speed, 
@@ -1847,24 +1893,25 @@ class BulletManager:
         bullet.owner_id = owner_id
         
         # Set velocity directly (don't recalculate from angle)
-        bullet.velocity = pg.Vector2(velocity_x, velocity_y)
-        
-        self.bullets.append(bullet)
+        bullet.velocity.update(velocity_x, velocity_y)
         return bullet
 
     def get_bullets(self) -> List[Bullet]:
         """Get list of all active bullets."""
         return self.bullets
     
+    def add_bullet(self, bullet: Bullet) -> Bullet:
+        """Make a bullet from create_bullet() live."""
+        return self.bullet_pool.add(bullet)
+    
     def remove_bullet(self, bullet: Bullet):
         """Remove a specific bullet (for collision handling)."""
-        if bullet in self.bullets:
-            self.bullets.remove(bullet)
+        self.bullet_pool.release(bullet)
     
     def clear(self):
         """Remove all bullets and burning trails."""
-        self.bullets.clear()
-        self.burning_trails.clear()
+        self.bullet_pool.release_all()
+        self.trail_pool.release_all()
     
     def get_bullet_count(self) -> int:
         """Get the number of active bullets."""
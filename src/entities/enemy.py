@@ -5,9 +5,8 @@ Handles enemy AI, movement, and behavior.
 
 import pygame as pg
 import math
-import random
 import os
-from typing import List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from enum import Enum
 
 # Import MessageType for network communication
@@ -20,6 +19,15 @@ except ImportError:
         # Fallback if imports fail
         MessageType = None
 
+# Handle logging import
+try:
+    from src.utils.log import get_logger, LogChannel
+except ImportError:
+    from utils.log import get_logger, LogChannel
+
+logger = get_logger(__name__)
+_network_log = LogChannel(logger)  # Network spawns and deaths, at most one line per second
+
 # Handle imports for sprite animation
 try:
     from src.utils.sprite_animation import AnimatedSprite
@@ -41,6 +49,50 @@ except ImportError:
     except ImportError:
         asset_manager = None
 
+# Handle spatial hash import for the separation broad phase
+try:
+    from src.systems.spatial_hash import SpatialHash
+except ImportError:
+    from systems.spatial_hash import SpatialHash
+
+# Handle render queue import for batched sprite rendering
+try:
+    from src.utils.render_queue import RenderQueue
+except ImportError:
+    try:
+        from utils.render_queue import RenderQueue
+    except ImportError:
+        RenderQueue = None
+
+# NumPy is optional - only the batched separation solver needs it
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("enemies")  # Movement jitter, attack cooldowns, ids
+_spawn_random = rng.stream("spawns")  # Spawn sides, positions and enemy types
+
+# Enemy separation ("bubble") physics
+ENEMY_BUBBLE_PADDING = 15  # Bubble radius is enemy size plus this padding
+ENEMY_SEPARATION_STRENGTH = 0.3  # Fraction of the overlap pushed apart per frame
+ENEMY_SEPARATION_DAMPING = 0.9  # Velocity multiplier per overlapping neighbour
+ENEMY_SEPARATION_CELL_SIZE = 80  # Two of the largest (tank) bubbles
+
+# Enemies further than this from the player are culled without dropping cores
+ENEMY_CULL_DISTANCE = 4000
+
+# Render queue layer for enemy sprites
+ENEMY_RENDER_LAYER = "enemies"
+
 class EnemyType(Enum):
     """Types of enemies."""
     BASIC = "basic"
@@ -61,7 +113,7 @@ class Enemy:
         self.distance_from_spawn = distance_from_spawn
         
         # Network synchronization
-        self.enemy_id = enemy_id or f"enemy_{random.randint(10000, 99999)}"
+        self.enemy_id = enemy_id or f"enemy_{_random.randint(10000, 99999)}"
         self.last_network_update = 0.0
         self.network_update_interval = 0.1  # Update every 100ms
         
@@ -92,7 +144,7 @@ class Enemy:
         
         # AI state
         self.last_direction_change = 0.0
-        self.wander_angle = random.uniform(0, 360)
+        self.wander_angle = _random.uniform(0, 360)
         self.state = "seeking"  # seeking, wandering, attacking
         
         # Movement tracking for animation
@@ -103,8 +155,8 @@ class Enemy:
         
         # Laser shooting
         self.last_laser_shot = 0.0
-        self.laser_cooldown = random.uniform(0.3, 0.8)  # Much more frequent shooting
-        self.can_shoot_lasers = random.random() < 0.9  # 90% of enemies can shoot
+        self.laser_cooldown = _random.uniform(0.3, 0.8)  # Much more frequent shooting
+        self.can_shoot_lasers = _random.random() < 0.9  # 90% of enemies can shoot
         
         # Debug timer for movement
         self._last_debug_wave_check = 0.0
@@ -199,8 +251,8 @@ class Enemy:
                 
                 # Add slight randomness for swarming behavior (prevents perfect stacking)
                 swarm_offset = pg.Vector2(
-                    random.uniform(-0.3, 0.3), 
-                    random.uniform(-0.3, 0.3)
+                    _random.uniform(-0.3, 0.3), 
+                    _random.uniform(-0.3, 0.3)
                 )
                 direction += swarm_offset
                 if direction.length() > 0:
@@ -262,7 +314,7 @@ class Enemy:
             self.should_shoot_laser = True
             self.laser_angle = angle_to_player
             self.last_laser_shot = current_time
-            self.laser_cooldown = random.uniform(0.2, 0.6)  # Much more aggressive shooting
+            self.laser_cooldown = _random.uniform(0.2, 0.6)  # Much more aggressive shooting
         else:
             self.should_shoot_laser = False
     
@@ -271,19 +323,6 @@ class Enemy:
         self.health = max(0, self.health - damage)
         self.hurt_timer = self.hurt_duration
     
-    def _apply_hurt_tinting(self, surface: pg.Surface, intensity: float):
-        """Apply hurt flash tinting to a surface while respecting alpha channel - OPTIMIZED."""
-        # Use pygame's built-in color blending for better performance
-        if intensity <= 0:
-            return
-        
-        # Create a temporary surface for blending
-        overlay = pg.Surface(surface.get_size(), pg.SRCALPHA)
-        overlay.fill((255, 255, 255, int(128 * intensity)))  # Semi-transparent white
-        
-        # Use pygame's optimized blend modes
-        surface.blit(overlay, (0, 0), special_flags=pg.BLEND_ALPHA_SDL2)
-    
     def is_alive(self) -> bool:
         """Check if enemy is still alive."""
         return self.health > 0
@@ -329,31 +368,9 @@ class Enemy:
             self.animated_sprite.render(screen, offset)
             
             # Apply hurt flash effect with alpha-respecting tinting
-            if self.hurt_timer > 0:
-                # Get current sprite surface
-                sprite_surface = self.animated_sprite.animation.get_current_frame()
-                if sprite_surface:
-                    # Create a copy to apply tinting
-                    tinted_sprite = sprite_surface.copy()
-                    
-                    # Apply per-pixel tinting that respects alpha
-                    flash_intensity = min(1.0, self.hurt_timer / self.hurt_duration)
-                    self._apply_hurt_tinting(tinted_sprite, flash_intensity)
-                    
-                    # Scale sprite to match enemy scale
-                    sprite_size = int(32 * 0.8)
-                    tinted_sprite = pg.transform.scale(tinted_sprite, (sprite_size, sprite_size))
-                    
-                    # Render the tinted sprite
-                    sprite_rect = pg.Rect(render_x - sprite_size//2, render_y - sprite_size//2, sprite_size, sprite_size)
-                    screen.blit(tinted_sprite, sprite_rect.topleft)
-                else:
-                    # Fallback to overlay method
-                    sprite_size = int(32 * 0.8)
-                    sprite_rect = pg.Rect(render_x - sprite_size//2, render_y - sprite_size//2, sprite_size, sprite_size)
-                    white_overlay = pg.Surface((sprite_size, sprite_size), pg.SRCALPHA)
-                    white_overlay.fill((255, 255, 255, 128))
-                    screen.blit(white_overlay, sprite_rect)
+            hurt_blit = self._get_hurt_flash_blit(render_x, render_y)
+            if hurt_blit:
+                screen.blit(*hurt_blit)
         else:
             # Fallback to geometric rendering
             # Choose color based on state and hurt effect
@@ -369,6 +386,48 @@ class Enemy:
             outline_color = tuple(max(0, c - 50) for c in self.color)
             pg.draw.circle(screen, outline_color, (render_x, render_y), self.size, 2)
         
+        self._render_overlays(screen, render_x, render_y)
+    
+    def submit_render(self, render_queue, offset=(0, 0)) -> bool:
+        """Queue the sprite and hurt flash for batched rendering. Returns False if the enemy has no sprite."""
+        if not (self.use_sprites and self.animated_sprite):
+            return False
+        
+        blit = self.animated_sprite.get_blit(offset)
+        if blit:
+            render_queue.submit(ENEMY_RENDER_LAYER, *blit)
+        
+        hurt_blit = self._get_hurt_flash_blit(int(self.pos.x + offset[0]), int(self.pos.y + offset[1]))
+        if hurt_blit:
+            render_queue.submit(ENEMY_RENDER_LAYER, *hurt_blit)
+        return True
+    
+    def render_overlays(self, screen: pg.Surface, offset=(0, 0)):
+        """Render the health bar and type indicator drawn on top of the sprite."""
+        self._render_overlays(screen, int(self.pos.x + offset[0]), int(self.pos.y + offset[1]))
+    
+    def _get_hurt_flash_blit(self, render_x: int, render_y: int):
+        """Get the (surface, dest) pair for the hurt flash, or None when not hurt."""
+        if self.hurt_timer <= 0:
+            return None
+        
+        # Scale sprite to match enemy scale
+        sprite_size = int(32 * 0.8)
+        sprite_pos = (render_x - sprite_size//2, render_y - sprite_size//2)
+        
+        # Pre-tinted, pre-scaled frame from the asset cache (nearest intensity bucket)
+        flash_intensity = min(1.0, self.hurt_timer / self.hurt_duration)
+        tinted_sprite = self.animated_sprite.animation.get_hurt_frame(
+            flash_intensity, (sprite_size, sprite_size))
+        if tinted_sprite:
+            return tinted_sprite, sprite_pos
+        if asset_manager:
+            # Fallback to overlay method
+            return asset_manager.get_flash_overlay((sprite_size, sprite_size)), sprite_pos
+        return None
+    
+    def _render_overlays(self, screen: pg.Surface, render_x: int, render_y: int):
+        """Draw the health bar and type indicator."""
         # Draw health bar if damaged (scaled for larger resolution)
         if self.health < self.max_health:
             bar_width = int(self.size * 3)  # Scale with enemy size
@@ -411,14 +470,13 @@ class EnemyManager:
     def __init__(self, world_manager=None, spawn_point=(0, 0), is_host=False, game_synchronizer=None):
         """Initialize the enemy manager."""
         self.enemies: List[Enemy] = []
+        self.enemies_by_id: Dict[str, Enemy] = {}  # Client-side index for applying network updates
         self.world_manager = world_manager
         self.spawn_point = pg.Vector2(spawn_point)  # Player's starting position
         
         # Network multiplayer support
         self.is_host = is_host
         self.game_synchronizer = game_synchronizer
-        self.last_sync_time = 0.0
-        self.sync_interval = 0.5  # Sync every 500ms (reduced from 100ms to prevent flooding)
         self.next_enemy_id = 1
         
         # Spawning mechanics
@@ -445,6 +503,17 @@ class EnemyManager:
         self.initial_spawn_grace_period = 3.0  # Prevent spawning for first 3 seconds
         self.last_player_chunk = None  # Track player's current world chunk for pre-population
         
+        # Optional NumPy structure-of-arrays AI update (see enable_enemy_pool)
+        self.enemy_pool = None
+        
+        # Batched sprite rendering (culled against the screen, flushed with fblits)
+        self.render_queue = RenderQueue() if RenderQueue is not None else None
+        
+        # Separation physics broad phase (see _handle_enemy_collisions)
+        self.separation_grid = SpatialHash(ENEMY_SEPARATION_CELL_SIZE)
+        self.use_numpy_separation = False  # Opt-in batched solver (requires NumPy)
+        self.numpy_separation_min_enemies = 64  # Below this the grid path is faster
+        
         # Sprite sheet caching to prevent stuttering
         self.cached_sprite_path = "assets/images/Enemies/rapture1-sprite.png"
         
@@ -492,27 +561,27 @@ class EnemyManager:
         camera_bottom = player_pos.y + virtual_height / 2
         
         # Choose a spawn side (border) randomly: 0=left, 1=right, 2=top, 3=bottom
-        spawn_side = random.randint(0, 3)
+        spawn_side = _spawn_random.randint(0, 3)
         
         # Spawn exactly at world borders (guaranteed spawning)
         spawn_x = 0
         spawn_y = 0
         
         if spawn_side == 0:  # Left border
-            spawn_x = world_bounds[0] + random.uniform(50, 150)  # Near left border
-            spawn_y = random.uniform(world_bounds[1], world_bounds[3])
+            spawn_x = world_bounds[0] + _spawn_random.uniform(50, 150)  # Near left border
+            spawn_y = _spawn_random.uniform(world_bounds[1], world_bounds[3])
                 
         elif spawn_side == 1:  # Right border  
-            spawn_x = world_bounds[2] - random.uniform(50, 150)  # Near right border
-            spawn_y = random.uniform(world_bounds[1], world_bounds[3])
+            spawn_x = world_bounds[2] - _spawn_random.uniform(50, 150)  # Near right border
+            spawn_y = _spawn_random.uniform(world_bounds[1], world_bounds[3])
                 
         elif spawn_side == 2:  # Top border
-            spawn_x = random.uniform(world_bounds[0], world_bounds[2])
-            spawn_y = world_bounds[1] + random.uniform(50, 150)  # Near top border
+            spawn_x = _spawn_random.uniform(world_bounds[0], world_bounds[2])
+            spawn_y = world_bounds[1] + _spawn_random.uniform(50, 150)  # Near top border
                 
         elif spawn_side == 3:  # Bottom border
-            spawn_x = random.uniform(world_bounds[0], world_bounds[2])
-            spawn_y = world_bounds[3] - random.uniform(50, 150)  # Near bottom border
+            spawn_x = _spawn_random.uniform(world_bounds[0], world_bounds[2])
+            spawn_y = world_bounds[3] - _spawn_random.uniform(50, 150)  # Near bottom border
         
         # Additional check: ensure we're actually near the borders, not in the middle areas
         min_distance_from_edge = min(
@@ -535,7 +604,7 @@ class EnemyManager:
         if self.wave >= 3 or wave_danger_level >= 4:
             enemy_types.append(EnemyType.TANK)
         
-        enemy_type = random.choice(enemy_types)
+        enemy_type = _spawn_random.choice(enemy_types)
         distance_from_center = math.sqrt(spawn_x**2 + spawn_y**2)
         
         # Generate unique ID for multiplayer
@@ -589,27 +658,27 @@ class EnemyManager:
             spawn_attempts += 1
             
             # Choose spawn side randomly: 0=left, 1=right, 2=top, 3=bottom
-            spawn_side = random.randint(0, 3)
+            spawn_side = _spawn_random.randint(0, 3)
             
             spawn_x = 0
             spawn_y = 0
             valid_spawn = True
             
             if spawn_side == 0:  # Left border
-                spawn_x = world_bounds[0] + random.uniform(0, 300)
-                spawn_y = random.uniform(world_bounds[1], world_bounds[3])
+                spawn_x = world_bounds[0] + _spawn_random.uniform(0, 300)
+                spawn_y = _spawn_random.uniform(world_bounds[1], world_bounds[3])
                 
             elif spawn_side == 1:  # Right border  
-                spawn_x = world_bounds[2] - random.uniform(0, 300)
-                spawn_y = random.uniform(world_bounds[1], world_bounds[3])
+                spawn_x = world_bounds[2] - _spawn_random.uniform(0, 300)
+                spawn_y = _spawn_random.uniform(world_bounds[1], world_bounds[3])
                 
             elif spawn_side == 2:  # Top border
-                spawn_x = random.uniform(world_bounds[0], world_bounds[2])
-                spawn_y = world_bounds[1] + random.uniform(0, 300)
+                spawn_x = _spawn_random.uniform(world_bounds[0], world_bounds[2])
+                spawn_y = world_bounds[1] + _spawn_random.uniform(0, 300)
                 
             elif spawn_side == 3:  # Bottom border
-                spawn_x = random.uniform(world_bounds[0], world_bounds[2])
-                spawn_y = world_bounds[3] - random.uniform(0, 300)
+                spawn_x = _spawn_random.uniform(world_bounds[0], world_bounds[2])
+                spawn_y = world_bounds[3] - _spawn_random.uniform(0, 300)
             
             # Validate spawn position
             # 1. Not on camera (less strict for pre-population)
@@ -638,7 +707,7 @@ class EnemyManager:
             if self.wave >= 3 or wave_danger_level >= 4:
                 enemy_types.append(EnemyType.TANK)
             
-            enemy_type = random.choice(enemy_types)
+            enemy_type = _spawn_random.choice(enemy_types)
             distance_from_center = math.sqrt(spawn_x**2 + spawn_y**2)
             
             # Generate unique ID for multiplayer
@@ -697,106 +766,38 @@ class EnemyManager:
                 self.enemies_spawned_this_wave += 1
 
         # Update all enemies with performance optimizations
-        enemies_to_remove = []
-        collision_check_frequency = 10  # Only check collision every N frames for performance
-        
-        for i, enemy in enumerate(self.enemies):
-            enemy.update(dt, player_pos, current_time)
-            
-            # Keep enemies within world bounds (with some buffer for natural movement)
-            if self.world_manager:
-                world_bounds = self.world_manager.world_bounds  # (-1920, -1080, 1920, 1080)
-                buffer = 100  # Allow some movement beyond strict bounds
-                enemy.pos.x = max(world_bounds[0] - buffer, min(world_bounds[2] + buffer, enemy.pos.x))
-                enemy.pos.y = max(world_bounds[1] - buffer, min(world_bounds[3] + buffer, enemy.pos.y))
-                
-                # Always check if enemy is stuck in an obstacle (every frame for accuracy)
-                if self.world_manager.is_position_blocked_by_map(enemy.pos.x, enemy.pos.y):
-                    # Immediate extraction if stuck in obstacle
-                    for radius in [30, 50]:
-                        extraction_successful = False
-                        for angle in [0, 90, 180, 270]:  # Only try cardinal directions
-                            angle_rad = math.radians(angle)
-                            test_x = enemy.pos.x + math.cos(angle_rad) * radius
-                            test_y = enemy.pos.y + math.sin(angle_rad) * radius
-                            
-                            if not self.world_manager.is_position_blocked_by_map(test_x, test_y):
-                                # Calculate direction before moving
-                                direction = pg.Vector2(test_x - enemy.pos.x, test_y - enemy.pos.y)
-                                enemy.pos.x = test_x
-                                enemy.pos.y = test_y
-                                # Simple bounce using the direction we calculated
-                                if direction.length() > 0:
-                                    enemy.velocity = direction.normalize() * enemy.speed
-                                else:
-                                    # Fallback: random direction
-                                    angle = math.radians(random.uniform(0, 360))
-                                    enemy.velocity = pg.Vector2(math.cos(angle), math.sin(angle)) * enemy.speed
-                                extraction_successful = True
-                                break
-                        
-                        if extraction_successful:
-                            break
+        if self.enemy_pool is not None:
+            enemies_to_remove, enemies_to_cull = self._update_enemies_pooled(
+                dt, player_pos, current_time, bullet_manager)
+        else:
+            enemies_to_remove = []
+            for enemy in self.enemies:
+                enemy.update(dt, player_pos, current_time)
                 
-                # Performance optimization: Only do expensive obstacle avoidance for some enemies per frame
-                elif i % collision_check_frequency == (int(current_time * 10) % collision_check_frequency):
-                    # Simplified obstacle avoidance - less frequent and simpler
-                    if enemy.velocity.length() > 0:
-                        # Only check immediate ahead
-                        look_ahead_distance = 35
-                        velocity_normalized = enemy.velocity.normalize()
-                        future_x = enemy.pos.x + velocity_normalized.x * look_ahead_distance
-                        future_y = enemy.pos.y + velocity_normalized.y * look_ahead_distance
-                        
-                        if self.world_manager.is_position_blocked_by_map(future_x, future_y):
-                            # Simple steering - try left or right turn
-                            current_angle = math.atan2(enemy.velocity.y, enemy.velocity.x)
-                            for turn_angle in [math.pi/2, -math.pi/2]:  # Only 90 degree turns
-                                test_angle = current_angle + turn_angle
-                                test_x = enemy.pos.x + math.cos(test_angle) * look_ahead_distance
-                                test_y = enemy.pos.y + math.sin(test_angle) * look_ahead_distance
-                                
-                                if not self.world_manager.is_position_blocked_by_map(test_x, test_y):
-                                    enemy.velocity.x = math.cos(test_angle) * enemy.speed
-                                    enemy.velocity.y = math.sin(test_angle) * enemy.speed
-                                    break
+                # Keep enemies within world bounds (with some buffer for natural movement)
+                if self.world_manager:
+                    world_bounds = self.world_manager.world_bounds  # (-1920, -1080, 1920, 1080)
+                    buffer = 100  # Allow some movement beyond strict bounds
+                    enemy.pos.x = max(world_bounds[0] - buffer, min(world_bounds[2] + buffer, enemy.pos.x))
+                    enemy.pos.y = max(world_bounds[1] - buffer, min(world_bounds[3] + buffer, enemy.pos.y))
             
-            # Handle enemy laser shooting
-            if (bullet_manager is not None and 
-                hasattr(enemy, 'should_shoot_laser') and 
-                enemy.should_shoot_laser):
-                
-                # Create the enemy bullet
-                bullet_manager.shoot_enemy_laser(
-                    enemy.pos.x, 
-                    enemy.pos.y, 
-                    enemy.laser_angle, 
-                    current_time
-                )
+            # Check every enemy against the map in one batched query
+            blocked_flags = self._query_enemies_blocked()
+            
+            for i, enemy in enumerate(self.enemies):
+                if blocked_flags is not None:
+                    self._resolve_map_obstacles(i, enemy, current_time, bool(blocked_flags[i]))
                 
-                # Synchronize enemy bullet to network (host only)
-                if self.is_host and self.game_synchronizer:
-                    bullet_speed = 300  # Default enemy laser speed
-                    velocity_x = math.cos(math.radians(enemy.laser_angle)) * bullet_speed
-                    velocity_y = math.sin(math.radians(enemy.laser_angle)) * bullet_speed
-                    
-                    # Send enemy bullet data to clients  
-                    from ..networking.network_manager import MessageType
-                    self.game_synchronizer.network_manager.send_message(
-                        MessageType.ENEMY_BULLET_FIRE,  # Use proper MessageType enum
-                        {
-                            "enemy_id": enemy.enemy_id,
-                            "position": (enemy.pos.x, enemy.pos.y),
-                            "angle": enemy.laser_angle,
-                            "velocity": (velocity_x, velocity_y),
-                            "damage": 10,  # Default enemy bullet damage
-                            "timestamp": current_time
-                        }
-                    )
+                # Handle enemy laser shooting
+                if (bullet_manager is not None and 
+                    hasattr(enemy, 'should_shoot_laser') and 
+                    enemy.should_shoot_laser):
+                    self._fire_enemy_laser(enemy, bullet_manager, current_time)
 
-            if not enemy.is_alive():
-                enemies_to_remove.append(enemy)
-                self.enemies_killed += 1
+                if not enemy.is_alive():
+                    enemies_to_remove.append(enemy)
+                    self.enemies_killed += 1
+            enemies_to_cull = None
         
         # Handle enemy-to-enemy collision to prevent overlapping
         self._handle_enemy_collisions()
@@ -820,16 +821,175 @@ class EnemyManager:
             self.enemies_killed += 1
             self.enemies_killed_this_wave += 1
         # Performance optimization: Cull enemies that are too far from player
-        cull_distance = 4000  # Remove enemies beyond this distance
-        enemies_to_cull = []
-        for enemy in self.enemies:
-            distance_to_player = player_pos.distance_to(enemy.pos)
-            if distance_to_player > cull_distance:
-                enemies_to_cull.append(enemy)
+        cull_distance = ENEMY_CULL_DISTANCE  # Remove enemies beyond this distance
+        if enemies_to_cull is None:
+            enemies_to_cull = []
+            for enemy in self.enemies:
+                distance_to_player = player_pos.distance_to(enemy.pos)
+                if distance_to_player > cull_distance:
+                    enemies_to_cull.append(enemy)
         
         # Remove culled enemies (without dropping cores to maintain balance)
-        for enemy in enemies_to_cull:
-            self.enemies.remove(enemy)
+        if enemies_to_cull:
+            culled = set(enemies_to_cull)
+            self.enemies[:] = [enemy for enemy in self.enemies if enemy not in culled]
+    
+    def _update_enemies_pooled(self, dt: float, player_pos: pg.Vector2, current_time: float, bullet_manager=None):
+        """
+        Update all enemies through the NumPy enemy pool.
+        Returns (dead enemies, enemies beyond the cull distance).
+        """
+        pool = self.enemy_pool
+        pool.sync_members(self.enemies)
+        pool.gather()
+        
+        world_bounds = self.world_manager.world_bounds if self.world_manager else None
+        distances = pool.update(dt, (player_pos.x, player_pos.y), current_time, world_bounds)
+        pool.scatter(dt)
+        
+        # Check every enemy against the map in one batched query, straight from the pool arrays
+        if self.world_manager and hasattr(self.world_manager, 'are_positions_blocked_by_map'):
+            blocked_flags = self.world_manager.are_positions_blocked_by_map(
+                pool.pos[:pool.count, 0], pool.pos[:pool.count, 1])
+        else:
+            blocked_flags = self._query_enemies_blocked()
+        if blocked_flags is not None:
+            for i, enemy in enumerate(self.enemies):
+                self._resolve_map_obstacles(i, enemy, current_time, bool(blocked_flags[i]))
+        
+        # Handle enemy laser shooting
+        if bullet_manager is not None and pool.shooting.any():
+            for index in np.nonzero(pool.shooting)[0].tolist():
+                self._fire_enemy_laser(self.enemies[index], bullet_manager, current_time)
+        
+        members = self.enemies
+        enemies_to_remove = [members[index] for index in np.nonzero(pool.health[:pool.count] <= 0)[0].tolist()]
+        self.enemies_killed += len(enemies_to_remove)
+        enemies_to_cull = [members[index] for index in np.nonzero(distances > ENEMY_CULL_DISTANCE)[0].tolist()
+                           if members[index].is_alive()]
+        return enemies_to_remove, enemies_to_cull
+    
+    def _query_enemies_blocked(self):
+        """Return a map collision flag per enemy (batched), or None without a world manager."""
+        if not self.world_manager:
+            return None
+        if hasattr(self.world_manager, 'are_positions_blocked_by_map'):
+            return self.world_manager.are_positions_blocked_by_map(
+                [enemy.pos.x for enemy in self.enemies],
+                [enemy.pos.y for enemy in self.enemies])
+        return [self.world_manager.is_position_blocked_by_map(enemy.pos.x, enemy.pos.y)
+                for enemy in self.enemies]
+    
+    def _resolve_map_obstacles(self, i: int, enemy: Enemy, current_time: float, blocked: bool = None):
+        """
+        Push an enemy out of map obstacles and steer it around ones just ahead.
+        blocked is the precomputed map collision flag for the enemy's position.
+        """
+        collision_check_frequency = 10  # Only check collision every N frames for performance
+        
+        if blocked is None:
+            blocked = self.world_manager.is_position_blocked_by_map(enemy.pos.x, enemy.pos.y)
+        
+        # Always check if enemy is stuck in an obstacle (every frame for accuracy)
+        if blocked:
+            # Immediate extraction if stuck in obstacle
+            for radius in [30, 50]:
+                extraction_successful = False
+                for angle in [0, 90, 180, 270]:  # Only try cardinal directions
+                    angle_rad = math.radians(angle)
+                    test_x = enemy.pos.x + math.cos(angle_rad) * radius
+                    test_y = enemy.pos.y + math.sin(angle_rad) * radius
+                    
+                    if not self.world_manager.is_position_blocked_by_map(test_x, test_y):
+                        # Calculate direction before moving
+                        direction = pg.Vector2(test_x - enemy.pos.x, test_y - enemy.pos.y)
+                        enemy.pos.x = test_x
+                        enemy.pos.y = test_y
+                        # Simple bounce using the direction we calculated
+                        if direction.length() > 0:
+                            enemy.velocity = direction.normalize() * enemy.speed
+                        else:
+                            # Fallback: random direction
+                            angle = math.radians(_random.uniform(0, 360))
+                            enemy.velocity = pg.Vector2(math.cos(angle), math.sin(angle)) * enemy.speed
+                        extraction_successful = True
+                        break
+                
+                if extraction_successful:
+                    break
+        
+        # Performance optimization: Only do expensive obstacle avoidance for some enemies per frame
+        elif i % collision_check_frequency == (int(current_time * 10) % collision_check_frequency):
+            # Simplified obstacle avoidance - less frequent and simpler
+            if enemy.velocity.length() > 0:
+                # Only check immediate ahead
+                look_ahead_distance = 35
+                velocity_normalized = enemy.velocity.normalize()
+                future_x = enemy.pos.x + velocity_normalized.x * look_ahead_distance
+                future_y = enemy.pos.y + velocity_normalized.y * look_ahead_distance
+                
+                if self.world_manager.is_position_blocked_by_map(future_x, future_y):
+                    # Simple steering - try left or right turn
+                    current_angle = math.atan2(enemy.velocity.y, enemy.velocity.x)
+                    for turn_angle in [math.pi/2, -math.pi/2]:  # Only 90 degree turns
+                        test_angle = current_angle + turn_angle
+                        test_x = enemy.pos.x + math.cos(test_angle) * look_ahead_distance
+                        test_y = enemy.pos.y + math.sin(test_angle) * look_ahead_distance
+                        
+                        if not self.world_manager.is_position_blocked_by_map(test_x, test_y):
+                            enemy.velocity.x = math.cos(test_angle) * enemy.speed
+                            enemy.velocity.y = math.sin(test_angle) * enemy.speed
+                            break
+    
+    def _fire_enemy_laser(self, enemy: Enemy, bullet_manager, current_time: float):
+        """Create an enemy laser bullet and sync it to clients when hosting."""
+        # Create the enemy bullet
+        bullet_manager.shoot_enemy_laser(
+            enemy.pos.x, 
+            enemy.pos.y, 
+            enemy.laser_angle, 
+            current_time
+        )
+        
+        # Synchronize enemy bullet to network (host only)
+        if self.is_host and self.game_synchronizer:
+            bullet_speed = 300  # Default enemy laser speed
+            velocity_x = math.cos(math.radians(enemy.laser_angle)) * bullet_speed
+            velocity_y = math.sin(math.radians(enemy.laser_angle)) * bullet_speed
+            
+            # Send enemy bullet data to clients  
+            from ..networking.network_manager import MessageType
+            self.game_synchronizer.network_manager.send_message(
+                MessageType.ENEMY_BULLET_FIRE,  # Use proper MessageType enum
+                {
+                    "enemy_id": enemy.enemy_id,
+                    "position": (enemy.pos.x, enemy.pos.y),
+                    "angle": enemy.laser_angle,
+                    "velocity": (velocity_x, velocity_y),
+                    "damage": 10,  # Default enemy bullet damage
+                    "timestamp": current_time
+                }
+            )
+    
+    def enable_enemy_pool(self, enabled: bool = True, seed: Optional[int] = None) -> bool:
+        """
+        Switch enemy AI to the NumPy structure-of-arrays pool (or back to per-object updates).
+        Without a seed the pool's generator is seeded from the enemies stream.
+        Returns True if the pool is active afterwards.
+        """
+        if not enabled:
+            self.enemy_pool = None
+            return False
+        if not NUMPY_AVAILABLE:
+            print("NumPy not available - enemy pool disabled")
+            self.enemy_pool = None
+            return False
+        
+        from src.entities.enemy_pool import EnemyPool
+        if seed is None:
+            seed = _random.getrandbits(32)
+        self.enemy_pool = EnemyPool(capacity=max(256, len(self.enemies)), seed=seed)
+        return True
     
     def start_new_wave(self):
         """Start a new survival wave."""
@@ -855,9 +1015,26 @@ class EnemyManager:
         return max(0.0, self.wave_duration - self.wave_timer)
     
     def render(self, screen: pg.Surface, offset=(0, 0)):
-        """Render all enemies."""
+        """Render all enemies, batching sprite blits into a single fblits call."""
+        if self.render_queue is None:
+            for enemy in self.enemies:
+                enemy.render(screen, offset)
+            return
+        
+        render_queue = self.render_queue
+        render_queue.begin(screen)
+        geometric_enemies = []
         for enemy in self.enemies:
+            if not enemy.submit_render(render_queue, offset):
+                geometric_enemies.append(enemy)
+        render_queue.flush(screen, ENEMY_RENDER_LAYER)
+        
+        # Enemies without sprites draw themselves, then bars and indicators go on top
+        for enemy in geometric_enemies:
             enemy.render(screen, offset)
+        for enemy in self.enemies:
+            if enemy.use_sprites and enemy.animated_sprite:
+                enemy.render_overlays(screen, offset)
     
     def get_enemies(self) -> List[Enemy]:
         """Get list of all active enemies."""
@@ -881,60 +1058,157 @@ class EnemyManager:
             
             # Notify network if host (death synchronization)  
             if self.is_host and self.game_synchronizer:
-                # Log death message only occasionally 
-                print(f"[ENEMY_DEATH_HOST] Sending death message for enemy {enemy.enemy_id}")
+                _network_log("Host sending death message for enemy %s", enemy.enemy_id)
                 self.game_synchronizer.network_manager.send_message(
                     MessageType.ENEMY_DEATH,
                     {"enemy_id": enemy.enemy_id}
                 )
-                # Remove death message sent confirmation spam
-            else:
-                print(f"[ENEMY_DEATH_HOST] Not sending death message - is_host={self.is_host}, has_sync={self.game_synchronizer is not None}")
             
             # Remove excessive death removal debug
             self.enemies.remove(enemy)
+            self.enemies_by_id.pop(enemy.enemy_id, None)
             self.enemies_killed += 1
             self.enemies_killed_this_wave += 1
     
     def _handle_enemy_collisions(self):
         """Handle collision detection between enemies with smooth bubble physics."""
-        for i, enemy1 in enumerate(self.enemies):
-            for j, enemy2 in enumerate(self.enemies[i+1:], i+1):
+        if (self.use_numpy_separation and NUMPY_AVAILABLE and
+                len(self.enemies) >= self.numpy_separation_min_enemies):
+            self._handle_enemy_collisions_numpy()
+            return
+        
+        # Index enemies by bubble so each one only visits nearby neighbours
+        enemies = self.enemies
+        grid = self.separation_grid
+        grid.clear()
+        for index, enemy in enumerate(enemies):
+            grid.insert(index, enemy.pos.x, enemy.pos.y, enemy.size + ENEMY_BUBBLE_PADDING)
+        
+        for i, enemy1 in enumerate(enemies):
+            # Define bubble radius (larger than sprite for smooth separation)
+            bubble_radius1 = enemy1.size + ENEMY_BUBBLE_PADDING  # Larger bubble around enemy
+            
+            for j in grid.query(enemy1.pos.x, enemy1.pos.y, bubble_radius1):
+                if j <= i:
+                    continue  # Each pair is handled once, in list order
+                enemy2 = enemies[j]
+                
                 # Calculate distance between enemies
-                distance_vector = enemy1.pos - enemy2.pos
-                distance = distance_vector.length()
+                dx = enemy1.pos.x - enemy2.pos.x
+                dy = enemy1.pos.y - enemy2.pos.y
+                distance = math.hypot(dx, dy)
                 
-                # Define bubble radius (larger than sprite for smooth separation)
-                bubble_radius1 = enemy1.size + 15  # Larger bubble around enemy
-                bubble_radius2 = enemy2.size + 15
+                bubble_radius2 = enemy2.size + ENEMY_BUBBLE_PADDING
                 min_distance = bubble_radius1 + bubble_radius2
                 
                 if distance < min_distance and distance > 0.1:  # Avoid division by zero
-                    # Calculate separation direction
-                    separation_direction = distance_vector.normalize()
-                    
                     # Calculate how much they're overlapping
                     overlap = min_distance - distance
                     
-                    # Apply gentle push force (reduced strength to avoid glitching)
-                    push_strength = overlap * 0.3  # Gentler push
+                    # Apply gentle push force (reduced strength to avoid glitching),
+                    # split between both enemies along the separation direction
+                    half_push = overlap * ENEMY_SEPARATION_STRENGTH * 0.5 / distance
+                    push_x = dx * half_push
+                    push_y = dy * half_push
                     
-                    # Apply separation with damping to prevent oscillation
-                    push_vector = separation_direction * push_strength
-                    
-                    # Move each enemy away from the other (split the push)
-                    enemy1.pos += push_vector * 0.5
-                    enemy2.pos -= push_vector * 0.5
+                    # Move each enemy away from the other
+                    enemy1.pos.x += push_x
+                    enemy1.pos.y += push_y
+                    enemy2.pos.x -= push_x
+                    enemy2.pos.y -= push_y
                     
                     # Add slight velocity dampening to prevent jittery behavior
-                    if hasattr(enemy1, 'velocity'):
-                        enemy1.velocity *= 0.9
-                    if hasattr(enemy2, 'velocity'):
-                        enemy2.velocity *= 0.9
+                    enemy1.velocity *= ENEMY_SEPARATION_DAMPING
+                    enemy2.velocity *= ENEMY_SEPARATION_DAMPING
+    
+    def _handle_enemy_collisions_numpy(self):
+        """
+        Batched bubble separation using NumPy.
+        Finds neighbour pairs by sorting enemies into grid cells, then computes every
+        push vector in one vectorized pass. All pairs are resolved against the
+        positions at the start of the frame rather than one after another.
+        """
+        enemies = self.enemies
+        count = len(enemies)
+        if count < 2:
+            return
+        
+        pos = np.array([(enemy.pos.x, enemy.pos.y) for enemy in enemies], dtype=np.float64)
+        radius = np.array([enemy.size for enemy in enemies], dtype=np.float64) + ENEMY_BUBBLE_PADDING
+        
+        # Cells at least one full interaction distance wide, so neighbours are in adjacent cells
+        cell_size = 2.0 * radius.max()
+        cells = np.floor(pos / cell_size).astype(np.int64)
+        cells -= cells.min(axis=0)
+        row_width = int(cells[:, 1].max()) + 3  # Room for the -1/+1 row offsets without wrapping
+        keys = cells[:, 0] * row_width + cells[:, 1] + 1
+        
+        order = np.argsort(keys, kind='stable')
+        sorted_keys = keys[order]
+        sorted_index = np.arange(count)
+        
+        # Half of the 3x3 neighbourhood, so every pair of cells is visited once
+        pair_i = []
+        pair_j = []
+        for cell_dx, cell_dy in ((0, 0), (0, 1), (1, -1), (1, 0), (1, 1)):
+            target = sorted_keys + cell_dx * row_width + cell_dy
+            start = np.searchsorted(sorted_keys, target, side='left')
+            end = np.searchsorted(sorted_keys, target, side='right')
+            if cell_dx == 0 and cell_dy == 0:
+                start = np.maximum(start, sorted_index + 1)  # Same cell: only later entries
+            counts = np.maximum(end - start, 0)
+            total = int(counts.sum())
+            if total == 0:
+                continue
+            
+            # Expand each [start, end) range into explicit pair indices
+            first = np.repeat(sorted_index, counts)
+            run_offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+            second = np.repeat(start, counts) + run_offsets
+            pair_i.append(order[first])
+            pair_j.append(order[second])
+        
+        if not pair_i:
+            return
+        pair_i = np.concatenate(pair_i)
+        pair_j = np.concatenate(pair_j)
+        
+        delta = pos[pair_i] - pos[pair_j]
+        distance = np.hypot(delta[:, 0], delta[:, 1])
+        min_distance = radius[pair_i] + radius[pair_j]
+        touching = (distance < min_distance) & (distance > 0.1)
+        if not touching.any():
+            return
+        
+        pair_i = pair_i[touching]
+        pair_j = pair_j[touching]
+        delta = delta[touching]
+        distance = distance[touching]
+        overlap = min_distance[touching] - distance
+        
+        # Same split push as the grid path: half of 0.3 * overlap to each enemy
+        half_push = overlap * ENEMY_SEPARATION_STRENGTH * 0.5 / distance
+        push_x = delta[:, 0] * half_push
+        push_y = delta[:, 1] * half_push
+        shift_x = (np.bincount(pair_i, weights=push_x, minlength=count) -
+                   np.bincount(pair_j, weights=push_x, minlength=count))
+        shift_y = (np.bincount(pair_i, weights=push_y, minlength=count) -
+                   np.bincount(pair_j, weights=push_y, minlength=count))
+        
+        # One damping step per overlapping neighbour, as in the pairwise loop
+        contacts = np.bincount(pair_i, minlength=count) + np.bincount(pair_j, minlength=count)
+        damping = np.power(ENEMY_SEPARATION_DAMPING, contacts)
+        
+        for index in np.nonzero(contacts)[0].tolist():
+            enemy = enemies[index]
+            enemy.pos.x += shift_x[index]
+            enemy.pos.y += shift_y[index]
+            enemy.velocity *= damping[index]
     
     def clear(self):
         """Remove all enemies."""
         self.enemies.clear()
+        self.enemies_by_id.clear()
         
     def get_enemy_count(self) -> int:
         """Get the number of active enemies."""
@@ -953,52 +1227,14 @@ class EnemyManager:
         self.is_host = is_host
         self.game_synchronizer = game_synchronizer
     
-    def sync_enemies_to_network(self, current_time: float):
-        """Synchronize enemy states to network (host only)."""
-        if not self.is_host or not self.game_synchronizer:
-            return
-            
-        if current_time - self.last_sync_time < self.sync_interval:
-            return
-            
-        # Send enemy updates for all alive enemies
-        enemies_synced = 0
-        for enemy in self.enemies:
-            if enemy.is_alive():
-                enemy_state = enemy.get_network_state()
-                self.game_synchronizer.network_manager.send_message(
-                    MessageType.ENEMY_UPDATE,
-                    enemy_state
-                )
-                enemies_synced += 1
-                
-        if enemies_synced > 0:
-            # Reduce sync debug frequency
-            if hasattr(self, '_sync_count'):
-                self._sync_count += 1
-            else:
-                self._sync_count = 1
-                
-            # Only log every 20th sync operation to reduce spam
-            if self._sync_count % 20 == 1:
-                print(f"[ENEMY_SYNC] Host synced {enemies_synced} enemies to network")
-            
-        self.last_sync_time = current_time
-    
     def spawn_network_enemy(self, enemy_data: dict):
         """Spawn an enemy from network data (clients only)."""
         if self.is_host:
             return  # Host manages its own enemies
             
         # Log network enemy creation but less frequently
-        if hasattr(self, '_spawn_count'):
-            self._spawn_count += 1
-        else:
-            self._spawn_count = 1
-            
-        # Only log every 5th spawn to reduce spam
-        if self._spawn_count % 5 == 1:
-            print(f"[ENEMY_SYNC] Client creating network enemy {enemy_data.get('enemy_id', 'unknown')} at {enemy_data.get('position', 'unknown')}")
+        _network_log("Client creating network enemy %s at %s (%d enemies)",
+                   enemy_data.get('enemy_id', 'unknown'), enemy_data.get('position'), len(self.enemies))
         
         # Create enemy from network data
         enemy_type = EnemyType(enemy_data.get("type", "basic"))
@@ -1014,10 +1250,7 @@ class EnemyManager:
         enemy.max_health = enemy_data["max_health"]
         
         self.enemies.append(enemy)
-        # Only log total enemy count occasionally
-        if self._spawn_count % 5 == 1:
-            print(f"[ENEMY_SYNC] Client now has {len(self.enemies)} total enemies")
-        
+        self.enemies_by_id[enemy.enemy_id] = enemy
         # Don't send network message back - this would cause infinite loop!
     
     def update_network_enemy(self, enemy_data: dict):
@@ -1025,31 +1258,66 @@ class EnemyManager:
         if self.is_host:
             return  # Host manages its own enemies
             
-        enemy_id = enemy_data["enemy_id"]
+        enemy = self._find_network_enemy(enemy_data["enemy_id"])
+        if enemy:
+            enemy.apply_network_state(enemy_data)
+    
+    def apply_network_snapshot(self, snapshot: dict):
+        """Apply enemy arrays (ids, x, y, vx, vy, health) from a host snapshot in one pass (clients only)."""
+        if self.is_host:
+            return  # Host manages its own enemies
         
-        # Find and update the enemy
-        for enemy in self.enemies:
-            if enemy.enemy_id == enemy_id:
-                enemy.apply_network_state(enemy_data)
-                break
+        ids = snapshot["ids"]
+        xs, ys = snapshot["x"], snapshot["y"]
+        vxs, vys = snapshot["vx"], snapshot["vy"]
+        healths = snapshot["health"]
+        
+        index = self.enemies_by_id
+        if len(index) != len(self.enemies):
+            index = self._rebuild_enemy_index()
+        rebuilt = False
+        
+        for i, enemy_id in enumerate(ids):
+            enemy = index.get(enemy_id)
+            if enemy is None:
+                # The index may be stale if enemies were added outside the network paths
+                if rebuilt:
+                    continue
+                index = self._rebuild_enemy_index()
+                rebuilt = True
+                enemy = index.get(enemy_id)
+                if enemy is None:
+                    continue  # Spawn not received yet - the next keyframe will include it again
+            enemy.pos.update(xs[i], ys[i])
+            enemy.velocity.update(vxs[i], vys[i])
+            enemy.health = healths[i]
+    
+    def _find_network_enemy(self, enemy_id: str) -> Optional[Enemy]:
+        """Look up an enemy by network id, refreshing the index if it has drifted from the list."""
+        enemy = self.enemies_by_id.get(enemy_id)
+        if enemy is None and len(self.enemies_by_id) != len(self.enemies):
+            enemy = self._rebuild_enemy_index().get(enemy_id)
+        return enemy
+    
+    def _rebuild_enemy_index(self) -> Dict[str, Enemy]:
+        """Rebuild the enemy_id -> Enemy index from the enemy list."""
+        self.enemies_by_id = {enemy.enemy_id: enemy for enemy in self.enemies}
+        return self.enemies_by_id
     
     def remove_network_enemy(self, enemy_id: str):
         """Remove an enemy based on network command (clients only)."""
         if self.is_host:
-            print(f"[ENEMY_DEATH_CLIENT] Host shouldn't call remove_network_enemy for {enemy_id}")
+            logger.warning("Host shouldn't call remove_network_enemy for %s", enemy_id)
             return  # Host manages its own enemies
-            
-        print(f"[ENEMY_DEATH_CLIENT] Client searching for enemy {enemy_id} to remove")
-        print(f"[ENEMY_DEATH_CLIENT] Current enemies: {[e.enemy_id for e in self.enemies]}")
         
-        for enemy in self.enemies[:]:  # Copy list to avoid modification during iteration
-            if enemy.enemy_id == enemy_id:
-                print(f"[ENEMY_DEATH_CLIENT] Found and removing enemy {enemy_id}")
-                self.enemies.remove(enemy)
-                print(f"[ENEMY_DEATH_CLIENT] Enemy {enemy_id} removed successfully")
-                return
+        enemy = self._find_network_enemy(enemy_id)
+        if enemy is not None and enemy in self.enemies:
+            self.enemies.remove(enemy)
+            self.enemies_by_id.pop(enemy_id, None)
+            _network_log("Client removed enemy %s", enemy_id)
+            return
         
-        print(f"[ENEMY_DEATH_CLIENT] WARNING: Enemy {enemy_id} not found for removal")
+        _network_log("Client has no enemy %s to remove (%d enemies)", enemy_id, len(self.enemies))
 
     def update_render_only(self, dt: float):
         """Update only rendering/animation for enemies (multiplayer clients only)."""
@@ -1069,6 +1337,7 @@ class EnemyManager:
             else:
                 # Remove dead enemies (death state also comes from network)
                 self.enemies.remove(enemy)
+                self.enemies_by_id.pop(enemy.enemy_id, None)
     
     def generate_enemy_id(self) -> str:
         """Generate a unique enemy ID."""
@@ -0,0 +1,243 @@
+"""
+Structure-of-arrays enemy store for the twin-stick shooter game.
+Runs enemy seek/swarm AI, bounds clamping, laser eligibility and culling as
+batched NumPy operations. The Enemy objects in EnemyManager.enemies stay the
+public face of each enemy: the pool mirrors their hot fields into contiguous
+arrays, updates the arrays, and writes the results back so rendering,
+collision and networking code keep working unchanged.
+"""
+
+import math
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from src.entities.enemy import EnemyType
+
+# Direction names indexed by the pool's direction codes
+DIRECTION_NAMES = ('right', 'down', 'left', 'up')
+DIRECTION_CODES = {name: code for code, name in enumerate(DIRECTION_NAMES)}
+
+# Enemy type codes for the type array
+TYPE_CODES = {EnemyType.BASIC: 0, EnemyType.FAST: 1, EnemyType.TANK: 2}
+
+
+class EnemyPool:
+    """Contiguous NumPy arrays holding the simulation state of every live enemy."""
+
+    # AI tuning, matching Enemy.update
+    DETECTION_RANGE = 800  # Inside this range enemies swarm with jitter
+    CLOSE_RANGE = 150  # Speed boost range
+    CLOSE_SPEED_MULTIPLIER = 1.5
+    FAR_SPEED_MULTIPLIER = 0.8
+    SWARM_JITTER = 0.3
+    LASER_RANGE = 400
+    LASER_COOLDOWN_RANGE = (0.2, 0.6)
+
+    # Per-enemy arrays, all indexed by slot
+    FIELDS = ('pos', 'velocity', 'health', 'speed', 'size', 'type', 'hurt_timer',
+              'can_shoot', 'last_laser_shot', 'laser_cooldown', 'facing_angle',
+              'direction', 'direction_change_time', 'direction_change_delay')
+
+    def __init__(self, capacity: int = 256, seed: Optional[int] = None):
+        """Initialize an empty pool with room for capacity enemies."""
+        self.members: List = []  # Enemy objects in slot order
+        self.count = 0
+        self.rng = np.random.default_rng(seed)
+        self._allocate(max(1, capacity))
+
+        # Per-step outputs of update(), consumed by scatter() and the manager
+        self.shooting = np.zeros(0, dtype=np.bool_)
+        self.laser_angle = np.zeros(0)
+
+    def _allocate(self, capacity: int):
+        """(Re)allocate the backing arrays, preserving the first count rows."""
+        count = self.count
+
+        def grow(name, shape, dtype):
+            fresh = np.zeros(shape, dtype=dtype)
+            old = getattr(self, name, None)
+            if old is not None and count:
+                fresh[:count] = old[:count]
+            setattr(self, name, fresh)
+
+        self.capacity = capacity
+        for name in self.FIELDS:
+            vector = name in ('pos', 'velocity')
+            dtype = {'type': np.int8, 'direction': np.int8, 'can_shoot': np.bool_}.get(name, np.float64)
+            grow(name, (capacity, 2) if vector else capacity, dtype)
+
+    def _load_slot(self, slot: int, enemy):
+        """Copy every pooled field of an Enemy object into a slot."""
+        self.pos[slot] = (enemy.pos.x, enemy.pos.y)
+        self.velocity[slot] = (enemy.velocity.x, enemy.velocity.y)
+        self.health[slot] = enemy.health
+        self.speed[slot] = enemy.speed
+        self.size[slot] = enemy.size
+        self.type[slot] = TYPE_CODES.get(enemy.type, 0)
+        self.hurt_timer[slot] = enemy.hurt_timer
+        self.can_shoot[slot] = enemy.can_shoot_lasers
+        self.last_laser_shot[slot] = enemy.last_laser_shot
+        self.laser_cooldown[slot] = enemy.laser_cooldown
+        self.facing_angle[slot] = enemy.facing_angle
+        self.direction[slot] = DIRECTION_CODES.get(enemy.last_direction, 1)
+        self.direction_change_time[slot] = enemy.direction_change_cooldown
+        self.direction_change_delay[slot] = enemy.direction_change_delay
+
+    def sync_members(self, enemies: List):
+        """Match pool slots to the manager's enemy list, keeping rows of known enemies."""
+        if enemies == self.members:
+            return  # Identity comparison in C - the common, unchanged case
+
+        count = len(enemies)
+        if count > self.capacity:
+            self._allocate(max(count, self.capacity * 2))
+
+        # Gather surviving rows into their new slots in one fancy-index pass
+        old_slots = np.array([getattr(enemy, '_pool_slot', -1) for enemy in enemies], dtype=np.int64)
+        known = np.zeros(count, dtype=np.bool_)
+        if self.members:
+            in_range = (old_slots >= 0) & (old_slots < len(self.members))
+            for index in np.nonzero(in_range)[0].tolist():
+                known[index] = self.members[old_slots[index]] is enemies[index]
+
+        source = old_slots[known]
+        target = np.nonzero(known)[0]
+        for name in self.FIELDS:
+            array = getattr(self, name)
+            array[target] = array[source]
+
+        for index in np.nonzero(~known)[0].tolist():
+            self._load_slot(index, enemies[index])
+
+        for slot, enemy in enumerate(enemies):
+            enemy._pool_slot = slot
+        self.members = list(enemies)
+        self.count = count
+
+    def gather(self):
+        """Read back fields other systems mutate on the Enemy objects (damage, pushes, knockback)."""
+        count = self.count
+        if not count:
+            return
+        state = np.array([(enemy.pos.x, enemy.pos.y, enemy.velocity.x, enemy.velocity.y,
+                           enemy.health, enemy.hurt_timer) for enemy in self.members],
+                         dtype=np.float64)
+        self.pos[:count] = state[:, 0:2]
+        self.velocity[:count] = state[:, 2:4]
+        self.health[:count] = state[:, 4]
+        self.hurt_timer[:count] = state[:, 5]
+
+    def update(self, dt: float, player_pos, current_time: float,
+               world_bounds: Optional[Tuple[float, float, float, float]] = None,
+               bounds_buffer: float = 100) -> np.ndarray:
+        """
+        Run one AI step for every pooled enemy.
+        Returns the distance from each enemy to the player after movement.
+        """
+        count = self.count
+        if not count:
+            return np.zeros(0)
+
+        pos = self.pos[:count]
+        velocity = self.velocity[:count]
+        speed = self.speed[:count]
+
+        # Update hurt effect
+        hurt = self.hurt_timer[:count]
+        np.subtract(hurt, dt, out=hurt, where=hurt > 0)
+
+        # Seek: direction to the player, with swarm jitter inside detection range
+        to_x = player_pos[0] - pos[:, 0]
+        to_y = player_pos[1] - pos[:, 1]
+        distance = np.hypot(to_x, to_y)
+        has_target = distance > 0
+        safe_distance = np.where(has_target, distance, 1.0)
+        dir_x = to_x / safe_distance
+        dir_y = to_y / safe_distance
+
+        near = distance < self.DETECTION_RANGE
+        jitter = self.rng.uniform(-self.SWARM_JITTER, self.SWARM_JITTER, size=(count, 2))
+        dir_x = np.where(near, dir_x + jitter[:, 0], dir_x)
+        dir_y = np.where(near, dir_y + jitter[:, 1], dir_y)
+        dir_length = np.hypot(dir_x, dir_y)
+        dir_length = np.where(dir_length > 0, dir_length, 1.0)
+
+        multiplier = np.where(near,
+                              np.where(distance < self.CLOSE_RANGE, self.CLOSE_SPEED_MULTIPLIER, 1.0),
+                              self.FAR_SPEED_MULTIPLIER)
+        scale = speed * multiplier / dir_length
+        velocity[:, 0] = np.where(has_target, dir_x * scale, velocity[:, 0])
+        velocity[:, 1] = np.where(has_target, dir_y * scale, velocity[:, 1])
+
+        # Apply movement and keep enemies within world bounds (with buffer)
+        pos += velocity * dt
+        if world_bounds is not None:
+            np.clip(pos[:, 0], world_bounds[0] - bounds_buffer, world_bounds[2] + bounds_buffer, out=pos[:, 0])
+            np.clip(pos[:, 1], world_bounds[1] - bounds_buffer, world_bounds[3] + bounds_buffer, out=pos[:, 1])
+
+        # Facing direction with the same change cooldown as Enemy.update
+        moving = (velocity[:, 0] != 0) | (velocity[:, 1] != 0)
+        angle = np.degrees(np.arctan2(velocity[:, 1], velocity[:, 0]))
+        new_direction = np.select(
+            [(angle >= -45) & (angle < 45), (angle >= 45) & (angle < 135), (angle >= 135) | (angle < -135)],
+            [DIRECTION_CODES['right'], DIRECTION_CODES['down'], DIRECTION_CODES['left']],
+            DIRECTION_CODES['up'])
+        direction = self.direction[:count]
+        change_time = self.direction_change_time[:count]
+        same = moving & (new_direction == direction)
+        changed = (moving & ~same &
+                   (current_time - change_time > self.direction_change_delay[:count]))
+        direction[changed] = new_direction[changed]
+        change_time[changed] = current_time
+        facing = self.facing_angle[:count]
+        turned = same | changed
+        facing[turned] = angle[turned]
+
+        # Laser eligibility, aimed at the player's position before this step's movement
+        self.shooting = (self.can_shoot[:count] & (distance < self.LASER_RANGE) &
+                         (current_time - self.last_laser_shot[:count] > self.laser_cooldown[:count]))
+        shooter_count = int(self.shooting.sum())
+        self.laser_angle = np.degrees(np.arctan2(to_y, to_x))
+        if shooter_count:
+            self.last_laser_shot[:count][self.shooting] = current_time
+            self.laser_cooldown[:count][self.shooting] = self.rng.uniform(
+                self.LASER_COOLDOWN_RANGE[0], self.LASER_COOLDOWN_RANGE[1], size=shooter_count)
+
+        return np.hypot(player_pos[0] - pos[:, 0], player_pos[1] - pos[:, 1])
+
+    def scatter(self, dt: float):
+        """Write updated state back to the Enemy objects and advance their sprite animations."""
+        count = self.count
+        if not count:
+            return
+        positions = self.pos[:count].tolist()
+        velocities = self.velocity[:count].tolist()
+        hurt_timers = self.hurt_timer[:count].tolist()
+        facings = self.facing_angle[:count].tolist()
+        directions = self.direction[:count].tolist()
+        change_times = self.direction_change_time[:count].tolist()
+        shooting = self.shooting.tolist()
+        laser_angles = self.laser_angle.tolist()
+        last_shots = self.last_laser_shot[:count].tolist()
+        cooldowns = self.laser_cooldown[:count].tolist()
+
+        for index, enemy in enumerate(self.members):
+            x, y = positions[index]
+            enemy.pos.update(x, y)
+            vx, vy = velocities[index]
+            enemy.velocity.update(vx, vy)
+            enemy.hurt_timer = hurt_timers[index]
+            enemy.facing_angle = facings[index]
+            enemy.last_direction = DIRECTION_NAMES[directions[index]]
+            enemy.direction_change_cooldown = change_times[index]
+            enemy.should_shoot_laser = shooting[index]
+            if shooting[index]:
+                enemy.laser_angle = laser_angles[index]
+                enemy.last_laser_shot = last_shots[index]
+                enemy.laser_cooldown = cooldowns[index]
+
+            # Update sprite animation if using sprites
+            if enemy.use_sprites and enemy.animated_sprite:
+                enemy.animated_sprite.set_position(x, y)
+                enemy.animated_sprite.update(dt, enemy.velocity, math.radians(facings[index]))
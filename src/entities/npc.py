@@ -4,12 +4,19 @@ Implements rescue NPCs for mission objectives.
 """
 
 import pygame as pg
-import random
 import math
 import os
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
 
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("npcs")  # Animation phases
+
 
 @dataclass
 class NPCState:
@@ -35,9 +42,9 @@ class NPC:
         self.visual_radius = 40  # Visual rendering radius - increased from 35
         
         # Animation
-        self.glow_phase = random.uniform(0, math.pi * 2)
-        self.float_phase = random.uniform(0, math.pi * 2)
-        self.distress_phase = random.uniform(0, math.pi * 2)
+        self.glow_phase = _random.uniform(0, math.pi * 2)
+        self.float_phase = _random.uniform(0, math.pi * 2)
+        self.distress_phase = _random.uniform(0, math.pi * 2)
         
         # Rescue interaction
         self.interaction_radius = 100  # Distance for starting rescue - increased from 80
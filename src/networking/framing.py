@@ -0,0 +1,98 @@
+"""
+Length-prefixed frame reader shared by the network managers.
+Bytes are received straight into a preallocated bytearray with recv_into and
+complete frames are handed out as memoryview slices of it, so draining a burst
+of frames copies nothing until a message is decoded. The unread tail (at most
+one partial frame) is moved to the front only when the buffer runs out of room,
+and the buffer only grows for frames larger than it.
+"""
+
+import struct
+from typing import Iterator
+
+FRAME_HEADER = struct.Struct('>I')  # Payload length prefix
+DEFAULT_CAPACITY = 256 * 1024
+MIN_RECV_SPACE = 16 * 1024          # Free space guaranteed before each recv_into
+MAX_FRAME_SIZE = 16 * 1024 * 1024   # Larger length prefixes mean a corrupt stream
+
+
+class FrameError(ValueError):
+    """Raised when the stream cannot be framed (it is corrupt or out of sync)."""
+
+
+class FrameReader:
+    """Reassembles length-prefixed frames from a stream socket without per-frame copies."""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, max_frame_size: int = MAX_FRAME_SIZE):
+        """Initialize the reader with a buffer of capacity bytes."""
+        self.max_frame_size = max_frame_size
+        self._buffer = bytearray(capacity)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # First unread byte
+        self._end = 0    # One past the last received byte
+
+    @property
+    def pending(self) -> int:
+        """Bytes received but not yet handed out as frames."""
+        return self._end - self._start
+
+    def recv_from(self, sock) -> int:
+        """
+        Receive once from a socket into the free space. Returns the number of
+        bytes read (0 means the peer closed the connection); socket exceptions
+        such as timeouts propagate. Invalidates views returned by frames().
+        """
+        self._reserve(MIN_RECV_SPACE)
+        received = sock.recv_into(self._view[self._end:])
+        self._end += received
+        return received
+
+    def feed(self, data) -> None:
+        """Append bytes that did not come from recv_from. Invalidates views returned by frames()."""
+        self._reserve(len(data))
+        self._view[self._end:self._end + len(data)] = data
+        self._end += len(data)
+
+    def frames(self) -> Iterator[memoryview]:
+        """
+        Yield the payload of every complete frame in the buffer, in order.
+        Each payload is a view into the buffer: decode it (or copy it with
+        bytes()) before the next recv_from() or feed().
+        """
+        header_size = FRAME_HEADER.size
+        while self._end - self._start >= header_size:
+            length = FRAME_HEADER.unpack_from(self._buffer, self._start)[0]
+            if length > self.max_frame_size:
+                raise FrameError(f"frame length {length} exceeds {self.max_frame_size} bytes")
+            payload_start = self._start + header_size
+            payload_end = payload_start + length
+            if payload_end > self._end:
+                return  # Rest of the frame has not arrived yet
+            self._start = payload_end
+            yield self._view[payload_start:payload_end]
+
+        if self._start == self._end:
+            self._start = self._end = 0  # Drained: reuse the buffer from the front
+
+    def reset(self) -> None:
+        """Discard everything buffered (after a framing error)."""
+        self._start = self._end = 0
+
+    def _reserve(self, size: int) -> None:
+        """Make room for at least size more bytes after the unread data."""
+        if len(self._buffer) - self._end >= size:
+            return
+
+        pending = self._end - self._start
+        if pending + size <= len(self._buffer):
+            # Move the partial frame to the front (memmove of at most one frame)
+            self._view[:pending] = self._view[self._start:self._end]
+        else:
+            # Grow into a new buffer: the old one cannot be resized while views of it exist
+            capacity = max(len(self._buffer) * 2, pending + size)
+            buffer = bytearray(capacity)
+            buffer[:pending] = self._view[self._start:self._end]
+            self._buffer = buffer
+            self._view = memoryview(buffer)
+        self._start = 0
+        self._end = pending
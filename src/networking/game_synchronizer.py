@@ -4,10 +4,23 @@ Handles synchronization of players, bullets, enemies, and effects across clients
 """
 
 import time
-import pygame as pg
 from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict, replace
+from dataclasses import dataclass, asdict
 from .network_manager import NetworkManager, MessageType, NetworkMessage
+from .snapshot_delta import DeltaSnapshotSender, DeltaSnapshotReceiver
+from .prediction import EntityInterpolator, ClientPredictor, MovementValidator
+from .lag_compensation import LagCompensator
+
+try:
+    from src.utils.log import get_logger, LogChannel
+except ImportError:
+    from utils.log import get_logger, LogChannel
+
+logger = get_logger(__name__)
+_enemy_event_log = LogChannel(logger)  # Enemy deaths and shots arrive many times per second
+_damage_log = LogChannel(logger)       # Client hit reports on the host
+_player_log = LogChannel(logger, interval=3.0)
+_correction_log = LogChannel(logger)   # Host corrections to the predicted local player
 
 
 @dataclass
@@ -99,7 +112,7 @@ class GameStateSynchronizer:
         
         # Synchronization timing
         self.last_update_time = 0.0
-        self.update_interval = 1/60.0  # 60 FPS sync rate
+        self.update_interval = 1/20.0  # 20 Hz sync rate; receivers interpolate between updates
         
         # Message throttling to prevent network flooding
         self.last_muzzle_flash_time = 0.0
@@ -109,13 +122,38 @@ class GameStateSynchronizer:
         self.explosion_throttle = 0.1     # Max 10 explosions per second  
         self.bullet_hit_throttle = 0.02   # Max 50 bullet hits per second
         
-        # Network interpolation
-        self.player_interpolation = {}  # player_id -> interpolation data
-        self.interpolation_speed = 10.0  # How fast to interpolate
+        # Remote players and enemies are drawn a little in the past, interpolated
+        # between timestamped updates; each sender's clock is tracked separately
+        self.player_interpolation = {}  # player_id -> EntityInterpolator
+        self.enemy_interpolation = EntityInterpolator()  # Enemies all come from the host
+        
+        # The local player is predicted; the host bounds client movement and
+        # sends a correction for the input sequence when it had to intervene
+        self.predictor = ClientPredictor()
+        self.movement_validator = MovementValidator()
+        
+        # Host: recent enemy positions, to check client hits where the client saw the enemy
+        self.lag_compensator = LagCompensator()
         
         # Bullet tracking
         self.next_bullet_id = 1
         
+        # World snapshots: the host sends wave, score and enemy state as deltas
+        # against the last snapshot every client acknowledged
+        self.snapshot_sender = DeltaSnapshotSender(keyframe_interval=2.0)
+        self.snapshot_receiver = DeltaSnapshotReceiver()
+        self.snapshot_interval = 0.1  # 10 snapshots per second
+        self.last_snapshot_time = 0.0
+        self.wave_state = None  # (wave_number, enemies_remaining, wave_timer) from on_wave_update
+        self.score_states = {}  # player_id -> (score, cores, kills) from on_score_update
+        self.network_wave_info = {}
+        self.network_scores = {}
+        
+        # Player updates are skipped while nothing changes, apart from a periodic keepalive
+        self.last_sent_player_state = None
+        self.player_keepalive_interval = 1.0
+        self.last_player_send_time = 0.0
+        
         self._setup_message_handlers()
     
     def _setup_message_handlers(self):
@@ -171,6 +209,17 @@ class GameStateSynchronizer:
             self.network_manager.register_message_handler(
                 MessageType.ENEMY_DEATH, self._handle_enemy_death
             )
+            self.network_manager.register_message_handler(
+                MessageType.WORLD_SNAPSHOT, self._handle_world_snapshot
+            )
+            self.network_manager.register_message_handler(
+                MessageType.PLAYER_CORRECTION, self._handle_player_correction
+            )
+        else:
+            # Host-only handlers
+            self.network_manager.register_message_handler(
+                MessageType.SNAPSHOT_ACK, self._handle_snapshot_ack
+            )
     
     def set_local_player_id(self, player_id: str):
         """Set the local player ID."""
@@ -190,12 +239,29 @@ class GameStateSynchronizer:
         # Process incoming network messages
         self.network_manager.process_messages()
         
+        # Blend in host corrections and number this tick's predicted position
+        if not self.is_host and self.local_player:
+            dx, dy = self.predictor.step(dt)
+            if dx or dy:
+                self.local_player.pos.x += dx
+                self.local_player.pos.y += dy
+            self.predictor.record(self.local_player.pos.x, self.local_player.pos.y)
+        
         if current_time - self.last_update_time >= self.update_interval:
             self._send_player_update()
             self.last_update_time = current_time
         
-        # Update player position interpolation
-        self._update_player_interpolation(dt)
+        if self.is_host and self.enemy_manager:
+            self.lag_compensator.record(current_time, self.enemy_manager.get_enemies())
+        
+        if self.is_host and current_time - self.last_snapshot_time >= self.snapshot_interval:
+            self._send_world_snapshot(current_time)
+            self.last_snapshot_time = current_time
+        
+        # Move remote players (and enemies on clients) to their interpolated positions
+        self._update_player_interpolation(current_time)
+        if not self.is_host:
+            self._update_enemy_interpolation(current_time)
         
         # Clean up old network bullets periodically
         if hasattr(self, '_last_cleanup_time'):
@@ -205,30 +271,43 @@ class GameStateSynchronizer:
         else:
             self._last_cleanup_time = current_time
     
-    def _update_player_interpolation(self, dt: float):
-        """Smooth player position interpolation."""
-        for player_id, interpolation_data in self.player_interpolation.items():
-            if player_id in self.players:
-                current = interpolation_data["current"]
-                target = interpolation_data["target"]
-                
-                # Interpolate towards target
-                current_vec = pg.Vector2(current)
-                target_vec = pg.Vector2(target)
-                
-                diff = target_vec - current_vec
-                if diff.length() > 1.0:  # Only interpolate if significant distance
-                    move_amount = min(diff.length(), self.interpolation_speed * diff.length() * dt)
-                    if diff.length() > 0:
-                        direction = diff.normalize()
-                        new_pos = current_vec + (direction * move_amount)
-                        interpolation_data["current"] = (new_pos.x, new_pos.y)
-                        
-                        # Update player state position with interpolated value
-                        self.players[player_id] = replace(
-                            self.players[player_id],
-                            position=interpolation_data["current"]
-                        )
+    def _update_player_interpolation(self, now: float):
+        """Place remote players where their buffered updates put them INTERPOLATION_DELAY ago."""
+        for player_id, interpolator in self.player_interpolation.items():
+            player_state = self.players.get(player_id)
+            if player_state is not None:
+                position = interpolator.sample(player_id, now)
+                if position is not None:
+                    player_state.position = position
+    
+    def get_enemy_view_time(self) -> Optional[float]:
+        """Host clock time of the enemy positions this client is drawing (None until known)."""
+        offset = self.enemy_interpolation.clock.offset
+        if offset is None:
+            return None
+        return time.time() - self.enemy_interpolation.delay - offset
+    
+    def _update_enemy_interpolation(self, now: float):
+        """Place network enemies at their interpolated snapshot positions (clients only)."""
+        buffers = self.enemy_interpolation.buffers
+        if not self.enemy_manager or not buffers:
+            return
+        enemies = self.enemy_manager.enemies_by_id
+        index_complete = len(enemies) == len(self.enemy_manager.enemies)
+        render_time = now - self.enemy_interpolation.delay
+        
+        removed = []
+        for enemy_id, buffer in buffers.items():
+            enemy = enemies.get(enemy_id)
+            if enemy is None:
+                if index_complete:
+                    removed.append(enemy_id)  # Died or despawned
+                continue
+            position = buffer.sample(render_time)
+            if position is not None:
+                enemy.pos.update(position)
+        for enemy_id in removed:
+            del buffers[enemy_id]
     
     def _send_player_update(self):
         """Send local player state to other clients."""
@@ -257,13 +336,18 @@ class GameStateSynchronizer:
             burst_gauge=getattr(self.local_player, 'burst_gauge', 0.0)
         )
         
-        # Debug velocity being sent (rate limited)
-        if not hasattr(self, '_velocity_send_debug'):
-            self._velocity_send_debug = 0
-        self.network_manager.send_message(
-            MessageType.PLAYER_UPDATE,
-            asdict(player_state)
-        )
+        # Skip unchanged state; receivers keep the last full update they got
+        current_time = time.time()
+        if (player_state == self.last_sent_player_state and
+                current_time - self.last_player_send_time < self.player_keepalive_interval):
+            return
+        self.last_sent_player_state = player_state
+        self.last_player_send_time = current_time
+        
+        data = asdict(player_state)
+        if not self.is_host:
+            data["input_seq"] = self.predictor.input_seq  # Tick this position was predicted for
+        self.network_manager.send_message(MessageType.PLAYER_UPDATE, data)
     
     def on_bullet_fired(self, bullet, owner_player_id: str):
         """Called when local player fires a bullet."""
@@ -416,29 +500,78 @@ class GameStateSynchronizer:
             )
     
     def on_wave_update(self, wave_number: int, enemies_remaining: int, wave_timer: float):
-        """Called when wave information updates (host only)."""
+        """Record wave information for the next world snapshot (host only)."""
         if self.is_host:
-            self.network_manager.send_message(
-                MessageType.WAVE_UPDATE,
-                {
-                    "wave_number": wave_number,
-                    "enemies_remaining": enemies_remaining,
-                    "wave_timer": wave_timer
-                }
-            )
+            # Timer at 0.1 s resolution so it does not change every frame
+            self.wave_state = (wave_number, enemies_remaining, round(wave_timer, 1))
     
     def on_score_update(self, player_id: str, score: int, cores: int, kills: int):
-        """Called when player score updates."""
+        """Record a player's score for the next world snapshot (host only)."""
         if self.is_host:
-            self.network_manager.send_message(
-                MessageType.SCORE_UPDATE,
-                {
-                    "player_id": player_id,
-                    "score": score,
-                    "cores": cores,
-                    "kills": kills
-                }
-            )
+            self.score_states[player_id] = (score, cores, kills)
+    
+    def _collect_world_state(self) -> dict:
+        """Gather the host's current wave, score and enemy state as snapshot sections."""
+        state = {}
+        if self.wave_state is not None:
+            wave_number, enemies_remaining, wave_timer = self.wave_state
+            state["wave"] = {
+                "wave_number": wave_number,
+                "enemies_remaining": enemies_remaining,
+                "wave_timer": wave_timer
+            }
+        state["scores"] = dict(self.score_states)
+        
+        enemies = {}
+        if self.enemy_manager:
+            for enemy in self.enemy_manager.get_enemies():
+                if enemy.is_alive():
+                    pos = enemy.pos
+                    velocity = enemy.velocity
+                    # Rounded to about wire precision so sub-pixel jitter does not count as a change
+                    enemies[enemy.enemy_id] = (round(pos.x, 1), round(pos.y, 1),
+                                               round(velocity.x), round(velocity.y), enemy.health)
+        state["enemies"] = enemies
+        return state
+    
+    def _get_client_ids(self) -> List[str]:
+        """Get the ids of connected clients, matching the sender ids on their messages."""
+        if hasattr(self.network_manager, 'client_connections'):
+            return list(self.network_manager.client_connections)  # SecureNetworkManager
+        return list(getattr(self.network_manager, 'connected_clients', {}))
+    
+    def _send_world_snapshot(self, current_time: float):
+        """Send wave, score and enemy changes since the clients' acknowledged snapshot (host only)."""
+        client_ids = self._get_client_ids()
+        if not client_ids:
+            return
+        
+        snapshot = self.snapshot_sender.build(self._collect_world_state(), client_ids, current_time)
+        if snapshot is None:
+            return  # Nothing changed since every client's baseline
+        sequence, base, entries = snapshot
+        
+        # Flatten to parallel arrays so the binary codec can pack the message
+        data = {"seq": sequence, "base": base, "timestamp": current_time}
+        data.update(entries.get("wave", {}))
+        
+        scores = entries.get("scores")
+        if scores:
+            data["score_ids"] = list(scores)
+            data["scores"] = [value[0] for value in scores.values()]
+            data["cores"] = [value[1] for value in scores.values()]
+            data["kills"] = [value[2] for value in scores.values()]
+        
+        enemies = entries.get("enemies")
+        if enemies:
+            data["ids"] = list(enemies)
+            data["x"] = [value[0] for value in enemies.values()]
+            data["y"] = [value[1] for value in enemies.values()]
+            data["vx"] = [value[2] for value in enemies.values()]
+            data["vy"] = [value[3] for value in enemies.values()]
+            data["health"] = [value[4] for value in enemies.values()]
+        
+        self.network_manager.send_message(MessageType.WORLD_SNAPSHOT, data)
     
     def on_world_event(self, event_type: str, event_data: dict):
         """Called when a world event occurs (host only)."""
@@ -460,30 +593,44 @@ class GameStateSynchronizer:
         character_id = data.get('character_id', 'Cecil')
         position = data['position']
         
-        # Temporarily increase debug for movement troubleshooting
-        # Only log new player connections or every 3 seconds (increased frequency)
-        if player_id not in self.players or (hasattr(self, '_last_player_log') and time.time() - self._last_player_log > 3):
-            self._last_player_log = time.time()
-            print(f"[GAME_SYNC] Player update from {player_id} at pos=({position[0]:.1f}, {position[1]:.1f}), character={character_id}")
+        if player_id not in self.players:
+            logger.info("New network player %s at (%.1f, %.1f), character=%s",
+                        player_id, position[0], position[1], character_id)
+        else:
+            _player_log("Player update from %s at (%.1f, %.1f)", player_id, position[0], position[1])
         
         # Don't update our own player from network
         if player_id == self.local_player_id:
             return
         
         # Create or update player state
+        input_seq = data.get('input_seq')
+        if input_seq is not None:
+            data = {key: value for key, value in data.items() if key != 'input_seq'}
         player_state = PlayerState(**data)
         
-        # Initialize interpolation data for new players
-        if player_id not in self.player_interpolation:
-            self.player_interpolation[player_id] = {
-                "current": player_state.position,
-                "target": player_state.position
-            }
-        else:
-            # Update target position for interpolation
-            self.player_interpolation[player_id]["target"] = player_state.position
-        
-        # Store the raw network state (position will be updated by interpolation)
+        # Host: hold client movement to what the game allows and correct the client if needed
+        if self.is_host and input_seq is not None:
+            validated = self.movement_validator.validate(player_id, input_seq, position[0], position[1])
+            if validated is None:
+                return  # Older than an update already applied
+            x, y, corrected = validated
+            if corrected:
+                position = (x, y)
+                self.network_manager.send_message(MessageType.PLAYER_CORRECTION, {
+                    "player_id": player_id, "input_seq": input_seq, "position": position
+                }, target_peer=message.sender_id)
+        
+        # Buffer the update against its send time; the drawn position is set by interpolation
+        interpolator = self.player_interpolation.get(player_id)
+        if interpolator is None:
+            interpolator = self.player_interpolation[player_id] = EntityInterpolator()
+        velocity = player_state.velocity
+        interpolator.push(player_id, message.timestamp, time.time(),
+                          position[0], position[1], velocity[0], velocity[1])
+        
+        previous = self.players.get(player_id)
+        player_state.position = previous.position if previous is not None else position
         self.players[player_id] = player_state
         
         # Debug: Log current network players
@@ -598,23 +745,22 @@ class GameStateSynchronizer:
             player_id = data.get('player_id', 'unknown')
             position = data.get('position', (0, 0))
             
-            # Log damage events only occasionally to reduce spam
-            if hasattr(self, '_damage_log_count'):
-                self._damage_log_count += 1
-            else:
-                self._damage_log_count = 1
-            
-            if self._damage_log_count % 10 == 1:  # Log every 10th damage event
-                print(f"[ENEMY_DAMAGE_HOST] Processing damage {damage} to enemy {enemy_id} from client {player_id}")
-            
             # Find the enemy and apply damage
             enemies_found = 0
             for enemy in self.enemy_manager.get_enemies():
                 enemies_found += 1
                 if enemy.enemy_id == enemy_id and enemy.is_alive():
-                    # Only log damage application occasionally
-                    if self._damage_log_count % 10 == 1:
-                        print(f"[ENEMY_DAMAGE_HOST] Applying {damage} damage to enemy {enemy_id} (health: {enemy.health})")
+                    # Rewind the enemy to what the client saw and check the hit there
+                    hit_position = data.get('hit_position', position)
+                    if not self.lag_compensator.validate_hit(enemy, data.get('view_time'), hit_position,
+                                                             data.get('hit_radius', 0.0)):
+                        _damage_log("Rejected hit on enemy %s from client %s (%d/%d rejected)",
+                                    enemy_id, player_id, self.lag_compensator.hits_rejected,
+                                    self.lag_compensator.hits_checked)
+                        return
+                    
+                    _damage_log("Applying %s damage to enemy %s from client %s (health: %s)",
+                                damage, enemy_id, player_id, enemy.health)
                     enemy.take_damage(damage)
                     
                     # Send enemy state update to clients after damage is applied
@@ -633,20 +779,12 @@ class GameStateSynchronizer:
                     
                     # If enemy died, handle it by calling remove_enemy which will send ENEMY_DEATH message
                     if not enemy.is_alive():
-                        # Log enemy kills (important event) 
-                        print(f"[ENEMY_DAMAGE_HOST] Enemy {enemy_id} killed by client {player_id}")
+                        _enemy_event_log("Enemy %s killed by client %s", enemy_id, player_id)
                         # Use remove_enemy to properly handle death, send network messages, and drop cores
                         self.enemy_manager.remove_enemy(enemy)
                         return
             
-            # Reduce debug spam for missing enemies - only log occasionally
-            if hasattr(self, '_enemy_not_found_count'):
-                self._enemy_not_found_count += 1 
-            else:
-                self._enemy_not_found_count = 1
-                
-            if self._enemy_not_found_count % 5 == 1:  # Log every 5th miss
-                print(f"[ENEMY_DAMAGE_HOST] Enemy {enemy_id} not found among {enemies_found} enemies")
+            _damage_log("Enemy %s not found among %d enemies", enemy_id, enemies_found)
         else:
             # Remove client-side damage message spam
             pass  # Clients should ignore damage messages
@@ -702,7 +840,7 @@ class GameStateSynchronizer:
         """Handle enemy spawn (host authoritative)."""
         if not self.is_host and self.enemy_manager:
             data = message.data
-            print(f"[ENEMY_SYNC] Client spawning enemy {data.get('enemy_id', 'unknown')} at {data.get('position', 'unknown')}")
+            _enemy_event_log("Client spawning enemy %s at %s", data.get('enemy_id', 'unknown'), data.get('position'))
             self.enemy_manager.spawn_network_enemy(data)
     
     def _handle_enemy_update(self, message: NetworkMessage):
@@ -712,30 +850,66 @@ class GameStateSynchronizer:
             enemy_id = data.get('enemy_id', 'unknown')
             position = data.get('position', (0, 0))
             
-            # Rate limit enemy update debug messages
-            if hasattr(self, '_enemy_update_count'):
-                self._enemy_update_count += 1
-            else:
-                self._enemy_update_count = 1
-                
-            # Only log every 50th enemy update to reduce spam
-            if self._enemy_update_count % 50 == 1:
-                print(f"[ENEMY_SYNC] Client received enemy update for enemy {enemy_id} at {position}")
+            _enemy_event_log("Client received enemy update for enemy %s at %s", enemy_id, position)
             
-            # Apply the update to the enemy (this should happen for EVERY update, not just logged ones)
             self.enemy_manager.update_network_enemy(data)
     
+    def _handle_world_snapshot(self, message: NetworkMessage):
+        """Apply a world snapshot delta from the host and acknowledge it."""
+        if self.is_host:
+            return
+        data = message.data
+        if not self.snapshot_receiver.accept(data["seq"], data["base"]):
+            return
+        
+        for key in ("wave_number", "enemies_remaining", "wave_timer"):
+            if key in data:
+                self.network_wave_info[key] = data[key]
+        
+        for i, player_id in enumerate(data.get("score_ids", ())):
+            self.network_scores[player_id] = {
+                'score': data['scores'][i],
+                'cores': data['cores'][i],
+                'kills': data['kills'][i]
+            }
+        
+        if "ids" in data and self.enemy_manager:
+            self.enemy_manager.apply_network_snapshot(data)
+            
+            # Buffer enemy motion so it can be drawn smoothly between snapshots
+            now = time.time()
+            snapshot_time = data.get("timestamp")
+            push = self.enemy_interpolation.push
+            xs, ys, vxs, vys = data["x"], data["y"], data["vx"], data["vy"]
+            for i, enemy_id in enumerate(data["ids"]):
+                push(enemy_id, snapshot_time, now, xs[i], ys[i], vxs[i], vys[i])
+        
+        self.network_manager.send_message(MessageType.SNAPSHOT_ACK, {"seq": data["seq"]})
+    
+    def _handle_player_correction(self, message: NetworkMessage):
+        """Reconcile the local player with the host's position for one of its input sequences."""
+        data = message.data
+        if data.get("player_id") != self.local_player_id or not self.local_player:
+            return
+        position = data["position"]
+        snap = self.predictor.reconcile(data["input_seq"], position[0], position[1])
+        if snap is not None:
+            _correction_log("Host moved local player by (%.0f, %.0f)", snap[0], snap[1])
+            self.local_player.pos.x += snap[0]
+            self.local_player.pos.y += snap[1]
+    
+    def _handle_snapshot_ack(self, message: NetworkMessage):
+        """Record a client's acknowledgement of a world snapshot (host only)."""
+        if self.is_host and message.sender_id is not None:
+            self.snapshot_sender.acknowledge(message.sender_id, message.data["seq"])
+    
     def _handle_enemy_death(self, message: NetworkMessage):
         """Handle enemy death (host authoritative)."""
-        print(f"[ENEMY_DEATH_CLIENT] Received enemy death message: {message.data}")
         if not self.is_host and self.enemy_manager:
-            data = message.data
-            enemy_id = data['enemy_id']
-            print(f"[ENEMY_DEATH_CLIENT] Attempting to remove enemy {enemy_id} on client")
-            self.enemy_manager.remove_network_enemy(enemy_id)
-            print(f"[ENEMY_DEATH_CLIENT] Remove call completed for enemy {enemy_id}")
+            self.enemy_manager.remove_network_enemy(message.data['enemy_id'])
         else:
-            print(f"[ENEMY_DEATH_CLIENT] Not processing death - is_host={self.is_host}, has_enemy_mgr={self.enemy_manager is not None}")
+            _enemy_event_log("Ignoring enemy death - is_host=%s, has_enemy_mgr=%s",
+                             self.is_host, self.enemy_manager is not None)
     
     def _handle_enemy_bullet_fire(self, message: NetworkMessage):
         """Handle enemy bullet fire (host authoritative)."""
@@ -745,7 +919,7 @@ class GameStateSynchronizer:
             position = data.get('position', (0, 0))
             angle = data.get('angle', 0)
             
-            print(f"[ENEMY_BULLET] Client creating enemy bullet from {enemy_id} at {position}")
+            _enemy_event_log("Client creating enemy bullet from %s at %s", enemy_id, position)
             
             # Create enemy bullet on client
             self.bullet_manager.shoot_enemy_laser(
@@ -791,7 +965,7 @@ class GameStateSynchronizer:
         
         for bullet_id in bullets_to_remove:
             del self.bullets[bullet_id]
-            print(f"[BULLET_CLEANUP] Removed old network bullet: {bullet_id}")
+            logger.debug("Removed old network bullet %s", bullet_id)
     
     def remove_network_bullet(self, bullet_id: str):
         """Remove a specific network bullet."""
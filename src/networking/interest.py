@@ -0,0 +1,192 @@
+"""
+Area-of-interest filtering for host broadcasts.
+The host tracks where each client's player is (from its player updates) and
+trims every broadcast to what that client can see: cosmetic effects outside the
+view radius are dropped, projectiles are kept a little further out since they
+can fly into view, and enemies in world snapshots are sent less often the
+further they are from the client.
+
+Snapshot deltas are acknowledged per sequence, so an enemy trimmed from one
+client's copy would otherwise count as delivered. Trimmed entries are kept per
+client and merged into that client's later snapshots until it acknowledges one
+that carried them.
+"""
+
+from typing import Any, Dict, Optional, Tuple
+
+from .snapshot_delta import KEYFRAME_BASE
+
+# Half diagonal of a 1920x1080 view (~1100 px) plus a margin for camera movement
+INTEREST_RADIUS = 1400.0
+# Between the two radii entities are rate-scaled instead of sent every snapshot
+FAR_INTEREST_RADIUS = 2 * INTEREST_RADIUS
+MID_RATE_DIVISOR = 2  # Entities between the radii go out every 2nd snapshot
+FAR_RATE_DIVISOR = 4  # Entities beyond the far radius go out every 4th snapshot
+
+# Events only worth sending to clients that can see them (effects, plus single
+# enemy updates whose state also arrives with world snapshots)
+NEARBY_MESSAGE_TYPES = frozenset(("explosion", "muzzle_flash", "bullet_hit", "dash_effect", "enemy_update"))
+# Projectiles can travel into view, so they are sent within the far radius
+PROJECTILE_MESSAGE_TYPES = frozenset(("bullet_fire", "enemy_bullet_fire"))
+WORLD_SNAPSHOT_TYPE = "world_snapshot"
+
+# Per-enemy arrays in a world snapshot, filtered together
+SNAPSHOT_ENTITY_FIELDS = ("ids", "x", "y", "vx", "vy", "health")
+_SNAPSHOT_VALUE_FIELDS = SNAPSHOT_ENTITY_FIELDS[1:]
+ENEMY_DEATH_TYPE = "enemy_death"
+
+
+def _message_position(data: dict):
+    """Get the world position an event happened at, if it has one."""
+    position = data.get("position")
+    if position is None:
+        position = data.get("start_position")
+    return position
+
+
+class InterestManager:
+    """Filters host broadcasts per client by distance from that client's player."""
+
+    def __init__(self, radius: float = INTEREST_RADIUS, far_radius: float = FAR_INTEREST_RADIUS):
+        """Initialize the interest manager."""
+        self.radius_sq = radius * radius
+        self.far_radius_sq = far_radius * far_radius
+        self.client_positions: Dict[str, tuple] = {}  # client id -> (x, y) of its player
+        self.snapshot_counts: Dict[str, int] = {}     # client id -> world snapshots sent
+        # client id -> {enemy id: ((x, y, vx, vy, health), sequence last sent in or None)}
+        self.deferred_entities: Dict[str, Dict[Any, Tuple[tuple, Optional[int]]]] = {}
+
+        # Statistics
+        self.messages_dropped = 0
+        self.entities_dropped = 0
+
+    def update_client_position(self, client_id: str, position):
+        """Record a client's player position from its latest player update."""
+        if position is not None:
+            self.client_positions[client_id] = (position[0], position[1])
+
+    def forget_client(self, client_id: str):
+        """Drop state for a disconnected client."""
+        self.client_positions.pop(client_id, None)
+        self.snapshot_counts.pop(client_id, None)
+        self.deferred_entities.pop(client_id, None)
+
+    def acknowledge_snapshot(self, client_id: str, sequence: int):
+        """Stop resending deferred enemies that reached a client in a snapshot it has now applied."""
+        deferred = self.deferred_entities.get(client_id)
+        if not deferred:
+            return
+        delivered = [enemy_id for enemy_id, (_, sent) in deferred.items()
+                     if sent is not None and sent <= sequence]
+        for enemy_id in delivered:
+            del deferred[enemy_id]
+
+    def filter_message(self, client_id: str, message_type: str, data: Any) -> Optional[Any]:
+        """
+        Return the data to send to a client: the original data, a trimmed copy,
+        or None if the client should not receive the message at all.
+        """
+        center = self.client_positions.get(client_id)
+        if center is None or not isinstance(data, dict):
+            return data  # Position unknown yet - send everything
+
+        if message_type == WORLD_SNAPSHOT_TYPE:
+            return self._filter_snapshot(client_id, center, data)
+        if message_type == ENEMY_DEATH_TYPE:
+            deferred = self.deferred_entities.get(client_id)
+            if deferred:
+                deferred.pop(data.get("enemy_id"), None)
+            return data
+
+        if message_type in NEARBY_MESSAGE_TYPES:
+            limit_sq = self.radius_sq
+        elif message_type in PROJECTILE_MESSAGE_TYPES:
+            limit_sq = self.far_radius_sq
+        else:
+            return data
+
+        position = _message_position(data)
+        if position is None:
+            return data
+        dx = position[0] - center[0]
+        dy = position[1] - center[1]
+        if dx * dx + dy * dy > limit_sq:
+            self.messages_dropped += 1
+            return None
+        return data
+
+    def _filter_snapshot(self, client_id: str, center: tuple, data: dict) -> dict:
+        """
+        Trim the enemy arrays of a world snapshot, sending far enemies less often.
+        Enemies skipped here are resent in later snapshots to this client until it
+        acknowledges one that carried them (see acknowledge_snapshot).
+        """
+        count = self.snapshot_counts.get(client_id, 0) + 1
+        self.snapshot_counts[client_id] = count
+        sequence = data.get("seq")
+        deferred = self.deferred_entities.get(client_id)
+
+        if data.get("base") == KEYFRAME_BASE:
+            # Keyframes stay complete so every client can resynchronize; they
+            # also carry the current value of every deferred enemy
+            if deferred:
+                for enemy_id, (values, _) in deferred.items():
+                    deferred[enemy_id] = (values, sequence)
+            return data
+
+        ids = data.get("ids") or ()
+        if not ids and not deferred:
+            return data
+
+        send_mid = count % MID_RATE_DIVISOR == 0
+        send_far = count % FAR_RATE_DIVISOR == 0
+        cx, cy = center
+        radius_sq = self.radius_sq
+        far_radius_sq = self.far_radius_sq
+
+        def in_range(x, y):
+            dx = x - cx
+            dy = y - cy
+            distance_sq = dx * dx + dy * dy
+            return distance_sq <= radius_sq or (send_mid and distance_sq <= far_radius_sq) or send_far
+
+        # Earlier skips not superseded by this snapshot's own entries
+        resent = []
+        if deferred:
+            in_snapshot = set(ids)
+            for enemy_id, (values, _) in deferred.items():
+                if enemy_id in in_snapshot:
+                    continue
+                if in_range(values[0], values[1]):
+                    resent.append((enemy_id, values))
+                    deferred[enemy_id] = (values, sequence)
+                else:
+                    deferred[enemy_id] = (values, None)
+
+        keep = []
+        if ids:
+            xs, ys = data["x"], data["y"]
+            for i in range(len(ids)):
+                if in_range(xs[i], ys[i]):
+                    keep.append(i)
+                    if deferred:
+                        deferred.pop(ids[i], None)  # Now covered by the sender's own acks
+                else:
+                    if deferred is None:
+                        deferred = self.deferred_entities[client_id] = {}
+                    deferred[ids[i]] = (tuple(data[field][i] for field in _SNAPSHOT_VALUE_FIELDS), None)
+
+        if len(keep) == len(ids) and not resent:
+            return data
+        self.entities_dropped += len(ids) - len(keep)
+
+        trimmed = dict(data)
+        if not keep and not resent:
+            for field in SNAPSHOT_ENTITY_FIELDS:
+                trimmed.pop(field, None)
+            return trimmed
+        trimmed["ids"] = [ids[i] for i in keep] + [enemy_id for enemy_id, _ in resent]
+        for column, field in enumerate(_SNAPSHOT_VALUE_FIELDS):
+            values = data.get(field, ())
+            trimmed[field] = [values[i] for i in keep] + [entry[column] for _, entry in resent]
+        return trimmed
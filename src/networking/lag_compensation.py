@@ -0,0 +1,112 @@
+"""
+Host-side lag compensation for hits reported by clients.
+Clients draw enemies about 100 ms in the past and their hit reports reach the
+host another half round trip later, by which time the enemy has moved on. The
+host keeps a ring buffer of enemy positions for the last half second, one frame
+per simulation tick. A hit report names the host time the client was looking
+at; the host rewinds the enemy to that time and checks the hit against where it
+was then, instead of trusting the client or testing against the present.
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from .prediction import TICK_SECONDS
+
+HISTORY_SECONDS = 0.5    # Longest rewind; older views are checked against the oldest frame
+HIT_TOLERANCE = 24.0     # Slack (pixels) for interpolation and quantization differences
+MAX_HIT_RADIUS = 60.0    # Largest bullet radius a client may claim
+
+
+class LagCompensator:
+    """Ring buffer of past enemy positions used to validate client hit claims."""
+
+    def __init__(self, history_seconds: float = HISTORY_SECONDS, tick_seconds: float = TICK_SECONDS):
+        self.capacity = int(round(history_seconds / tick_seconds)) + 1
+        self.times = [0.0] * self.capacity
+        self.frames: list = [None] * self.capacity  # enemy id -> (x, y) per recorded tick
+        self.head = 0    # Slot the next frame is written to
+        self.count = 0
+
+        # Statistics
+        self.hits_checked = 0
+        self.hits_rejected = 0
+        self.rewinds_clamped = 0   # Views older than the history (laggy or lying clients)
+
+    def record(self, now: float, enemies: Iterable):
+        """Store the live enemies' positions for this tick."""
+        self.times[self.head] = now
+        self.frames[self.head] = {enemy.enemy_id: (enemy.pos.x, enemy.pos.y)
+                                  for enemy in enemies if enemy.is_alive()}
+        self.head = (self.head + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def clear(self):
+        """Forget all history (new game or wave reset)."""
+        self.frames = [None] * self.capacity
+        self.head = 0
+        self.count = 0
+
+    def _slot(self, index: int) -> int:
+        """Ring slot of the index-th oldest frame."""
+        return (self.head - self.count + index) % self.capacity
+
+    def position_at(self, enemy_id: str, when: float) -> Optional[Tuple[float, float]]:
+        """Return where an enemy was at host time when, or None if it is not in the history."""
+        if self.count == 0:
+            return None
+        times = self.times
+
+        oldest = self._slot(0)
+        newest = self._slot(self.count - 1)
+        if when <= times[oldest]:
+            if when < times[oldest] - TICK_SECONDS:
+                self.rewinds_clamped += 1
+            return self.frames[oldest].get(enemy_id)
+        if when >= times[newest]:
+            return self.frames[newest].get(enemy_id)
+
+        # Binary search for the last frame at or before when
+        low, high = 0, self.count - 1
+        while high - low > 1:
+            middle = (low + high) // 2
+            if times[self._slot(middle)] <= when:
+                low = middle
+            else:
+                high = middle
+        before = self._slot(low)
+        after = self._slot(high)
+        start = self.frames[before].get(enemy_id)
+        end = self.frames[after].get(enemy_id)
+        if start is None or end is None:
+            return start or end  # Spawned or died between the two ticks
+        s = (when - times[before]) / (times[after] - times[before])
+        return start[0] + (end[0] - start[0]) * s, start[1] + (end[1] - start[1]) * s
+
+    def validate_hit(self, enemy, when: Optional[float], hit_position, hit_radius: float) -> bool:
+        """
+        Check a client's hit on a live enemy at the host time the client saw it.
+        Without a view time the hit is checked against the newest frame.
+        """
+        self.hits_checked += 1
+        if when is None and self.count:
+            when = self.times[self._slot(self.count - 1)]
+        position = self.position_at(enemy.enemy_id, when) if when is not None else None
+        if position is None:
+            position = (enemy.pos.x, enemy.pos.y)  # Too new for the history
+
+        radius = enemy.size + min(max(hit_radius, 0.0), MAX_HIT_RADIUS) + HIT_TOLERANCE
+        dx = hit_position[0] - position[0]
+        dy = hit_position[1] - position[1]
+        if dx * dx + dy * dy <= radius * radius:
+            return True
+        self.hits_rejected += 1
+        return False
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get validation statistics."""
+        return {
+            "hits_checked": self.hits_checked,
+            "hits_rejected": self.hits_rejected,
+            "rewinds_clamped": self.rewinds_clamped,
+        }
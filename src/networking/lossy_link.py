@@ -0,0 +1,81 @@
+"""
+Lossy link simulator for testing the UDP channel on one machine.
+Outgoing datagrams are dropped, delayed, jittered (which also reorders them)
+and duplicated at configurable rates before they reach the socket.
+"""
+
+import heapq
+import random
+import threading
+import time
+from typing import Optional
+
+
+class LossyLink:
+    """Applies loss, latency, jitter and duplication to outgoing datagrams."""
+
+    def __init__(self, loss: float = 0.0, latency: float = 0.0, jitter: float = 0.0,
+                 duplicate: float = 0.0, seed: Optional[int] = None):
+        """
+        Initialize the link. loss and duplicate are probabilities (0-1),
+        latency and jitter are in seconds (each datagram is delayed by
+        latency +- jitter, so jitter larger than the send interval reorders).
+        """
+        self.loss = loss
+        self.latency = latency
+        self.jitter = jitter
+        self.duplicate = duplicate
+        self.random = random.Random(seed)
+        self.pending = []  # Heap of (due time, order, data, address)
+        self.order = 0     # Tie-breaker so datagrams due at the same time keep their order
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.datagrams_in = 0
+        self.dropped = 0
+        self.duplicated = 0
+        self.delivered = 0
+
+    def send(self, sock, data: bytes, address, now: Optional[float] = None):
+        """Queue a datagram for delayed delivery (or drop it)."""
+        if now is None:
+            now = time.perf_counter()
+        with self.lock:
+            self.datagrams_in += 1
+            if self.random.random() < self.loss:
+                self.dropped += 1
+                return
+            copies = 1
+            if self.random.random() < self.duplicate:
+                copies = 2
+                self.duplicated += 1
+            for _ in range(copies):
+                delay = max(0.0, self.latency + self.random.uniform(-self.jitter, self.jitter))
+                self.order += 1
+                heapq.heappush(self.pending, (now + delay, self.order, data, address))
+        self.flush(sock, now)
+
+    def flush(self, sock, now: Optional[float] = None) -> int:
+        """Send every queued datagram whose delay has passed; returns how many were sent."""
+        if now is None:
+            now = time.perf_counter()
+        due = []
+        with self.lock:
+            while self.pending and self.pending[0][0] <= now:
+                due.append(heapq.heappop(self.pending))
+        for _, _, data, address in due:
+            try:
+                sock.sendto(data, address)
+                self.delivered += 1
+            except OSError:
+                pass  # The real network would lose it too
+        return len(due)
+
+    def time_until_next(self, now: Optional[float] = None) -> Optional[float]:
+        """Seconds until the next queued datagram is due, or None if nothing is queued."""
+        if now is None:
+            now = time.perf_counter()
+        with self.lock:
+            if not self.pending:
+                return None
+            return max(0.0, self.pending[0][0] - now)
@@ -0,0 +1,205 @@
+"""
+Network statistics for Kingdom-Pygame.
+Counts messages and bytes per message type in each direction, keeps
+round-trip time and jitter per connection from timestamped heartbeats, and
+turns the counters into per-second rates. The network managers feed it from
+their I/O threads; the game reads consistent snapshots for the HUD overlay and
+can dump them to a CSV or JSONL file to tune send intervals with real numbers.
+"""
+
+import csv
+import json
+import os
+import threading
+import time
+from typing import Any, Dict
+
+HEARTBEAT_INTERVAL = 1.0   # Seconds between heartbeat pings on every connection
+RATE_WINDOW = 1.0          # Seconds of traffic each per-second rate is averaged over
+
+# Counter slots per message type
+_SENT_MESSAGES, _SENT_BYTES, _RECEIVED_MESSAGES, _RECEIVED_BYTES = range(4)
+
+CSV_COLUMNS = (
+    "time", "kind", "name",
+    "sent_messages", "sent_bytes", "received_messages", "received_bytes",
+    "sent_per_s", "sent_bytes_per_s", "received_per_s", "received_bytes_per_s",
+    "rtt_ms", "jitter_ms", "min_rtt_ms", "send_queue", "receive_queue", "write_buffer_bytes",
+)
+
+
+class RttEstimator:
+    """Smoothed round-trip time and jitter for one connection."""
+
+    __slots__ = ("srtt", "jitter", "min_rtt", "last_rtt", "samples")
+
+    def __init__(self):
+        self.srtt = None      # Smoothed RTT (1/8 gain, as TCP)
+        self.jitter = 0.0     # Mean deviation between consecutive samples (1/16 gain, as RTP)
+        self.min_rtt = None
+        self.last_rtt = None
+        self.samples = 0
+
+    def add(self, rtt: float):
+        """Add one round-trip sample in seconds."""
+        if self.srtt is None:
+            self.srtt = rtt
+            self.min_rtt = rtt
+        else:
+            self.jitter += (abs(rtt - self.last_rtt) - self.jitter) / 16.0
+            self.srtt += (rtt - self.srtt) / 8.0
+            self.min_rtt = min(self.min_rtt, rtt)
+        self.last_rtt = rtt
+        self.samples += 1
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the estimate in milliseconds."""
+        return {
+            "rtt_ms": self.srtt * 1000.0 if self.srtt is not None else None,
+            "jitter_ms": self.jitter * 1000.0,
+            "min_rtt_ms": self.min_rtt * 1000.0 if self.min_rtt is not None else None,
+            "last_rtt_ms": self.last_rtt * 1000.0 if self.last_rtt is not None else None,
+            "samples": self.samples,
+        }
+
+
+class NetworkStats:
+    """Thread-safe per-message-type traffic counters and per-connection RTT."""
+
+    def __init__(self, rate_window: float = RATE_WINDOW):
+        self.rate_window = rate_window
+        self.lock = threading.Lock()
+        self.counters: Dict[str, list] = {}     # message type -> [sent msgs, sent bytes, received msgs, received bytes]
+        self.rtt: Dict[str, RttEstimator] = {}  # peer id -> estimator
+        self.rates: Dict[str, tuple] = {}       # message type -> per-second rates over the last window
+        self.started = time.time()
+        self._window_start = time.perf_counter()
+        self._window_counts: Dict[str, tuple] = {}
+
+    def count_sent(self, message_type: str, size: int):
+        """Count one outgoing message of size bytes."""
+        with self.lock:
+            counter = self.counters.get(message_type)
+            if counter is None:
+                counter = self.counters[message_type] = [0, 0, 0, 0]
+            counter[_SENT_MESSAGES] += 1
+            counter[_SENT_BYTES] += size
+
+    def count_received(self, message_type: str, size: int):
+        """Count one incoming message of size bytes."""
+        with self.lock:
+            counter = self.counters.get(message_type)
+            if counter is None:
+                counter = self.counters[message_type] = [0, 0, 0, 0]
+            counter[_RECEIVED_MESSAGES] += 1
+            counter[_RECEIVED_BYTES] += size
+
+    def record_rtt(self, peer_id: str, rtt: float):
+        """Add a heartbeat round trip for a connection."""
+        with self.lock:
+            estimator = self.rtt.get(peer_id)
+            if estimator is None:
+                estimator = self.rtt[peer_id] = RttEstimator()
+            estimator.add(rtt)
+
+    def forget_peer(self, peer_id: str):
+        """Drop the RTT estimate of a closed connection."""
+        with self.lock:
+            self.rtt.pop(peer_id, None)
+
+    def _update_rates(self):
+        """Recompute per-second rates once a full window has passed (lock held)."""
+        now = time.perf_counter()
+        elapsed = now - self._window_start
+        if elapsed < self.rate_window:
+            return
+        rates = {}
+        for message_type, counter in self.counters.items():
+            previous = self._window_counts.get(message_type, (0, 0, 0, 0))
+            rates[message_type] = tuple((counter[i] - previous[i]) / elapsed for i in range(4))
+        self.rates = rates
+        self._window_counts = {message_type: tuple(counter) for message_type, counter in self.counters.items()}
+        self._window_start = now
+
+    def snapshot(self, **gauges) -> Dict[str, Any]:
+        """
+        Return a consistent copy of every counter, rate and RTT estimate.
+        Keyword arguments (queue depths and the like) are added as gauges.
+        """
+        with self.lock:
+            self._update_rates()
+            types = {}
+            totals = [0, 0, 0, 0]
+            total_rates = [0.0, 0.0, 0.0, 0.0]
+            for message_type, counter in sorted(self.counters.items()):
+                rates = self.rates.get(message_type, (0.0, 0.0, 0.0, 0.0))
+                types[message_type] = _traffic_dict(counter, rates)
+                for i in range(4):
+                    totals[i] += counter[i]
+                    total_rates[i] += rates[i]
+            peers = {peer_id: estimator.to_dict() for peer_id, estimator in self.rtt.items()}
+
+        return {
+            "time": time.time(),
+            "uptime": time.time() - self.started,
+            "totals": _traffic_dict(totals, total_rates),
+            "types": types,
+            "peers": peers,
+            "gauges": gauges,
+        }
+
+
+def _traffic_dict(counter, rates) -> Dict[str, float]:
+    """Name the four counter slots and their rates."""
+    return {
+        "sent_messages": counter[_SENT_MESSAGES],
+        "sent_bytes": counter[_SENT_BYTES],
+        "received_messages": counter[_RECEIVED_MESSAGES],
+        "received_bytes": counter[_RECEIVED_BYTES],
+        "sent_per_s": rates[_SENT_MESSAGES],
+        "sent_bytes_per_s": rates[_SENT_BYTES],
+        "received_per_s": rates[_RECEIVED_MESSAGES],
+        "received_bytes_per_s": rates[_RECEIVED_BYTES],
+    }
+
+
+class StatsLogger:
+    """Appends network stats snapshots to a JSONL file (one snapshot per line) or a CSV file."""
+
+    def __init__(self, path: str):
+        """Open path for writing; a .csv extension selects CSV, anything else JSONL."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.is_csv = path.lower().endswith(".csv")
+        self.file = open(path, "w", newline="" if self.is_csv else None, encoding="utf-8")
+        self.writer = None
+        if self.is_csv:
+            self.writer = csv.DictWriter(self.file, fieldnames=CSV_COLUMNS, extrasaction="ignore")
+            self.writer.writeheader()
+        self.rows_written = 0
+
+    def write(self, snapshot: Dict[str, Any]):
+        """Write one snapshot."""
+        if self.file is None:
+            return
+        if not self.is_csv:
+            self.file.write(json.dumps(snapshot, separators=(',', ':')) + "\n")
+        else:
+            stamp = round(snapshot["time"], 3)
+            rows = [dict(snapshot["totals"], kind="total", name="all", **snapshot["gauges"])]
+            rows += [dict(traffic, kind="type", name=name) for name, traffic in snapshot["types"].items()]
+            rows += [dict(rtt, kind="peer", name=peer_id) for peer_id, rtt in snapshot["peers"].items()]
+            for row in rows:
+                row["time"] = stamp
+                self.writer.writerow(row)
+        self.file.flush()
+        self.rows_written += 1
+
+    def close(self):
+        """Close the file."""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
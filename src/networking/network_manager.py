@@ -3,15 +3,25 @@ Network Manager for Kingdom-Pygame multiplayer.
 Handles client-server communication, message routing, and connection management.
 """
 
+import queue
+import selectors
 import socket
+import struct
 import threading
 import json
 import time
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Callable
 from dataclasses import dataclass
 from enum import Enum
 import pygame as pg
 
+from .wire_codec import (WireCodec, CODEC_JSON, CODEC_BINARY, SUPPORTED_CODECS,
+                         negotiate_codec, is_binary_frame)
+from .interest import InterestManager
+from .udp_channel import UdpChannel, UNRELIABLE_MESSAGE_TYPES, DEFAULT_REDUNDANCY, HOST_PEER_ID
+from .framing import FrameReader, FrameError
+from .net_stats import NetworkStats, HEARTBEAT_INTERVAL
+
 
 class MessageType(Enum):
     """Types of network messages."""
@@ -51,6 +61,18 @@ class MessageType(Enum):
     WAVE_UPDATE = "wave_update"
     SCORE_UPDATE = "score_update"
     WORLD_EVENT = "world_event"
+    
+    # Delta world snapshots (appended: wire ids follow declaration order)
+    WORLD_SNAPSHOT = "world_snapshot"
+    SNAPSHOT_ACK = "snapshot_ack"
+    
+    # Host correction of a client's predicted position
+    PLAYER_CORRECTION = "player_correction"
+
+
+# Binary codec shared by both network managers. Type ids follow enum order, so
+# new message types must be appended to the end of MessageType.
+WIRE_CODEC = WireCodec(message_type.value for message_type in MessageType)
 
 
 @dataclass
@@ -65,8 +87,13 @@ class NetworkMessage:
         if self.timestamp is None:
             self.timestamp = time.time()
     
-    def to_bytes(self) -> bytes:
-        """Convert message to bytes for transmission."""
+    def to_bytes(self, codec: str = CODEC_JSON) -> bytes:
+        """Convert message to bytes for transmission using the negotiated codec."""
+        if codec == CODEC_BINARY:
+            message_bytes = WIRE_CODEC.encode(self.message_type.value, self.data,
+                                              self.timestamp, self.sender_id)
+            return len(message_bytes).to_bytes(4, byteorder='big') + message_bytes
+        
         message_dict = {
             'type': self.message_type.value,
             'data': self.data,
@@ -80,9 +107,18 @@ class NetworkMessage:
         return length_prefix + message_bytes
     
     @classmethod
-    def from_bytes(cls, data: bytes) -> 'NetworkMessage':
-        """Create message from bytes."""
-        message_dict = json.loads(data.decode('utf-8'))
+    def from_bytes(cls, data) -> 'NetworkMessage':
+        """Create message from bytes or a memoryview (binary or JSON, detected from the payload)."""
+        if is_binary_frame(data):
+            message_type, message_data, timestamp, sender_id = WIRE_CODEC.decode(data)
+            return cls(
+                message_type=MessageType(message_type),
+                data=message_data,
+                timestamp=timestamp,
+                sender_id=sender_id
+            )
+        
+        message_dict = json.loads(str(data, 'utf-8'))
         return cls(
             message_type=MessageType(message_dict['type']),
             data=message_dict['data'],
@@ -91,6 +127,31 @@ class NetworkMessage:
         )
 
 
+# Bounds for the I/O loop
+IO_POLL_INTERVAL = 0.05        # Longest the loop sleeps without socket activity (seconds)
+MAX_WRITE_BUFFER = 4 * 1024 * 1024   # A peer this far behind is not reading - drop it
+
+# Selector registration tags for the sockets that are not connections
+_WAKER = "waker"
+_LISTENER = "listener"
+_DATAGRAMS = "datagrams"
+
+
+class _Connection:
+    """A TCP connection owned by the I/O loop, with its read and write buffers."""
+    
+    __slots__ = ("sock", "peer_id", "address", "reader", "write_buffer", "writing", "closed")
+    
+    def __init__(self, sock: socket.socket, peer_id: str, address):
+        self.sock = sock
+        self.peer_id = peer_id
+        self.address = address
+        self.reader = FrameReader()      # Received bytes not yet handled as frames
+        self.write_buffer = bytearray()  # Encoded frames waiting for the socket
+        self.writing = False             # Registered for write readiness
+        self.closed = False
+
+
 class NetworkManager:
     """Manages network connections and message handling."""
     
@@ -98,33 +159,53 @@ class NetworkManager:
         self.is_server = is_server
         self.socket = None
         self.running = False
-        self.connected_clients = {}  # client_id -> (socket, address)
+        self.connected_clients = {}  # client_id -> _Connection
         self.message_handlers = {}  # MessageType -> callback function
         self.player_id = None
         
+        # Wire codec negotiated at connect time (JSON until the peer agrees to binary)
+        self.codec = CODEC_JSON  # Client: codec for messages to the server
+        self.client_codecs = {}  # Server: client_id -> codec
+        
+        # Server: per-client area-of-interest filtering of broadcasts
+        self.interest = InterestManager()
+        
+        # Unreliable UDP channel for high-frequency state (TCP stays the reliable channel)
+        self.udp_channel = None
+        self.udp_redundancy = DEFAULT_REDUNDANCY  # Earlier messages repeated in each datagram
+        self.udp_link = None  # Optional LossyLink to simulate a bad network when testing
+        self.server_udp_address = None  # Client: resolved server address for datagrams
+        
         # Server-specific
         self.server_socket = None
-        self.server_thread = None
         
         # Client-specific
-        self.client_thread = None
+        self.server_connection = None
         self.server_address = None
         
-        # Message queues
-        self.incoming_messages = []
-        self.outgoing_messages = []
-        self.message_lock = threading.Lock()
+        # One I/O thread owns every socket; the game thread talks to it through queues
+        self.io_thread = None
+        self.selector = None
+        self.waker_reader = None  # Socket pair that interrupts select() when messages are queued
+        self.waker_writer = None
+        self.wake_pending = False
+        self.pending_writes = set()  # Connections with buffered output
+        
+        # Message queues (game thread <-> I/O thread)
+        self.incoming_messages = queue.SimpleQueue()
+        self.outgoing_messages = queue.SimpleQueue()
         
         # Connection state
         self.connected = False
-        self.last_heartbeat = time.time()
-        self.heartbeat_interval = 5.0  # seconds
+        self.last_heartbeat = 0.0
+        self.heartbeat_interval = HEARTBEAT_INTERVAL  # Pings that measure round-trip time
         
         # Performance monitoring
         self.bytes_sent = 0
         self.bytes_received = 0
         self.messages_sent = 0
         self.messages_received = 0
+        self.stats = NetworkStats()  # Per message type traffic and per connection RTT
     
     def start_server(self, host: str = "localhost", port: int = 7777):
         """Start as a server."""
@@ -134,15 +215,22 @@ class NetworkManager:
                 self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
                 self.server_socket.bind((host, port))
                 self.server_socket.listen(8)  # Support up to 8 players
+                self.server_socket.setblocking(False)
+                
+                # UDP uses the same port number as the TCP listener
+                self._open_udp_channel(host, port)
                 
                 self.running = True
-                self.server_thread = threading.Thread(target=self._server_loop, daemon=True)
-                self.server_thread.start()
+                self._start_io_thread()
                 
                 print(f"Server started on {host}:{port}")
                 return True
             except Exception as e:
                 print(f"Failed to start server: {e}")
+                if self.server_socket:
+                    self.server_socket.close()
+                    self.server_socket = None
+                self._close_udp_channel()
                 return False
         return False
     
@@ -152,19 +240,24 @@ class NetworkManager:
             try:
                 self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
                 self.socket.connect((host, port))
+                self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.socket.setblocking(False)
                 self.server_address = (host, port)
+                self.server_udp_address = self.socket.getpeername()
+                self.server_connection = _Connection(self.socket, HOST_PEER_ID, self.server_address)
+                self._open_udp_channel("0.0.0.0", 0)
                 
-                # Send connection request
+                # Send connection request (always JSON, before the server has picked a codec)
                 connect_msg = NetworkMessage(
                     MessageType.CONNECT,
-                    {"player_name": player_name}
+                    {"player_name": player_name, "codecs": list(SUPPORTED_CODECS),
+                     "udp": self.udp_channel is not None}
                 )
-                self._send_message(connect_msg, self.socket)
+                self._queue_frame(self.server_connection, connect_msg.to_bytes(), MessageType.CONNECT.value)
                 
                 self.running = True
                 self.connected = True
-                self.client_thread = threading.Thread(target=self._client_loop, daemon=True)
-                self.client_thread.start()
+                self._start_io_thread()
                 
                 print(f"Connected to server {host}:{port}")
                 return True
@@ -173,69 +266,54 @@ class NetworkManager:
                 if self.socket:
                     self.socket.close()
                     self.socket = None
+                self.server_connection = None
+                self._close_udp_channel()
                 return False
         return False
     
     def disconnect(self):
         """Disconnect from server or stop server."""
         if self.running:
+            if not self.is_server and self.connected:
+                # Goes out with the final flush before the I/O thread closes the socket
+                self.outgoing_messages.put((NetworkMessage(MessageType.DISCONNECT, {}), None))
+            
             self.running = False
+            self._wake()
+            if self.io_thread and self.io_thread is not threading.current_thread():
+                self.io_thread.join(timeout=1.0)
+            self.io_thread = None
             
             if self.is_server:
-                # Close all client connections
-                for client_id, (client_socket, _) in self.connected_clients.items():
-                    try:
-                        client_socket.close()
-                    except:
-                        pass
                 self.connected_clients.clear()
-                
-                if self.server_socket:
-                    self.server_socket.close()
-                    self.server_socket = None
-                
-                if self.server_thread:
-                    self.server_thread.join(timeout=1.0)
-                    
+                self.client_codecs.clear()
+                self.interest = InterestManager()
                 print("Server stopped")
             else:
-                # Send disconnect message
-                if self.connected and self.socket:
-                    try:
-                        disconnect_msg = NetworkMessage(MessageType.DISCONNECT, {})
-                        self._send_message(disconnect_msg, self.socket)
-                    except:
-                        pass
-                    
-                    self.socket.close()
-                    self.socket = None
-                
-                if self.client_thread:
-                    self.client_thread.join(timeout=1.0)
-                
+                self.socket = None
                 self.connected = False
+                self.codec = CODEC_JSON
                 print("Disconnected from server")
     
     def register_message_handler(self, message_type: MessageType, handler: Callable):
         """Register a callback for a specific message type."""
         self.message_handlers[message_type] = handler
     
-    def send_message(self, message_type: MessageType, data: Dict[str, Any]):
-        """Send a message to connected peers."""
+    def send_message(self, message_type: MessageType, data: Dict[str, Any], target_peer: str = None):
+        """Send a message to connected peers (the server can address a single client with target_peer)."""
         message = NetworkMessage(message_type, data, sender_id=self.player_id)
-        
-        with self.message_lock:
-            self.outgoing_messages.append(message)
+        self.outgoing_messages.put((message, target_peer))
+        self._wake()
     
     def process_messages(self):
         """Process incoming messages (call from main game loop)."""
-        messages_to_process = []
-        
-        with self.message_lock:
-            messages_to_process = self.incoming_messages.copy()
-            self.incoming_messages.clear()
-        
-        for message in messages_to_process:
+        # Only what is queued now, so a busy connection cannot stall the frame
+        for _ in range(self.incoming_messages.qsize()):
+            try:
+                message = self.incoming_messages.get_nowait()
+            except queue.Empty:
+                break
+            
             if message.message_type in self.message_handlers:
                 try:
                     self.message_handlers[message.message_type](message)
@@ -252,139 +330,365 @@ class NetworkManager:
             "bytes_sent": self.bytes_sent,
             "bytes_received": self.bytes_received,
             "messages_sent": self.messages_sent,
-            "messages_received": self.messages_received
+            "messages_received": self.messages_received,
+            "udp": self.udp_channel.get_stats() if self.udp_channel else None
         }
     
-    def _server_loop(self):
-        """Main server loop for handling connections."""
+    def get_network_stats(self) -> Dict[str, Any]:
+        """Snapshot traffic per message type, round-trip time per connection and queue depths."""
+        if self.is_server:
+            connections = list(self.connected_clients.values())
+        else:
+            connections = [self.server_connection] if self.server_connection else []
+        return self.stats.snapshot(
+            send_queue=self.outgoing_messages.qsize(),
+            receive_queue=self.incoming_messages.qsize(),
+            write_buffer_bytes=sum(len(connection.write_buffer) for connection in connections)
+        )
+    
+    def _start_io_thread(self):
+        """Register the sockets with a selector and start the I/O thread."""
+        self.selector = selectors.DefaultSelector()
+        self.waker_reader, self.waker_writer = socket.socketpair()
+        self.waker_reader.setblocking(False)
+        self.waker_writer.setblocking(False)
+        self.wake_pending = False
+        self.selector.register(self.waker_reader, selectors.EVENT_READ, _WAKER)
+        
+        if self.server_socket:
+            self.selector.register(self.server_socket, selectors.EVENT_READ, _LISTENER)
+        if self.server_connection:
+            self.selector.register(self.server_connection.sock, selectors.EVENT_READ, self.server_connection)
+        if self.udp_channel:
+            self.selector.register(self.udp_channel.socket, selectors.EVENT_READ, _DATAGRAMS)
+        
+        self.io_thread = threading.Thread(target=self._io_loop, daemon=True)
+        self.io_thread.start()
+    
+    def _wake(self):
+        """Interrupt the I/O thread's select() so queued messages go out now."""
+        if self.waker_writer is None or self.wake_pending:
+            return
+        self.wake_pending = True
+        try:
+            self.waker_writer.send(b'\0')
+        except OSError:
+            pass  # Buffer full (a wake-up is already pending) or shutting down
+    
+    def _io_loop(self):
+        """Main I/O loop: accept, read and write every socket from one thread."""
         while self.running:
             try:
-                client_socket, client_address = self.server_socket.accept()
-                client_thread = threading.Thread(
-                    target=self._handle_client, 
-                    args=(client_socket, client_address),
-                    daemon=True
-                )
-                client_thread.start()
+                timeout = IO_POLL_INTERVAL
+                if self.udp_channel:
+                    timeout = self.udp_channel.poll_timeout(timeout)
+                
+                for key, events in self.selector.select(timeout):
+                    tag = key.data
+                    if tag is _WAKER:
+                        self._drain_waker()
+                    elif tag is _LISTENER:
+                        self._accept_clients()
+                    elif tag is _DATAGRAMS:
+                        pass  # Serviced below on every pass
+                    else:
+                        if events & selectors.EVENT_READ:
+                            self._read_connection(tag)
+                        if events & selectors.EVENT_WRITE and not tag.closed:
+                            self._flush_connection(tag)
+                
+                self._service_udp()
+                self._drain_outgoing()
+                self._send_heartbeats()
+                
+                # Everything queued this pass leaves in one send per connection
+                for connection in list(self.pending_writes):
+                    self._flush_connection(connection)
+                
+                if not self.is_server and self.server_connection is None:
+                    break  # Lost the server
+            
             except Exception as e:
+                if self.running:
+                    print(f"I/O loop error: {e}")
+        
+        self._shutdown_io()
+    
+    def _drain_waker(self):
+        """Empty the waker socket, then allow the next wake-up.
+
+        The flag is cleared only after the socket is drained: clearing it first
+        lets a concurrent _wake() byte be swallowed here while the flag stays
+        set, after which no send would ever interrupt select() again. Messages
+        queued before the flag clears are picked up by _drain_outgoing() later
+        in the same pass.
+        """
+        try:
+            while self.waker_reader.recv(4096):
+                pass
+        except OSError:
+            pass
+        self.wake_pending = False
+    
+    def _accept_clients(self):
+        """Accept every pending client connection."""
+        while True:
+            try:
+                client_socket, client_address = self.server_socket.accept()
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as e:
                 if self.running:
                     print(f"Server loop error: {e}")
-                break
+                return
+            
+            client_socket.setblocking(False)
+            client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            client_id = f"{client_address[0]}:{client_address[1]}"
+            connection = _Connection(client_socket, client_id, client_address)
+            self.connected_clients[client_id] = connection
+            self.selector.register(client_socket, selectors.EVENT_READ, connection)
     
-    def _handle_client(self, client_socket: socket.socket, client_address):
-        """Handle individual client connection."""
-        client_id = f"{client_address[0]}:{client_address[1]}"
-        self.connected_clients[client_id] = (client_socket, client_address)
+    def _read_connection(self, connection: _Connection):
+        """Read what the socket has and handle every complete frame in the buffer."""
+        try:
+            received = connection.reader.recv_from(connection.sock)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError:
+            received = 0
+        if not received:
+            self._close_connection(connection)
+            return
+        self.bytes_received += received
         
         try:
-            while self.running:
-                message = self._receive_message(client_socket)
-                if message is None:
-                    break
+            for payload in connection.reader.frames():
+                try:
+                    message = NetworkMessage.from_bytes(payload)
+                except (ValueError, KeyError, IndexError, struct.error) as e:
+                    print(f"[NETWORK] Dropped undecodable message from {connection.peer_id}: {e}")
+                    continue
                 
-                message.sender_id = client_id
+                self.messages_received += 1
+                self.stats.count_received(message.message_type.value, len(payload) + 4)
+                self._handle_message(connection, message)
+                if connection.closed:
+                    return
+        except FrameError as e:
+            print(f"[NETWORK] Corrupt stream from {connection.peer_id} - closing: {e}")
+            self._close_connection(connection)
+    
+    def _handle_message(self, connection: _Connection, message: NetworkMessage):
+        """Route a message received over TCP."""
+        if message.message_type == MessageType.HEARTBEAT:
+            self._handle_heartbeat(connection, message)
+            return
+        
+        if not self.is_server:
+            # The server's welcome reply names the codec to use from now on
+            if message.message_type == MessageType.CONNECT:
+                codec = message.data.get("codec", CODEC_JSON)
+                self.codec = codec if codec in SUPPORTED_CODECS else CODEC_JSON
                 
-                # Handle connection messages specially
-                if message.message_type == MessageType.CONNECT:
-                    self._handle_client_connect(message, client_id)
-                elif message.message_type == MessageType.DISCONNECT:
-                    break
-                else:
-                    # Add to incoming messages for processing
-                    with self.message_lock:
-                        self.incoming_messages.append(message)
-                    
-                    # Broadcast to other clients (except sender)
-                    self._broadcast_message(message, exclude_client=client_id)
+                # ...and the UDP token if it accepted our datagram offer
+                udp_token = message.data.get("udp_token")
+                if udp_token and self.udp_channel:
+                    self.udp_channel.connect(HOST_PEER_ID, udp_token, self.server_udp_address)
+            
+            self.incoming_messages.put(message)
+            return
         
-        except Exception as e:
-            print(f"Error handling client {client_id}: {e}")
-        finally:
-            # Clean up client connection
-            if client_id in self.connected_clients:
-                del self.connected_clients[client_id]
+        client_id = connection.peer_id
+        message.sender_id = client_id
+        
+        # Track where this client's player is, and what it has applied, for interest filtering
+        if message.message_type == MessageType.PLAYER_UPDATE:
+            self.interest.update_client_position(client_id, message.data.get("position"))
+        elif message.message_type == MessageType.SNAPSHOT_ACK:
+            self.interest.acknowledge_snapshot(client_id, message.data["seq"])
+        
+        # Handle connection messages specially
+        if message.message_type == MessageType.CONNECT:
+            self._handle_client_connect(message, client_id)
+        elif message.message_type == MessageType.DISCONNECT:
+            self._close_connection(connection)
+        else:
+            # Add to incoming messages for processing
+            self.incoming_messages.put(message)
+            
+            # Broadcast to other clients (except sender)
+            self._broadcast_message(message, exclude_client=client_id)
+    
+    def _send_heartbeats(self):
+        """Ping every connection once per heartbeat interval to measure round-trip time."""
+        now = time.perf_counter()
+        if now - self.last_heartbeat < self.heartbeat_interval:
+            return
+        self.last_heartbeat = now
+        
+        ping = NetworkMessage(MessageType.HEARTBEAT, {"ping": now})
+        if self.is_server:
+            frames = {}
+            for client_id, connection in list(self.connected_clients.items()):
+                codec = self.client_codecs.get(client_id, CODEC_JSON)
+                frame = frames.get(codec)
+                if frame is None:
+                    frame = frames[codec] = ping.to_bytes(codec)
+                self._queue_frame(connection, frame, MessageType.HEARTBEAT.value)
+        elif self.server_connection:
+            self._queue_frame(self.server_connection, ping.to_bytes(self.codec), MessageType.HEARTBEAT.value)
+    
+    def _handle_heartbeat(self, connection: _Connection, message: NetworkMessage):
+        """Answer a peer's ping, or turn the answer to ours into a round-trip sample."""
+        data = message.data
+        if "ping" in data:
+            codec = self.client_codecs.get(connection.peer_id, CODEC_JSON) if self.is_server else self.codec
+            pong = NetworkMessage(MessageType.HEARTBEAT, {"pong": data["ping"]})
+            self._queue_frame(connection, pong.to_bytes(codec), MessageType.HEARTBEAT.value)
+        elif "pong" in data:
+            self.stats.record_rtt(connection.peer_id, time.perf_counter() - data["pong"])
+    
+    def _drain_outgoing(self):
+        """Move messages queued by the game thread into the connections' write buffers."""
+        while True:
             try:
-                client_socket.close()
-            except:
-                pass
+                message, target_peer = self.outgoing_messages.get_nowait()
+            except queue.Empty:
+                return
             
-            # Notify other clients of disconnection
+            if self.is_server:
+                self._broadcast_message(message, only_client=target_peer)
+            elif self.server_connection and not self._send_unreliable(message):
+                self._queue_frame(self.server_connection, message.to_bytes(self.codec),
+                                  message.message_type.value)
+    
+    def _queue_frame(self, connection: _Connection, frame: bytes, message_type: str):
+        """Append an encoded frame to a connection's write buffer."""
+        if connection.closed:
+            return
+        if len(connection.write_buffer) + len(frame) > MAX_WRITE_BUFFER:
+            print(f"[NETWORK] {connection.peer_id} is not reading - dropping connection")
+            self._close_connection(connection)
+            return
+        connection.write_buffer += frame
+        self.pending_writes.add(connection)
+        self.messages_sent += 1
+        self.stats.count_sent(message_type, len(frame))
+    
+    def _flush_connection(self, connection: _Connection):
+        """Write as much buffered output as the socket takes, in a single send."""
+        if connection.write_buffer:
+            try:
+                sent = connection.sock.send(connection.write_buffer)
+            except (BlockingIOError, InterruptedError):
+                sent = 0
+            except OSError as e:
+                print(f"[NETWORK] Send error to {connection.peer_id}: {e}")
+                self._close_connection(connection)
+                return
+            if sent:
+                del connection.write_buffer[:sent]
+                self.bytes_sent += sent
+        
+        # Ask for write readiness only while output is backed up
+        backed_up = bool(connection.write_buffer)
+        if not backed_up:
+            self.pending_writes.discard(connection)
+        if backed_up != connection.writing:
+            connection.writing = backed_up
+            events = selectors.EVENT_READ | (selectors.EVENT_WRITE if backed_up else 0)
+            self.selector.modify(connection.sock, events, connection)
+    
+    def _close_connection(self, connection: _Connection, notify: bool = True):
+        """Close a connection and forget its client."""
+        if connection.closed:
+            return
+        connection.closed = True
+        self.pending_writes.discard(connection)
+        self.stats.forget_peer(connection.peer_id)
+        try:
+            self.selector.unregister(connection.sock)
+        except (KeyError, ValueError):
+            pass
+        try:
+            connection.sock.close()
+        except OSError:
+            pass
+        
+        if not self.is_server:
+            self.server_connection = None
+            self.connected = False
+            return
+        
+        client_id = connection.peer_id
+        self.connected_clients.pop(client_id, None)
+        self.client_codecs.pop(client_id, None)
+        self.interest.forget_client(client_id)
+        if self.udp_channel:
+            self.udp_channel.remove_peer(client_id)
+        
+        # Notify other clients of disconnection
+        if notify:
             disconnect_msg = NetworkMessage(
                 MessageType.PLAYER_LEAVE,
                 {"player_id": client_id}
             )
             self._broadcast_message(disconnect_msg)
     
-    def _client_loop(self):
-        """Main client loop for receiving messages and processing outgoing queue."""
-        import time
-        last_send_time = 0
-        send_interval = 0.01  # Send outgoing messages every 10ms to prevent flooding
+    def _shutdown_io(self):
+        """Flush what the sockets take without blocking, then close everything."""
+        try:
+            self._drain_outgoing()
+            for connection in list(self.pending_writes):
+                self._flush_connection(connection)
+        except Exception as e:
+            print(f"[NETWORK] Error flushing on shutdown: {e}")
         
-        while self.running and self.connected:
-            try:
-                # Process outgoing messages with rate limiting
-                current_time = time.time()
-                if current_time - last_send_time >= send_interval:
-                    messages_to_send = []
-                    with self.message_lock:
-                        messages_to_send = self.outgoing_messages.copy()
-                        self.outgoing_messages.clear()
-                    
-                    # Send up to 10 messages per batch to prevent flooding
-                    for message in messages_to_send[:10]:
-                        try:
-                            self._send_message(message, self.socket)
-                        except Exception as e:
-                            print(f"Error sending message: {e}")
-                            break
-                    
-                    # Re-queue remaining messages if we hit the batch limit
-                    if len(messages_to_send) > 10:
-                        with self.message_lock:
-                            self.outgoing_messages = messages_to_send[10:] + self.outgoing_messages
-                    
-                    last_send_time = current_time
-                
-                # Receive incoming messages
-                try:
-                    self.socket.settimeout(0.1)  # Short timeout to allow outgoing processing
-                    message = self._receive_message(self.socket)
-                    if message is None:
-                        continue
-                    
-                    with self.message_lock:
-                        self.incoming_messages.append(message)
-                        
-                except socket.timeout:
-                    continue  # Timeout is normal, just continue the loop
-                
-            except Exception as e:
-                if self.running:
-                    print(f"Client loop error: {e}")
-                break
+        for connection in list(self.connected_clients.values()):
+            self._close_connection(connection, notify=False)
+        if self.server_connection:
+            self._close_connection(self.server_connection)
         
+        if self.server_socket:
+            self.server_socket.close()
+            self.server_socket = None
+        self._close_udp_channel()
+        for waker in (self.waker_reader, self.waker_writer):
+            if waker:
+                waker.close()
+        self.waker_reader = self.waker_writer = None
+        self.selector.close()
         self.connected = False
     
     def _handle_client_connect(self, message: NetworkMessage, client_id: str):
         """Handle a new client connection."""
         player_name = message.data.get("player_name", f"Player_{client_id}")
         
-        # Send welcome message to new client
+        # Older clients offer no codecs and stay on JSON
+        codec = negotiate_codec(message.data.get("codecs", ()))
+        self.client_codecs[client_id] = codec
+        
+        # Clients with a UDP socket get a token to tag their datagrams with
+        udp_token = None
+        if message.data.get("udp") and self.udp_channel:
+            udp_token = self.udp_channel.add_peer(client_id)
+        
+        # Send welcome message to new client (always JSON, before the client knows the codec)
         welcome_msg = NetworkMessage(
             MessageType.CONNECT,
             {
                 "player_id": client_id,
                 "player_name": player_name,
+                "codec": codec,
+                "udp_token": udp_token,
                 "connected_players": [
                     {"id": cid, "name": f"Player_{cid}"}
                     for cid in self.connected_clients.keys()
                 ]
             }
         )
-        
-        client_socket, _ = self.connected_clients[client_id]
-        self._send_message(welcome_msg, client_socket)
+        self._queue_frame(self.connected_clients[client_id], welcome_msg.to_bytes(), MessageType.CONNECT.value)
         
         # Notify other clients of new player
         join_msg = NetworkMessage(
@@ -393,75 +697,92 @@ class NetworkManager:
         )
         self._broadcast_message(join_msg, exclude_client=client_id)
     
-    def _broadcast_message(self, message: NetworkMessage, exclude_client: str = None):
-        """Broadcast message to all connected clients."""
+    def _broadcast_message(self, message: NetworkMessage, exclude_client: str = None,
+                           only_client: str = None):
+        """Broadcast message to all connected clients, or just only_client (I/O thread only)."""
         if not self.is_server:
             return
         
-        clients_to_remove = []
-        for client_id, (client_socket, _) in self.connected_clients.items():
-            if client_id == exclude_client:
+        frames = {}  # codec -> encoded frame, so each format is encoded once per broadcast
+        unreliable = self.udp_channel is not None and message.message_type.value in UNRELIABLE_MESSAGE_TYPES
+        for client_id, connection in list(self.connected_clients.items()):
+            if client_id == exclude_client or (only_client is not None and client_id != only_client):
                 continue
             
-            try:
-                self._send_message(message, client_socket)
-            except Exception as e:
-                print(f"Failed to send to client {client_id}: {e}")
-                clients_to_remove.append(client_id)
-        
-        # Remove disconnected clients
-        for client_id in clients_to_remove:
-            if client_id in self.connected_clients:
-                del self.connected_clients[client_id]
-    
-    def _send_message(self, message: NetworkMessage, target_socket: socket.socket):
-        """Send a single message to a socket with error handling."""
-        try:
-            message_bytes = message.to_bytes()
-            
-            # Set a short send timeout to prevent blocking
-            target_socket.settimeout(0.5)  # 500ms timeout
-            target_socket.sendall(message_bytes)
+            # Drop or trim what this client's player is too far away to see
+            data = self.interest.filter_message(client_id, message.message_type.value, message.data)
+            if data is None:
+                continue
             
-            self.bytes_sent += len(message_bytes)
-            self.messages_sent += 1
+            codec = self.client_codecs.get(client_id, CODEC_JSON)
+            if data is not message.data:
+                # Trimmed for this client only - encode it separately
+                frame = NetworkMessage(message.message_type, data, message.timestamp,
+                                       message.sender_id).to_bytes(codec)
+            else:
+                frame = frames.get(codec)
+                if frame is None:
+                    frame = frames[codec] = message.to_bytes(codec)
             
-        except socket.timeout:
-            print(f"[NETWORK] Send timeout - message dropped")
-            raise
-        except Exception as e:
-            print(f"[NETWORK] Send error: {e}")
-            raise
+            if unreliable and self.udp_channel.send(client_id, frame[4:]):
+                self.bytes_sent += len(frame) - 4
+                self.messages_sent += 1
+                self.stats.count_sent(message.message_type.value, len(frame) - 4)
+                continue
+            self._queue_frame(connection, frame, message.message_type.value)
     
-    def _receive_message(self, source_socket: socket.socket) -> Optional[NetworkMessage]:
-        """Receive a single message from a socket."""
+    def _open_udp_channel(self, host: str, port: int):
+        """Open the UDP channel; without it everything keeps going over TCP."""
         try:
-            # First, read the message length (4 bytes)
-            length_bytes = self._receive_exact(source_socket, 4)
-            if not length_bytes:
-                return None
+            self.udp_channel = UdpChannel(host, port, self.udp_redundancy, self.udp_link)
+        except OSError as e:
+            print(f"UDP channel unavailable, using TCP only: {e}")
+            self.udp_channel = None
+    
+    def _close_udp_channel(self):
+        """Close the UDP channel."""
+        if self.udp_channel:
+            self.udp_channel.close()
+        self.udp_channel = None
+    
+    def _service_udp(self):
+        """Handle datagrams that arrived on the UDP channel."""
+        channel = self.udp_channel
+        if not channel:
+            return
+        for peer_id, sequence, payload in channel.receive():
+            try:
+                message = NetworkMessage.from_bytes(payload)
+            except (ValueError, KeyError, IndexError, struct.error):
+                continue  # Corrupt datagram - the next update replaces it
+            if self.is_server:
+                message.sender_id = peer_id
+            if not channel.accept_message(peer_id, sequence, message.message_type.value,
+                                          message.sender_id, message.data):
+                continue  # Older than state already applied
             
-            message_length = int.from_bytes(length_bytes, byteorder='big')
+            self.bytes_received += len(payload)
+            self.messages_received += 1
+            self.stats.count_received(message.message_type.value, len(payload))
             
-            # Then read the message data
-            message_bytes = self._receive_exact(source_socket, message_length)
-            if not message_bytes:
-                return None
+            if self.is_server and message.message_type == MessageType.PLAYER_UPDATE:
+                self.interest.update_client_position(peer_id, message.data.get("position"))
+            elif self.is_server and message.message_type == MessageType.SNAPSHOT_ACK:
+                self.interest.acknowledge_snapshot(peer_id, message.data["seq"])
             
-            self.bytes_received += len(message_bytes) + 4
-            self.messages_received += 1
+            self.incoming_messages.put(message)
             
-            return NetworkMessage.from_bytes(message_bytes)
-        
-        except Exception as e:
-            return None
-    
-    def _receive_exact(self, source_socket: socket.socket, num_bytes: int) -> Optional[bytes]:
-        """Receive exactly num_bytes from socket."""
-        data = b''
-        while len(data) < num_bytes:
-            chunk = source_socket.recv(num_bytes - len(data))
-            if not chunk:
-                return None
-            data += chunk
-        return data
\ No newline at end of file
+            if self.is_server:
+                self._broadcast_message(message, exclude_client=peer_id)
+    
+    def _send_unreliable(self, message: NetworkMessage) -> bool:
+        """Client: send a message over UDP if it is high-frequency state and the channel is up."""
+        if not self.udp_channel or message.message_type.value not in UNRELIABLE_MESSAGE_TYPES:
+            return False
+        payload = message.to_bytes(self.codec)[4:]
+        if not self.udp_channel.send(HOST_PEER_ID, payload):
+            return False
+        self.bytes_sent += len(payload)
+        self.messages_sent += 1
+        self.stats.count_sent(message.message_type.value, len(payload))
+        return True
@@ -0,0 +1,270 @@
+"""
+Client-side prediction and snapshot interpolation for Kingdom-Pygame.
+The local player is simulated immediately. Every simulation tick is numbered
+and its predicted position kept, so a correction from the host can be applied
+to the tick it refers to and carried forward to the present instead of
+yanking the player back in time. Remote players and enemies are drawn slightly
+in the past from a buffer of timestamped samples, interpolating between the
+two samples around the render time, so updates can arrive at a low rate and
+with jitter without visible stepping.
+"""
+
+import math
+from collections import deque
+from typing import Dict, Optional, Tuple
+
+INTERPOLATION_DELAY = 0.1    # Remote entities are drawn this far in the past (seconds)
+MAX_EXTRAPOLATION = 0.05     # Longest a stale entity is carried forward on its last velocity
+BUFFER_SIZE = 16             # Samples kept per remote entity
+HOLD_GAP = 0.25              # Samples further apart than this after standing still start a new move
+OFFSET_DRIFT = 0.01          # How fast a clock offset estimate follows slower deliveries
+HERMITE_TOLERANCE = 0.5      # Velocities this far off the distance actually covered fall back to linear
+
+INPUT_HISTORY = 256          # Predicted ticks kept for reconciliation (about 2 s at 120 Hz)
+CORRECTION_TOLERANCE = 2.0   # Host corrections smaller than this (pixels) are ignored
+SNAP_DISTANCE = 120.0        # Larger corrections are applied at once instead of blended in
+CORRECTION_RATE = 10.0       # Share of a pending correction applied per second
+
+TICK_SECONDS = 1.0 / 120     # Matches SIMULATION_HZ in main.py
+MAX_PLAYER_SPEED = 1600.0    # Fastest legal player movement (a dash) in pixels per second
+MOVEMENT_SLACK = 8.0         # Extra distance allowed per update for rounding and quantization
+WORLD_BOUNDS = (-1920.0, -1080.0, 1920.0, 1080.0)  # min x, min y, max x, max y
+
+
+class ClockOffset:
+    """Estimates the offset between a sender's clock and ours from message timestamps."""
+
+    def __init__(self):
+        self.offset = None  # local time - remote time for the least delayed message
+
+    def to_local(self, remote_time: float, local_time: float) -> float:
+        """Convert a sender timestamp to local time, updating the estimate with this message."""
+        sample = local_time - remote_time
+        if self.offset is None or sample < self.offset:
+            self.offset = sample  # Least delayed message so far is the best estimate
+        else:
+            self.offset += (sample - self.offset) * OFFSET_DRIFT  # Follow clock drift slowly
+        return remote_time + self.offset
+
+
+class SnapshotBuffer:
+    """Timestamped position samples for one remote entity, sampled in the past."""
+
+    __slots__ = ("samples",)
+
+    def __init__(self):
+        self.samples = deque(maxlen=BUFFER_SIZE)  # (time, x, y, vx, vy), oldest first
+
+    def push(self, sample_time: float, x: float, y: float, vx: float = 0.0, vy: float = 0.0):
+        """Add a sample (in local time); samples older than the newest are ignored."""
+        samples = self.samples
+        if samples:
+            last_time, last_x, last_y, last_vx, last_vy = samples[-1]
+            if sample_time <= last_time:
+                return
+            if sample_time - last_time > HOLD_GAP and last_vx == 0.0 and last_vy == 0.0:
+                # The sender skipped updates while standing still: hold the old spot
+                # until just before this sample instead of gliding across the whole gap
+                samples.append((sample_time - TICK_SECONDS * 6, last_x, last_y, 0.0, 0.0))
+        samples.append((sample_time, x, y, vx, vy))
+
+    def sample(self, render_time: float) -> Optional[Tuple[float, float]]:
+        """Return the interpolated position at render_time, or None without samples."""
+        samples = self.samples
+        if not samples:
+            return None
+
+        newest = samples[-1]
+        if render_time >= newest[0]:
+            # Nothing newer yet: carry on along the last velocity for a moment, then wait
+            ahead = min(render_time - newest[0], MAX_EXTRAPOLATION)
+            return newest[1] + newest[3] * ahead, newest[2] + newest[4] * ahead
+
+        oldest = samples[0]
+        if render_time <= oldest[0]:
+            return oldest[1], oldest[2]
+
+        # Buffers are short and render_time sits near the newest end
+        index = len(samples) - 2
+        while samples[index][0] > render_time:
+            index -= 1
+        return _interpolate(samples[index], samples[index + 1], render_time)
+
+    def clear(self):
+        """Drop all samples (after a teleport or respawn)."""
+        self.samples.clear()
+
+
+def _interpolate(start: tuple, end: tuple, render_time: float) -> Tuple[float, float]:
+    """Interpolate between two samples, using their velocities when they match the motion."""
+    t0, x0, y0, vx0, vy0 = start
+    t1, x1, y1, vx1, vy1 = end
+    span = t1 - t0
+    s = (render_time - t0) / span
+
+    # Cubic Hermite only when the reported velocities agree with the distance
+    # covered; a player pushing into a wall reports speed without moving
+    covered = math.hypot(x1 - x0, y1 - y0)
+    expected = 0.5 * (math.hypot(vx0, vy0) + math.hypot(vx1, vy1)) * span
+    if expected > 0.0 and abs(covered - expected) <= HERMITE_TOLERANCE * expected:
+        s2 = s * s
+        s3 = s2 * s
+        h00 = 2 * s3 - 3 * s2 + 1
+        h10 = (s3 - 2 * s2 + s) * span
+        h01 = -2 * s3 + 3 * s2
+        h11 = (s3 - s2) * span
+        return (h00 * x0 + h10 * vx0 + h01 * x1 + h11 * vx1,
+                h00 * y0 + h10 * vy0 + h01 * y1 + h11 * vy1)
+
+    return x0 + (x1 - x0) * s, y0 + (y1 - y0) * s
+
+
+class EntityInterpolator:
+    """Snapshot buffers for a set of entities whose updates come from one sender."""
+
+    def __init__(self, delay: float = INTERPOLATION_DELAY):
+        self.delay = delay
+        self.clock = ClockOffset()
+        self.buffers: Dict[str, SnapshotBuffer] = {}
+
+    def push(self, entity_id: str, remote_time: Optional[float], local_time: float,
+             x: float, y: float, vx: float = 0.0, vy: float = 0.0):
+        """Record an entity's state as of the sender's timestamp."""
+        sample_time = local_time if remote_time is None else self.clock.to_local(remote_time, local_time)
+        buffer = self.buffers.get(entity_id)
+        if buffer is None:
+            buffer = self.buffers[entity_id] = SnapshotBuffer()
+        buffer.push(sample_time, x, y, vx, vy)
+
+    def sample(self, entity_id: str, now: float) -> Optional[Tuple[float, float]]:
+        """Return where to draw an entity at local time now."""
+        buffer = self.buffers.get(entity_id)
+        return buffer.sample(now - self.delay) if buffer is not None else None
+
+    def remove(self, entity_id: str):
+        """Forget an entity that died or left."""
+        self.buffers.pop(entity_id, None)
+
+
+class ClientPredictor:
+    """Numbers the local player's simulation ticks and reconciles them with host corrections."""
+
+    def __init__(self, snap_distance: float = SNAP_DISTANCE, correction_rate: float = CORRECTION_RATE):
+        self.snap_distance = snap_distance
+        self.correction_rate = correction_rate
+        self.input_seq = 0
+        self.history = deque(maxlen=INPUT_HISTORY)  # (input seq, predicted x, predicted y)
+        self.last_corrected_seq = 0
+        self.pending_x = 0.0   # Correction not yet applied to the player
+        self.pending_y = 0.0
+
+        # Statistics
+        self.corrections = 0
+        self.snaps = 0
+
+    def record(self, x: float, y: float) -> int:
+        """Record the predicted position after the latest tick and return its input sequence."""
+        self.input_seq += 1
+        self.history.append((self.input_seq, x, y))
+        return self.input_seq
+
+    def reconcile(self, input_seq: int, x: float, y: float) -> Optional[Tuple[float, float]]:
+        """
+        Compare the host's position for a tick with what was predicted for it.
+        Returns an offset to apply to the player right away (a snap) or None;
+        smaller errors are blended in by step().
+        """
+        if input_seq <= self.last_corrected_seq:
+            return None  # Older than a correction already applied
+        history = self.history
+        while history and history[0][0] < input_seq:
+            history.popleft()
+        if not history or history[0][0] != input_seq:
+            return None  # Too old to replay against
+        self.last_corrected_seq = input_seq
+
+        _, predicted_x, predicted_y = history[0]
+        error_x = x - predicted_x
+        error_y = y - predicted_y
+        if error_x * error_x + error_y * error_y <= CORRECTION_TOLERANCE * CORRECTION_TOLERANCE:
+            return None
+
+        # Movement is relative, so replaying the later ticks from the corrected
+        # position is the same as shifting their predictions by the error
+        self.history = deque(((seq, px + error_x, py + error_y) for seq, px, py in history),
+                             maxlen=INPUT_HISTORY)
+        self.corrections += 1
+        if math.hypot(error_x, error_y) >= self.snap_distance:
+            self.snaps += 1
+            self.pending_x = self.pending_y = 0.0
+            return error_x, error_y
+        self.pending_x += error_x
+        self.pending_y += error_y
+        return None
+
+    def step(self, dt: float) -> Tuple[float, float]:
+        """Return the part of the pending correction to apply this tick."""
+        if not self.pending_x and not self.pending_y:
+            return 0.0, 0.0
+        share = min(1.0, self.correction_rate * dt)
+        dx = self.pending_x * share
+        dy = self.pending_y * share
+        self.pending_x -= dx
+        self.pending_y -= dy
+        if abs(self.pending_x) < 0.01 and abs(self.pending_y) < 0.01:
+            dx += self.pending_x
+            dy += self.pending_y
+            self.pending_x = self.pending_y = 0.0
+        return dx, dy
+
+
+class MovementValidator:
+    """Host-side bounds on how far each client's player may move between updates."""
+
+    def __init__(self, max_speed: float = MAX_PLAYER_SPEED, tick_seconds: float = TICK_SECONDS,
+                 bounds: Tuple[float, float, float, float] = WORLD_BOUNDS):
+        self.max_speed = max_speed
+        self.tick_seconds = tick_seconds
+        self.bounds = bounds
+        self.accepted: Dict[str, Tuple[int, float, float]] = {}  # player id -> (input seq, x, y)
+        self.corrections_sent = 0
+
+    def validate(self, player_id: str, input_seq: int, x: float, y: float) -> Optional[Tuple[float, float, bool]]:
+        """
+        Return the authoritative (x, y, corrected) for a client's reported position,
+        or None if the update is older than one already validated.
+        """
+        previous = self.accepted.get(player_id)
+        if previous is not None:
+            last_seq, last_x, last_y = previous
+            if input_seq <= last_seq:
+                return None
+            allowed = (input_seq - last_seq) * self.tick_seconds * self.max_speed + MOVEMENT_SLACK
+            dx = x - last_x
+            dy = y - last_y
+            distance = math.hypot(dx, dy)
+            if distance > allowed:
+                scale = allowed / distance
+                x = last_x + dx * scale
+                y = last_y + dy * scale
+                corrected = True
+            else:
+                corrected = False
+        else:
+            corrected = False
+
+        min_x, min_y, max_x, max_y = self.bounds
+        clamped_x = min(max(x, min_x), max_x)
+        clamped_y = min(max(y, min_y), max_y)
+        if clamped_x != x or clamped_y != y:
+            x, y = clamped_x, clamped_y
+            corrected = True
+
+        self.accepted[player_id] = (input_seq, x, y)
+        if corrected:
+            self.corrections_sent += 1
+        return x, y, corrected
+
+    def forget(self, player_id: str):
+        """Drop state for a player who left."""
+        self.accepted.pop(player_id, None)
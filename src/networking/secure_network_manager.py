@@ -10,6 +10,7 @@ import time
 import uuid
 import hashlib
 import base64
+import struct
 import ssl
 from typing import Dict, List, Any, Optional, Callable, Tuple
 from dataclasses import dataclass, asdict
@@ -19,6 +20,17 @@ from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 
+from .network_manager import WIRE_CODEC
+from .interest import InterestManager
+from .udp_channel import UdpChannel, UNRELIABLE_MESSAGE_TYPES, DEFAULT_REDUNDANCY, HOST_PEER_ID
+from .framing import FrameReader, FrameError
+from .net_stats import NetworkStats, HEARTBEAT_INTERVAL
+from .wire_codec import (CODEC_JSON, CODEC_BINARY, SUPPORTED_CODECS, ENCRYPTED_MAGIC,
+                         negotiate_codec, is_binary_frame, is_encrypted_frame)
+
+# Message dicts with exactly these keys can travel in the binary codec
+WIRE_MESSAGE_KEYS = frozenset(("type", "data", "sender", "timestamp"))
+
 
 class NetworkMode(Enum):
     """Network connection modes."""
@@ -113,6 +125,7 @@ class SecureNetworkManager:
         # Direct connection
         self.server_socket = None
         self.client_socket = None
+        self.client_reader = FrameReader()  # Client: frames received from the host
         self.client_connections = {}  # peer_id -> client_socket mapping for host
         
         # Relay connection
@@ -128,6 +141,19 @@ class SecureNetworkManager:
         self.encryption_key = None
         self.cipher_suite = None
         
+        # Wire codec negotiated in the join handshake (JSON until both sides agree)
+        self.codec = CODEC_JSON  # Client: codec for messages to the host
+        self.peer_codecs = {}    # Host: peer_id -> codec
+        
+        # Host: per-client area-of-interest filtering of broadcasts
+        self.interest = InterestManager()
+        
+        # Unreliable UDP channel for high-frequency state in direct mode (TCP stays reliable)
+        self.udp_channel = None
+        self.udp_thread = None
+        self.udp_redundancy = DEFAULT_REDUNDANCY  # Earlier messages repeated in each datagram
+        self.udp_link = None  # Optional LossyLink to simulate a bad network when testing
+        
         # Message handling
         self.message_handlers = {}
         self.message_queue = []
@@ -140,6 +166,8 @@ class SecureNetworkManager:
         self.packets_sent = 0
         self.packets_received = 0
         self.connection_start_time = 0.0
+        self.stats = NetworkStats()  # Per message type traffic and per connection RTT
+        self.last_heartbeat = 0.0
         
         # Broadcast listener for lobby discovery
         self.broadcast_listener_thread = None
@@ -379,6 +407,7 @@ class SecureNetworkManager:
             
             # Create client socket
             self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.client_reader = FrameReader()
             self.client_socket.settimeout(10.0)  # 10 second timeout
             
             # Connect to host
@@ -478,6 +507,9 @@ class SecureNetworkManager:
             self.server_socket.bind(("0.0.0.0", 7777))  # Allow external connections
             self.server_socket.listen(max_players - 1)  # Host counts as 1
             
+            # UDP uses the same port number as the TCP listener
+            self._open_udp_channel("0.0.0.0", 7777)
+            
             # Register lobby locally
             registration = LobbyRegistration(
                 lobby_code=lobby_code,
@@ -502,6 +534,7 @@ class SecureNetworkManager:
             
             # Start accepting connections
             self._start_network_thread()
+            self._start_udp_thread()
             
             print(f"Direct lobby created on port 7777")
             return True
@@ -692,12 +725,14 @@ class SecureNetworkManager:
         try:
             # Create client socket
             self.client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.client_reader = FrameReader()
             self.client_socket.settimeout(10.0)  # 10 second timeout
             
             # Connect to host
             print(f"Connecting to {host_ip}:{port}...")
             self.client_socket.connect((host_ip, port))
             self.is_host = False
+            self._open_udp_channel("0.0.0.0", 0)
             
             # Note: Client encryption initialization moved to after join_accepted
             # to use shared key from host
@@ -708,6 +743,8 @@ class SecureNetworkManager:
                 "player_name": player_name,
                 "peer_id": self.local_peer_id,
                 "character": "Cecil",  # Default character for now
+                "codecs": list(SUPPORTED_CODECS),
+                "udp": self.udp_channel is not None,
                 "timestamp": time.time()
             }
             
@@ -725,6 +762,17 @@ class SecureNetworkManager:
             if response and response.get("type") == "join_accepted":
                 print(f"Successfully joined direct lobby at {host_ip}:{port}")
                 
+                # Hosts without codec support never answer with one and stay on JSON
+                codec = response.get("codec", CODEC_JSON)
+                self.codec = codec if codec in SUPPORTED_CODECS else CODEC_JSON
+                
+                # Likewise hosts without UDP send no token and everything stays on TCP
+                udp_token = response.get("udp_token")
+                if udp_token and self.udp_channel:
+                    self.udp_channel.connect(HOST_PEER_ID, udp_token, self.client_socket.getpeername())
+                else:
+                    self._close_udp_channel()
+                
                 # Initialize encryption with shared key from host
                 if self.security == ConnectionSecurity.ENCRYPTED:
                     encryption_key = response.get("encryption_key")
@@ -746,12 +794,14 @@ class SecureNetworkManager:
                 
                 # Start network processing
                 self._start_network_thread()
+                self._start_udp_thread()
                 return True
             else:
                 error_msg = response.get("error", "Join request rejected") if response else "No response from host"
                 print(f"Join failed: {error_msg}")
                 self.client_socket.close()
                 self.client_socket = None
+                self._close_udp_channel()
                 return False
                 
         except Exception as e:
@@ -759,6 +809,7 @@ class SecureNetworkManager:
             if self.client_socket:
                 self.client_socket.close()
                 self.client_socket = None
+            self._close_udp_channel()
             return False
     
     def _start_network_thread(self):
@@ -782,8 +833,10 @@ class SecureNetworkManager:
                 
                 if self.is_host and self.server_socket:
                     self._handle_host_networking()
+                    self._send_heartbeats()
                 elif self.client_socket:
                     self._handle_client_networking()
+                    self._send_heartbeats()
                 elif self.relay_connection:
                     self._handle_relay_networking()
                 
@@ -818,11 +871,13 @@ class SecureNetworkManager:
         """Handle a client connection."""
         try:
             # Receive join request using framed messages
-            messages = self._receive_framed_messages(client_socket)
+            # Only the join request; anything sent after it stays in the reader
+            reader = FrameReader()
+            messages = self._receive_framed_messages(client_socket, reader, limit=1)
             
             if messages:
                 message_data = messages[0]  # Get first message
-                message = json.loads(message_data.decode())
+                message = json.loads(str(message_data, 'utf-8'))
                 
                 if message.get("type") == "join_request":
                     player_name = message.get("player_name", "Unknown")
@@ -842,6 +897,13 @@ class SecureNetworkManager:
                     
                     # Store client connection for message broadcasting
                     self.client_connections[peer_id] = client_socket
+                    codec = negotiate_codec(message.get("codecs", ()))
+                    self.peer_codecs[peer_id] = codec
+                    
+                    # Clients with a UDP socket get a token to tag their datagrams with
+                    udp_token = None
+                    if message.get("udp") and self.udp_channel:
+                        udp_token = self.udp_channel.add_peer(peer_id)
                     
                     # Important: Notify about new player connection
                     print(f"[CONNECTION] New player joined lobby: {player_name} ({peer_id})")
@@ -855,6 +917,8 @@ class SecureNetworkManager:
                         "peer_id": peer_id,
                         "lobby_code": self.current_lobby_code,
                         "host_name": host_name,
+                        "codec": codec,
+                        "udp_token": udp_token,
                         "encryption_key": self.encryption_key if self.security == ConnectionSecurity.ENCRYPTED else None
                     }
                     
@@ -870,7 +934,7 @@ class SecureNetworkManager:
                     # Start a separate thread to handle ongoing messages from this client
                     message_thread = threading.Thread(
                         target=self._handle_client_messages,
-                        args=(client_socket, peer_id),
+                        args=(client_socket, peer_id, reader),
                         daemon=True
                     )
                     message_thread.start()
@@ -881,7 +945,7 @@ class SecureNetworkManager:
             if 'client_socket' in locals():
                 client_socket.close()
             
-    def _handle_client_messages(self, client_socket: socket.socket, peer_id: str):
+    def _handle_client_messages(self, client_socket: socket.socket, peer_id: str, reader: FrameReader):
         """Handle ongoing messages from a connected client."""
         try:
             client_socket.settimeout(1.0)  # Set timeout for non-blocking receive
@@ -896,34 +960,25 @@ class SecureNetworkManager:
                         last_debug_time = current_time
                     
                     # Use framed message receiving
-                    messages = self._receive_framed_messages(client_socket)
+                    messages = self._receive_framed_messages(client_socket, reader)
                     
                     for message_data in messages:
                         try:
-                            message = json.loads(message_data.decode())
-                            
-                            # Decrypt if the message is encrypted
-                            if 'encrypted' in message and self.cipher_suite:
-                                try:
-                                    encrypted_data = base64.b64decode(message['encrypted'])
-                                    decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-                                    message = json.loads(decrypted_data.decode())
-                                    # Reduce spam - only log important messages
-                                    if message.get('type') not in ['player_update', 'wave_update']:
-                                        pass
-                                except Exception as e:
-                                    # Don't rate limit decrypt errors - they indicate real connection/security issues
-                                    print(f"[ERROR] Failed to decrypt message from {peer_id}: {e}")
-                                    continue
-                            
-                            # Process the message (ready state updates, etc.)
-                            self._process_client_message(message, peer_id)
-                            
-                        except json.JSONDecodeError as e:
-                            # Don't rate limit JSON decode errors - they indicate message corruption
-                            print(f"[ERROR] Host JSON decode error from {peer_id}: {e}")
-                            print(f"[ERROR] Problematic data (first 200 chars): {message_data[:200]}")
+                            message = self._decode_frame(message_data)
+                        except (ValueError, struct.error, IndexError) as e:
+                            # Don't rate limit decode errors - they indicate message corruption
+                            print(f"[ERROR] Host decode error from {peer_id}: {e}")
+                            print(f"[ERROR] Problematic data (first 200 chars): {bytes(message_data[:200])}")
                             continue
+                        except Exception as e:
+                            # Don't rate limit decrypt errors - they indicate real connection/security issues
+                            print(f"[ERROR] Failed to decrypt message from {peer_id}: {e}")
+                            continue
+                        
+                        self.stats.count_received(message.get('type', ''), len(message_data) + 4)
+                        
+                        # Process the message (ready state updates, etc.)
+                        self._process_client_message(message, peer_id)
                         
                 except socket.timeout:
                     # Continue waiting for messages
@@ -939,6 +994,11 @@ class SecureNetworkManager:
             print(f"Cleaning up client {peer_id}")
             if peer_id in self.client_connections:
                 del self.client_connections[peer_id]
+            self.peer_codecs.pop(peer_id, None)
+            self.interest.forget_client(peer_id)
+            self.stats.forget_peer(peer_id)
+            if self.udp_channel:
+                self.udp_channel.remove_peer(peer_id)
             if peer_id in self.peers:
                 del self.peers[peer_id]
             try:
@@ -950,9 +1010,19 @@ class SecureNetworkManager:
         """Process a message received from a client."""
         message_type = message.get('type', '')
         
+        if message_type == 'heartbeat':
+            self._handle_heartbeat(message, sender_peer_id)
+            return
+        
         # Add message to queue for game synchronizer processing
         self.message_queue.append(message)
         
+        # Track where this client's player is, and what it has applied, for interest filtering
+        if message_type == 'player_update' and isinstance(message.get('data'), dict):
+            self.interest.update_client_position(sender_peer_id, message['data'].get('position'))
+        elif message_type == 'snapshot_ack' and isinstance(message.get('data'), dict):
+            self.interest.acknowledge_snapshot(sender_peer_id, message['data'].get('seq', -1))
+        
         if message_type == 'lobby_ready_state':
             # Update the peer's ready state
             data = message.get('data', {})
@@ -979,37 +1049,26 @@ class SecureNetworkManager:
             
         try:
             # Use framed message receiving to avoid JSON parsing errors
-            messages = self._receive_framed_messages(self.client_socket)
+            messages = self._receive_framed_messages(self.client_socket, self.client_reader)
             
             for message_data in messages:
                 try:
-                    message = json.loads(message_data.decode())
-                    
-                    # Decrypt if the message is encrypted
-                    if 'encrypted' in message and self.cipher_suite:
-                        try:
-                            encrypted_data = base64.b64decode(message['encrypted'])
-                            decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-                            message = json.loads(decrypted_data.decode())
-                            
-                            # Only log important messages
-                            important_messages = ['lobby_setting_change', 'game_start', 'lobby_ready_state', 'join_request']
-                            if message.get('type') in important_messages:
-                                pass
-                        except Exception as e:
-                            # Don't rate limit client decrypt errors - they indicate real connection issues
-                            print(f"[ERROR] Client failed to decrypt message from host: {e}")
-                            continue
-                    
-                    # Process the message (setting changes, ready states, etc.)
-                    self._process_host_message(message)
-                    
-                except json.JSONDecodeError as e:
-                    # Don't rate limit client JSON decode errors - they indicate message corruption  
-                    print(f"[ERROR] Client JSON decode error: {e}")
-                    print(f"[ERROR] Problematic data (first 200 chars): {message_data[:200]}")
+                    message = self._decode_frame(message_data)
+                except (ValueError, struct.error, IndexError) as e:
+                    # Don't rate limit client decode errors - they indicate message corruption
+                    print(f"[ERROR] Client decode error: {e}")
+                    print(f"[ERROR] Problematic data (first 200 chars): {bytes(message_data[:200])}")
+                    continue
+                except Exception as e:
+                    # Don't rate limit client decrypt errors - they indicate real connection issues
+                    print(f"[ERROR] Client failed to decrypt message from host: {e}")
                     continue
                 
+                self.stats.count_received(message.get('type', ''), len(message_data) + 4)
+                
+                # Process the message (setting changes, ready states, etc.)
+                self._process_host_message(message)
+                
         except socket.timeout:
             # Continue waiting for messages
             pass
@@ -1026,6 +1085,10 @@ class SecureNetworkManager:
         """Process a message received from the host."""
         message_type = message.get('type', '')
         
+        if message_type == 'heartbeat':
+            self._handle_heartbeat(message, HOST_PEER_ID)
+            return
+        
         # Add message to queue for game synchronizer processing
         self.message_queue.append(message)
         
@@ -1033,47 +1096,39 @@ class SecureNetworkManager:
         if hasattr(self, 'message_handler') and self.message_handler:
             self.message_handler(message)
     
-    def _receive_framed_messages(self, socket):
-        """Receive length-prefixed messages from socket."""
-        messages = []
-        
+    def _receive_framed_messages(self, sock, reader: FrameReader, limit: int = None) -> list:
+        """
+        Return complete length-prefixed frames, receiving once from the socket
+        if the reader holds none. Frames are memoryviews into the reader's buffer,
+        valid until the next call with the same reader; frames beyond limit stay
+        buffered for the next call.
+        """
         try:
-            # Check if we have any partial data from previous receive
-            if not hasattr(self, '_receive_buffer'):
-                self._receive_buffer = b''
-            
-            # Receive new data
-            data = socket.recv(4096)
-            if not data:
+            messages = self._take_frames(reader, limit)
+            if messages:
                 return messages
             
-            self._receive_buffer += data
-            
-            # Process complete messages from buffer
-            while len(self._receive_buffer) >= 4:  # Need at least 4 bytes for length prefix
-                # Read message length (first 4 bytes, big endian)
-                msg_length = int.from_bytes(self._receive_buffer[:4], 'big')
-                
-                # Check if we have the complete message
-                if len(self._receive_buffer) >= 4 + msg_length:
-                    # Extract the message
-                    message_data = self._receive_buffer[4:4 + msg_length]
-                    messages.append(message_data)
-                    
-                    # Remove processed message from buffer
-                    self._receive_buffer = self._receive_buffer[4 + msg_length:]
-                else:
-                    # Not enough data for complete message yet
-                    break
-                    
-        except Exception as e:
-            # Handle timeout exceptions gracefully - they're expected when no messages are pending
-            if "timed out" not in str(e).lower():
-                print(f"[ERROR] Message framing error: {e}")
-            # Clear the buffer on non-timeout errors to prevent corruption
-            if hasattr(self, '_receive_buffer') and "timed out" not in str(e).lower():
-                self._receive_buffer = b''
-            
+            try:
+                received = reader.recv_from(sock)
+            except socket.timeout:
+                return messages  # Expected when no messages are pending
+            if not received:
+                raise ConnectionResetError("connection closed by peer")
+            self.bytes_received += received
+            
+            return self._take_frames(reader, limit)
+        except FrameError as e:
+            print(f"[ERROR] Message framing error: {e}")
+            reader.reset()  # Out of sync - drop the buffered bytes
+            return []
+    
+    def _take_frames(self, reader: FrameReader, limit: int = None) -> list:
+        """Collect buffered complete frames from a reader, up to limit."""
+        messages = []
+        for message_data in reader.frames():
+            messages.append(message_data)
+            if limit is not None and len(messages) >= limit:
+                break
         return messages
     
     def _handle_relay_networking(self):
@@ -1081,25 +1136,68 @@ class SecureNetworkManager:
         # Relay-specific networking would go here
         pass
     
-    def _send_direct_message(self, message: dict):
+    def _frame_message(self, message: dict, codec: str = CODEC_JSON, encrypt: bool = False) -> bytes:
+        """Serialize (and optionally encrypt) a message dict into a length-prefixed frame."""
+        payload = None
+        if codec == CODEC_BINARY and message.keys() == WIRE_MESSAGE_KEYS:
+            payload = WIRE_CODEC.encode(message["type"], message["data"],
+                                        message["timestamp"], message["sender"])
+            if encrypt and self.cipher_suite:
+                try:
+                    payload = bytes((ENCRYPTED_MAGIC,)) + self.cipher_suite.encrypt(payload)
+                except Exception as e:
+                    print(f"Encryption error: {e}")
+        
+        if payload is None:
+            if encrypt and self.cipher_suite:
+                try:
+                    encrypted_data = self.cipher_suite.encrypt(json.dumps(message).encode())
+                    message = {"encrypted": base64.b64encode(encrypted_data).decode()}
+                except Exception as e:
+                    print(f"Encryption error: {e}")
+            payload = json.dumps(message).encode()
+        
+        return len(payload).to_bytes(4, 'big') + payload
+    
+    def _decode_frame(self, message_data: bytes) -> dict:
+        """Decode a received frame (JSON or binary, encrypted or not) into a message dict."""
+        if is_encrypted_frame(message_data):
+            if not self.cipher_suite:
+                raise ValueError("encrypted frame received without a session key")
+            message_data = self.cipher_suite.decrypt(bytes(message_data[1:]))
+        
+        if is_binary_frame(message_data):
+            message_type, data, timestamp, sender = WIRE_CODEC.decode(message_data)
+            return {"type": message_type, "data": data, "sender": sender, "timestamp": timestamp}
+        
+        message = json.loads(str(message_data, 'utf-8'))
+        
+        # Decrypt if the message is encrypted
+        if 'encrypted' in message and self.cipher_suite:
+            encrypted_data = base64.b64decode(message['encrypted'])
+            decrypted_data = self.cipher_suite.decrypt(encrypted_data)
+            message = json.loads(decrypted_data.decode())
+        return message
+    
+    def _send_direct_message(self, message: dict, encrypt: bool = False, target_peer: str = None):
         """Send a message via direct connection."""
         
         if self.is_host:
-            # Host broadcasts to all connected clients
-            self._broadcast_to_clients(message)
+            # Host broadcasts to all connected clients (or the one it is addressed to)
+            self._broadcast_to_clients(message, encrypt=encrypt, only_peer=target_peer)
         elif self.client_socket:
+            # High-frequency state goes over UDP when the channel is up
+            if self._send_unreliable(message, encrypt):
+                return
+            
             # Client sends to host using length-prefixed framing
             try:
-                data = json.dumps(message).encode()
-                
-                # Create length-prefixed message
-                msg_length = len(data)
-                length_prefix = msg_length.to_bytes(4, 'big')
-                framed_message = length_prefix + data
+                framed_message = self._frame_message(message, self.codec, encrypt)
                 
                 self.client_socket.send(framed_message)
                 self.bytes_sent += len(framed_message)
                 self.packets_sent += 1
+                self.stats.count_sent(message.get('type', ''), len(framed_message))
             except Exception as e:
                 # Don't rate limit connection errors - they indicate real problems
                 print(f"Error sending message to host: {e}")
@@ -1107,36 +1205,54 @@ class SecureNetworkManager:
             # Don't rate limit - connection status is important
             print("No connection available - message not sent")
     
-    def _broadcast_to_clients(self, message: dict, exclude_peer: str = None):
-        """Broadcast a message to all connected clients (host only)."""
+    def _broadcast_to_clients(self, message: dict, exclude_peer: str = None, encrypt: bool = False,
+                              only_peer: str = None):
+        """Broadcast a message to all connected clients, or just only_peer (host only)."""
         if not self.is_host:
             return
-            
-        data = json.dumps(message).encode()
         
-        # Create length-prefixed message
-        msg_length = len(data)
-        length_prefix = msg_length.to_bytes(4, 'big')
-        framed_message = length_prefix + data
+        frames = {}  # codec -> framed message, so each format is encoded once per broadcast
         
         disconnected_peers = []
         
         # Only log important message types
         msg_type = message.get('type', 'unknown')
+        unreliable = self.udp_channel is not None and msg_type in UNRELIABLE_MESSAGE_TYPES
         important_messages = ['lobby_setting_change', 'game_start', 'lobby_ready_state', 'join_request']
         
         # Create a copy of client_connections to avoid dictionary changed size during iteration
         for peer_id, client_socket in list(self.client_connections.items()):
-            if exclude_peer and peer_id == exclude_peer:
+            if (exclude_peer and peer_id == exclude_peer) or (only_peer and peer_id != only_peer):
                 continue
                 
             try:
                 if msg_type in important_messages:
                     pass  # Important message handling
                 
+                # Drop or trim what this client's player is too far away to see
+                data = self.interest.filter_message(peer_id, msg_type, message.get('data'))
+                if data is None:
+                    continue
+                
+                codec = self.peer_codecs.get(peer_id, CODEC_JSON)
+                if data is not message.get('data'):
+                    # Trimmed for this client only - frame it separately
+                    framed_message = self._frame_message(dict(message, data=data), codec, encrypt)
+                else:
+                    framed_message = frames.get(codec)
+                    if framed_message is None:
+                        framed_message = frames[codec] = self._frame_message(message, codec, encrypt)
+                
+                if unreliable and self.udp_channel.send(peer_id, framed_message[4:]):
+                    self.bytes_sent += len(framed_message) - 4
+                    self.packets_sent += 1
+                    self.stats.count_sent(msg_type, len(framed_message) - 4)
+                    continue
+                
                 client_socket.send(framed_message)
                 self.bytes_sent += len(framed_message)
                 self.packets_sent += 1
+                self.stats.count_sent(msg_type, len(framed_message))
             except Exception as e:
                 disconnected_peers.append(peer_id)
         
@@ -1144,9 +1260,104 @@ class SecureNetworkManager:
         for peer_id in disconnected_peers:
             if peer_id in self.client_connections:
                 del self.client_connections[peer_id]
+            self.peer_codecs.pop(peer_id, None)
+            self.interest.forget_client(peer_id)
+            self.stats.forget_peer(peer_id)
+            if self.udp_channel:
+                self.udp_channel.remove_peer(peer_id)
             if peer_id in self.peers:
                 del self.peers[peer_id]
     
+    def _open_udp_channel(self, host: str, port: int):
+        """Open the UDP channel; without it everything keeps going over TCP."""
+        try:
+            self.udp_channel = UdpChannel(host, port, self.udp_redundancy, self.udp_link)
+        except OSError as e:
+            print(f"UDP channel unavailable, using TCP only: {e}")
+            self.udp_channel = None
+    
+    def _start_udp_thread(self):
+        """Start receiving datagrams once the network thread is running."""
+        if self.udp_channel and self.udp_thread is None:
+            self.udp_thread = threading.Thread(target=self._udp_loop, daemon=True)
+            self.udp_thread.start()
+    
+    def _close_udp_channel(self):
+        """Close the UDP channel and wait for its thread."""
+        if self.udp_channel:
+            self.udp_channel.close()
+        if self.udp_thread and self.udp_thread is not threading.current_thread():
+            self.udp_thread.join(timeout=1.0)
+        self.udp_channel = None
+        self.udp_thread = None
+    
+    def _udp_loop(self):
+        """Receive datagrams on the UDP channel."""
+        channel = self.udp_channel
+        while self.running and channel is self.udp_channel:
+            try:
+                for peer_id, sequence, payload in channel.receive(timeout=0.05):
+                    try:
+                        message = self._decode_frame(payload)
+                    except Exception:
+                        continue  # Corrupt or undecryptable datagram - the next update replaces it
+                    if not channel.accept_message(peer_id, sequence, message.get('type', ''),
+                                                  message.get('sender'), message.get('data')):
+                        continue  # Older than state already applied
+                    
+                    self.bytes_received += len(payload)
+                    self.packets_received += 1
+                    self.stats.count_received(message.get('type', ''), len(payload))
+                    
+                    if self.is_host:
+                        self._process_client_message(message, peer_id)
+                    else:
+                        self._process_host_message(message)
+            except Exception as e:
+                if self.running:
+                    print(f"UDP loop error: {e}")
+    
+    def _send_heartbeats(self):
+        """Ping the host (or every client) once per heartbeat interval to measure round-trip time."""
+        now = time.perf_counter()
+        if now - self.last_heartbeat < HEARTBEAT_INTERVAL:
+            return
+        self.last_heartbeat = now
+        if self.is_host and not self.client_connections:
+            return
+        self._send_direct_message(self._heartbeat_message({"ping": now}), encrypt=self.cipher_suite is not None)
+    
+    def _handle_heartbeat(self, message: dict, peer_id: str):
+        """Answer a peer's ping, or turn the answer to ours into a round-trip sample."""
+        data = message.get('data') or {}
+        if "ping" in data:
+            self._send_direct_message(self._heartbeat_message({"pong": data["ping"]}),
+                                      encrypt=self.cipher_suite is not None,
+                                      target_peer=peer_id if self.is_host else None)
+        elif "pong" in data:
+            self.stats.record_rtt(peer_id, time.perf_counter() - data["pong"])
+    
+    def _heartbeat_message(self, data: dict) -> dict:
+        """Build a heartbeat message (never queued for the game)."""
+        return {"type": "heartbeat", "data": data, "sender": self.local_peer_id, "timestamp": time.time()}
+    
+    def get_network_stats(self) -> dict:
+        """Snapshot traffic per message type, round-trip time per connection and the receive backlog."""
+        # Sends are written to the sockets by the caller, so there is no send queue to report
+        return self.stats.snapshot(receive_queue=len(self.message_queue))
+    
+    def _send_unreliable(self, message: dict, encrypt: bool = False) -> bool:
+        """Client: send a message over UDP if it is high-frequency state and the channel is up."""
+        if not self.udp_channel or message.get('type') not in UNRELIABLE_MESSAGE_TYPES:
+            return False
+        payload = self._frame_message(message, self.codec, encrypt)[4:]
+        if not self.udp_channel.send(HOST_PEER_ID, payload):
+            return False
+        self.bytes_sent += len(payload)
+        self.packets_sent += 1
+        self.stats.count_sent(message.get('type', ''), len(payload))
+        return True
+    
     def _receive_direct_message(self, timeout: float = 1.0) -> Optional[dict]:
         """Receive a message - during join use socket, otherwise use queue."""
         # During initial join, read directly from socket
@@ -1166,23 +1377,11 @@ class SecureNetworkManager:
             
         try:
             self.client_socket.settimeout(timeout)
-            messages = self._receive_framed_messages(self.client_socket)
+            messages = self._receive_framed_messages(self.client_socket, self.client_reader, limit=1)
             
             if messages:
                 message_data = messages[0]  # Get first message
-                message = json.loads(message_data.decode())
-                
-                # Decrypt if the message is encrypted
-                if 'encrypted' in message and self.cipher_suite:
-                    try:
-                        encrypted_data = base64.b64decode(message['encrypted'])
-                        decrypted_data = self.cipher_suite.decrypt(encrypted_data)
-                        message = json.loads(decrypted_data.decode())
-                    except Exception as e:
-                        print(f"[ERROR] Failed to decrypt join response: {e}")
-                        return None
-                
-                return message
+                return self._decode_frame(message_data)
                 
         except socket.timeout:
             return None
@@ -1221,21 +1420,12 @@ class SecureNetworkManager:
         if str(message_type) in important_messages:
             pass
         
-        # Encrypt if enabled
-        if self.cipher_suite:
-            try:
-                encrypted_data = self.cipher_suite.encrypt(json.dumps(message).encode())
-                message = {"encrypted": base64.b64encode(encrypted_data).decode()}
-                if str(message_type) in important_messages:
-                    pass
-            except Exception as e:
-                print(f"Encryption error: {e}")
-        
-        # Route message based on connection type
+        # Route message based on connection type; encryption (if enabled) happens per
+        # peer when the message is framed, since peers may use different codecs
         if self.mode == NetworkMode.DIRECT:
             if str(message_type) in important_messages:
                 pass
-            self._send_direct_message(message)
+            self._send_direct_message(message, encrypt=self.cipher_suite is not None, target_peer=target_peer)
         elif self.mode == NetworkMode.RELAY:
             self._send_relay_message(message, target_peer)
         
@@ -1263,7 +1453,8 @@ class SecureNetworkManager:
             "bytes_received": self.bytes_received,
             "packets_sent": self.packets_sent,
             "packets_received": self.packets_received,
-            "encryption_enabled": self.cipher_suite is not None
+            "encryption_enabled": self.cipher_suite is not None,
+            "udp": self.udp_channel.get_stats() if self.udp_channel else None
         }
     
     def get_peer_list(self) -> List[PeerInfo]:
@@ -1289,8 +1480,13 @@ class SecureNetworkManager:
             self.relay_connection.close()
             self.relay_connection = None
         
+        self._close_udp_channel()
+        
         # Clear state
         self.peers.clear()
+        self.peer_codecs.clear()
+        self.interest = InterestManager()
+        self.codec = CODEC_JSON
         self.current_lobby_code = None
         self.is_host = False
         
@@ -0,0 +1,145 @@
+"""
+Delta-compressed world snapshots for host-to-client synchronization.
+The host records world state as sections of keyed values under increasing
+sequence numbers. Clients acknowledge the snapshots they apply, and the host
+sends only the entries that changed since the oldest snapshot every client has
+acknowledged. Entries carry absolute values, so one delta is valid for every
+client at or past that baseline. Periodic keyframes resend everything.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple
+
+# Base sequence sent with keyframes (full state, no baseline required)
+KEYFRAME_BASE = -1
+
+_MISSING = object()
+
+# section name -> {key: value}
+WorldState = Dict[str, Dict]
+
+
+def diff_states(base: WorldState, current: WorldState) -> WorldState:
+    """Return the entries of current that are new or different from base."""
+    delta = {}
+    for section, entries in current.items():
+        base_entries = base.get(section, {})
+        changed = {key: value for key, value in entries.items()
+                   if base_entries.get(key, _MISSING) != value}
+        if changed:
+            delta[section] = changed
+    return delta
+
+
+class DeltaSnapshotSender:
+    """Host-side snapshot history with per-client acknowledgements."""
+
+    def __init__(self, keyframe_interval: float = 2.0, history_size: int = 64):
+        """Initialize the sender."""
+        self.keyframe_interval = keyframe_interval
+        self.history_size = history_size
+        self.history: "OrderedDict[int, WorldState]" = OrderedDict()  # sequence -> state
+        self.client_acks: Dict[str, int] = {}  # client id -> last acknowledged sequence
+        self.sequence = 0
+        self.last_keyframe_time = None
+
+        # Statistics
+        self.keyframes_sent = 0
+        self.deltas_sent = 0
+        self.entries_sent = 0
+
+    def acknowledge(self, client_id: str, sequence: int):
+        """Record that a client has applied the snapshot with this sequence number."""
+        if sequence > self.client_acks.get(client_id, KEYFRAME_BASE):
+            self.client_acks[client_id] = sequence
+
+    def forget_client(self, client_id: str):
+        """Drop a disconnected client's acknowledgement."""
+        self.client_acks.pop(client_id, None)
+
+    def _choose_base(self, client_ids: Iterable[str], current_time: float) -> int:
+        """Pick the baseline every client has, or KEYFRAME_BASE if a keyframe is needed."""
+        if self.last_keyframe_time is None or current_time - self.last_keyframe_time >= self.keyframe_interval:
+            return KEYFRAME_BASE
+
+        base = None
+        for client_id in client_ids:
+            acked = self.client_acks.get(client_id)
+            if acked is None or acked not in self.history:
+                return KEYFRAME_BASE  # New client, or its baseline fell out of the history
+            if base is None or acked < base:
+                base = acked
+        return KEYFRAME_BASE if base is None else base
+
+    def _changes_since(self, base: int, state: WorldState) -> WorldState:
+        """
+        Return the entries of state that changed in any snapshot after base.
+        Diffing against base alone misses values that changed and then returned
+        to the base value while a client already applied the intermediate snapshot.
+        """
+        changed_keys: Dict[str, set] = {}
+        previous = self.history[base]
+        snapshots = [snapshot for sequence, snapshot in self.history.items() if sequence > base]
+        for snapshot in snapshots + [state]:
+            for section, entries in diff_states(previous, snapshot).items():
+                changed_keys.setdefault(section, set()).update(entries)
+            previous = snapshot
+
+        delta = {}
+        for section, keys in changed_keys.items():
+            entries = state.get(section, {})
+            changed = {key: entries[key] for key in keys if key in entries}
+            if changed:
+                delta[section] = changed
+        return delta
+
+    def build(self, state: WorldState, client_ids: Iterable[str],
+              current_time: float) -> Optional[Tuple[int, int, WorldState]]:
+        """
+        Record a new snapshot and return (sequence, base, entries) to send,
+        or None if nothing changed since the baseline.
+        """
+        client_ids = list(client_ids)
+
+        # Forget acknowledgements from clients that have left
+        for client_id in list(self.client_acks):
+            if client_id not in client_ids:
+                del self.client_acks[client_id]
+
+        base = self._choose_base(client_ids, current_time)
+        if base == KEYFRAME_BASE:
+            entries = state
+            self.last_keyframe_time = current_time
+            self.keyframes_sent += 1
+        else:
+            entries = self._changes_since(base, state)
+            if not entries:
+                return None  # Every client already has this state
+            self.deltas_sent += 1
+
+        self.sequence += 1
+        self.history[self.sequence] = state
+        while len(self.history) > self.history_size:
+            self.history.popitem(last=False)
+
+        self.entries_sent += sum(len(section) for section in entries.values())
+        return self.sequence, base, entries
+
+
+class DeltaSnapshotReceiver:
+    """Client-side ordering check for incoming snapshots."""
+
+    def __init__(self):
+        """Initialize the receiver."""
+        self.applied_sequence = KEYFRAME_BASE
+
+    def accept(self, sequence: int, base: int) -> bool:
+        """Check whether a snapshot can be applied on top of the current state, and mark it applied."""
+        if base == KEYFRAME_BASE:
+            # Keyframes always apply (they also resynchronize after a host restart)
+            self.applied_sequence = sequence
+            return True
+        if sequence <= self.applied_sequence or self.applied_sequence < base:
+            return False  # Stale, or built on a baseline this client never applied
+        self.applied_sequence = sequence
+        return True
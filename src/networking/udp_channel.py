@@ -0,0 +1,331 @@
+"""
+Unreliable UDP channel for high-frequency game state.
+Player updates, world snapshots and cosmetic effects travel as sequenced
+datagrams next to the TCP connection, so a lost packet only costs that one
+update instead of stalling everything queued behind it on the TCP stream.
+Receivers drop duplicates and state older than what they already applied.
+An optional redundancy mode repeats the last few messages in every datagram
+so isolated losses are recovered without a resend. Reliable events (deaths,
+game start, lobby changes) stay on TCP.
+
+Peers are identified by a random token handed out over TCP. A client sends
+hello datagrams carrying its token until the host answers, then confirms. The
+host learns the client's address from the hellos and only sends it UDP once the
+confirmation (or any data) arrives, which proves the path works both ways.
+"""
+
+import secrets
+import select
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, List, Tuple
+
+# Messages worth losing rather than waiting for (everything else stays on TCP)
+UNRELIABLE_MESSAGE_TYPES = frozenset((
+    "player_update", "world_snapshot", "snapshot_ack", "enemy_update",
+    "explosion", "muzzle_flash", "bullet_hit", "dash_effect", "player_correction",
+))
+# Latest-wins state: an update older than one already applied to the same stream is dropped
+STATE_MESSAGE_TYPES = frozenset(("player_update", "world_snapshot", "snapshot_ack", "enemy_update",
+                                 "player_correction"))
+
+DATAGRAM_MAGIC = 0xB9
+HOST_PEER_ID = "host"      # Peer id a client uses for the host on its channel
+MAX_DATAGRAM_SIZE = 1200   # Stay under common path MTUs so datagrams are never fragmented
+DEFAULT_REDUNDANCY = 0     # Previous messages repeated in each datagram (0 = off)
+HELLO_INTERVAL = 0.5       # Seconds between client hellos until the host answers
+RECEIVE_WINDOW = 64        # Sequence numbers tracked for duplicate detection
+
+_DATAGRAM_HEADER = struct.Struct('>BIB')  # magic, token, entry count (0 = hello)
+_ENTRY_HEADER = struct.Struct('>IH')      # sequence, payload length
+_HELLO = 0              # Hello kinds (the byte after a hello's header)
+_HELLO_CONFIRM = 1
+_WINDOW_MASK = (1 << RECEIVE_WINDOW) - 1
+_MAX_ENTRIES = 0xFF
+
+
+def stream_key(message_type: str, sender: Any, data: Any) -> tuple:
+    """Key of the state stream a message updates (per sender and entity)."""
+    entity = None
+    if isinstance(data, dict):
+        entity = data.get("player_id") or data.get("enemy_id")
+    return message_type, sender, entity
+
+
+class _PeerState:
+    """Sequence and address state for one peer on the channel."""
+
+    def __init__(self, peer_id: str, token: int, redundancy: int,
+                 address=None, initiator: bool = False):
+        self.peer_id = peer_id
+        self.token = token
+        self.address = address      # Where to send; learned from the peer's datagrams on the host
+        self.initiator = initiator  # True on the client side of the handshake
+        self.ready = False          # Datagrams can flow both ways
+        self.last_hello = 0.0
+
+        self.send_sequence = 0
+        self.history = deque(maxlen=redundancy)  # Recently sent (sequence, payload), repeated for redundancy
+
+        self.highest_received = 0
+        self.received_mask = 0       # Bit n set: highest_received - n has arrived
+        self.stream_sequences = {}   # stream key -> last applied sequence
+
+
+class UdpChannel:
+    """Sequenced, optionally redundant datagrams over one UDP socket."""
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 0,
+                 redundancy: int = DEFAULT_REDUNDANCY, link=None):
+        """Bind the socket. link is an optional LossyLink that outgoing datagrams go through."""
+        self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        try:
+            self.socket.bind((host, port))
+        except OSError:
+            self.socket.close()
+            raise
+        self.socket.setblocking(False)
+        self.port = self.socket.getsockname()[1]
+        self.redundancy = max(0, redundancy)
+        self.link = link
+
+        self.peers: Dict[int, _PeerState] = {}  # token -> state
+        self.tokens: Dict[str, int] = {}        # peer id -> token
+        self.lock = threading.Lock()
+
+        # Statistics
+        self.datagrams_sent = 0
+        self.datagrams_received = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.duplicates_dropped = 0
+        self.stale_dropped = 0
+        self.recovered = 0      # Messages that only arrived as a redundant copy
+        self.oversized = 0      # Messages too large for a datagram (sent over TCP instead)
+
+    def add_peer(self, peer_id: str) -> int:
+        """Host: register a client and return the token it should tag its datagrams with."""
+        with self.lock:
+            token = 0
+            while token == 0 or token in self.peers:
+                token = secrets.randbits(32)
+            self.peers[token] = _PeerState(peer_id, token, self.redundancy)
+            self.tokens[peer_id] = token
+            return token
+
+    def connect(self, peer_id: str, token: int, address):
+        """Client: start the handshake with the host at address using the token it assigned."""
+        with self.lock:
+            self.peers[token] = _PeerState(peer_id, token, self.redundancy, address, initiator=True)
+            self.tokens[peer_id] = token
+
+    def remove_peer(self, peer_id: str):
+        """Forget a peer that disconnected."""
+        with self.lock:
+            token = self.tokens.pop(peer_id, None)
+            if token is not None:
+                self.peers.pop(token, None)
+
+    def is_ready(self, peer_id: str) -> bool:
+        """Check whether datagrams to this peer are known to get through."""
+        token = self.tokens.get(peer_id)
+        peer = self.peers.get(token) if token is not None else None
+        return peer is not None and peer.ready
+
+    def send(self, peer_id: str, payload: bytes) -> bool:
+        """
+        Send one message payload to a ready peer. Returns False if the peer is
+        not ready or the payload does not fit in a datagram (send it over TCP).
+        """
+        token = self.tokens.get(peer_id)
+        peer = self.peers.get(token) if token is not None else None
+        if peer is None or not peer.ready:
+            return False
+        size = _DATAGRAM_HEADER.size + _ENTRY_HEADER.size + len(payload)
+        if size > MAX_DATAGRAM_SIZE:
+            self.oversized += 1
+            return False
+
+        with self.lock:
+            peer.send_sequence += 1
+            entries = [(peer.send_sequence, payload)]
+            # Repeat the most recent earlier messages while they still fit
+            for sequence, old_payload in reversed(peer.history):
+                size += _ENTRY_HEADER.size + len(old_payload)
+                if size > MAX_DATAGRAM_SIZE or len(entries) == _MAX_ENTRIES:
+                    break
+                entries.append((sequence, old_payload))
+            peer.history.append((peer.send_sequence, payload))
+
+            datagram = bytearray(_DATAGRAM_HEADER.pack(DATAGRAM_MAGIC, token, len(entries)))
+            for sequence, entry_payload in reversed(entries):  # Oldest first
+                datagram += _ENTRY_HEADER.pack(sequence, len(entry_payload))
+                datagram += entry_payload
+            self._sendto(bytes(datagram), peer.address)
+        return True
+
+    def _send_hello(self, peer: _PeerState, kind: int = _HELLO):
+        """Send a hello datagram to open (or confirm) the path to a peer."""
+        self._sendto(_DATAGRAM_HEADER.pack(DATAGRAM_MAGIC, peer.token, 0) + bytes((kind,)), peer.address)
+
+    def _sendto(self, datagram: bytes, address):
+        """Hand a datagram to the socket (through the lossy link when one is set)."""
+        if address is None:
+            return
+        try:
+            if self.link:
+                self.link.send(self.socket, datagram, address)
+            else:
+                self.socket.sendto(datagram, address)
+        except OSError:
+            return  # Unreliable by design - the next update replaces it
+        self.datagrams_sent += 1
+        self.bytes_sent += len(datagram)
+
+    def poll_timeout(self, timeout: float) -> float:
+        """Cap an event loop's wait so datagrams held by the lossy link go out on time."""
+        if self.link:
+            next_due = self.link.time_until_next()
+            if next_due is not None:
+                return min(timeout, next_due)
+        return timeout
+
+    def receive(self, timeout: float = 0.0) -> List[Tuple[str, int, bytes]]:
+        """
+        Wait up to timeout for datagrams and return new (peer id, sequence, payload)
+        entries, oldest first. Also keeps client handshakes going.
+        """
+        now = time.perf_counter()
+        for peer in list(self.peers.values()):
+            if peer.initiator and not peer.ready and now - peer.last_hello >= HELLO_INTERVAL:
+                peer.last_hello = now
+                self._send_hello(peer)
+
+        if self.link:
+            self.link.flush(self.socket, now)
+            next_due = self.link.time_until_next(now)
+            if next_due is not None:
+                timeout = min(timeout, next_due)
+
+        try:
+            readable, _, _ = select.select([self.socket], [], [], timeout)
+        except (OSError, ValueError):
+            return []  # Socket closed
+        if not readable:
+            return []
+
+        results = []
+        while True:
+            try:
+                datagram, address = self.socket.recvfrom(65535)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                break  # e.g. ICMP port unreachable surfaced as a reset on Windows
+            self.datagrams_received += 1
+            self.bytes_received += len(datagram)
+            try:
+                self._read_datagram(datagram, address, results)
+            except (struct.error, IndexError):
+                continue  # Malformed datagram
+        return results
+
+    def _read_datagram(self, datagram: bytes, address, results: list):
+        """Unpack one datagram, appending its new entries to results."""
+        magic, token, count = _DATAGRAM_HEADER.unpack_from(datagram, 0)
+        peer = self.peers.get(token)
+        if magic != DATAGRAM_MAGIC or peer is None:
+            return
+        if peer.initiator:
+            if address != peer.address:
+                return  # Only the host may talk to a client
+        else:
+            peer.address = address  # Follow the client if its NAT mapping changes
+
+        if count == 0:
+            kind = datagram[_DATAGRAM_HEADER.size]
+            if peer.initiator:
+                if not peer.ready:
+                    peer.ready = True  # The host answered our hello
+                    self._send_hello(peer, _HELLO_CONFIRM)
+            elif kind == _HELLO_CONFIRM:
+                peer.ready = True
+            else:
+                self._send_hello(peer)  # Answer so the client can confirm
+            return
+        # Clients only send data once they heard back, so the path works both ways
+        peer.ready = True
+
+        offset = _DATAGRAM_HEADER.size
+        for index in range(count):
+            sequence, length = _ENTRY_HEADER.unpack_from(datagram, offset)
+            offset += _ENTRY_HEADER.size
+            payload = datagram[offset:offset + length]
+            if len(payload) != length:
+                raise IndexError("truncated datagram")
+            offset += length
+            if self._mark_received(peer, sequence):
+                if index < count - 1:
+                    self.recovered += 1  # The original datagram was lost
+                results.append((peer.peer_id, sequence, payload))
+
+    def _mark_received(self, peer: _PeerState, sequence: int) -> bool:
+        """Record a sequence number, returning False for duplicates and very late packets."""
+        if sequence > peer.highest_received:
+            shift = sequence - peer.highest_received
+            if shift >= RECEIVE_WINDOW:
+                peer.received_mask = 1
+            else:
+                peer.received_mask = ((peer.received_mask << shift) | 1) & _WINDOW_MASK
+            peer.highest_received = sequence
+            return True
+
+        offset = peer.highest_received - sequence
+        if offset >= RECEIVE_WINDOW:
+            self.stale_dropped += 1
+            return False
+        bit = 1 << offset
+        if peer.received_mask & bit:
+            self.duplicates_dropped += 1
+            return False
+        peer.received_mask |= bit
+        return True
+
+    def accept_message(self, peer_id: str, sequence: int, message_type: str,
+                       sender: Any, data: Any) -> bool:
+        """Check that a decoded message is not older than state already applied from its stream."""
+        if message_type not in STATE_MESSAGE_TYPES:
+            return True  # Events are not superseded by later ones
+        token = self.tokens.get(peer_id)
+        peer = self.peers.get(token) if token is not None else None
+        if peer is None:
+            return False
+        key = stream_key(message_type, sender, data)
+        if sequence <= peer.stream_sequences.get(key, 0):
+            self.stale_dropped += 1
+            return False
+        peer.stream_sequences[key] = sequence
+        return True
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get channel statistics."""
+        return {
+            "datagrams_sent": self.datagrams_sent,
+            "datagrams_received": self.datagrams_received,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "duplicates_dropped": self.duplicates_dropped,
+            "stale_dropped": self.stale_dropped,
+            "recovered": self.recovered,
+            "oversized": self.oversized,
+        }
+
+    def close(self):
+        """Close the socket."""
+        try:
+            self.socket.close()
+        except OSError:
+            pass
@@ -0,0 +1,410 @@
+"""
+Compact binary wire codec for Kingdom-Pygame network messages.
+High-frequency messages (player and enemy updates) are struct-packed against a
+fixed schema: the message type becomes a 1-byte id, dict keys disappear,
+positions and velocities are quantized to fixed point and angles to 16 bits.
+Other messages keep a compact JSON body behind the same binary header.
+Peers agree on a codec at connect time and fall back to JSON.
+"""
+
+import json
+import struct
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+CODEC_JSON = "json"
+CODEC_BINARY = "binary-v1"
+# Codecs this build can speak, most preferred first
+SUPPORTED_CODECS = (CODEC_BINARY, CODEC_JSON)
+
+BINARY_MAGIC = 0xB7      # First payload byte of a binary frame (JSON frames start with '{')
+ENCRYPTED_MAGIC = 0xB8   # Binary frame wrapped in a Fernet token
+UNKNOWN_TYPE_ID = 0xFF   # Type id for message types outside the table; the name follows inline
+
+POSITION_SCALE = 10.0    # Positions travel as int32 tenths of a pixel
+VELOCITY_SCALE = 4.0     # Velocities travel as int16 quarter pixels per second (+-8191 px/s)
+ANGLE_STEPS = 65536      # Angles in degrees map onto a uint16 full turn
+
+_FLAG_SCHEMA_BODY = 0x01
+_FLAG_HAS_TIMESTAMP = 0x02
+_FLAG_HAS_SENDER = 0x04
+
+_HEADER = struct.Struct('>BBB')
+_PRESENCE = struct.Struct('>H')
+_COUNT = struct.Struct('>H')
+_POSITION = struct.Struct('>ii')
+_VELOCITY = struct.Struct('>hh')
+_ANGLE = struct.Struct('>H')
+_BOOL = struct.Struct('>?')
+_INT32 = struct.Struct('>i')
+_FLOAT32 = struct.Struct('>f')
+_FLOAT64 = struct.Struct('>d')
+
+# Field layouts for the bulk of the traffic. Each field is optional on the wire
+# (a presence bit), but a message carrying keys outside its schema, or values
+# the field kind cannot hold, is sent with a JSON body instead.
+MESSAGE_SCHEMAS = {
+    "player_update": (
+        ("player_id", "str"),
+        ("position", "pos"),
+        ("angle", "angle"),
+        ("velocity", "vel"),
+        ("health", "num"),
+        ("max_health", "num"),
+        ("character_id", "str"),
+        ("weapon_type", "str"),
+        ("is_dashing", "bool"),
+        ("is_alive", "bool"),
+        ("player_name", "str"),
+        ("animation_state", "str"),
+        ("ammo", "i32"),
+        ("burst_gauge", "f32"),
+        ("input_seq", "i32"),
+    ),
+    "enemy_update": (
+        ("enemy_id", "str"),
+        ("position", "pos"),
+        ("velocity", "vel"),
+        ("health", "num"),
+        ("max_health", "num"),
+        ("type", "str"),
+        ("target_player_id", "str"),
+        ("is_alive", "bool"),
+        ("wave", "i32"),
+        ("timestamp", "f64"),
+    ),
+    # Delta world snapshot: only changed fields are present; per-entity
+    # fields travel as parallel arrays (one entry per changed enemy/player)
+    "world_snapshot": (
+        ("seq", "i32"),
+        ("base", "i32"),
+        ("timestamp", "f64"),
+        ("wave_number", "i32"),
+        ("enemies_remaining", "i32"),
+        ("wave_timer", "f32"),
+        ("score_ids", "str[]"),
+        ("scores", "i32[]"),
+        ("cores", "i32[]"),
+        ("kills", "i32[]"),
+        ("ids", "str[]"),
+        ("x", "pos[]"),
+        ("y", "pos[]"),
+        ("vx", "vel[]"),
+        ("vy", "vel[]"),
+        ("health", "num[]"),
+    ),
+    "snapshot_ack": (
+        ("seq", "i32"),
+    ),
+    "player_correction": (
+        ("player_id", "str"),
+        ("input_seq", "i32"),
+        ("position", "pos"),
+    ),
+}
+
+
+def negotiate_codec(offered: Iterable[str]) -> str:
+    """Pick the most preferred codec both sides support, falling back to JSON."""
+    offered = set(offered or ())
+    for codec in SUPPORTED_CODECS:
+        if codec in offered:
+            return codec
+    return CODEC_JSON
+
+
+def is_binary_frame(payload: bytes) -> bool:
+    """Check whether a frame payload uses the binary codec."""
+    return len(payload) > 0 and payload[0] == BINARY_MAGIC
+
+
+def is_encrypted_frame(payload: bytes) -> bool:
+    """Check whether a frame payload is an encrypted binary frame."""
+    return len(payload) > 0 and payload[0] == ENCRYPTED_MAGIC
+
+
+def _pack_str(out: bytearray, value):
+    """Append a short string (or None) with a 1-byte length prefix."""
+    if value is None:
+        out.append(0xFF)
+        return
+    if not isinstance(value, str):
+        raise TypeError("expected str")
+    raw = value.encode('utf-8')
+    if len(raw) >= 0xFF:
+        raise ValueError("string too long for the binary codec")
+    out.append(len(raw))
+    out += raw
+
+
+def _unpack_str(buffer: bytes, offset: int):
+    """Read a string written by _pack_str."""
+    length = buffer[offset]
+    offset += 1
+    if length == 0xFF:
+        return None, offset
+    end = offset + length
+    return str(buffer[offset:end], 'utf-8'), end
+
+
+def _pack_position(out: bytearray, value):
+    """Append an (x, y) position as fixed-point int32 pair."""
+    out += _POSITION.pack(round(value[0] * POSITION_SCALE), round(value[1] * POSITION_SCALE))
+
+
+def _unpack_position(buffer: bytes, offset: int):
+    """Read a position written by _pack_position."""
+    x, y = _POSITION.unpack_from(buffer, offset)
+    return (x / POSITION_SCALE, y / POSITION_SCALE), offset + 8
+
+
+def _pack_velocity(out: bytearray, value):
+    """Append an (x, y) velocity as fixed-point int16 pair."""
+    out += _VELOCITY.pack(round(value[0] * VELOCITY_SCALE), round(value[1] * VELOCITY_SCALE))
+
+
+def _unpack_velocity(buffer: bytes, offset: int):
+    """Read a velocity written by _pack_velocity."""
+    x, y = _VELOCITY.unpack_from(buffer, offset)
+    return (x / VELOCITY_SCALE, y / VELOCITY_SCALE), offset + 4
+
+
+def _pack_angle(out: bytearray, value):
+    """Append an angle in degrees as a uint16 fraction of a full turn."""
+    out += _ANGLE.pack(round((value % 360.0) * ANGLE_STEPS / 360.0) % ANGLE_STEPS)
+
+
+def _unpack_angle(buffer: bytes, offset: int):
+    """Read an angle written by _pack_angle (normalized to 0-360 degrees)."""
+    return _ANGLE.unpack_from(buffer, offset)[0] * 360.0 / ANGLE_STEPS, offset + 2
+
+
+def _pack_bool(out: bytearray, value):
+    """Append a boolean as one byte."""
+    if not isinstance(value, bool):
+        raise TypeError("expected bool")
+    out += _BOOL.pack(value)
+
+
+def _unpack_bool(buffer: bytes, offset: int):
+    """Read a boolean written by _pack_bool."""
+    return buffer[offset] != 0, offset + 1
+
+
+def _pack_int32(out: bytearray, value):
+    """Append a signed 32-bit integer."""
+    out += _INT32.pack(value)
+
+
+def _unpack_int32(buffer: bytes, offset: int):
+    """Read an integer written by _pack_int32."""
+    return _INT32.unpack_from(buffer, offset)[0], offset + 4
+
+
+def _pack_float32(out: bytearray, value):
+    """Append a single-precision float."""
+    out += _FLOAT32.pack(value)
+
+
+def _unpack_float32(buffer: bytes, offset: int):
+    """Read a float written by _pack_float32."""
+    return _FLOAT32.unpack_from(buffer, offset)[0], offset + 4
+
+
+def _unpack_number(buffer: bytes, offset: int):
+    """Read a float32 number, returning whole values (health is usually an int) as ints like JSON would."""
+    value = _FLOAT32.unpack_from(buffer, offset)[0]
+    return (int(value) if value.is_integer() else value), offset + 4
+
+
+def _pack_float64(out: bytearray, value):
+    """Append a double-precision float."""
+    out += _FLOAT64.pack(value)
+
+
+def _unpack_float64(buffer: bytes, offset: int):
+    """Read a float written by _pack_float64."""
+    return _FLOAT64.unpack_from(buffer, offset)[0], offset + 8
+
+
+def _pack_str_list(out: bytearray, values):
+    """Append a list of short strings with a uint16 count."""
+    out += _COUNT.pack(len(values))
+    for value in values:
+        _pack_str(out, value)
+
+
+def _unpack_str_list(buffer: bytes, offset: int):
+    """Read a list written by _pack_str_list."""
+    count = _COUNT.unpack_from(buffer, offset)[0]
+    offset += _COUNT.size
+    values = []
+    for _ in range(count):
+        value, offset = _unpack_str(buffer, offset)
+        values.append(value)
+    return values, offset
+
+
+def _scaled_list_kind(format_char: str, scale: float):
+    """Build (packer, unpacker) for a list of numbers stored as fixed-point integers."""
+    item_size = struct.calcsize('>' + format_char)
+
+    def pack(out: bytearray, values):
+        count = len(values)
+        out += _COUNT.pack(count)
+        if scale == 1:
+            out += struct.pack(f'>{count}{format_char}', *values)  # Non-integers fail and fall back to JSON
+        else:
+            out += struct.pack(f'>{count}{format_char}', *[round(value * scale) for value in values])
+
+    def unpack(buffer: bytes, offset: int):
+        count = _COUNT.unpack_from(buffer, offset)[0]
+        offset += _COUNT.size
+        values = struct.unpack_from(f'>{count}{format_char}', buffer, offset)
+        if scale == 1:
+            return list(values), offset + count * item_size
+        return [value / scale for value in values], offset + count * item_size
+
+    return pack, unpack
+
+
+def _pack_number_list(out: bytearray, values):
+    """Append a list of numbers as float32 with a uint16 count."""
+    count = len(values)
+    out += _COUNT.pack(count)
+    out += struct.pack(f'>{count}f', *values)
+
+
+def _unpack_number_list(buffer: bytes, offset: int):
+    """Read a list written by _pack_number_list (whole values come back as ints)."""
+    count = _COUNT.unpack_from(buffer, offset)[0]
+    offset += _COUNT.size
+    values = struct.unpack_from(f'>{count}f', buffer, offset)
+    return [int(value) if value.is_integer() else value for value in values], offset + count * 4
+
+
+# Field kind -> (packer, unpacker)
+FIELD_KINDS = {
+    "str": (_pack_str, _unpack_str),
+    "pos": (_pack_position, _unpack_position),
+    "vel": (_pack_velocity, _unpack_velocity),
+    "angle": (_pack_angle, _unpack_angle),
+    "bool": (_pack_bool, _unpack_bool),
+    "i32": (_pack_int32, _unpack_int32),
+    "num": (_pack_float32, _unpack_number),
+    "f32": (_pack_float32, _unpack_float32),
+    "f64": (_pack_float64, _unpack_float64),
+    "str[]": (_pack_str_list, _unpack_str_list),
+    "i32[]": _scaled_list_kind('i', 1),
+    "pos[]": _scaled_list_kind('i', POSITION_SCALE),
+    "vel[]": _scaled_list_kind('h', VELOCITY_SCALE),
+    "num[]": (_pack_number_list, _unpack_number_list),
+}
+
+
+class WireCodec:
+    """Encodes messages to and from the binary wire format."""
+
+    def __init__(self, type_names: Iterable[str]):
+        """
+        Initialize the codec with the ordered list of message type names.
+        A type's position in the list is its wire id, so both peers must build
+        the codec from the same list (new types are appended, never inserted).
+        """
+        self.type_names = tuple(type_names)
+        if len(self.type_names) >= UNKNOWN_TYPE_ID:
+            raise ValueError("too many message types for a 1-byte id")
+        self.type_ids = {name: type_id for type_id, name in enumerate(self.type_names)}
+        if any(len(fields) > _PRESENCE.size * 8 for fields in MESSAGE_SCHEMAS.values()):
+            raise ValueError("schema has more fields than the presence mask can flag")
+        # Schemas resolved to (key, packer, unpacker) so encoding skips the kind lookup
+        self.schemas = {
+            message_type: tuple((key,) + FIELD_KINDS[kind] for key, kind in fields)
+            for message_type, fields in MESSAGE_SCHEMAS.items()
+        }
+
+    def encode(self, message_type: str, data: Any, timestamp: Optional[float] = None,
+               sender_id: Optional[str] = None) -> bytes:
+        """Encode a message into a binary frame payload (without the length prefix)."""
+        out = bytearray()
+        type_id = self.type_ids.get(message_type, UNKNOWN_TYPE_ID)
+        flags = 0
+        if timestamp is not None:
+            flags |= _FLAG_HAS_TIMESTAMP
+        if sender_id is not None:
+            flags |= _FLAG_HAS_SENDER
+
+        body = self._encode_schema_body(message_type, data)
+        if body is not None:
+            flags |= _FLAG_SCHEMA_BODY
+
+        out += _HEADER.pack(BINARY_MAGIC, type_id, flags)
+        if type_id == UNKNOWN_TYPE_ID:
+            _pack_str(out, message_type)
+        if timestamp is not None:
+            out += _FLOAT64.pack(timestamp)
+        if sender_id is not None:
+            _pack_str(out, str(sender_id))
+
+        if body is not None:
+            out += body
+        else:
+            out += json.dumps(data, separators=(',', ':')).encode('utf-8')
+        return bytes(out)
+
+    def _encode_schema_body(self, message_type: str, data: Any) -> Optional[bytearray]:
+        """Pack data against the type's schema, or return None if it does not fit."""
+        schema = self.schemas.get(message_type)
+        if schema is None or not isinstance(data, dict):
+            return None
+        if len(data) > len(schema):
+            return None
+
+        body = bytearray(_PRESENCE.size)
+        presence = 0
+        fields_used = 0
+        try:
+            for bit, (key, pack, _) in enumerate(schema):
+                if key not in data:
+                    continue
+                pack(body, data[key])
+                presence |= 1 << bit
+                fields_used += 1
+        except (struct.error, TypeError, ValueError, OverflowError, IndexError):
+            return None
+
+        if fields_used != len(data):
+            return None  # Keys outside the schema - keep them by sending JSON
+        _PRESENCE.pack_into(body, 0, presence)
+        return body
+
+    def decode(self, payload) -> Tuple[str, Any, Optional[float], Optional[str]]:
+        """Decode a binary frame payload (bytes or memoryview) into (message type, data, timestamp, sender id)."""
+        magic, type_id, flags = _HEADER.unpack_from(payload, 0)
+        if magic != BINARY_MAGIC:
+            raise ValueError("not a binary frame")
+        offset = _HEADER.size
+
+        if type_id == UNKNOWN_TYPE_ID:
+            message_type, offset = _unpack_str(payload, offset)
+        else:
+            message_type = self.type_names[type_id]
+
+        timestamp = None
+        if flags & _FLAG_HAS_TIMESTAMP:
+            timestamp = _FLOAT64.unpack_from(payload, offset)[0]
+            offset += _FLOAT64.size
+        sender_id = None
+        if flags & _FLAG_HAS_SENDER:
+            sender_id, offset = _unpack_str(payload, offset)
+
+        if flags & _FLAG_SCHEMA_BODY:
+            data: Dict[str, Any] = {}
+            presence = _PRESENCE.unpack_from(payload, offset)[0]
+            offset += _PRESENCE.size
+            for bit, (key, _, unpack) in enumerate(self.schemas[message_type]):
+                if presence & (1 << bit):
+                    data[key], offset = unpack(payload, offset)
+        else:
+            data = json.loads(str(payload[offset:], 'utf-8'))
+
+        return message_type, data, timestamp, sender_id
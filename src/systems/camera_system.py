@@ -4,7 +4,14 @@ Handles camera movement, zoom, shake effects, and world bounds.
 """
 
 import pygame as pg
-import random
+
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
+_random = rng.stream("camera")  # Screen shake
 
 
 class CameraSystem:
@@ -45,8 +52,8 @@ class CameraSystem:
             
             # Calculate shake offset
             shake_amount = self.camera_shake_intensity * (self.camera_shake_duration / 0.5)
-            self.camera_offset.x = random.uniform(-shake_amount, shake_amount)
-            self.camera_offset.y = random.uniform(-shake_amount, shake_amount)
+            self.camera_offset.x = _random.uniform(-shake_amount, shake_amount)
+            self.camera_offset.y = _random.uniform(-shake_amount, shake_amount)
             
             if self.camera_shake_duration <= 0:
                 self.camera_offset = pg.Vector2(0, 0)
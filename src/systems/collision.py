@@ -3,19 +3,50 @@ Collision detection system for the twin-stick shooter game.
 Handles all collision detection and response between game objects.
 """
 
+import logging
 import pygame as pg
 import math
 from typing import List, Tuple
 from src.entities.player import Player
 from src.entities.bullet import Bullet, BulletManager
 from src.entities.enemy import Enemy, EnemyManager
+from src.systems.spatial_hash import SpatialHash
+from src.utils.log import get_logger, LogChannel
+
+logger = get_logger(__name__)
+_client_hit_log = LogChannel(logger)  # Per-hit client damage reports
+
+# Grid cell size for broad-phase queries (a few enemy diameters per cell)
+COLLISION_CELL_SIZE = 128
 
 class CollisionManager:
     """Handles all collision detection in the game."""
     
     def __init__(self):
         """Initialize the collision manager."""
-        pass
+        # Broad-phase indexes, rebuilt once per frame before the passes that query them
+        self.enemy_grid = SpatialHash(COLLISION_CELL_SIZE)
+        self.bullet_grid = SpatialHash(COLLISION_CELL_SIZE)
+    
+    def rebuild_enemy_grid(self, enemy_manager: EnemyManager):
+        """Index all current enemies by position and collision size."""
+        self.enemy_grid.rebuild(enemy_manager.get_enemies())
+    
+    def rebuild_bullet_grid(self, bullet_manager: BulletManager):
+        """Index all current bullets by position and effective collision size."""
+        grid = self.bullet_grid
+        grid.clear()
+        for bullet in bullet_manager.get_bullets():
+            grid.insert(bullet, bullet.pos.x, bullet.pos.y, self._get_effective_bullet_size(bullet))
+    
+    @staticmethod
+    def _get_effective_bullet_size(bullet) -> float:
+        """Get the collision radius of a bullet, widening laser beams to their visual width."""
+        if getattr(bullet, 'shape', None) == "laser":
+            # Laser bullets (sniper) have much larger visual beam width
+            # Match the visual beam_width = max(size * 4, 24)
+            return max(bullet.size * 4, 24) / 2  # Divide by 2 since we're using radius
+        return bullet.size
     
     def check_bullet_enemy_collisions(self, bullet_manager: BulletManager, 
                                     enemy_manager: EnemyManager, player=None, effects_manager=None, world_manager=None, bullet_hit_callback=None) -> int:
@@ -28,6 +59,10 @@ class CollisionManager:
         enemies_to_remove = []
         enemy_death_positions = []  # Store positions for explosion effects
         
+        # Index enemies once so each bullet only tests its neighbours
+        self.rebuild_enemy_grid(enemy_manager)
+        enemy_grid = self.enemy_grid
+        
         for bullet in bullet_manager.get_bullets():
             # Skip enemy bullets - they shouldn't hit enemies (friendly fire)
             from src.entities.bullet import BulletType
@@ -38,105 +73,99 @@ class CollisionManager:
             if hasattr(bullet, 'is_network_bullet') and bullet.is_network_bullet:
                 continue  # Network bullets don't collide with local enemies
                 
-            bullet_rect = bullet.get_rect()
+            # Calculate effective bullet collision size based on shape
+            effective_bullet_size = self._get_effective_bullet_size(bullet)
             
-            for enemy in enemy_manager.get_enemies():
-                enemy_rect = enemy.get_rect()
+            # Only test enemies sharing a grid cell with the bullet
+            for enemy in enemy_grid.query(bullet.pos.x, bullet.pos.y, effective_bullet_size):
+                # Check if actually colliding using distance (more accurate for circles)
+                dx = bullet.pos.x - enemy.pos.x
+                dy = bullet.pos.y - enemy.pos.y
+                hit_distance = effective_bullet_size + enemy.size
                 
-                if bullet_rect.colliderect(enemy_rect):
-                    # Check if actually colliding using distance (more accurate for circles)
-                    distance = (bullet.pos - enemy.pos).length()
+                if dx * dx + dy * dy <= hit_distance * hit_distance:
+                    # Collision detected
+                    enemy.take_damage(bullet.damage)
                     
-                    # Calculate effective bullet collision size based on shape
-                    effective_bullet_size = bullet.size
-                    if hasattr(bullet, 'shape') and bullet.shape == "laser":
-                        # Laser bullets (sniper) have much larger visual beam width
-                        # Match the visual beam_width = max(size * 4, 24)
-                        effective_bullet_size = max(bullet.size * 4, 24) / 2  # Divide by 2 since we're using radius
+                    # Add BURST points to player when hitting enemy
+                    if player and hasattr(player, 'add_burst_points'):
+                        player.add_burst_points(1)
                     
-                    if distance <= effective_bullet_size + enemy.size:
-                        # Collision detected
-                        enemy.take_damage(bullet.damage)
-                        
-                        # Add BURST points to player when hitting enemy
-                        if player and hasattr(player, 'add_burst_points'):
-                            player.add_burst_points(1)
-                        
-                        # Check for SMG bouncing bullets first
-                        should_remove_bullet = True
-                        if (hasattr(bullet, 'bounce_enabled') and bullet.bounce_enabled and 
-                            hasattr(bullet, 'bounces_remaining') and bullet.bounces_remaining > 0):
-                            # Try to bounce off enemy toward another target
-                            if self.handle_enemy_bounce(bullet, enemy, enemy_manager, world_manager):
-                                should_remove_bullet = False  # Bullet bounced successfully
-                                bullet.bounces_remaining -= 1
-                                bullet.has_bounced = True
-                                # Add visual bounce effect at the enemy position (impact point)
-                                bullet.add_bounce_effect(enemy.pos)
-                                # Move bullet to enemy position for accurate bounce start point
-                                bullet.pos = enemy.pos.copy()
-                        
-                        # Handle bullet penetration
-                        if hasattr(bullet, 'hits_remaining'):
-                            bullet.hits_remaining -= 1
-                            # Only remove bullet if it has no penetration left and didn't bounce
-                            if bullet.hits_remaining <= 0 and should_remove_bullet and bullet not in bullets_to_remove:
-                                # Grenades now use missile system, so no special handling needed for bullets
-                                # All bullets get removed normally
-                                bullets_to_remove.append(bullet)
-                                    
-                                # Check for special attack V-shaped blast (shotgun)
-                                if (hasattr(bullet, 'special_attack') and bullet.special_attack and 
-                                      hasattr(bullet, 'weapon_type') and bullet.weapon_type == "Shotgun"):
-                                    self.trigger_v_shaped_blast(bullet, enemy, enemy_manager, effects_manager)
-                                
-                                # Add pellet impact effect for shotgun energy balls
-                                if effects_manager and hasattr(bullet, 'shape') and bullet.shape == "pellet":
-                                    effects_manager.add_pellet_impact_effect(bullet.pos.x, bullet.pos.y)
-                                # Add tracer impact effect for assault rifle rounds
-                                elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "tracer":
-                                    effects_manager.add_tracer_impact_effect(bullet.pos.x, bullet.pos.y)
-                                # Add neon impact effect for SMG cyberpunk rounds
-                                elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "neon":
-                                    effects_manager.add_neon_impact_effect(bullet.pos.x, bullet.pos.y)
-                                # Add sword impact effect for magical blade slashes
-                                elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "slash":
-                                    effects_manager.add_sword_impact_effect(bullet.pos.x, bullet.pos.y)
-                                
-                                # Send bullet hit event for network synchronization
-                                if bullet_hit_callback:
-                                    bullet_hit_callback(bullet.pos.x, bullet.pos.y)
-                        else:
-                            # Default behavior for bullets without penetration system
-                            if should_remove_bullet and bullet not in bullets_to_remove:
-                                bullets_to_remove.append(bullet)
-                                
-                                # Check for special attack V-shaped blast (shotgun)
-                                if (hasattr(bullet, 'special_attack') and bullet.special_attack and 
-                                    hasattr(bullet, 'weapon_type') and bullet.weapon_type == "Shotgun"):
-                                    self.trigger_v_shaped_blast(bullet, enemy, enemy_manager, effects_manager)
-                                
-                                # Add pellet impact effect for shotgun energy balls
-                                if effects_manager and hasattr(bullet, 'shape') and bullet.shape == "pellet":
-                                    effects_manager.add_pellet_impact_effect(bullet.pos.x, bullet.pos.y)
-                                # Add tracer impact effect for assault rifle rounds
-                                elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "tracer":
-                                    effects_manager.add_tracer_impact_effect(bullet.pos.x, bullet.pos.y)
-                                # Add neon impact effect for SMG cyberpunk rounds
-                                elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "neon":
-                                    effects_manager.add_neon_impact_effect(bullet.pos.x, bullet.pos.y)
-                                # Add sword impact effect for magical blade slashes
-                                elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "slash":
-                                    effects_manager.add_sword_impact_effect(bullet.pos.x, bullet.pos.y)
+                    # Check for SMG bouncing bullets first
+                    should_remove_bullet = True
+                    if (hasattr(bullet, 'bounce_enabled') and bullet.bounce_enabled and 
+                        hasattr(bullet, 'bounces_remaining') and bullet.bounces_remaining > 0):
+                        # Try to bounce off enemy toward another target
+                        if self.handle_enemy_bounce(bullet, enemy, enemy_manager, world_manager):
+                            should_remove_bullet = False  # Bullet bounced successfully
+                            bullet.bounces_remaining -= 1
+                            bullet.has_bounced = True
+                            # Add visual bounce effect at the enemy position (impact point)
+                            bullet.add_bounce_effect(enemy.pos)
+                            # Move bullet to enemy position for accurate bounce start point
+                            bullet.pos = enemy.pos.copy()
+                    
+                    # Handle bullet penetration
+                    if hasattr(bullet, 'hits_remaining'):
+                        bullet.hits_remaining -= 1
+                        # Only remove bullet if it has no penetration left and didn't bounce
+                        if bullet.hits_remaining <= 0 and should_remove_bullet and bullet not in bullets_to_remove:
+                            # Grenades now use missile system, so no special handling needed for bullets
+                            # All bullets get removed normally
+                            bullets_to_remove.append(bullet)
                                 
-                                # Send bullet hit event for network synchronization
-                                if bullet_hit_callback:
-                                    bullet_hit_callback(bullet.pos.x, bullet.pos.y)
-                        
-                        if not enemy.is_alive() and enemy not in enemies_to_remove:
-                            enemies_to_remove.append(enemy)
-                            enemy_death_positions.append((enemy.pos.x, enemy.pos.y))  # Store position for explosion
-                            kills += 1
+                            # Check for special attack V-shaped blast (shotgun)
+                            if (hasattr(bullet, 'special_attack') and bullet.special_attack and 
+                                  hasattr(bullet, 'weapon_type') and bullet.weapon_type == "Shotgun"):
+                                self.trigger_v_shaped_blast(bullet, enemy, enemy_manager, effects_manager)
+                            
+                            # Add pellet impact effect for shotgun energy balls
+                            if effects_manager and hasattr(bullet, 'shape') and bullet.shape == "pellet":
+                                effects_manager.add_pellet_impact_effect(bullet.pos.x, bullet.pos.y)
+                            # Add tracer impact effect for assault rifle rounds
+                            elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "tracer":
+                                effects_manager.add_tracer_impact_effect(bullet.pos.x, bullet.pos.y)
+                            # Add neon impact effect for SMG cyberpunk rounds
+                            elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "neon":
+                                effects_manager.add_neon_impact_effect(bullet.pos.x, bullet.pos.y)
+                            # Add sword impact effect for magical blade slashes
+                            elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "slash":
+                                effects_manager.add_sword_impact_effect(bullet.pos.x, bullet.pos.y)
+                            
+                            # Send bullet hit event for network synchronization
+                            if bullet_hit_callback:
+                                bullet_hit_callback(bullet.pos.x, bullet.pos.y)
+                    else:
+                        # Default behavior for bullets without penetration system
+                        if should_remove_bullet and bullet not in bullets_to_remove:
+                            bullets_to_remove.append(bullet)
+                            
+                            # Check for special attack V-shaped blast (shotgun)
+                            if (hasattr(bullet, 'special_attack') and bullet.special_attack and 
+                                hasattr(bullet, 'weapon_type') and bullet.weapon_type == "Shotgun"):
+                                self.trigger_v_shaped_blast(bullet, enemy, enemy_manager, effects_manager)
+                            
+                            # Add pellet impact effect for shotgun energy balls
+                            if effects_manager and hasattr(bullet, 'shape') and bullet.shape == "pellet":
+                                effects_manager.add_pellet_impact_effect(bullet.pos.x, bullet.pos.y)
+                            # Add tracer impact effect for assault rifle rounds
+                            elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "tracer":
+                                effects_manager.add_tracer_impact_effect(bullet.pos.x, bullet.pos.y)
+                            # Add neon impact effect for SMG cyberpunk rounds
+                            elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "neon":
+                                effects_manager.add_neon_impact_effect(bullet.pos.x, bullet.pos.y)
+                            # Add sword impact effect for magical blade slashes
+                            elif effects_manager and hasattr(bullet, 'shape') and bullet.shape == "slash":
+                                effects_manager.add_sword_impact_effect(bullet.pos.x, bullet.pos.y)
+                            
+                            # Send bullet hit event for network synchronization
+                            if bullet_hit_callback:
+                                bullet_hit_callback(bullet.pos.x, bullet.pos.y)
+                    
+                    if not enemy.is_alive() and enemy not in enemies_to_remove:
+                        enemies_to_remove.append(enemy)
+                        enemy_death_positions.append((enemy.pos.x, enemy.pos.y))  # Store position for explosion
+                        kills += 1
         
         # Remove bullets and enemies that collided
         for bullet in bullets_to_remove:
@@ -156,8 +185,9 @@ class CollisionManager:
         """Trigger V-shaped blast behind the hit enemy for shotgun special attacks."""
         import math
         
-        print(f"=== V-SHAPED BLAST TRIGGERED ===")
-        print(f"Original enemy hit at: {hit_enemy.pos}")
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("V-shaped blast triggered, original enemy hit at %s", hit_enemy.pos)
         
         # Use bullet's velocity direction (the direction it was traveling)
         bullet_velocity = getattr(bullet, 'velocity', None)
@@ -192,10 +222,12 @@ class CollisionManager:
         total_damage_dealt = 0
         
         # Check for enemies in the V-shaped blast area
-        print(f"🔍 DEBUG: Checking {len(enemy_manager.get_enemies())} enemies for V-blast damage")
-        print(f"🔍 Blast center angle: {v_direction_angle:.1f}°, blast_angle: {blast_angle}° (±{blast_angle/2:.1f}°)")
+        if debug:
+            logger.debug("V-blast center angle %.1f, blast angle %s (+-%.1f)",
+                         v_direction_angle, blast_angle, blast_angle / 2)
         
-        for enemy in enemy_manager.get_enemies():
+        # Only enemies in grid cells overlapping the blast range can be hit
+        for enemy in self.enemy_grid.query(blast_origin_x, blast_origin_y, blast_range):
             if enemy == hit_enemy:
                 continue  # Don't damage the originally hit enemy again
             
@@ -203,14 +235,10 @@ class CollisionManager:
             to_enemy = enemy.pos - pg.Vector2(blast_origin_x, blast_origin_y)
             distance = to_enemy.length()
             
-            print(f"🔍 Enemy at {enemy.pos} -> Distance: {distance:.1f} (max: {blast_range})")
-            
             if distance > blast_range:
-                print(f"  ❌ Too far ({distance:.1f} > {blast_range})")
                 continue  # Too far away
             
             if distance == 0:
-                print(f"  ❌ Zero distance")
                 continue  # Avoid division by zero
             
             # Calculate angle to this enemy
@@ -227,23 +255,19 @@ class CollisionManager:
             blast_center = normalize_angle(v_direction_angle)  # Use V direction, not origin direction
             enemy_relative = normalize_angle(enemy_angle - blast_center)
             
-            print(f"  🎯 Enemy angle: {enemy_angle:.1f}°, relative to blast: {enemy_relative:.1f}°")
-            print(f"  🎯 Checking if |{enemy_relative:.1f}°| <= {blast_angle/2:.1f}°")
-            
             # Check if enemy is within the V-shaped blast angle
             if abs(enemy_relative) <= blast_angle / 2:
                 # Damage enemy
                 enemy.take_damage(blast_damage)
                 enemies_hit += 1
                 total_damage_dealt += blast_damage
-                print(f"  ✅ V-BLAST HIT! Enemy took {blast_damage} damage (distance: {distance:.1f})")
-            else:
-                print(f"  ❌ Outside V-angle ({abs(enemy_relative):.1f}° > {blast_angle/2:.1f}°)")
+                if debug:
+                    logger.debug("V-blast hit enemy at %s: %s damage (distance %.1f, angle %.1f)",
+                                 enemy.pos, blast_damage, distance, enemy_relative)
         
-        print(f"🔍 V-Blast Summary: {enemies_hit} enemies hit, {total_damage_dealt} total damage dealt!")
-        print(f"🔍 Blast origin: ({blast_origin_x:.1f}, {blast_origin_y:.1f})")
-        print(f"🔍 Blast range: {blast_range}, damage per hit: {blast_damage}")
-        print("=" * 40)
+        if debug:
+            logger.debug("V-blast from (%.1f, %.1f), range %s: %s enemies hit, %s total damage",
+                         blast_origin_x, blast_origin_y, blast_range, enemies_hit, total_damage_dealt)
         
         # Add visual effect for V-shaped blast
         # The V should open AWAY from the bullet's origin (opposite to bullet travel direction)
@@ -253,9 +277,8 @@ class CollisionManager:
         
         if effects_manager and hasattr(effects_manager, 'add_v_shaped_blast'):
             effects_manager.add_v_shaped_blast(blast_origin_x, blast_origin_y, v_opening_angle)
-            print(f"🔥 MASSIVE RED V-BLAST EFFECT ADDED at ({blast_origin_x:.1f}, {blast_origin_y:.1f}) with angle {v_opening_angle}°")
         else:
-            print(f"❌ Effects manager issue: {effects_manager}")
+            logger.warning("No effects manager for the V-blast effect: %s", effects_manager)
     
     def handle_enemy_bounce(self, bullet, hit_enemy, enemy_manager, world_manager=None):
         """Handle bullet bouncing off enemies toward nearest target."""
@@ -270,7 +293,7 @@ class CollisionManager:
         nearest_enemy = None
         min_distance = float('inf')
         
-        for enemy in enemy_manager.get_enemies():
+        for enemy in self.enemy_grid.query(bounce_origin.x, bounce_origin.y, bounce_range):
             if enemy == hit_enemy:
                 continue  # Skip the enemy we just hit
                 
@@ -344,14 +367,17 @@ class CollisionManager:
         bullets_to_remove = []
         player_took_damage = False
         
-        for bullet in bullet_manager.get_bullets():
+        # Query the bullet grid (see rebuild_bullet_grid) around the player only
+        for bullet in self.bullet_grid.query(player.pos.x, player.pos.y, player.size):
             # Only check enemy bullets
             if bullet.type != BulletType.ENEMY_LASER:
                 continue
             
             # Check collision with player
-            distance = (bullet.pos - player.pos).length()
-            if distance <= bullet.size + player.size:
+            dx = bullet.pos.x - player.pos.x
+            dy = bullet.pos.y - player.pos.y
+            hit_distance = bullet.size + player.size
+            if dx * dx + dy * dy <= hit_distance * hit_distance:
                 # Player takes damage from enemy bullet
                 player.take_damage(bullet.damage)
                 player_took_damage = True
@@ -363,6 +389,37 @@ class CollisionManager:
             
         return player_took_damage
     
+    def check_bullet_chest_collisions(self, bullet_manager: BulletManager, core_manager) -> int:
+        """
+        Check collisions between player bullets and core chests.
+        Queries the bullet grid built by rebuild_bullet_grid, so each chest only
+        tests bullets in its own cells. Returns the number of chest hits.
+        """
+        bullets_to_remove = []
+        
+        for chest in core_manager.chests:
+            if chest.exploding:
+                continue
+            
+            chest_rect = chest.get_collision_rect()
+            for bullet in self.bullet_grid.query_rect(chest_rect):
+                if bullet.type.value != "player":  # Only player bullets can damage chests
+                    continue
+                if bullet in bullets_to_remove:
+                    continue  # Each bullet damages at most one chest
+                
+                if chest_rect.colliderect(bullet.get_rect()):
+                    chest.take_damage(bullet.damage)
+                    bullets_to_remove.append(bullet)
+                    if chest.exploding:
+                        break  # Exploding chests stop taking hits
+        
+        # Remove bullets that hit chests
+        for bullet in bullets_to_remove:
+            bullet_manager.remove_bullet(bullet)
+        
+        return len(bullets_to_remove)
+    
     def check_point_in_circle(self, point: pg.Vector2, center: pg.Vector2, 
                             radius: float) -> bool:
         """Check if a point is inside a circle."""
@@ -414,58 +471,44 @@ class CollisionManager:
         bullets_to_remove = []
         damage_messages = []
         
+        # Index enemies once so each bullet only tests its neighbours
+        self.rebuild_enemy_grid(enemy_manager)
+        enemy_grid = self.enemy_grid
+        
         for bullet in bullet_manager.get_bullets():
             # Only check player bullets hitting enemies
             if bullet.type.value != "player":
                 continue
-                
-            bullet_pos = pg.Vector2(bullet.pos)
             
-            for enemy in enemy_manager.get_enemies():
+            # Calculate effective bullet collision size based on shape
+            effective_bullet_size = self._get_effective_bullet_size(bullet)
+            
+            for enemy in enemy_grid.query(bullet.pos.x, bullet.pos.y, effective_bullet_size):
                 if not enemy.is_alive():
                     continue
-                    
-                enemy_pos = pg.Vector2(enemy.pos)
-                distance = bullet_pos.distance_to(enemy_pos)
                 
-                # Calculate effective bullet collision size based on shape
-                effective_bullet_size = bullet.size
-                if hasattr(bullet, 'shape') and bullet.shape == "laser":
-                    # Laser bullets (sniper) have much larger visual beam width
-                    effective_bullet_size = max(bullet.size * 4, 24) / 2  # Divide by 2 since we're using radius
+                dx = bullet.pos.x - enemy.pos.x
+                dy = bullet.pos.y - enemy.pos.y
+                hit_distance = effective_bullet_size + enemy.size
                 
-                if distance <= effective_bullet_size + enemy.size:
+                if dx * dx + dy * dy <= hit_distance * hit_distance:
                     # Collision detected - send damage to host instead of applying locally
-                    # Rate-limited debug to reduce spam
-                    import time
-                    if not hasattr(self, '_collision_debug_time'):
-                        self._collision_debug_time = 0
-                    current_time = time.time()
-                    if current_time - self._collision_debug_time > 3.0:
-                        self._collision_debug_time = current_time
-                        # Reduce client collision debug spam
-                        if hasattr(self, '_client_collision_count'):
-                            self._client_collision_count += 1
-                        else:
-                            self._client_collision_count = 1
-                            
-                        # Only log every 10th collision to reduce spam
-                        if self._client_collision_count % 10 == 1:
-                            print(f"[CLIENT_COLLISION] Client hit detected, sending to host")
-                    
                     if game_synchronizer and game_synchronizer.network_manager:
-                        # Send damage message to host
+                        # Send damage message to host, with what we saw so it can rewind and check it
                         damage_data = {
                             'enemy_id': enemy.enemy_id,
                             'damage': bullet.damage,
                             'player_id': game_synchronizer.local_player_id,
                             'bullet_id': getattr(bullet, 'bullet_id', 'unknown'),
-                            'position': (enemy.pos.x, enemy.pos.y)
+                            'position': (enemy.pos.x, enemy.pos.y),
+                            'hit_position': (bullet.pos.x, bullet.pos.y),
+                            'hit_radius': effective_bullet_size
                         }
+                        view_time = game_synchronizer.get_enemy_view_time()
+                        if view_time is not None:
+                            damage_data['view_time'] = view_time
                         
-                        # Only log every 10th damage message to reduce spam
-                        if self._client_collision_count % 10 == 1:
-                            print(f"[CLIENT_DAMAGE] Sending damage message: {bullet.damage} to enemy {enemy.enemy_id}")
+                        _client_hit_log("Client hit: sending %s damage to enemy %s", bullet.damage, enemy.enemy_id)
                         game_synchronizer.network_manager.send_message(
                             MessageType.ENEMY_DAMAGE,
                             damage_data
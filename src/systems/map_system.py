@@ -6,7 +6,16 @@ Handles TMX map loading, rendering, and collision detection.
 import pygame as pg
 import xml.etree.ElementTree as ET
 import os
-from typing import List, Tuple, Optional, Set, Dict
+from collections import OrderedDict
+from typing import List, Tuple, Optional, Set, Dict, Sequence
+
+# NumPy is optional - batched collision queries fall back to a Python loop
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 class Tileset:
     """Represents a tileset with image and tile information."""
@@ -22,8 +31,10 @@ class Tileset:
         self.columns = 0
         self.image_path = ""
         self.image = None
+        self.tile_images: List[pg.Surface] = []  # Subsurfaces of image, indexed by local tile ID
         
         self._load_tileset()
+        self._slice_tiles()
     
     def _load_tileset(self):
         """Load tileset from TSX file."""
@@ -60,26 +71,93 @@ class Tileset:
         except Exception as e:
             print(f"Error loading tileset {self.source_path}: {e}")
     
+    def _slice_tiles(self):
+        """Slice the tileset image into one subsurface per tile."""
+        self.tile_images = []
+        if not self.image:
+            return
+        
+        image_width, image_height = self.image.get_size()
+        for local_id in range(self.tile_count):
+            # Calculate tile position in tileset
+            tile_x = (local_id % self.columns) * self.tile_width
+            tile_y = (local_id // self.columns) * self.tile_height
+            if tile_x + self.tile_width > image_width or tile_y + self.tile_height > image_height:
+                break  # Tile count claims more tiles than the image holds
+            self.tile_images.append(
+                self.image.subsurface(pg.Rect(tile_x, tile_y, self.tile_width, self.tile_height)))
+    
     def get_tile_image(self, tile_id: int) -> Optional[pg.Surface]:
-        """Get tile image by tile ID."""
+        """
+        Get tile image by global tile ID.
+        Returns a subsurface shared with the tileset image - copy it before drawing on it.
+        """
         if not self.image or tile_id < self.first_gid:
             return None
         
         # Convert global tile ID to local tile ID
         local_id = tile_id - self.first_gid
-        if local_id >= self.tile_count:
+        if local_id >= len(self.tile_images):
             return None
         
-        # Calculate tile position in tileset
-        tile_x = (local_id % self.columns) * self.tile_width
-        tile_y = (local_id // self.columns) * self.tile_height
-        
-        # Extract tile from tileset image
-        tile_rect = pg.Rect(tile_x, tile_y, self.tile_width, self.tile_height)
-        tile_surface = pg.Surface((self.tile_width, self.tile_height), pg.SRCALPHA)  # Enable alpha
-        tile_surface.blit(self.image, (0, 0), tile_rect)
+        return self.tile_images[local_id]
+
+class TileImageCache:
+    """
+    LRU cache of tile images keyed by (gid, target size).
+    Shared by everything that draws map tiles, so each tile is converted or
+    scaled once per size instead of once per draw.
+    """
+    
+    def __init__(self, tilesets: List[Tileset], max_entries: int = 1024):
+        self.tilesets = tilesets
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple[int, Optional[Tuple[int, int]]], Optional[pg.Surface]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def _find_tileset(self, tile_id: int) -> Optional[Tileset]:
+        """Find the tileset a global tile ID belongs to."""
+        for tileset in reversed(self.tilesets):  # Check in reverse order to find the right tileset
+            if tile_id >= tileset.first_gid:
+                return tileset
+        return None
+    
+    def get(self, tile_id: int, size: Optional[Tuple[int, int]] = None) -> Optional[pg.Surface]:
+        """Get a tile image, scaled to size (width, height) when given."""
+        if tile_id == 0:
+            return None  # Empty tile
         
-        return tile_surface
+        key = (tile_id, size)
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+        self.misses += 1
+        
+        image = None
+        tileset = self._find_tileset(tile_id)
+        tile_image = tileset.get_tile_image(tile_id) if tileset else None
+        if tile_image:
+            if size is not None and size != tile_image.get_size():
+                image = pg.transform.scale(tile_image, size)
+            else:
+                image = tile_image.copy()
+            if pg.display.get_surface() is not None:
+                image = image.convert_alpha()  # Per-pixel alpha in display format
+        
+        # Unknown IDs are cached too (as None) so repeated lookups stay cheap
+        self._entries[key] = image
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)  # Evict least recently used
+        return image
+    
+    def clear(self):
+        """Drop all cached images."""
+        self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
 
 class MapLayer:
     """Represents a single map layer."""
@@ -122,7 +200,22 @@ class TiledMap:
         self.invisible_collision_layers = ["Tile Layer 3"]  # Only Layer 3 is invisible
         self.solid_tile_ids = {330, 286}  # Tile IDs that are solid
         
+        # Tile images per (gid, size), shared by chunk baking, rendering and other map consumers
+        self.tile_cache = TileImageCache(self.tilesets)
+        
+        # Collision layers baked into one byte per tile (1 = solid), row-major
+        self.collision_grid = bytearray()
+        self.collision_array = None  # NumPy bool view of collision_grid (height x width)
+        
+        # Visual layers pre-rendered into world-scale chunks (see _build_render_chunks)
+        self.render_chunk_size = 512  # World pixels per chunk side
+        self.render_chunks: Dict[Tuple[int, int], pg.Surface] = {}
+        self.render_chunk_cols = 0
+        self.render_chunk_rows = 0
+        
         self._load_map()
+        self._build_collision_grid()
+        self._build_render_chunks()
     
     def _load_map(self):
         """Load TMX map file."""
@@ -176,6 +269,84 @@ class TiledMap:
         except Exception as e:
             print(f"Error loading map {self.file_path}: {e}")
     
+    def _build_collision_grid(self):
+        """Bake all collision layers into a single solid-tile bitmap."""
+        grid = bytearray(self.width * self.height)
+        for layer in self.layers:
+            if layer.name not in self.collision_layers:
+                continue
+            # Layers can in principle differ in size from the map
+            rows = min(layer.height, self.height)
+            cols = min(layer.width, self.width)
+            for y in range(rows):
+                row = layer.data[y * layer.width:y * layer.width + cols]
+                base = y * self.width
+                for x, tile_id in enumerate(row):
+                    if tile_id in self.solid_tile_ids:
+                        grid[base + x] = 1
+        
+        self.collision_grid = grid
+        if NUMPY_AVAILABLE and self.width and self.height:
+            self.collision_array = np.frombuffer(grid, dtype=np.uint8).reshape(self.height, self.width).view(np.bool_)
+    
+    def _build_render_chunks(self):
+        """Pre-render the static visual layers into scaled chunk surfaces."""
+        self.render_chunks = {}
+        if not self.width or not self.height:
+            return
+        
+        chunk_size = self.render_chunk_size
+        self.render_chunk_cols = -(-self.world_width // chunk_size)  # Ceiling division
+        self.render_chunk_rows = -(-self.world_height // chunk_size)
+        
+        scaled_tile_width = self.get_scaled_tile_width()
+        scaled_tile_height = self.get_scaled_tile_height()
+        tile_size = (int(scaled_tile_width), int(scaled_tile_height))
+        
+        # Same layer order as the old per-tile render, so later layers draw on top
+        for layer in self.layers:
+            if layer.name in self.invisible_collision_layers:
+                continue  # Invisible collision boundaries only
+            for y in range(layer.height):
+                for x in range(layer.width):
+                    tile_id = layer.get_tile_id(x, y)
+                    if tile_id == 0:
+                        continue  # Skip empty tiles
+                    
+                    scaled_image = self.get_scaled_tile_image(tile_id, tile_size)
+                    if scaled_image is None:
+                        continue
+                    
+                    # Map-space pixel position (0..world size), blitted into every chunk it overlaps
+                    map_x = int(x * scaled_tile_width)
+                    map_y = int(y * scaled_tile_height)
+                    for chunk_y in range(map_y // chunk_size, (map_y + tile_size[1] - 1) // chunk_size + 1):
+                        for chunk_x in range(map_x // chunk_size, (map_x + tile_size[0] - 1) // chunk_size + 1):
+                            if chunk_x >= self.render_chunk_cols or chunk_y >= self.render_chunk_rows:
+                                continue
+                            chunk = self.render_chunks.get((chunk_x, chunk_y))
+                            if chunk is None:
+                                chunk = self._create_render_chunk(chunk_x, chunk_y)
+                            chunk.blit(scaled_image, (map_x - chunk_x * chunk_size, map_y - chunk_y * chunk_size))
+    
+    def _create_render_chunk(self, chunk_x: int, chunk_y: int) -> pg.Surface:
+        """Create an empty transparent chunk surface, clipped to the map edge."""
+        chunk_size = self.render_chunk_size
+        width = min(chunk_size, self.world_width - chunk_x * chunk_size)
+        height = min(chunk_size, self.world_height - chunk_y * chunk_size)
+        chunk = pg.Surface((width, height), pg.SRCALPHA)
+        if pg.display.get_surface() is not None:
+            chunk = chunk.convert_alpha()  # Match display format for fast blits
+        chunk.fill((0, 0, 0, 0))
+        self.render_chunks[(chunk_x, chunk_y)] = chunk
+        return chunk
+    
+    def is_solid_tile_at(self, tile_x: int, tile_y: int) -> bool:
+        """Check the baked collision grid at tile coordinates."""
+        if tile_x < 0 or tile_x >= self.width or tile_y < 0 or tile_y >= self.height:
+            return False
+        return self.collision_grid[tile_y * self.width + tile_x] == 1
+    
     def get_pixel_width(self) -> int:
         """Get map width in pixels (scaled to world size)."""
         return self.world_width
@@ -193,28 +364,12 @@ class TiledMap:
         return self.world_height / self.height
     
     def get_tile_image(self, tile_id: int) -> Optional[pg.Surface]:
-        """Get tile image by tile ID from appropriate tileset."""
-        if tile_id == 0:
-            return None  # Empty tile
-        
-        # Find the appropriate tileset for this tile ID
-        tileset = None
-        for ts in reversed(self.tilesets):  # Check in reverse order to find the right tileset
-            if tile_id >= ts.first_gid:
-                tileset = ts
-                break
-        
-        if tileset:
-            tile_image = tileset.get_tile_image(tile_id)
-            if tile_image:
-                # Convert to per-pixel alpha and set proper alpha handling
-                tile_image = tile_image.convert_alpha()
-                # If the image has a colorkey (transparency), preserve it
-                if tile_image.get_colorkey():
-                    tile_image = tile_image.convert_alpha()
-            return tile_image
-        
-        return None
+        """Get tile image by tile ID from appropriate tileset (cached, do not modify)."""
+        return self.tile_cache.get(tile_id)
+    
+    def get_scaled_tile_image(self, tile_id: int, size: Tuple[int, int]) -> Optional[pg.Surface]:
+        """Get tile image scaled to size (cached per size, do not modify)."""
+        return self.tile_cache.get(tile_id, size)
     
     def get_layer_by_name(self, name: str) -> Optional[MapLayer]:
         """Get layer by name."""
@@ -244,26 +399,32 @@ class TiledMap:
     def is_collision_at_world_pos(self, world_x: float, world_y: float) -> bool:
         """Check if there's a collision at world position."""
         tile_x, tile_y = self.world_to_tile_coords(world_x, world_y)
-        
-        # Check collision layers
-        for layer in self.layers:
-            if layer.name in self.collision_layers:
-                if layer.is_solid_tile(tile_x, tile_y, self.solid_tile_ids):
-                    return True
-        
-        return False
+        return self.is_solid_tile_at(tile_x, tile_y)
+    
+    def are_positions_blocked(self, xs: Sequence[float], ys: Sequence[float]):
+        """
+        Check many world positions against the collision grid at once.
+        Returns a NumPy bool array when NumPy is available, otherwise a list of bools.
+        """
+        if not NUMPY_AVAILABLE or self.collision_array is None:
+            return [self.is_collision_at_world_pos(x, y) for x, y in zip(xs, ys)]
+        
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        
+        # Same conversion as world_to_tile_coords (int() truncates toward zero)
+        tile_x = ((xs + self.world_width / 2) / self.get_scaled_tile_width()).astype(np.int64)
+        tile_y = ((ys + self.world_height / 2) / self.get_scaled_tile_height()).astype(np.int64)
+        
+        inside = (tile_x >= 0) & (tile_x < self.width) & (tile_y >= 0) & (tile_y < self.height)
+        blocked = np.zeros(xs.shape, dtype=np.bool_)
+        blocked[inside] = self.collision_array[tile_y[inside], tile_x[inside]]
+        return blocked
     
     def get_collision_rect_at_tile(self, tile_x: int, tile_y: int) -> Optional[pg.Rect]:
         """Get collision rectangle for tile at given tile coordinates."""
         # Check if any collision layer has a solid tile here
-        has_collision = False
-        for layer in self.layers:
-            if layer.name in self.collision_layers:
-                if layer.is_solid_tile(tile_x, tile_y, self.solid_tile_ids):
-                    has_collision = True
-                    break
-        
-        if not has_collision:
+        if not self.is_solid_tile_at(tile_x, tile_y):
             return None
         
         # Convert back to world coordinates using scaled tile dimensions
@@ -337,41 +498,31 @@ class TiledMap:
                                 pg.draw.rect(screen, color[:3], rect, 2)  # Draw border only
     
     def render(self, screen: pg.Surface, camera_offset: Tuple[float, float] = (0, 0), debug_mode: bool = False):
-        """Render the map with textures."""
-        scaled_tile_width = self.get_scaled_tile_width()
-        scaled_tile_height = self.get_scaled_tile_height()
-        
-        # Render visual layers: Layer 1 (background) and Layer 2 (obstacles)
-        # Skip Layer 3 as it's invisible collision boundaries only
-        for layer in self.layers:
-            # Render Layer 1 (background) and Layer 2 (visible obstacles)
-            # Skip Layer 3 (invisible collision boundaries)
-            if layer.name == "Tile Layer 3":
-                continue
-            for y in range(layer.height):
-                for x in range(layer.width):
-                    tile_id = layer.get_tile_id(x, y)
-                    if tile_id == 0:
-                        continue  # Skip empty tiles
-                    
-                    # Calculate world position using scaled coordinates
-                    world_x = x * scaled_tile_width - self.world_width / 2
-                    world_y = y * scaled_tile_height - self.world_height / 2
-                    
-                    # Apply camera offset
-                    screen_x = world_x + camera_offset[0]
-                    screen_y = world_y + camera_offset[1]
-                    
-                    # Only render if on screen (with some margin for performance)
-                    if (-scaled_tile_width <= screen_x <= screen.get_width() and
-                        -scaled_tile_height <= screen_y <= screen.get_height()):
-                        
-                        # Get tile image
-                        tile_image = self.get_tile_image(tile_id)
-                        if tile_image:
-                            # Scale tile image to match scaled tile size
-                            scaled_image = pg.transform.scale(tile_image, (int(scaled_tile_width), int(scaled_tile_height)))
-                            screen.blit(scaled_image, (screen_x, screen_y))
+        """Render the map by blitting the pre-rendered chunks that intersect the screen."""
+        chunk_size = self.render_chunk_size
+        
+        # Map-space rectangle covered by the screen
+        view_left = -camera_offset[0] - (-self.world_width / 2)
+        view_top = -camera_offset[1] - (-self.world_height / 2)
+        screen_width, screen_height = screen.get_size()
+        
+        first_x = max(0, int(view_left // chunk_size))
+        last_x = min(self.render_chunk_cols - 1, int((view_left + screen_width) // chunk_size))
+        first_y = max(0, int(view_top // chunk_size))
+        last_y = min(self.render_chunk_rows - 1, int((view_top + screen_height) // chunk_size))
+        
+        blit_sequence = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                chunk = self.render_chunks.get((chunk_x, chunk_y))
+                if chunk is None:
+                    continue  # Fully transparent chunk
+                screen_x = chunk_x * chunk_size - self.world_width / 2 + camera_offset[0]
+                screen_y = chunk_y * chunk_size - self.world_height / 2 + camera_offset[1]
+                blit_sequence.append((chunk, (int(screen_x), int(screen_y))))
+        
+        if blit_sequence:
+            screen.blits(blit_sequence, doreturn=False)
         
         # Render debug overlay if requested (collision boundaries)
         if debug_mode:
@@ -407,6 +558,13 @@ class MapManager:
         
         return self.current_map.is_collision_at_world_pos(x, y)
     
+    def are_positions_blocked(self, xs: Sequence[float], ys: Sequence[float]):
+        """Check many positions against map collision in one call."""
+        if not self.current_map:
+            return [False] * len(xs)
+        
+        return self.current_map.are_positions_blocked(xs, ys)
+    
     def get_collision_rects_near(self, x: float, y: float, radius: float) -> List[pg.Rect]:
         """Get collision rectangles near position."""
         if not self.current_map:
@@ -0,0 +1,76 @@
+"""
+Render interpolation for the fixed-timestep game loop.
+The simulation advances in fixed ticks; rendering happens between ticks. Before
+each tick the positions of moving objects are captured, and at render time
+objects are drawn between their previous and current tick positions so motion
+stays smooth when the render rate and tick rate differ.
+"""
+
+from typing import Iterable, List, Tuple
+
+# Objects that move further than this in one tick (teleports, respawns) snap instead of sliding
+INTERPOLATION_SNAP_DISTANCE = 200.0
+
+
+class RenderInterpolator:
+    """Captures pre-tick positions and temporarily blends object positions for rendering."""
+
+    def __init__(self, snap_distance: float = INTERPOLATION_SNAP_DISTANCE):
+        """Initialize the interpolator."""
+        self.snap_distance_sq = snap_distance * snap_distance
+        self._restore: List[Tuple] = []  # (object, x, y, sprite x, sprite y) overridden for this frame
+
+    def capture(self, objects: Iterable):
+        """Remember each object's position before a simulation tick."""
+        for obj in objects:
+            obj._prev_render_pos = (obj.pos.x, obj.pos.y)
+
+    def begin(self, objects: Iterable, alpha: float):
+        """
+        Move objects to their interpolated positions for rendering.
+        alpha is how far the simulation clock is between the last tick (0) and the next (1).
+        Must be paired with end() once rendering is done.
+        """
+        restore = self._restore
+        snap_distance_sq = self.snap_distance_sq
+        for obj in objects:
+            prev = getattr(obj, '_prev_render_pos', None)
+            if prev is None:
+                continue  # Spawned this tick - draw at its current position
+
+            pos = obj.pos
+            x, y = pos.x, pos.y
+            dx = x - prev[0]
+            dy = y - prev[1]
+            if dx * dx + dy * dy > snap_distance_sq:
+                continue
+
+            # Sprites render from their own position, which mirrors pos after update
+            sprite = getattr(obj, 'animated_sprite', None)
+            sprite_pos = sprite.pos if sprite is not None else None
+            restore.append((obj, x, y,
+                            sprite_pos.x if sprite_pos is not None else None,
+                            sprite_pos.y if sprite_pos is not None else None))
+
+            # Blend back from the current position toward the previous one
+            pos.x = prev[0] + dx * alpha
+            pos.y = prev[1] + dy * alpha
+            if sprite_pos is not None:
+                sprite_pos.x = sprite_pos.x - (1.0 - alpha) * dx
+                sprite_pos.y = sprite_pos.y - (1.0 - alpha) * dy
+
+    def end(self):
+        """Restore the simulation positions overridden by begin()."""
+        for obj, x, y, sprite_x, sprite_y in self._restore:
+            obj.pos.x = x
+            obj.pos.y = y
+            if sprite_x is not None:
+                sprite_pos = obj.animated_sprite.pos
+                sprite_pos.x = sprite_x
+                sprite_pos.y = sprite_y
+        self._restore.clear()
+
+
+def interpolate(previous: float, current: float, alpha: float) -> float:
+    """Linearly interpolate a scalar between its previous and current tick values."""
+    return previous + (current - previous) * alpha
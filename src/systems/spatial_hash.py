@@ -0,0 +1,105 @@
+"""
+Spatial hash for broad-phase collision queries.
+Buckets objects into a uniform grid so collision passes only test nearby pairs.
+"""
+
+import math
+from typing import Any, Dict, List, Tuple
+
+
+class SpatialHash:
+    """Uniform grid that buckets objects by the cells their bounds overlap."""
+
+    def __init__(self, cell_size: float = 128.0):
+        """Initialize an empty spatial hash."""
+        self.cell_size = float(cell_size)
+        self._inv_cell_size = 1.0 / self.cell_size
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+        self._objects: List[Any] = []
+        self.max_radius = 0.0  # Largest radius inserted since the last clear
+
+    def clear(self):
+        """Remove all objects from the grid."""
+        self._cells.clear()
+        self._objects.clear()
+        self.max_radius = 0.0
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def insert(self, obj: Any, x: float, y: float, radius: float = 0.0):
+        """Insert an object covering the circle at (x, y) with the given radius."""
+        self.insert_bounds(obj, x - radius, y - radius, x + radius, y + radius)
+        if radius > self.max_radius:
+            self.max_radius = radius
+
+    def insert_rect(self, obj: Any, rect):
+        """Insert an object covering a pygame Rect (or any object with left/top/right/bottom)."""
+        self.insert_bounds(obj, rect.left, rect.top, rect.right, rect.bottom)
+        half_extent = max(rect.width, rect.height) / 2
+        if half_extent > self.max_radius:
+            self.max_radius = half_extent
+
+    def insert_bounds(self, obj: Any, left: float, top: float, right: float, bottom: float):
+        """Insert an object into every cell overlapped by the given bounds."""
+        index = len(self._objects)
+        self._objects.append(obj)
+
+        inv = self._inv_cell_size
+        min_cx = math.floor(left * inv)
+        max_cx = math.floor(right * inv)
+        min_cy = math.floor(top * inv)
+        max_cy = math.floor(bottom * inv)
+
+        cells = self._cells
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket is None:
+                    cells[(cx, cy)] = [index]
+                else:
+                    bucket.append(index)
+
+    def rebuild(self, objects, radius_attr: str = 'size'):
+        """Clear the grid and insert every object by its pos and radius attribute."""
+        self.clear()
+        for obj in objects:
+            self.insert(obj, obj.pos.x, obj.pos.y, getattr(obj, radius_attr, 0.0))
+
+    def query(self, x: float, y: float, radius: float = 0.0) -> List[Any]:
+        """Return objects whose cells overlap the circle's bounding box, in insertion order."""
+        return self.query_bounds(x - radius, y - radius, x + radius, y + radius)
+
+    def query_rect(self, rect) -> List[Any]:
+        """Return objects whose cells overlap a pygame Rect, in insertion order."""
+        return self.query_bounds(rect.left, rect.top, rect.right, rect.bottom)
+
+    def query_bounds(self, left: float, top: float, right: float, bottom: float) -> List[Any]:
+        """Return objects whose cells overlap the given bounds, in insertion order."""
+        inv = self._inv_cell_size
+        min_cx = math.floor(left * inv)
+        max_cx = math.floor(right * inv)
+        min_cy = math.floor(top * inv)
+        max_cy = math.floor(bottom * inv)
+
+        cells = self._cells
+        # Fast path: a single cell needs no de-duplication
+        if min_cx == max_cx and min_cy == max_cy:
+            bucket = cells.get((min_cx, min_cy))
+            if not bucket:
+                return []
+            objects = self._objects
+            return [objects[i] for i in bucket]
+
+        found = set()
+        for cx in range(min_cx, max_cx + 1):
+            for cy in range(min_cy, max_cy + 1):
+                bucket = cells.get((cx, cy))
+                if bucket:
+                    found.update(bucket)
+
+        if not found:
+            return []
+        # Sorting by insertion index keeps results deterministic and matches list order
+        objects = self._objects
+        return [objects[i] for i in sorted(found)]
@@ -0,0 +1,84 @@
+"""
+Network stats overlay for Kingdom-Pygame.
+Shows round-trip time, jitter, traffic per message type and queue depths from
+the network manager's stats snapshot. The text is rebuilt a few times per
+second and cached as one surface, so leaving it open costs a single blit per frame.
+"""
+
+import time
+import pygame as pg
+from typing import List, Optional, Tuple
+
+REFRESH_INTERVAL = 0.25  # Seconds between stats polls
+MAX_TYPE_ROWS = 8        # Busiest message types listed
+
+
+class NetStatsOverlay:
+    """Toggleable HUD panel with the network manager's live stats."""
+
+    def __init__(self, font: pg.font.Font):
+        self.font = font
+        self.visible = False
+        self.surface: Optional[pg.Surface] = None
+        self.last_refresh = 0.0
+        self.line_height = font.get_linesize()
+
+    def toggle(self):
+        """Show or hide the overlay."""
+        self.visible = not self.visible
+        self.surface = None  # Rebuild with fresh numbers when shown again
+
+    def render(self, screen: pg.Surface, network_manager, position: Tuple[int, int]):
+        """Draw the overlay if it is visible and the network manager reports stats."""
+        if not self.visible or not hasattr(network_manager, 'get_network_stats'):
+            return
+        now = time.perf_counter()
+        if self.surface is None or now - self.last_refresh >= REFRESH_INTERVAL:
+            self.surface = self._build_surface(self._format_lines(network_manager.get_network_stats()))
+            self.last_refresh = now
+        screen.blit(self.surface, position)
+
+    def _format_lines(self, stats: dict) -> List[Tuple[str, tuple]]:
+        """Turn a stats snapshot into (text, color) lines."""
+        lines = [("NETWORK (F4)", (255, 200, 100))]
+
+        for peer_id, rtt in stats["peers"].items():
+            if rtt["rtt_ms"] is None:
+                continue
+            rtt_ms = rtt["rtt_ms"]
+            color = (0, 255, 0) if rtt_ms < 80 else (255, 255, 0) if rtt_ms < 150 else (255, 0, 0)
+            lines.append((f"{peer_id}: rtt {rtt_ms:.1f} ms  jitter {rtt['jitter_ms']:.1f}  "
+                          f"min {rtt['min_rtt_ms']:.1f}", color))
+        if len(lines) == 1:
+            lines.append(("rtt: waiting for heartbeat", (150, 150, 150)))
+
+        totals = stats["totals"]
+        lines.append((f"out {totals['sent_per_s']:.0f} msg/s {totals['sent_bytes_per_s'] / 1024:.1f} KB/s   "
+                      f"in {totals['received_per_s']:.0f} msg/s {totals['received_bytes_per_s'] / 1024:.1f} KB/s",
+                      (255, 255, 255)))
+
+        gauges = ", ".join(f"{name.replace('_', ' ')} {value}" for name, value in stats["gauges"].items())
+        if gauges:
+            lines.append((gauges, (200, 200, 200)))
+
+        # Busiest message types first
+        busiest = sorted(stats["types"].items(),
+                         key=lambda item: item[1]["sent_bytes_per_s"] + item[1]["received_bytes_per_s"],
+                         reverse=True)
+        for message_type, traffic in busiest[:MAX_TYPE_ROWS]:
+            lines.append((f"{message_type:<18} out {traffic['sent_per_s']:5.1f}/s {traffic['sent_bytes_per_s']:7.0f} B/s"
+                          f"  in {traffic['received_per_s']:5.1f}/s {traffic['received_bytes_per_s']:7.0f} B/s",
+                          (180, 180, 180)))
+        return lines
+
+    def _build_surface(self, lines: List[Tuple[str, tuple]]) -> pg.Surface:
+        """Render the lines onto one semi-transparent panel."""
+        rendered = [self.font.render(text, True, color) for text, color in lines]
+        width = max(text.get_width() for text in rendered) + 20
+        height = self.line_height * len(rendered) + 16
+        surface = pg.Surface((width, height), pg.SRCALPHA)
+        surface.fill((20, 20, 30, 180))
+        pg.draw.rect(surface, (100, 100, 120), surface.get_rect(), 2, border_radius=8)
+        for row, text in enumerate(rendered):
+            surface.blit(text, (10, 8 + row * self.line_height))
+        return surface
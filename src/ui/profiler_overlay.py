@@ -0,0 +1,130 @@
+"""
+Frame profiler overlay for Kingdom-Pygame.
+Draws the profiler's rolling window as a stacked bar per frame (one color per
+system, bottom to top in call order) against the frame budget line, with a
+p50/p95/max table of the most expensive systems. Like the network overlay it
+is rebuilt a few times per second and blitted from a cached surface.
+"""
+
+import time
+import pygame as pg
+from typing import Dict, Optional, Tuple
+
+from src.utils.profiler import FrameProfiler, FRAME_BUDGET
+
+REFRESH_INTERVAL = 0.25   # Seconds between redraws of the cached panel
+GRAPH_HEIGHT = 120        # Pixels for two frame budgets
+BAR_WIDTH = 2             # Pixels per frame in the graph
+MAX_TABLE_ROWS = 10       # Most expensive systems listed
+
+# Distinct colors handed out to systems in the order they are first seen
+PALETTE = [
+    (230, 90, 80), (90, 170, 240), (120, 220, 110), (240, 200, 80), (190, 120, 230),
+    (80, 220, 210), (245, 140, 60), (230, 110, 180), (160, 200, 60), (120, 130, 240),
+    (200, 160, 120), (100, 190, 150), (240, 240, 140), (170, 90, 130), (90, 120, 150),
+]
+UNTRACKED_COLOR = (90, 90, 100)
+
+
+class ProfilerOverlay:
+    """Toggleable stacked-bar HUD of per-system frame times."""
+
+    def __init__(self, profiler: FrameProfiler, font: pg.font.Font):
+        self.profiler = profiler
+        self.font = font
+        self.visible = False
+        self.surface: Optional[pg.Surface] = None
+        self.last_refresh = 0.0
+        self.colors: Dict[str, Tuple[int, int, int]] = {}
+
+    def toggle(self):
+        """Show or hide the overlay; timing runs only while it is shown (or a trace is recording)."""
+        self.visible = not self.visible
+        self.profiler.set_enabled(self.visible or self.profiler.tracing)
+        self.surface = None
+
+    def _color(self, name: str) -> Tuple[int, int, int]:
+        """Stable color for a system."""
+        color = self.colors.get(name)
+        if color is None:
+            color = self.colors[name] = PALETTE[len(self.colors) % len(PALETTE)]
+        return color
+
+    def render(self, screen: pg.Surface, position: Tuple[int, int]):
+        """Draw the overlay if it is visible."""
+        if not self.visible:
+            return
+        now = time.perf_counter()
+        if self.surface is None or now - self.last_refresh >= REFRESH_INTERVAL:
+            self.surface = self._build_surface()
+            self.last_refresh = now
+        screen.blit(self.surface, position)
+
+    def _build_surface(self) -> pg.Surface:
+        """Draw the graph and the table onto one panel."""
+        profiler = self.profiler
+        history = list(profiler.history)
+        stats = profiler.get_stats()
+        line_height = self.font.get_linesize()
+
+        # Most expensive systems by p95, then the frame summary
+        systems = sorted((name for name in profiler.order if name in stats),
+                         key=lambda name: stats[name]["p95"], reverse=True)[:MAX_TABLE_ROWS]
+        rows = len(systems) + 4  # Header, systems, untracked, frame, trace status
+
+        graph_width = profiler.history.maxlen * BAR_WIDTH
+        width = graph_width + 20
+        height = GRAPH_HEIGHT + rows * line_height + 24
+        surface = pg.Surface((width, height), pg.SRCALPHA)
+        surface.fill((20, 20, 30, 200))
+        pg.draw.rect(surface, (100, 100, 120), surface.get_rect(), 2, border_radius=8)
+
+        # Stacked bar per frame, newest on the right; the graph spans two frame budgets
+        scale = GRAPH_HEIGHT / (FRAME_BUDGET * 2)
+        base_y = 10 + GRAPH_HEIGHT
+        x = 10 + graph_width - len(history) * BAR_WIDTH
+        for total, frame in history:
+            y = base_y
+            for name in profiler.order:
+                seconds = frame.get(name)
+                if seconds:
+                    bar = min(y - 10, max(1, int(seconds * scale)))
+                    if bar > 0:
+                        surface.fill(self._color(name), (x, y - bar, BAR_WIDTH, bar))
+                        y -= bar
+            untracked = min(y - 10, int((total - sum(frame.values())) * scale))
+            if untracked > 0:
+                surface.fill(UNTRACKED_COLOR, (x, y - untracked, BAR_WIDTH, untracked))
+            x += BAR_WIDTH
+        budget_y = base_y - int(FRAME_BUDGET * scale)
+        pg.draw.line(surface, (255, 80, 80), (10, budget_y), (10 + graph_width, budget_y))
+
+        # Table
+        y = base_y + 8
+        surface.blit(self.font.render("PROFILER (F6, F7 trace)", True, (255, 200, 100)), (10, y))
+        self._blit_columns(surface, ("p50 ms", "p95 ms", "max ms"), y, (255, 200, 100))
+        y += line_height
+        for name in systems + ["untracked", "frame"]:
+            if name not in stats:
+                continue
+            entry = stats[name]
+            color = UNTRACKED_COLOR if name == "untracked" else (255, 255, 255) if name == "frame" else self._color(name)
+            if name == "frame" and entry["p95"] > FRAME_BUDGET * 1000.0:
+                color = (255, 80, 80)
+            pg.draw.rect(surface, color, (10, y + 3, 8, line_height - 6))
+            surface.blit(self.font.render(name, True, (220, 220, 220)), (24, y))
+            self._blit_columns(surface, tuple(f"{entry[key]:.2f}" for key in ("p50", "p95", "max")),
+                               y, (220, 220, 220))
+            y += line_height
+        if profiler.tracing:
+            surface.blit(self.font.render(f"recording trace: {len(profiler.trace_events)} events",
+                                          True, (255, 80, 80)), (10, y))
+        return surface
+
+    def _blit_columns(self, surface: pg.Surface, values: Tuple[str, ...], y: int, color: tuple):
+        """Right-align values in the table's number columns."""
+        right = surface.get_width() - 10
+        for value in reversed(values):
+            text = self.font.render(value, True, color)
+            surface.blit(text, (right - text.get_width(), y))
+            right -= 64
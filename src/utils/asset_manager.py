@@ -3,7 +3,10 @@ Asset manager for caching and reusing game assets.
 """
 
 import pygame as pg
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Number of pre-tinted hurt-flash intensity levels per frame
+HURT_TINT_BUCKETS = 4
 
 class AssetManager:
     """Manages and caches game assets to prevent redundant loading."""
@@ -22,6 +25,12 @@ class AssetManager:
         if not AssetManager._initialized:
             self.sprite_sheets: Dict[str, pg.Surface] = {}
             self.cached_animations: Dict[str, tuple] = {}  # Cache animation frame data
+            # Frames pre-scaled for rendering, keyed by (path, frame width, frame height, scale factor)
+            self.scaled_animations: Dict[Tuple, Dict[str, List[pg.Surface]]] = {}
+            # Hurt-flash frames, keyed by (path, frame width, frame height, target size)
+            self.hurt_tint_animations: Dict[Tuple, Dict[str, List[List[pg.Surface]]]] = {}
+            # Plain white flash overlays, keyed by (size, alpha)
+            self.flash_overlays: Dict[Tuple, pg.Surface] = {}
             AssetManager._initialized = True
     
     def load_sprite_sheet(self, path: str) -> Optional[pg.Surface]:
@@ -82,10 +91,81 @@ class AssetManager:
         # print(f"Frame data: {len(frames)} animations, each with {len(frames.get('down', []))} frames")
         return frames
     
+    def get_scaled_animation_frames(self, path: str, frame_width: int, frame_height: int,
+                                    scale_factor: float) -> Optional[Dict[str, List[pg.Surface]]]:
+        """Get animation frames pre-scaled by scale_factor, scaling each frame only once."""
+        cache_key = (path, frame_width, frame_height, scale_factor)
+        if cache_key in self.scaled_animations:
+            return self.scaled_animations[cache_key]
+        
+        frames = self.cache_animation_frames(path, frame_width, frame_height)
+        if frames is None:
+            return None
+        
+        scaled_size = (int(frame_width * scale_factor), int(frame_height * scale_factor))
+        scaled_frames = {
+            animation_name: [pg.transform.scale(frame, scaled_size) for frame in frame_list]
+            for animation_name, frame_list in frames.items()
+        }
+        self.scaled_animations[cache_key] = scaled_frames
+        return scaled_frames
+    
+    def get_hurt_tint_frames(self, path: str, frame_width: int, frame_height: int,
+                             size: Tuple[int, int]) -> Optional[Dict[str, List[List[pg.Surface]]]]:
+        """
+        Get hurt-flash frames scaled to size, as frames[animation][frame][bucket].
+        Bucket b is tinted at intensity (b + 1) / HURT_TINT_BUCKETS.
+        """
+        cache_key = (path, frame_width, frame_height, size)
+        if cache_key in self.hurt_tint_animations:
+            return self.hurt_tint_animations[cache_key]
+        
+        frames = self.cache_animation_frames(path, frame_width, frame_height)
+        if frames is None:
+            return None
+        
+        tinted_frames = {}
+        for animation_name, frame_list in frames.items():
+            tinted_frames[animation_name] = [
+                [pg.transform.scale(self._tint_hurt_frame(frame, (bucket + 1) / HURT_TINT_BUCKETS), size)
+                 for bucket in range(HURT_TINT_BUCKETS)]
+                for frame in frame_list
+            ]
+        self.hurt_tint_animations[cache_key] = tinted_frames
+        return tinted_frames
+    
+    @staticmethod
+    def get_hurt_tint_bucket(intensity: float) -> int:
+        """Map a flash intensity in (0, 1] to the nearest pre-tinted bucket index."""
+        bucket = int(round(intensity * HURT_TINT_BUCKETS)) - 1
+        return max(0, min(HURT_TINT_BUCKETS - 1, bucket))
+    
+    @staticmethod
+    def _tint_hurt_frame(frame: pg.Surface, intensity: float) -> pg.Surface:
+        """Return a copy of frame with the white hurt flash blended in, respecting alpha."""
+        tinted = frame.copy()
+        overlay = pg.Surface(tinted.get_size(), pg.SRCALPHA)
+        overlay.fill((255, 255, 255, int(128 * intensity)))  # Semi-transparent white
+        tinted.blit(overlay, (0, 0), special_flags=pg.BLEND_ALPHA_SDL2)
+        return tinted
+    
+    def get_flash_overlay(self, size: Tuple[int, int], alpha: int = 128) -> pg.Surface:
+        """Get a cached semi-transparent white overlay surface."""
+        cache_key = (size, alpha)
+        overlay = self.flash_overlays.get(cache_key)
+        if overlay is None:
+            overlay = pg.Surface(size, pg.SRCALPHA)
+            overlay.fill((255, 255, 255, alpha))
+            self.flash_overlays[cache_key] = overlay
+        return overlay
+    
     def clear_cache(self):
         """Clear all cached assets."""
         self.sprite_sheets.clear()
         self.cached_animations.clear()
+        self.scaled_animations.clear()
+        self.hurt_tint_animations.clear()
+        self.flash_overlays.clear()
         print("Asset cache cleared")
 
 # Global asset manager instance
@@ -377,7 +377,7 @@ class InputHandler:
                         pellet_angle = self.game.player.angle + angle_offset
                         
                         # Create individual pellet
-                        self.game.bullet_manager.bullets.append(
+                        self.game.bullet_manager.add_bullet(
                             self.game.bullet_manager.create_bullet(
                                 gun_tip.x, gun_tip.y, pellet_angle,
                                 damage=weapon_damage,
@@ -398,7 +398,7 @@ class InputHandler:
             else:
                 if self.game.bullet_manager.can_shoot(self.game.game_time):
                     # Create and fire the bullet
-                    self.game.bullet_manager.bullets.append(
+                    self.game.bullet_manager.add_bullet(
                         self.game.bullet_manager.create_bullet(
                             gun_tip.x, gun_tip.y, self.game.player.angle,
                             damage=weapon_damage,
@@ -0,0 +1,139 @@
+"""
+Logging for Kingdom-Pygame.
+Thin setup around the standard logging module for code that runs every frame
+or every hit. Each module gets a logger under "kingdom" with its own level,
+messages are %-formatted only when the level is enabled, LogChannel rate-limits
+a noisy message kind to one line per interval, and records are handed to a
+background thread through a queue so the game thread never blocks on stdout.
+
+Levels come from the KINGDOM_LOG environment variable, e.g.
+    KINGDOM_LOG="INFO,entities.enemy=DEBUG,systems.collision=DEBUG"
+or from set_level() at runtime.
+"""
+
+import atexit
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import time
+from typing import Optional
+
+ROOT_NAME = "kingdom"
+DEFAULT_LEVEL = logging.INFO
+LEVELS_ENV = "KINGDOM_LOG"
+LOG_FORMAT = "[%(name)s] %(message)s"
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class _StdoutHandler(logging.StreamHandler):
+    """Writes to whatever sys.stdout is at the time (so redirect_stdout still works)."""
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass  # Always follow sys.stdout
+
+
+def _short_name(module_name: str) -> str:
+    """Map a module path (src.entities.enemy) to its logger suffix (entities.enemy)."""
+    if module_name.startswith("src."):
+        return module_name[4:]
+    return module_name
+
+
+def configure(levels: Optional[str] = None):
+    """
+    Install the queued stdout handler on the "kingdom" logger and apply levels
+    ("LEVEL,module=LEVEL,..."; defaults to $KINGDOM_LOG). Safe to call again.
+    """
+    global _listener
+    root = logging.getLogger(ROOT_NAME)
+    if _listener is None:
+        records = queue.SimpleQueue()
+        handler = _StdoutHandler()
+        handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        _listener = logging.handlers.QueueListener(records, handler, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown)
+        root.addHandler(logging.handlers.QueueHandler(records))
+        root.propagate = False  # Keep game output out of other libraries' root handlers
+        root.setLevel(DEFAULT_LEVEL)
+
+    spec = os.environ.get(LEVELS_ENV, "") if levels is None else levels
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        module, _, level = part.rpartition("=")
+        try:
+            set_level(module, level)
+        except ValueError as e:
+            print(f"Warning: ignoring log level '{part}': {e}")
+
+
+def shutdown():
+    """Flush queued records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def set_level(module: str, level):
+    """Set the level of one module ("entities.enemy"), a package ("networking") or everything ("")."""
+    if isinstance(level, str):
+        name = level.strip().upper()
+        level = logging.getLevelName(name)
+        if not isinstance(level, int):
+            raise ValueError(f"unknown level {name}")
+    name = ROOT_NAME + "." + _short_name(module) if module else ROOT_NAME
+    logging.getLogger(name).setLevel(level)
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """Get the logger for a module (pass __name__)."""
+    if _listener is None:
+        configure()
+    return logging.getLogger(ROOT_NAME + "." + _short_name(module_name))
+
+
+class LogChannel:
+    """
+    One kind of message that may fire many times per frame (per hit, per kill).
+    At most one line is written per interval; the lines skipped in between are
+    counted and reported with the next one.
+    """
+
+    __slots__ = ("logger", "level", "interval", "last_time", "suppressed")
+
+    def __init__(self, logger: logging.Logger, level: int = logging.DEBUG, interval: float = 1.0):
+        self.logger = logger
+        self.level = level
+        self.interval = interval
+        self.last_time = float("-inf")
+        self.suppressed = 0
+
+    def enabled(self) -> bool:
+        """True if the level is enabled (use it to guard expensive arguments)."""
+        return self.logger.isEnabledFor(self.level)
+
+    def __call__(self, message: str, *args):
+        """Log a %-format message unless the level is disabled or the channel fired too recently."""
+        if not self.logger.isEnabledFor(self.level):
+            return
+        now = time.monotonic()
+        if now - self.last_time < self.interval:
+            self.suppressed += 1
+            return
+        self.last_time = now
+        if self.suppressed:
+            message += " (+%d similar)"
+            args += (self.suppressed,)
+            self.suppressed = 0
+        self.logger.log(self.level, message, *args)
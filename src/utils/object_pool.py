@@ -0,0 +1,101 @@
+"""
+Object pools for Kingdom-Pygame.
+Bullets, sparks, particles and explosions are created many times a second and
+live for a fraction of one. Instead of building a new instance (and its
+Vector2s, lists and dicts) per spawn and dropping it on expiry, a pool keeps
+the expired ones on a free list and re-initializes them with reset(), which a
+pooled class implements with the same arguments as its constructor.
+
+Live objects sit in a dense list (pool.active) that managers iterate directly.
+release() moves the last live object into the freed slot, so removal is O(1)
+instead of list.remove's O(n) scan; the order of the live list is not kept.
+Never release while iterating the live list - collect the expired objects
+first, or walk the list backwards.
+"""
+
+from typing import Callable, List
+
+DEFAULT_MAX_FREE = 1024  # Free objects kept around after a spike
+
+
+def swap_remove(items: list, index: int):
+    """Remove items[index] in O(1) by moving the last item into its place."""
+    last = items.pop()
+    if index < len(items):
+        items[index] = last
+
+
+class ObjectPool:
+    """Free list of reusable objects plus the dense list of live ones."""
+
+    def __init__(self, factory: Callable, max_free: int = DEFAULT_MAX_FREE):
+        self.factory = factory  # Class (or callable) building a new object
+        self.max_free = max_free
+        self.active: List = []
+        self.free: List = []
+        self.created = 0
+        self.reused = 0
+
+    def obtain(self, *args, **kwargs):
+        """Get an initialized object without adding it to the live list."""
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.reused += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.created += 1
+        obj._pool_index = None
+        return obj
+
+    def acquire(self, *args, **kwargs):
+        """Get an initialized object and add it to the live list."""
+        return self.add(self.obtain(*args, **kwargs))
+
+    def add(self, obj):
+        """Put an object from obtain() on the live list."""
+        obj._pool_index = len(self.active)
+        self.active.append(obj)
+        return obj
+
+    def release(self, obj) -> bool:
+        """Swap-remove a live object and keep it for reuse. Returns False if it was not live."""
+        active = self.active
+        index = getattr(obj, "_pool_index", None)
+        if index is None or index >= len(active) or active[index] is not obj:
+            # Appended to the live list directly instead of through add() - find it
+            try:
+                index = active.index(obj)
+            except ValueError:
+                return False
+        last = active.pop()
+        if last is not obj:
+            active[index] = last
+            last._pool_index = index
+        self.recycle(obj)
+        return True
+
+    def recycle(self, obj):
+        """Keep an object that is not on the live list for reuse (for managers with their own list)."""
+        obj._pool_index = None
+        if len(self.free) < self.max_free:
+            self.free.append(obj)
+
+    def release_all(self):
+        """Release every live object."""
+        for obj in self.active:
+            obj._pool_index = None
+        room = self.max_free - len(self.free)
+        if room > 0:
+            self.free.extend(self.active[:room])
+        self.active.clear()
+
+    def get_stats(self) -> dict:
+        """Live/free counts and how many objects were built vs reused."""
+        return {
+            "active": len(self.active),
+            "free": len(self.free),
+            "created": self.created,
+            "reused": self.reused,
+        }
+
@@ -0,0 +1,214 @@
+"""
+Per-system frame profiler for Kingdom-Pygame.
+Subsystem calls are wrapped in named sections (a context manager or a
+decorator). While the profiler is enabled, each section's time is summed per
+rendered frame and kept for a rolling window, giving p50/p95/max per system,
+and can be recorded as Chrome trace events for chrome://tracing or Perfetto.
+While it is disabled, a section is one attribute check and a shared no-op
+context manager, so the instrumentation can stay in the game loop.
+Sections are meant to be siblings: a section opened inside another is counted
+in both, and the stacked frame graph would show its time twice.
+"""
+
+import functools
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+WINDOW_FRAMES = 240          # Frames kept for the rolling statistics (about 4 s at 60 FPS)
+FRAME_BUDGET = 1.0 / 60      # Seconds a frame may take at the target frame rate
+MAX_TRACE_EVENTS = 500000    # Events per trace capture; recording stops when it is full
+
+
+class _NullSection:
+    """Context manager that does nothing (the profiler is disabled)."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NULL_SECTION = _NullSection()
+
+
+class _Section:
+    """Times one named system; reused for every call of that system."""
+
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "FrameProfiler", name: str):
+        self.profiler = profiler
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.profiler._add(self.name, self.start, time.perf_counter())
+        return False
+
+
+class FrameProfiler:
+    """Rolling per-system frame timings with optional Chrome trace capture."""
+
+    def __init__(self, window: int = WINDOW_FRAMES):
+        self.enabled = False
+        self.tracing = False
+        self.sections: Dict[str, _Section] = {}
+        self.frame: Dict[str, float] = {}         # Seconds per system in the current frame
+        self.frame_start = None
+        self.history = deque(maxlen=window)       # (frame seconds, {system: seconds}) per frame
+        self.order: List[str] = []                # Systems in the order first seen (update, then render)
+        self.frames_recorded = 0
+
+        # Trace capture
+        self.trace_events: List[tuple] = []       # (name, start, end)
+        self.trace_origin = 0.0
+
+    def section(self, name: str):
+        """Return a context manager timing the named system (free when disabled)."""
+        if not self.enabled:
+            return _NULL_SECTION
+        section = self.sections.get(name)
+        if section is None:
+            section = self.sections[name] = _Section(self, name)
+        return section
+
+    def _add(self, name: str, start: float, end: float):
+        """Add one timed call to the current frame (and the trace)."""
+        frame = self.frame
+        if name in frame:
+            frame[name] += end - start
+        else:
+            frame[name] = end - start
+            if name not in self.order:
+                self.order.append(name)
+        if self.tracing:
+            self._trace(name, start, end)
+
+    def _trace(self, name: str, start: float, end: float):
+        """Record a trace event, stopping the capture once it is full."""
+        if len(self.trace_events) >= MAX_TRACE_EVENTS:
+            self.tracing = False
+            print(f"[PROFILER] Trace capture full ({MAX_TRACE_EVENTS} events), recording stopped")
+            return
+        self.trace_events.append((name, start, end))
+
+    def begin_frame(self):
+        """Start timing a rendered frame."""
+        if not self.enabled:
+            self.frame_start = None
+            return
+        self.frame = {}
+        self.frame_start = time.perf_counter()
+
+    def end_frame(self):
+        """Close the frame and push its per-system times into the rolling window."""
+        if self.frame_start is None or not self.enabled:
+            return
+        end = time.perf_counter()
+        self.history.append((end - self.frame_start, self.frame))
+        self.frames_recorded += 1
+        if self.tracing:
+            self._trace("frame", self.frame_start, end)
+        self.frame = {}
+        self.frame_start = None
+
+    def set_enabled(self, enabled: bool):
+        """Turn timing on or off; the rolling window restarts when turned on."""
+        if enabled and not self.enabled:
+            self.history.clear()
+            self.frame = {}
+        self.enabled = enabled
+        if not enabled:
+            self.frame_start = None
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Return p50/p95/max/mean milliseconds per frame for every system over the
+        rolling window, plus "frame" for the whole frame and "untracked" for the
+        part of it no section covered.
+        """
+        history = list(self.history)
+        if not history:
+            return {}
+        series = {name: [frame.get(name, 0.0) for _, frame in history] for name in self.order}
+        series["frame"] = [total for total, _ in history]
+        series["untracked"] = [max(0.0, total - sum(frame.values())) for total, frame in history]
+        return {name: _summarize(values) for name, values in series.items()}
+
+    def start_trace(self):
+        """Begin recording trace events (enables the profiler)."""
+        self.set_enabled(True)
+        self.trace_events = []
+        self.trace_origin = time.perf_counter()
+        self.tracing = True
+
+    def stop_trace(self, path: Optional[str] = None) -> Optional[str]:
+        """Stop recording and write the Chrome trace (to path, or profiles/trace_<time>.json)."""
+        self.tracing = False
+        if not self.trace_events:
+            return None
+        if path is None:
+            path = os.path.join("profiles", time.strftime("trace_%Y%m%d_%H%M%S.json"))
+        self.export_chrome_trace(path)
+        self.trace_events = []
+        return path
+
+    def export_chrome_trace(self, path: str):
+        """Write the recorded events as Chrome trace-event JSON (complete "X" events, microseconds)."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        origin = self.trace_origin
+        events = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": 1, "args": {"name": "game loop"}}]
+        for name, start, end in self.trace_events:
+            events.append({
+                "name": name,
+                "cat": "frame" if name == "frame" else "system",
+                "ph": "X",
+                "ts": round((start - origin) * 1e6, 3),
+                "dur": round((end - start) * 1e6, 3),
+                "pid": 1,
+                "tid": 1,
+            })
+        with open(path, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        print(f"[PROFILER] Wrote {len(self.trace_events)} trace events to {path}")
+
+
+def _summarize(values: List[float]) -> Dict[str, float]:
+    """Percentiles of per-frame seconds, in milliseconds."""
+    ordered = sorted(values)
+    count = len(ordered)
+    return {
+        "p50": ordered[count // 2] * 1000.0,
+        "p95": ordered[min(count - 1, int(count * 0.95))] * 1000.0,
+        "max": ordered[-1] * 1000.0,
+        "mean": sum(ordered) / count * 1000.0,
+    }
+
+
+# Global profiler instance
+profiler = FrameProfiler()
+
+
+def profiled(name: str):
+    """Decorator timing every call of a function as the named system."""
+    def decorator(function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not profiler.enabled:
+                return function(*args, **kwargs)
+            with profiler.section(name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
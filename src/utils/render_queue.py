@@ -0,0 +1,109 @@
+"""
+Batched sprite rendering for Kingdom-Pygame.
+Entities submit (surface, dest) pairs into named layers instead of blitting
+directly. Each layer is culled against the camera view and flushed with a
+single Surface.fblits call, replacing hundreds of Python-level blit calls.
+"""
+
+import pygame as pg
+from typing import Dict, List, Optional, Tuple
+
+# Upper bound on cached circle sprites before the cache is reset
+CIRCLE_CACHE_LIMIT = 4096
+
+# Fading circles are cached at this many brightness levels per colour and radius
+CIRCLE_FADE_LEVELS = 32
+
+_circle_sprites: Dict[Tuple, pg.Surface] = {}
+_faded_circle_sprites: Dict[Tuple, pg.Surface] = {}
+
+
+def get_circle_sprite(color: Tuple[int, int, int], radius: int) -> pg.Surface:
+    """
+    Get a cached surface holding a filled circle.
+    Blitting it at (x - radius, y - radius) produces the same pixels as
+    pg.draw.circle(screen, color, (x, y), radius) on an opaque target.
+    """
+    key = (color[0], color[1], color[2], radius)
+    sprite = _circle_sprites.get(key)
+    if sprite is None:
+        if len(_circle_sprites) >= CIRCLE_CACHE_LIMIT:
+            _circle_sprites.clear()
+        sprite = pg.Surface((radius * 2, radius * 2), pg.SRCALPHA)
+        pg.draw.circle(sprite, key[:3], (radius, radius), radius)
+        _circle_sprites[key] = sprite
+    return sprite
+
+
+def get_faded_circle_sprite(color: Tuple[int, int, int], radius: int, fade: float) -> pg.Surface:
+    """
+    Get a cached filled circle of color scaled by fade (0-1).
+    Fading particles would give a new exact RGB nearly every frame, missing a
+    colour-keyed cache on every blit, so fade is rounded down to one of
+    CIRCLE_FADE_LEVELS steps: the result can be up to 1/32 darker than
+    drawing the exact faded colour.
+    """
+    key = (color, radius, int(fade * CIRCLE_FADE_LEVELS))
+    sprite = _faded_circle_sprites.get(key)
+    if sprite is None:
+        if len(_faded_circle_sprites) >= CIRCLE_CACHE_LIMIT:
+            _faded_circle_sprites.clear()
+        scale = max(0, min(key[2], CIRCLE_FADE_LEVELS)) / CIRCLE_FADE_LEVELS
+        sprite = pg.Surface((radius * 2, radius * 2), pg.SRCALPHA)
+        pg.draw.circle(sprite, [int(c * scale) for c in color[:3]], (radius, radius), radius)
+        _faded_circle_sprites[key] = sprite
+    return sprite
+
+
+class RenderQueue:
+    """Collects blits per layer and flushes each layer with one fblits call."""
+
+    def __init__(self, cull_margin: int = 0):
+        """Initialize an empty render queue."""
+        self.layers: Dict[str, List[Tuple[pg.Surface, Tuple[int, int]]]] = {}
+        self.view_rect: Optional[pg.Rect] = None
+        self.cull_margin = cull_margin
+        self.submitted = 0  # Blits submitted since the last begin()
+        self.culled = 0     # Blits rejected by the view test since the last begin()
+
+    def begin(self, screen: pg.Surface):
+        """Start a new frame, culling subsequent submissions against the screen area."""
+        self.view_rect = screen.get_rect().inflate(self.cull_margin * 2, self.cull_margin * 2)
+        for items in self.layers.values():
+            items.clear()
+        self.submitted = 0
+        self.culled = 0
+
+    def submit(self, layer: str, surface: pg.Surface, dest: Tuple[int, int]) -> bool:
+        """Queue a blit in screen space. Returns False if it was culled."""
+        self.submitted += 1
+        view = self.view_rect
+        if view is not None:
+            width, height = surface.get_size()
+            if (dest[0] + width <= view.left or dest[0] >= view.right or
+                    dest[1] + height <= view.top or dest[1] >= view.bottom):
+                self.culled += 1
+                return False
+
+        items = self.layers.get(layer)
+        if items is None:
+            items = self.layers[layer] = []
+        items.append((surface, dest))
+        return True
+
+    def flush(self, screen: pg.Surface, layer: str, special_flags: int = 0):
+        """Draw every queued blit in a layer, in submission order, then empty it."""
+        items = self.layers.get(layer)
+        if not items:
+            return
+        if hasattr(screen, 'fblits'):
+            screen.fblits(items, special_flags)
+        else:
+            # Older pygame without fblits still batches through blits
+            screen.blits([(surface, dest, None, special_flags) for surface, dest in items], doreturn=False)
+        items.clear()
+
+    def flush_all(self, screen: pg.Surface):
+        """Flush every layer in the order the layers were first used."""
+        for layer in list(self.layers):
+            self.flush(screen, layer)
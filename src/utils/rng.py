@@ -0,0 +1,62 @@
+"""
+Seeded random streams for Kingdom-Pygame.
+Gameplay code draws from a named stream per subsystem instead of the global
+random module, so one seed reproduces a whole run, and a subsystem that starts
+drawing more or fewer numbers (a new particle effect, a changed spawn rule)
+does not shift the sequences of all the others. Randomness used only while
+drawing goes to the "render" stream, so the frame rate never reaches gameplay.
+Streams are created once and reseeded in place, so a module can bind its
+stream at import time:
+
+    _random = rng.stream("enemies")
+    _random.uniform(0, 1)
+"""
+
+import random
+from typing import Dict, Optional
+
+# Streams used by the game; any other name gets a stream on first use
+STREAMS = ("spawns", "enemies", "cores", "bullets", "missiles", "effects", "atmosphere", "npcs", "camera", "render")
+
+
+class RngStreams:
+    """Named random.Random streams all derived from one seed."""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.streams: Dict[str, random.Random] = {}
+        self.seed = 0
+        self.reseed(seed)
+
+    def stream(self, name: str) -> random.Random:
+        """Get the stream for a subsystem (created on first use)."""
+        stream = self.streams.get(name)
+        if stream is None:
+            stream = self.streams[name] = random.Random(self._derive(name))
+        return stream
+
+    def reseed(self, seed: Optional[int] = None):
+        """Restart every stream from a new seed (a fresh random one if None)."""
+        if seed is None:
+            seed = random.SystemRandom().randrange(1 << 32)
+        self.seed = seed
+        for name in STREAMS:
+            self.stream(name)
+        for name, stream in self.streams.items():
+            stream.seed(self._derive(name))
+
+    def _derive(self, name: str) -> str:
+        """Per-stream seed; string seeds are hashed (SHA-512), independent of PYTHONHASHSEED."""
+        return f"{self.seed}:{name}"
+
+    def get_state(self) -> Dict[str, tuple]:
+        """Snapshot every stream's state (to compare runs or rewind)."""
+        return {name: stream.getstate() for name, stream in self.streams.items()}
+
+    def set_state(self, state: Dict[str, tuple]):
+        """Restore a snapshot from get_state()."""
+        for name, stream_state in state.items():
+            self.stream(name).setstate(stream_state)
+
+
+# Global stream registry
+rng = RngStreams()
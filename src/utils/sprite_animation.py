@@ -49,10 +49,18 @@ class SpriteAnimation:
             self.frames = asset_manager.cache_animation_frames(sprite_sheet_path, frame_width, frame_height)
             if self.frames is None:
                 raise Exception(f"Failed to load sprite sheet: {sprite_sheet_path}")
+            # Frames pre-scaled once and shared by every sprite using this sheet and scale
+            self.scaled_frames = asset_manager.get_scaled_animation_frames(
+                sprite_sheet_path, frame_width, frame_height, scale_factor)
         else:
             # Fallback to original loading method
             self.sprite_sheet = pg.image.load(sprite_sheet_path).convert_alpha()
             self.frames = self._slice_sprite_sheet()
+            scaled_size = self.get_scaled_dimensions()
+            self.scaled_frames = {
+                animation_name: [pg.transform.scale(frame, scaled_size) for frame in frame_list]
+                for animation_name, frame_list in self.frames.items()
+            }
         
         # Current animation state
         self.current_animation = 'down'
@@ -137,27 +145,46 @@ class SpriteAnimation:
         """Get the current animation frame."""
         return self.frames[self.current_animation][self.current_frame]
     
+    def get_current_scaled_frame(self) -> pg.Surface:
+        """Get the current animation frame at render scale (shared, do not modify)."""
+        return self.scaled_frames[self.current_animation][self.current_frame]
+    
+    def get_hurt_frame(self, intensity: float, size: Tuple[int, int]) -> pg.Surface:
+        """Get the current frame with a white hurt flash, scaled to size (cached per intensity bucket)."""
+        if not asset_manager:
+            return None
+        tinted_frames = asset_manager.get_hurt_tint_frames(
+            self.sprite_sheet_path, self.frame_width, self.frame_height, size)
+        if tinted_frames is None:
+            return None
+        bucket = asset_manager.get_hurt_tint_bucket(intensity)
+        return tinted_frames[self.current_animation][self.current_frame][bucket]
+    
     def get_scaled_dimensions(self):
         """Get the scaled dimensions of frames."""
         return int(self.frame_width * self.scale_factor), int(self.frame_height * self.scale_factor)
     
-    def render(self, screen: pg.Surface, x: int, y: int, offset=(0, 0)):
-        """Render the current frame at the specified position."""
-        frame = self.get_current_frame()
+    def get_blit(self, x: int, y: int, offset=(0, 0)):
+        """Get the (surface, dest) pair that renders the current frame centered at x, y."""
+        scaled_frame = self.get_current_scaled_frame()
         
-        if frame is None:
+        if scaled_frame is None:
             print(f"Warning: No frame to render for animation '{self.current_animation}' frame {self.current_frame}")
-            return
+            return None
         
-        # Scale frame using the configured scale factor
-        scaled_width = int(self.frame_width * self.scale_factor)
-        scaled_height = int(self.frame_height * self.scale_factor)
-        scaled_frame = pg.transform.scale(frame, (scaled_width, scaled_height))
+        # Frames are pre-scaled using the configured scale factor
+        scaled_width, scaled_height = scaled_frame.get_size()
         
         render_x = x + offset[0] - scaled_width // 2
         render_y = y + offset[1] - scaled_height // 2
         
-        screen.blit(scaled_frame, (render_x, render_y))
+        return scaled_frame, (render_x, render_y)
+    
+    def render(self, screen: pg.Surface, x: int, y: int, offset=(0, 0)):
+        """Render the current frame at the specified position."""
+        blit = self.get_blit(x, y, offset)
+        if blit:
+            screen.blit(*blit)
 
 class AnimatedSprite:
     """A sprite with animation capabilities."""
@@ -238,6 +265,10 @@ class AnimatedSprite:
         """Render the animated sprite."""
         self.animation.render(screen, int(self.pos.x), int(self.pos.y), offset)
     
+    def get_blit(self, offset=(0, 0)):
+        """Get the (surface, dest) pair for the current frame, for batched rendering."""
+        return self.animation.get_blit(int(self.pos.x), int(self.pos.y), offset)
+    
     def set_position(self, x: float, y: float):
         """Set sprite position."""
         self.pos.x = x
@@ -23,6 +23,12 @@ except ImportError:
     except ImportError:
         MapManager = None
 
+# Handle seeded random stream import
+try:
+    from src.utils.rng import rng
+except ImportError:
+    from utils.rng import rng
+
 # Objective Types for Level System
 class ObjectiveType(Enum):
     COLLECT_CORES = "collect_cores"
@@ -66,7 +72,7 @@ class WorldManager:
     def __init__(self, seed: int = None):
         """Initialize the world manager for level-based gameplay."""
         self.seed = seed or random.randint(0, 1000000)
-        random.seed(self.seed)
+        rng.reseed(self.seed)  # Every gameplay stream follows the world seed
         
         # New level-based world settings (rectangular)
         self.world_width = 3840   # 3840 pixel width
@@ -226,6 +232,12 @@ class WorldManager:
             return self.map_manager.is_position_blocked(world_x, world_y)
         return False
     
+    def are_positions_blocked_by_map(self, xs, ys):
+        """Check many positions against map collision at once (one flag per position)."""
+        if self.map_manager:
+            return self.map_manager.are_positions_blocked(xs, ys)
+        return [False] * len(xs)
+    
     def get_map_collision_rects_near(self, world_x: float, world_y: float, radius: float = 100.0):
         """Get map collision rectangles near position."""
         if self.map_manager:
@@ -496,11 +508,11 @@ class WorldManager:
         # Use camera position as seed for consistent decorations that don't flicker
         seed_x = int(camera_x // 100) * 100  # Round to nearest 100 for stability
         seed_y = int(camera_y // 100) * 100
-        random.seed(seed_x ^ seed_y)  # Consistent but varied decorations
+        decoration_random = random.Random(seed_x ^ seed_y)  # Consistent but varied decorations
         
         for _ in range(num_decorations):
-            dec_x = x + random.randint(0, max(1, width - 1))  
-            dec_y = y + random.randint(0, max(1, height - 1))
+            dec_x = x + decoration_random.randint(0, max(1, width - 1))  
+            dec_y = y + decoration_random.randint(0, max(1, height - 1))
             
             # Convert screen coordinates back to world coordinates
             world_x = dec_x - (surface.get_width()//2) + camera_x
@@ -511,13 +523,13 @@ class WorldManager:
                 continue
                 
             # Add simple grass and flowers
-            if random.random() < 0.7:
+            if decoration_random.random() < 0.7:
                 # Grass tufts
                 pg.draw.circle(surface, (0, 120, 0), (dec_x, dec_y), 1)
             else:
                 # Simple flowers
                 flower_colors = [(255, 255, 0), (255, 192, 203), (138, 43, 226)]
-                pg.draw.circle(surface, random.choice(flower_colors), (dec_x, dec_y), 1)
+                pg.draw.circle(surface, decoration_random.choice(flower_colors), (dec_x, dec_y), 1)
     
     def update(self, dt: float, player_pos: pg.Vector2 = None, keys_pressed: dict = None):
         """Update world manager systems including NPCs and objectives."""